@@ -16,6 +16,10 @@
 #
 
 
+import importlib
+import importlib.util
+from typing import Any, Dict, Tuple
+
 from google.cloud.aiplatform import version as aiplatform_version
 
 __version__ = aiplatform_version.__version__
@@ -23,65 +27,6 @@ __version__ = aiplatform_version.__version__
 
 from google.cloud.aiplatform import initializer
 
-from google.cloud.aiplatform.datasets import (
-    ImageDataset,
-    TabularDataset,
-    TextDataset,
-    TimeSeriesDataset,
-    VideoDataset,
-)
-from google.cloud.aiplatform import explain
-from google.cloud.aiplatform import gapic
-from google.cloud.aiplatform import hyperparameter_tuning
-from google.cloud.aiplatform.featurestore import (
-    EntityType,
-    Feature,
-    Featurestore,
-)
-from google.cloud.aiplatform.matching_engine import (
-    MatchingEngineIndex,
-    MatchingEngineIndexEndpoint,
-)
-from google.cloud.aiplatform import metadata
-from google.cloud.aiplatform.tensorboard import uploader_tracker
-from google.cloud.aiplatform.models import DeploymentResourcePool
-from google.cloud.aiplatform.models import Endpoint
-from google.cloud.aiplatform.models import PrivateEndpoint
-from google.cloud.aiplatform.models import Model
-from google.cloud.aiplatform.models import ModelRegistry
-from google.cloud.aiplatform.model_evaluation import ModelEvaluation
-from google.cloud.aiplatform.jobs import (
-    BatchPredictionJob,
-    CustomJob,
-    HyperparameterTuningJob,
-    ModelDeploymentMonitoringJob,
-)
-from google.cloud.aiplatform.pipeline_jobs import PipelineJob
-from google.cloud.aiplatform.pipeline_job_schedules import (
-    PipelineJobSchedule,
-)
-from google.cloud.aiplatform.tensorboard import (
-    Tensorboard,
-    TensorboardExperiment,
-    TensorboardRun,
-    TensorboardTimeSeries,
-)
-from google.cloud.aiplatform.training_jobs import (
-    CustomTrainingJob,
-    CustomContainerTrainingJob,
-    CustomPythonPackageTrainingJob,
-    AutoMLTabularTrainingJob,
-    AutoMLForecastingTrainingJob,
-    SequenceToSequencePlusForecastingTrainingJob,
-    TemporalFusionTransformerForecastingTrainingJob,
-    TimeSeriesDenseEncoderForecastingTrainingJob,
-    AutoMLImageTrainingJob,
-    AutoMLTextTrainingJob,
-    AutoMLVideoTrainingJob,
-)
-
-from google.cloud.aiplatform import helpers
-
 """
 Usage:
 from google.cloud import aiplatform
@@ -90,34 +35,211 @@ aiplatform.init(project='my_project')
 """
 init = initializer.global_config.init
 
-get_pipeline_df = metadata.metadata._LegacyExperimentService.get_pipeline_df
+# The public surface is imported on first access (PEP 562), so that importing
+# the package does not load every resource module and its GAPIC types.
+# Maps each attribute to the module defining it and the path of the attribute
+# within that module, or None for the module itself.
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, Any]] = {
+    "explain": ("google.cloud.aiplatform.explain", None),
+    "gapic": ("google.cloud.aiplatform.gapic", None),
+    "helpers": ("google.cloud.aiplatform.helpers", None),
+    "hyperparameter_tuning": ("google.cloud.aiplatform.hyperparameter_tuning", None),
+    "metadata": ("google.cloud.aiplatform.metadata", None),
+    "uploader_tracker": ("google.cloud.aiplatform.tensorboard.uploader_tracker", None),
+    "ImageDataset": ("google.cloud.aiplatform.datasets", "ImageDataset"),
+    "TabularDataset": ("google.cloud.aiplatform.datasets", "TabularDataset"),
+    "TextDataset": ("google.cloud.aiplatform.datasets", "TextDataset"),
+    "TimeSeriesDataset": ("google.cloud.aiplatform.datasets", "TimeSeriesDataset"),
+    "VideoDataset": ("google.cloud.aiplatform.datasets", "VideoDataset"),
+    "EntityType": ("google.cloud.aiplatform.featurestore", "EntityType"),
+    "Feature": ("google.cloud.aiplatform.featurestore", "Feature"),
+    "Featurestore": ("google.cloud.aiplatform.featurestore", "Featurestore"),
+    "MatchingEngineIndex": (
+        "google.cloud.aiplatform.matching_engine",
+        "MatchingEngineIndex",
+    ),
+    "MatchingEngineIndexEndpoint": (
+        "google.cloud.aiplatform.matching_engine",
+        "MatchingEngineIndexEndpoint",
+    ),
+    "DeploymentResourcePool": (
+        "google.cloud.aiplatform.models",
+        "DeploymentResourcePool",
+    ),
+    "Endpoint": ("google.cloud.aiplatform.models", "Endpoint"),
+    "PrivateEndpoint": ("google.cloud.aiplatform.models", "PrivateEndpoint"),
+    "Model": ("google.cloud.aiplatform.models", "Model"),
+    "ModelRegistry": ("google.cloud.aiplatform.models", "ModelRegistry"),
+    "ModelEvaluation": ("google.cloud.aiplatform.model_evaluation", "ModelEvaluation"),
+    "BatchPredictionJob": ("google.cloud.aiplatform.jobs", "BatchPredictionJob"),
+    "CustomJob": ("google.cloud.aiplatform.jobs", "CustomJob"),
+    "HyperparameterTuningJob": (
+        "google.cloud.aiplatform.jobs",
+        "HyperparameterTuningJob",
+    ),
+    "ModelDeploymentMonitoringJob": (
+        "google.cloud.aiplatform.jobs",
+        "ModelDeploymentMonitoringJob",
+    ),
+    "PipelineJob": ("google.cloud.aiplatform.pipeline_jobs", "PipelineJob"),
+    "PipelineJobSchedule": (
+        "google.cloud.aiplatform.pipeline_job_schedules",
+        "PipelineJobSchedule",
+    ),
+    "Tensorboard": ("google.cloud.aiplatform.tensorboard", "Tensorboard"),
+    "TensorboardExperiment": (
+        "google.cloud.aiplatform.tensorboard",
+        "TensorboardExperiment",
+    ),
+    "TensorboardRun": ("google.cloud.aiplatform.tensorboard", "TensorboardRun"),
+    "TensorboardTimeSeries": (
+        "google.cloud.aiplatform.tensorboard",
+        "TensorboardTimeSeries",
+    ),
+    "CustomTrainingJob": ("google.cloud.aiplatform.training_jobs", "CustomTrainingJob"),
+    "CustomContainerTrainingJob": (
+        "google.cloud.aiplatform.training_jobs",
+        "CustomContainerTrainingJob",
+    ),
+    "CustomPythonPackageTrainingJob": (
+        "google.cloud.aiplatform.training_jobs",
+        "CustomPythonPackageTrainingJob",
+    ),
+    "AutoMLTabularTrainingJob": (
+        "google.cloud.aiplatform.training_jobs",
+        "AutoMLTabularTrainingJob",
+    ),
+    "AutoMLForecastingTrainingJob": (
+        "google.cloud.aiplatform.training_jobs",
+        "AutoMLForecastingTrainingJob",
+    ),
+    "SequenceToSequencePlusForecastingTrainingJob": (
+        "google.cloud.aiplatform.training_jobs",
+        "SequenceToSequencePlusForecastingTrainingJob",
+    ),
+    "TemporalFusionTransformerForecastingTrainingJob": (
+        "google.cloud.aiplatform.training_jobs",
+        "TemporalFusionTransformerForecastingTrainingJob",
+    ),
+    "TimeSeriesDenseEncoderForecastingTrainingJob": (
+        "google.cloud.aiplatform.training_jobs",
+        "TimeSeriesDenseEncoderForecastingTrainingJob",
+    ),
+    "AutoMLImageTrainingJob": (
+        "google.cloud.aiplatform.training_jobs",
+        "AutoMLImageTrainingJob",
+    ),
+    "AutoMLTextTrainingJob": (
+        "google.cloud.aiplatform.training_jobs",
+        "AutoMLTextTrainingJob",
+    ),
+    "AutoMLVideoTrainingJob": (
+        "google.cloud.aiplatform.training_jobs",
+        "AutoMLVideoTrainingJob",
+    ),
+    "get_pipeline_df": (
+        "google.cloud.aiplatform.metadata.metadata",
+        "_LegacyExperimentService.get_pipeline_df",
+    ),
+    "log_params": (
+        "google.cloud.aiplatform.metadata.metadata",
+        "_experiment_tracker.log_params",
+    ),
+    "log_metrics": (
+        "google.cloud.aiplatform.metadata.metadata",
+        "_experiment_tracker.log_metrics",
+    ),
+    "log_classification_metrics": (
+        "google.cloud.aiplatform.metadata.metadata",
+        "_experiment_tracker.log_classification_metrics",
+    ),
+    "log_model": (
+        "google.cloud.aiplatform.metadata.metadata",
+        "_experiment_tracker.log_model",
+    ),
+    "get_experiment_df": (
+        "google.cloud.aiplatform.metadata.metadata",
+        "_experiment_tracker.get_experiment_df",
+    ),
+    "start_run": (
+        "google.cloud.aiplatform.metadata.metadata",
+        "_experiment_tracker.start_run",
+    ),
+    "autolog": (
+        "google.cloud.aiplatform.metadata.metadata",
+        "_experiment_tracker.autolog",
+    ),
+    "start_execution": (
+        "google.cloud.aiplatform.metadata.metadata",
+        "_experiment_tracker.start_execution",
+    ),
+    "log": ("google.cloud.aiplatform.metadata.metadata", "_experiment_tracker.log"),
+    "log_time_series_metrics": (
+        "google.cloud.aiplatform.metadata.metadata",
+        "_experiment_tracker.log_time_series_metrics",
+    ),
+    "end_run": (
+        "google.cloud.aiplatform.metadata.metadata",
+        "_experiment_tracker.end_run",
+    ),
+    "upload_tb_log": (
+        "google.cloud.aiplatform.tensorboard.uploader_tracker",
+        "_tensorboard_tracker.upload_tb_log",
+    ),
+    "start_upload_tb_log": (
+        "google.cloud.aiplatform.tensorboard.uploader_tracker",
+        "_tensorboard_tracker.start_upload_tb_log",
+    ),
+    "end_upload_tb_log": (
+        "google.cloud.aiplatform.tensorboard.uploader_tracker",
+        "_tensorboard_tracker.end_upload_tb_log",
+    ),
+    "save_model": ("google.cloud.aiplatform.metadata._models", "save_model"),
+    "get_experiment_model": (
+        "google.cloud.aiplatform.metadata.schema.google.artifact_schema",
+        "ExperimentModel.get",
+    ),
+    "Experiment": (
+        "google.cloud.aiplatform.metadata.experiment_resources",
+        "Experiment",
+    ),
+    "ExperimentRun": (
+        "google.cloud.aiplatform.metadata.experiment_run_resource",
+        "ExperimentRun",
+    ),
+    "Artifact": ("google.cloud.aiplatform.metadata.artifact", "Artifact"),
+    "Execution": ("google.cloud.aiplatform.metadata.execution", "Execution"),
+    "Context": ("google.cloud.aiplatform.metadata.context", "Context"),
+}
 
-log_params = metadata.metadata._experiment_tracker.log_params
-log_metrics = metadata.metadata._experiment_tracker.log_metrics
-log_classification_metrics = (
-    metadata.metadata._experiment_tracker.log_classification_metrics
-)
-log_model = metadata.metadata._experiment_tracker.log_model
-get_experiment_df = metadata.metadata._experiment_tracker.get_experiment_df
-start_run = metadata.metadata._experiment_tracker.start_run
-autolog = metadata.metadata._experiment_tracker.autolog
-start_execution = metadata.metadata._experiment_tracker.start_execution
-log = metadata.metadata._experiment_tracker.log
-log_time_series_metrics = metadata.metadata._experiment_tracker.log_time_series_metrics
-end_run = metadata.metadata._experiment_tracker.end_run
-
-upload_tb_log = uploader_tracker._tensorboard_tracker.upload_tb_log
-start_upload_tb_log = uploader_tracker._tensorboard_tracker.start_upload_tb_log
-end_upload_tb_log = uploader_tracker._tensorboard_tracker.end_upload_tb_log
-
-save_model = metadata._models.save_model
-get_experiment_model = metadata.schema.google.artifact_schema.ExperimentModel.get
-
-Experiment = metadata.experiment_resources.Experiment
-ExperimentRun = metadata.experiment_run_resource.ExperimentRun
-Artifact = metadata.artifact.Artifact
-Execution = metadata.execution.Execution
-Context = metadata.context.Context
+
+# `importlib.reload` keeps the module globals. Drop the attributes cached by
+# `__getattr__` so that they are resolved again against the reloaded modules.
+for _name in _LAZY_ATTRIBUTES:
+    globals().pop(_name, None)
+del _name
+
+
+def __getattr__(name: str) -> Any:
+    # Lazily imports the public surface and submodules of the package.
+    # See https://peps.python.org/pep-0562/
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute_path = _LAZY_ATTRIBUTES[name]
+        value = importlib.import_module(module_name)
+        if attribute_path:
+            for attribute in attribute_path.split("."):
+                value = getattr(value, attribute)
+    elif importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    # Cache the attribute so that later accesses skip `__getattr__`.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 
 __all__ = (
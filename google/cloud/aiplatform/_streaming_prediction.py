@@ -16,7 +16,17 @@
 #
 """Streaming prediction functions."""
 
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+import math
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from google.cloud.aiplatform_v1.services import prediction_service
 from google.cloud.aiplatform_v1.types import (
@@ -26,42 +36,128 @@ from google.cloud.aiplatform_v1.types import (
     types as aiplatform_types,
 )
 
-
-def value_to_tensor(value: Any) -> aiplatform_types.Tensor:
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_TensorPb = aiplatform_types.Tensor.pb()
+_DataType = aiplatform_types.Tensor.DataType
+
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+
+# The repeated field and data type of the tensors packed from numpy arrays.
+_NUMPY_DTYPE_TO_TENSOR_FIELD = {
+    "bool": ("bool_val", _DataType.BOOL),
+    "float32": ("float_val", _DataType.FLOAT),
+    "float64": ("double_val", _DataType.DOUBLE),
+    "int8": ("int_val", _DataType.INT8),
+    "int16": ("int_val", _DataType.INT16),
+    "int32": ("int_val", _DataType.INT32),
+    "int64": ("int64_val", _DataType.INT64),
+    "uint8": ("uint_val", _DataType.UINT8),
+    "uint16": ("uint_val", _DataType.UINT16),
+    "uint32": ("uint_val", _DataType.UINT32),
+    "uint64": ("uint64_val", _DataType.UINT64),
+}
+
+_TENSOR_DTYPE_TO_NUMPY_DTYPE = {
+    data_type: numpy_dtype
+    for numpy_dtype, (_, data_type) in _NUMPY_DTYPE_TO_TENSOR_FIELD.items()
+}
+
+
+def value_to_tensor(
+    value: Any, pack_numeric_lists: bool = False
+) -> aiplatform_types.Tensor:
     """Converts a Python value to `Tensor`.
 
     Args:
         value: A value to convert
+        pack_numeric_lists: Whether to pack lists of only `int` or only
+            `float` values into a single tensor with a `shape`, instead of a
+            `list_val` with a tensor per element. Numpy arrays are always
+            packed.
 
     Returns:
         A `Tensor` object
     """
+    tensor_pb = _TensorPb()
+    _fill_tensor_pb(tensor_pb, value, pack_numeric_lists)
+    return aiplatform_types.Tensor.wrap(tensor_pb)
+
+
+def _fill_tensor_pb(tensor_pb: _TensorPb, value: Any, pack_numeric_lists: bool):
+    """Converts a Python value into an empty raw `Tensor` message in place."""
     if value is None:
-        return aiplatform_types.Tensor()
+        return
     elif isinstance(value, int):
-        return aiplatform_types.Tensor(int_val=[value])
+        tensor_pb.int_val.append(value)
     elif isinstance(value, float):
-        return aiplatform_types.Tensor(float_val=[value])
+        tensor_pb.float_val.append(value)
     elif isinstance(value, bool):
-        return aiplatform_types.Tensor(bool_val=[value])
+        tensor_pb.bool_val.append(value)
     elif isinstance(value, str):
-        return aiplatform_types.Tensor(string_val=[value])
+        tensor_pb.string_val.append(value)
     elif isinstance(value, bytes):
-        return aiplatform_types.Tensor(bytes_val=[value])
+        tensor_pb.bytes_val.append(value)
     elif isinstance(value, list):
-        return aiplatform_types.Tensor(list_val=[value_to_tensor(x) for x in value])
+        if not (pack_numeric_lists and _pack_numeric_list(tensor_pb, value)):
+            for x in value:
+                _fill_tensor_pb(tensor_pb.list_val.add(), x, pack_numeric_lists)
     elif isinstance(value, dict):
-        return aiplatform_types.Tensor(
-            struct_val={k: value_to_tensor(v) for k, v in value.items()}
-        )
-    raise TypeError(f"Unsupported value type {type(value)}")
+        for k, v in value.items():
+            _fill_tensor_pb(tensor_pb.struct_val[k], v, pack_numeric_lists)
+    elif np is not None and isinstance(value, np.ndarray):
+        field_and_dtype = _NUMPY_DTYPE_TO_TENSOR_FIELD.get(value.dtype.name)
+        if field_and_dtype is None:
+            _fill_tensor_pb(tensor_pb, value.tolist(), pack_numeric_lists)
+            return
+        field_name, tensor_pb.dtype = field_and_dtype
+        tensor_pb.shape.extend(value.shape)
+        getattr(tensor_pb, field_name).extend(value.ravel().tolist())
+    else:
+        raise TypeError(f"Unsupported value type {type(value)}")
+
 
+def _pack_numeric_list(tensor_pb: _TensorPb, value: list) -> bool:
+    """Packs a non-empty list of only `int` or only `float` values.
 
-def tensor_to_value(tensor_pb: aiplatform_types.Tensor) -> Any:
+    Ints are packed into `int_val` like scalar ints, unless a value does not
+    fit in 32 bits. Floats are packed into `float_val` like scalar floats.
+
+    Returns:
+        Whether the list was packed.
+    """
+    if not value:
+        return False
+    value_types = set(map(type, value))
+    if value_types == {int}:
+        if _INT32_MIN <= min(value) and max(value) <= _INT32_MAX:
+            tensor_pb.dtype = _DataType.INT32
+            tensor_pb.int_val.extend(value)
+        else:
+            tensor_pb.dtype = _DataType.INT64
+            tensor_pb.int64_val.extend(value)
+    elif value_types == {float}:
+        tensor_pb.dtype = _DataType.FLOAT
+        tensor_pb.float_val.extend(value)
+    else:
+        return False
+    tensor_pb.shape.append(len(value))
+    return True
+
+
+def tensor_to_value(tensor_pb: _TensorPb, numpy_arrays: bool = False) -> Any:
     """Converts `Tensor` to a Python value.
 
+    Tensors with a `shape` are converted to nested lists of that shape.
+
     Args:
         tensor_pb: A `Tensor` object
+        numpy_arrays: Whether to convert tensors with a `shape` to numpy
+            arrays instead of nested lists.
 
     Returns:
         A corresponding Python object
@@ -69,11 +165,13 @@ def tensor_to_value(tensor_pb: aiplatform_types.Tensor) -> Any:
     list_of_fields = tensor_pb.ListFields()
     if not list_of_fields:
         return None
-    descriptor, value = tensor_pb.ListFields()[0]
+    if tensor_pb.shape:
+        return _shaped_tensor_to_value(tensor_pb, list_of_fields, numpy_arrays)
+    descriptor, value = list_of_fields[0]
     if descriptor.name == "list_val":
-        return [tensor_to_value(x) for x in value]
+        return [tensor_to_value(x, numpy_arrays) for x in value]
     elif descriptor.name == "struct_val":
-        return {k: tensor_to_value(v) for k, v in value.items()}
+        return {k: tensor_to_value(v, numpy_arrays) for k, v in value.items()}
     if not isinstance(value, Sequence):
         raise TypeError(f"Unexpected non-list tensor value {value}")
     if len(value) == 1:
@@ -82,6 +180,85 @@ def tensor_to_value(tensor_pb: aiplatform_types.Tensor) -> Any:
         return value
 
 
+def _shaped_tensor_to_value(
+    tensor_pb: _TensorPb, list_of_fields: list, numpy_arrays: bool
+) -> Union[list, "np.ndarray"]:
+    values = []
+    for descriptor, value in list_of_fields:
+        if descriptor.name not in ("dtype", "shape"):
+            values = value
+            break
+    shape = list(tensor_pb.shape)
+    if numpy_arrays and np is not None:
+        return np.array(
+            values, dtype=_TENSOR_DTYPE_TO_NUMPY_DTYPE.get(tensor_pb.dtype)
+        ).reshape(shape)
+    return _reshape(list(values), shape)
+
+
+def _reshape(values: list, shape: List[int]) -> list:
+    """Reshapes a flat list into nested lists, like numpy.reshape."""
+    for axis in range(len(shape) - 1, 0, -1):
+        size = shape[axis]
+        values = [
+            values[i * size : (i + 1) * size] for i in range(math.prod(shape[:axis]))
+        ]
+    return values
+
+
+def _predict_stream_of_tensor_pb_lists(
+    prediction_service_client: prediction_service.PredictionServiceClient,
+    endpoint_name: str,
+    tensor_list: List[aiplatform_types.Tensor],
+    parameters_tensor: Optional[aiplatform_types.Tensor] = None,
+) -> Iterator[Sequence[_TensorPb]]:
+    """Like `predict_stream_of_tensor_lists_from_single_tensor_list`, but
+    yields the raw `Tensor` messages of the responses."""
+    request = _build_streaming_predict_request(
+        endpoint_name=endpoint_name,
+        tensor_list=tensor_list,
+        parameters_tensor=parameters_tensor,
+    )
+    for response in prediction_service_client.server_streaming_predict(request=request):
+        yield type(response).pb(response).outputs
+
+
+async def _predict_stream_of_tensor_pb_lists_async(
+    prediction_service_async_client: prediction_service.PredictionServiceAsyncClient,
+    endpoint_name: str,
+    tensor_list: List[aiplatform_types.Tensor],
+    parameters_tensor: Optional[aiplatform_types.Tensor] = None,
+) -> AsyncIterator[Sequence[_TensorPb]]:
+    """Like `predict_stream_of_tensor_lists_from_single_tensor_list_async`,
+    but yields the raw `Tensor` messages of the responses."""
+    request = _build_streaming_predict_request(
+        endpoint_name=endpoint_name,
+        tensor_list=tensor_list,
+        parameters_tensor=parameters_tensor,
+    )
+    async for response in await prediction_service_async_client.server_streaming_predict(
+        request=request
+    ):
+        yield type(response).pb(response).outputs
+
+
+def _build_streaming_predict_request(
+    endpoint_name: str,
+    tensor_list: List[aiplatform_types.Tensor],
+    parameters_tensor: Optional[aiplatform_types.Tensor] = None,
+) -> prediction_service_types.StreamingPredictRequest:
+    """Builds the request from the raw messages of the tensors."""
+    request_pb = prediction_service_types.StreamingPredictRequest.pb()(
+        endpoint=endpoint_name
+    )
+    request_pb.inputs.extend(
+        aiplatform_types.Tensor.pb(tensor) for tensor in tensor_list
+    )
+    if parameters_tensor is not None:
+        request_pb.parameters.CopyFrom(aiplatform_types.Tensor.pb(parameters_tensor))
+    return prediction_service_types.StreamingPredictRequest.wrap(request_pb)
+
+
 def predict_stream_of_tensor_lists_from_single_tensor_list(
     prediction_service_client: prediction_service.PredictionServiceClient,
     endpoint_name: str,
@@ -99,13 +276,13 @@ def predict_stream_of_tensor_lists_from_single_tensor_list(
     Yields:
         A generator of model prediction `Tensor` lists.
     """
-    request = prediction_service_types.StreamingPredictRequest(
-        endpoint=endpoint_name,
-        inputs=tensor_list,
-        parameters=parameters_tensor,
-    )
-    for response in prediction_service_client.server_streaming_predict(request=request):
-        yield response.outputs
+    for outputs in _predict_stream_of_tensor_pb_lists(
+        prediction_service_client=prediction_service_client,
+        endpoint_name=endpoint_name,
+        tensor_list=tensor_list,
+        parameters_tensor=parameters_tensor,
+    ):
+        yield [aiplatform_types.Tensor.wrap(output) for output in outputs]
 
 
 async def predict_stream_of_tensor_lists_from_single_tensor_list_async(
@@ -125,15 +302,13 @@ async def predict_stream_of_tensor_lists_from_single_tensor_list_async(
     Yields:
         A generator of model prediction `Tensor` lists.
     """
-    request = prediction_service_types.StreamingPredictRequest(
-        endpoint=endpoint_name,
-        inputs=tensor_list,
-        parameters=parameters_tensor,
-    )
-    async for response in await prediction_service_async_client.server_streaming_predict(
-        request=request
+    async for outputs in _predict_stream_of_tensor_pb_lists_async(
+        prediction_service_async_client=prediction_service_async_client,
+        endpoint_name=endpoint_name,
+        tensor_list=tensor_list,
+        parameters_tensor=parameters_tensor,
     ):
-        yield response.outputs
+        yield [aiplatform_types.Tensor.wrap(output) for output in outputs]
 
 
 def predict_stream_of_dict_lists_from_single_dict_list(
@@ -141,6 +316,8 @@ def predict_stream_of_dict_lists_from_single_dict_list(
     endpoint_name: str,
     dict_list: List[Dict[str, Any]],
     parameters: Optional[Dict[str, Any]] = None,
+    pack_numeric_lists: bool = False,
+    numpy_arrays: bool = False,
 ) -> Iterator[List[Dict[str, Any]]]:
     """Predicts a stream of lists of dicts from a stream of lists of dicts.
 
@@ -149,19 +326,25 @@ def predict_stream_of_dict_lists_from_single_dict_list(
         parameters: Optional. Prediction parameters `dict` form.
         prediction_service_client: A PredictionServiceClient object.
         endpoint_name: Resource name of Endpoint or PublisherModel.
+        pack_numeric_lists: Optional. Whether to pack the numeric lists of
+            the input. See `value_to_tensor`.
+        numpy_arrays: Optional. Whether to convert the tensors of the
+            predictions that have a shape to numpy arrays.
 
     Yields:
         A generator of model prediction dict lists.
     """
-    tensor_list = [value_to_tensor(d) for d in dict_list]
-    parameters_tensor = value_to_tensor(parameters) if parameters else None
-    for tensor_list in predict_stream_of_tensor_lists_from_single_tensor_list(
+    tensor_list = [value_to_tensor(d, pack_numeric_lists) for d in dict_list]
+    parameters_tensor = (
+        value_to_tensor(parameters, pack_numeric_lists) if parameters else None
+    )
+    for tensor_pb_list in _predict_stream_of_tensor_pb_lists(
         prediction_service_client=prediction_service_client,
         endpoint_name=endpoint_name,
         tensor_list=tensor_list,
         parameters_tensor=parameters_tensor,
     ):
-        yield [tensor_to_value(tensor._pb) for tensor in tensor_list]
+        yield [tensor_to_value(tensor_pb, numpy_arrays) for tensor_pb in tensor_pb_list]
 
 
 async def predict_stream_of_dict_lists_from_single_dict_list_async(
@@ -169,6 +352,8 @@ async def predict_stream_of_dict_lists_from_single_dict_list_async(
     endpoint_name: str,
     dict_list: List[Dict[str, Any]],
     parameters: Optional[Dict[str, Any]] = None,
+    pack_numeric_lists: bool = False,
+    numpy_arrays: bool = False,
 ) -> AsyncIterator[List[Dict[str, Any]]]:
     """Asynchronously predicts a stream of lists of dicts from a stream of lists of dicts.
 
@@ -177,19 +362,25 @@ async def predict_stream_of_dict_lists_from_single_dict_list_async(
         parameters: Optional. Prediction parameters `dict` form.
         prediction_service_async_client: A PredictionServiceAsyncClient object.
         endpoint_name: Resource name of Endpoint or PublisherModel.
+        pack_numeric_lists: Optional. Whether to pack the numeric lists of
+            the input. See `value_to_tensor`.
+        numpy_arrays: Optional. Whether to convert the tensors of the
+            predictions that have a shape to numpy arrays.
 
     Yields:
         A generator of model prediction dict lists.
     """
-    tensor_list = [value_to_tensor(d) for d in dict_list]
-    parameters_tensor = value_to_tensor(parameters) if parameters else None
-    async for tensor_list in predict_stream_of_tensor_lists_from_single_tensor_list_async(
+    tensor_list = [value_to_tensor(d, pack_numeric_lists) for d in dict_list]
+    parameters_tensor = (
+        value_to_tensor(parameters, pack_numeric_lists) if parameters else None
+    )
+    async for tensor_pb_list in _predict_stream_of_tensor_pb_lists_async(
         prediction_service_async_client=prediction_service_async_client,
         endpoint_name=endpoint_name,
         tensor_list=tensor_list,
         parameters_tensor=parameters_tensor,
     ):
-        yield [tensor_to_value(tensor._pb) for tensor in tensor_list]
+        yield [tensor_to_value(tensor_pb, numpy_arrays) for tensor_pb in tensor_pb_list]
 
 
 def predict_stream_of_dicts_from_single_dict(
@@ -197,6 +388,8 @@ def predict_stream_of_dicts_from_single_dict(
     endpoint_name: str,
     instance: Dict[str, Any],
     parameters: Optional[Dict[str, Any]] = None,
+    pack_numeric_lists: bool = False,
+    numpy_arrays: bool = False,
 ) -> Iterator[Dict[str, Any]]:
     """Predicts a stream of dicts from a single instance dict.
 
@@ -205,6 +398,10 @@ def predict_stream_of_dicts_from_single_dict(
         parameters: Optional. Prediction parameters `dict`.
         prediction_service_client: A PredictionServiceClient object.
         endpoint_name: Resource name of Endpoint or PublisherModel.
+        pack_numeric_lists: Optional. Whether to pack the numeric lists of
+            the input. See `value_to_tensor`.
+        numpy_arrays: Optional. Whether to convert the tensors of the
+            predictions that have a shape to numpy arrays.
 
     Yields:
         A generator of model prediction dicts.
@@ -214,6 +411,8 @@ def predict_stream_of_dicts_from_single_dict(
         endpoint_name=endpoint_name,
         dict_list=[instance],
         parameters=parameters,
+        pack_numeric_lists=pack_numeric_lists,
+        numpy_arrays=numpy_arrays,
     ):
         if len(dict_list) > 1:
             raise ValueError(
@@ -227,6 +426,8 @@ async def predict_stream_of_dicts_from_single_dict_async(
     endpoint_name: str,
     instance: Dict[str, Any],
     parameters: Optional[Dict[str, Any]] = None,
+    pack_numeric_lists: bool = False,
+    numpy_arrays: bool = False,
 ) -> AsyncIterator[Dict[str, Any]]:
     """Asynchronously predicts a stream of dicts from a single instance dict.
 
@@ -235,6 +436,10 @@ async def predict_stream_of_dicts_from_single_dict_async(
         parameters: Optional. Prediction parameters `dict`.
         prediction_service_async_client: A PredictionServiceAsyncClient object.
         endpoint_name: Resource name of Endpoint or PublisherModel.
+        pack_numeric_lists: Optional. Whether to pack the numeric lists of
+            the input. See `value_to_tensor`.
+        numpy_arrays: Optional. Whether to convert the tensors of the
+            predictions that have a shape to numpy arrays.
 
     Yields:
         A generator of model prediction dicts.
@@ -244,6 +449,8 @@ async def predict_stream_of_dicts_from_single_dict_async(
         endpoint_name=endpoint_name,
         dict_list=[instance],
         parameters=parameters,
+        pack_numeric_lists=pack_numeric_lists,
+        numpy_arrays=numpy_arrays,
     ):
         if len(dict_list) > 1:
             raise ValueError(
@@ -346,31 +346,8 @@ class FutureManager(metaclass=abc.ABCMeta):
             future (Future): Future of the submitted method call.
         """
 
-        def wait_for_dependencies_and_invoke(
-            deps: Sequence[futures.Future],
-            method: Callable[..., Any],
-            args: Sequence[Any],
-            kwargs: Dict[str, Any],
-            internal_callbacks: Iterable[Callable[[Any], Any]],
-        ) -> Any:
-            """Wrapper method to wait on any dependencies before submitting
-            method.
-
-            Args:
-                deps (Sequence[futures.Future]):
-                    Required. Dependent futures to wait on before executing method.
-                    Note: No validation is done on the dependencies.
-                method (Callable): Required. The method to submit.
-                args (Sequence[Any]): Required. The arguments to call the method with.
-                kwargs (Dict[str, Any]):
-                    Required. The keyword arguments to call the method with.
-                internal_callbacks: (Callable[[Any], Any]):
-                    Callbacks that take the result of method.
-            """
-
-            for future in set(deps):
-                future.result()
-
+        def invoke() -> Any:
+            """Calls method and the internal callbacks with its result."""
             result = method(*args, **kwargs)
 
             # call callbacks from within future
@@ -410,13 +387,12 @@ class FutureManager(metaclass=abc.ABCMeta):
             if self.__latest_future:
                 deps.append(self.__latest_future)
 
-            self.__latest_future = initializer.global_pool.submit(
-                wait_for_dependencies_and_invoke,
-                deps=deps,
-                method=method,
-                args=args,
-                kwargs=kwargs,
-                internal_callbacks=internal_callbacks,
+            # The method only takes a thread of the pool once all its
+            # dependencies have completed.
+            self.__latest_future = initializer.global_scheduler.submit(
+                invoke,
+                dependencies=deps,
+                name=f"{self.__class__.__name__}.{method.__name__}",
             )
 
             future = self.__latest_future
@@ -463,8 +439,18 @@ class VertexAiResourceNoun(metaclass=abc.ABCMeta):
 
     Subclass is required to populate private attribute _gca_resource which is the
     service representation of the resource noun.
+
+    Properties reading server-side state, such as `Endpoint.traffic_split` or
+    `_Job.state`, retrieve the resource on every access. Set `max_staleness` on
+    a class, or pass it to `aiplatform.init`, to serve them from the last
+    retrieved resource while it is more recent than `max_staleness`.
     """
 
+    # Upper bound of the age of the resource served by the properties reading
+    # server-side state, either as a timedelta or in seconds. Falls back to
+    # the `max_staleness` of `aiplatform.init` if not set.
+    max_staleness: Optional[Union[float, datetime.timedelta]] = None
+
     @property
     @classmethod
     @abc.abstractmethod
@@ -697,6 +683,98 @@ class VertexAiResourceNoun(metaclass=abc.ABCMeta):
         """Sync GAPIC service representation of client class resource."""
 
         self._gca_resource = self._get_gca_resource(resource_name=self.resource_name)
+        self._gca_resource_sync_time = time.monotonic()
+
+    def refresh(self) -> "VertexAiResourceNoun":
+        """Retrieves the resource, regardless of `max_staleness`.
+
+        Returns:
+            This resource.
+        """
+        self._sync_gca_resource()
+        return self
+
+    def _get_max_staleness(self) -> Optional[float]:
+        """Returns the max staleness of this resource, in seconds."""
+        max_staleness = self.max_staleness
+        if max_staleness is None:
+            max_staleness = initializer.global_config.max_staleness
+        if isinstance(max_staleness, datetime.timedelta):
+            return max_staleness.total_seconds()
+        return max_staleness
+
+    def _sync_gca_resource_if_stale(self):
+        """Syncs the GAPIC resource if it is older than `max_staleness`.
+
+        The resource is always retrieved if `max_staleness` is not set or 0.
+        Otherwise, a resource older than half of `max_staleness` is refreshed
+        in the background, so that readers rarely wait for it. Concurrent
+        readers share a single `get` call.
+        """
+        max_staleness = self._get_max_staleness()
+        if not max_staleness:
+            self._sync_gca_resource()
+            return
+
+        sync_time = getattr(self, "_gca_resource_sync_time", None)
+        age = None if sync_time is None else time.monotonic() - sync_time
+        if age is None or age > max_staleness:
+            self._sync_gca_resource_single_flight().result()
+        elif age > max_staleness / 2:
+            self._sync_gca_resource_single_flight(background=True)
+
+    def _sync_gca_resource_if_cached(self):
+        """Syncs the GAPIC resource if properties may serve a cached one.
+
+        Used by methods that are polled, such as `done`, which must not read
+        a state older than their previous call.
+        """
+        if self._get_max_staleness():
+            self._sync_gca_resource()
+
+    def _sync_gca_resource_single_flight(
+        self, background: bool = False
+    ) -> futures.Future:
+        """Syncs the GAPIC resource, or joins the sync in flight.
+
+        Args:
+            background (bool):
+                Optional. Whether to sync in a thread of the global pool
+                instead of the calling thread.
+
+        Returns:
+            futures.Future: The future of the sync.
+        """
+        lock = self.__dict__.setdefault("_gca_resource_sync_lock", threading.Lock())
+        with lock:
+            future = getattr(self, "_gca_resource_sync_future", None)
+            if future is not None:
+                return future
+            future = self._gca_resource_sync_future = futures.Future()
+
+        def sync():
+            try:
+                self._sync_gca_resource()
+            except Exception as e:  # pylint: disable=broad-except
+                if background:
+                    _LOGGER.warning(f"Failed to refresh {self.__class__.__name__}: {e}")
+                with lock:
+                    self._gca_resource_sync_future = None
+                future.set_exception(e)
+            else:
+                with lock:
+                    self._gca_resource_sync_future = None
+                future.set_result(None)
+
+        if background:
+            try:
+                initializer.global_pool.submit(sync)
+            except RuntimeError:
+                # The pool has been shut down.
+                sync()
+        else:
+            sync()
+        return future
 
     @property
     def name(self) -> str:
@@ -744,7 +822,7 @@ class VertexAiResourceNoun(metaclass=abc.ABCMeta):
     @property
     def update_time(self) -> datetime.datetime:
         """Time this resource was last updated."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._gca_resource.update_time
 
     @property
@@ -1490,6 +1568,7 @@ class VertexAiStatefulResource(VertexAiResourceNounWithFutureManager, StatefulRe
             True if the job has completed.
         """
         if self._gca_resource and self._gca_resource.name:
+            self._sync_gca_resource_if_cached()
             return super().done()
 
         return False
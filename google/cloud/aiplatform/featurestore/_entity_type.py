@@ -15,8 +15,9 @@
 # limitations under the License.
 #
 
+from concurrent import futures
 import datetime
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import uuid
 from google.protobuf import timestamp_pb2
 
@@ -36,6 +37,7 @@ from google.cloud.aiplatform import featurestore
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.utils import featurestore_utils
+from google.cloud.aiplatform.utils import instrumentation
 from google.cloud.aiplatform.utils import resource_manager_utils
 
 from google.cloud import bigquery
@@ -43,6 +45,42 @@ from google.cloud import bigquery
 _LOGGER = base.Logger(__name__)
 _ALL_FEATURE_IDS = "*"
 
+# DataFrames with fewer rows are ingested by ingest_from_df with streaming
+# writes instead of being staged in BigQuery.
+_STREAMING_INGEST_ROW_THRESHOLD = 1000
+
+# Upper bounds of the size of a WriteFeatureValues request. The service
+# accepts up to 100,000 feature values per request.
+_WRITE_FEATURE_VALUES_MAX_PAYLOADS_PER_REQUEST = 100
+_WRITE_FEATURE_VALUES_MAX_VALUES_PER_REQUEST = 100_000
+_WRITE_FEATURE_VALUES_MAX_REQUEST_BYTES = 4 * 1024 * 1024
+
+# Maximum number of WriteFeatureValues requests sent at the same time.
+_WRITE_FEATURE_VALUES_MAX_CONCURRENCY = 8
+
+# Converts the values of a feature to the type expected by its FeatureValue field.
+_FEATURE_VALUE_TYPE_TO_PYTHON_TYPE = {
+    "BOOL": bool,
+    "DOUBLE": float,
+    "INT64": int,
+    "STRING": str,
+    "BYTES": bytes,
+}
+
+_WriteFeatureValuesPayloadPb = (
+    gca_featurestore_online_service.WriteFeatureValuesPayload.pb()
+)
+
+# Maps the pandas inferred type of a DataFrame column to the FeatureValue field
+# of its values, for the types converted without inspecting each value.
+_INFERRED_DTYPE_TO_FEATURE_VALUE_FIELD = {
+    "boolean": "bool_value",
+    "bytes": "bytes_value",
+    "floating": "double_value",
+    "integer": "int64_value",
+    "string": "string_value",
+}
+
 
 class _EntityType(base.VertexAiResourceNounWithFutureManager):
     """Private managed EntityType resource for Vertex AI."""
@@ -1208,13 +1246,18 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
         entity_id_field: Optional[str] = None,
         request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
         ingest_request_timeout: Optional[float] = None,
+        streaming_row_threshold: int = _STREAMING_INGEST_ROW_THRESHOLD,
     ) -> "_EntityType":
         """Ingest feature values from DataFrame.
 
         Note:
-            Calling this method will automatically create and delete a temporary
-            bigquery dataset in the same GCP project, which will be used
-            as the intermediary storage for ingesting feature values
+            If the DataFrame has fewer rows than `streaming_row_threshold`,
+            the feature values are written with concurrent streaming writes,
+            see `write_feature_values`.
+
+            Otherwise, calling this method will automatically create and delete
+            a temporary bigquery dataset in the same GCP project, which will be
+            used as the intermediary storage for ingesting feature values
             from dataframe to featurestore.
 
             The call will return upon ingestion completes, where the
@@ -1270,6 +1313,11 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                 Optional. Strings which should be sent along with the request as metadata.
             ingest_request_timeout (float):
                 Optional. The timeout for the ingest request in seconds.
+                For streaming writes, the timeout of each write request.
+            streaming_row_threshold (int):
+                Optional. DataFrames with fewer rows are written with streaming
+                writes instead of being staged in BigQuery. Set to 0 to always
+                stage the DataFrame in BigQuery.
 
         Returns:
             EntityType - The entityType resource object with feature values imported.
@@ -1277,6 +1325,25 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
         """
         import pandas.api.types as pd_types
 
+        self.wait()
+
+        feature_source_fields = feature_source_fields or {}
+        feature_value_types = self._get_feature_value_types(feature_ids)
+
+        if len(df_source) < streaming_row_threshold:
+            payloads = self._generate_payloads_from_df(
+                df_source=df_source,
+                feature_value_types=feature_value_types,
+                feature_time=feature_time,
+                feature_source_fields=feature_source_fields,
+                entity_id_field=entity_id_field,
+            )
+            return self._write_payloads(
+                payloads=payloads,
+                request_metadata=request_metadata,
+                request_timeout=ingest_request_timeout,
+            )
+
         try:
             import pyarrow  # noqa: F401 - skip check for 'pyarrow' which is required when using 'google.cloud.bigquery'
         except ImportError:
@@ -1299,15 +1366,11 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             project=self.project, credentials=self.credentials
         )
 
-        self.wait()
-
-        feature_source_fields = feature_source_fields or {}
         bq_schema = []
         for feature_id in feature_ids:
             feature_field_name = feature_source_fields.get(feature_id, feature_id)
-            feature_value_type = self.get_feature(feature_id).to_dict()["valueType"]
             bq_schema_field = self._get_bq_schema_field(
-                feature_field_name, feature_value_type
+                feature_field_name, feature_value_types[feature_id]
             )
             bq_schema.append(bq_schema_field)
 
@@ -1369,6 +1432,399 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
 
         return entity_type_obj
 
+    def _get_feature_value_types(self, feature_ids: List[str]) -> Dict[str, str]:
+        """Gets the value types of Features of this EntityType.
+
+        The Features are listed with a single request.
+
+        Args:
+            feature_ids (List[str]):
+                Required. IDs of the Features.
+
+        Returns:
+            Dict[str, str]: The value type of each Feature, for example `INT64`.
+
+        Raises:
+            ValueError: If a Feature does not exist in this EntityType.
+        """
+        value_types = {
+            feature.name: feature.to_dict()["valueType"]
+            for feature in self.list_features()
+        }
+        missing_feature_ids = [
+            feature_id for feature_id in feature_ids if feature_id not in value_types
+        ]
+        if missing_feature_ids:
+            raise ValueError(
+                f"Features {missing_feature_ids} do not exist in EntityType "
+                f"{self.resource_name}."
+            )
+        return {feature_id: value_types[feature_id] for feature_id in feature_ids}
+
+    @classmethod
+    def _generate_payloads_from_df(
+        cls,
+        df_source: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        feature_value_types: Dict[str, str],
+        feature_time: Union[str, datetime.datetime],
+        feature_source_fields: Dict[str, str],
+        entity_id_field: Optional[str] = None,
+    ) -> List[_WriteFeatureValuesPayloadPb]:
+        """Generates raw WriteFeatureValuesPayload messages from the columns of
+        a DataFrame, using the value types of the Features.
+
+        Each column is converted at once to the type of its Feature. Missing
+        values are not written, nor are rows without any value.
+
+        Args:
+            df_source (pd.DataFrame):
+                Required. Pandas DataFrame containing the source data.
+            feature_value_types (Dict[str, str]):
+                Required. The value type of each Feature to write.
+            feature_time (Union[str, datetime.datetime]):
+                Required. The source column that holds the Feature timestamps,
+                or a single Feature timestamp for all entities.
+            feature_source_fields (Dict[str, str]):
+                Required. Maps Feature IDs to their source column, if it is not
+                the Feature ID.
+            entity_id_field (str):
+                Optional. Source column that holds entity IDs. Defaults to
+                ``entity_id``.
+
+        Returns:
+            List[WriteFeatureValuesPayload] - A raw payload message for each
+            row of the DataFrame with values.
+        """
+        import pandas as pd
+
+        entity_ids = [
+            str(entity_id)
+            for entity_id in df_source[entity_id_field or "entity_id"].tolist()
+        ]
+        if cls._is_timestamp(feature_time):
+            generate_times = cls._get_generate_time_pbs(feature_time, len(entity_ids))
+        else:
+            generate_times = cls._get_generate_time_pbs(
+                pd.to_datetime(df_source[feature_time]), len(entity_ids)
+            )
+
+        payloads = cls._new_payload_pbs(entity_ids)
+        for feature_id, value_type in feature_value_types.items():
+            column = df_source[feature_source_fields.get(feature_id, feature_id)]
+            cls._set_feature_values(
+                payloads=payloads,
+                feature_id=feature_id,
+                values=cls._convert_column_values(column, value_type),
+                field_name=featurestore_utils.FEATURE_STORE_VALUE_TYPE_TO_FEATURE_VALUE_FIELD_MAP[
+                    value_type
+                ],
+                generate_times=generate_times,
+            )
+        return [payload for payload in payloads if payload.feature_values]
+
+    @classmethod
+    def _generate_payloads_from_df_index(
+        cls,
+        df: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        feature_time: Union[str, datetime.datetime] = None,
+    ) -> List[_WriteFeatureValuesPayloadPb]:
+        """Generates raw WriteFeatureValuesPayload messages from a DataFrame
+        indexed by entity ID, using the dtypes of its columns.
+
+        This is the column-wise equivalent of `_generate_payloads` on
+        `df.to_dict(orient="index")`. Columns whose values all have the same
+        supported type are converted at once, other columns value by value.
+
+        Args:
+            df (pd.DataFrame):
+                Required. The DataFrame. Its index holds the entity IDs and
+                each column holds the values of a Feature.
+            feature_time (Union[str, datetime.datetime]):
+                Optional. Either the column which holds the Feature timestamps,
+                or a timestamp to apply to all values.
+
+        Returns:
+            List[WriteFeatureValuesPayload] - A raw payload message for each
+            row of the DataFrame.
+
+        Raises:
+            ValueError: If the index of the DataFrame is not unique, or if a
+                value type is not supported.
+        """
+        import pandas.api.types as pd_types
+
+        if not df.index.is_unique:
+            raise ValueError("DataFrame index must be unique.")
+
+        entity_ids = df.index.tolist()
+        if cls._is_timestamp(feature_time):
+            generate_times = cls._get_generate_time_pbs(feature_time, len(entity_ids))
+        elif feature_time is not None and feature_time in df.columns:
+            generate_times = cls._get_generate_time_pbs(
+                df[feature_time], len(entity_ids)
+            )
+        else:
+            generate_times = None
+
+        payloads = cls._new_payload_pbs(entity_ids)
+        for feature_id in df.columns:
+            if feature_id == feature_time:
+                continue
+            column = df[feature_id]
+            cls._set_feature_values(
+                payloads=payloads,
+                feature_id=feature_id,
+                values=column.tolist(),
+                field_name=_INFERRED_DTYPE_TO_FEATURE_VALUE_FIELD.get(
+                    pd_types.infer_dtype(column, skipna=False)
+                ),
+                generate_times=generate_times,
+            )
+        return payloads
+
+    @staticmethod
+    def _new_payload_pbs(
+        entity_ids: List[str],
+    ) -> List[_WriteFeatureValuesPayloadPb]:
+        """Creates empty raw WriteFeatureValuesPayload messages."""
+        return [
+            _WriteFeatureValuesPayloadPb(entity_id=entity_id)
+            for entity_id in entity_ids
+        ]
+
+    @classmethod
+    def _get_generate_time_pbs(
+        cls,
+        feature_time: Union[
+            datetime.datetime, timestamp_pb2.Timestamp, "pd.Series"
+        ],  # noqa: F821 - skip check for undefined name 'pd'
+        row_count: int,
+    ) -> List[Optional[timestamp_pb2.Timestamp]]:
+        """Converts Feature timestamps to Timestamp messages.
+
+        Datetimes are converted like proto-plus does.
+
+        Args:
+            feature_time (Union[datetime.datetime, timestamp_pb2.Timestamp, pd.Series]):
+                Required. A timestamp for all rows, or a column of timestamps.
+            row_count (int):
+                Required. The number of rows.
+
+        Returns:
+            List[Optional[timestamp_pb2.Timestamp]]: The timestamp of each row,
+            None if the row has no valid timestamp.
+        """
+        import numpy as np
+        import pandas as pd
+        import pandas.api.types as pd_types
+
+        def to_timestamp_pb(value) -> Optional[timestamp_pb2.Timestamp]:
+            if isinstance(value, timestamp_pb2.Timestamp):
+                return value
+            if isinstance(value, datetime.datetime) and value is not pd.NaT:
+                return timestamp_pb2.Timestamp(
+                    seconds=int(value.timestamp()), nanos=value.microsecond * 1000
+                )
+            return None
+
+        if cls._is_timestamp(feature_time):
+            return [to_timestamp_pb(feature_time)] * row_count
+
+        if not pd_types.is_datetime64_any_dtype(feature_time):
+            return [to_timestamp_pb(value) for value in feature_time.tolist()]
+
+        if getattr(feature_time.dt, "tz", None) is not None:
+            feature_time = feature_time.dt.tz_convert("UTC").dt.tz_localize(None)
+        epoch_nanos = feature_time.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+        seconds, nanos = np.divmod(epoch_nanos, 1_000_000_000)
+        # Truncated to microseconds, the precision of Python datetimes.
+        nanos -= nanos % 1000
+        return [
+            None if missing else timestamp_pb2.Timestamp(seconds=second, nanos=nano)
+            for second, nano, missing in zip(
+                seconds.tolist(), nanos.tolist(), feature_time.isna().tolist()
+            )
+        ]
+
+    @classmethod
+    def _set_feature_values(
+        cls,
+        payloads: List[_WriteFeatureValuesPayloadPb],
+        feature_id: str,
+        values: List[Any],
+        field_name: Optional[str],
+        generate_times: Optional[List[Optional[timestamp_pb2.Timestamp]]],
+    ) -> None:
+        """Sets the values of a Feature in raw payload messages.
+
+        Args:
+            payloads (List[WriteFeatureValuesPayload]):
+                Required. The raw payload messages, one for each row.
+            feature_id (str):
+                Required. The ID of the Feature.
+            values (List[Any]):
+                Required. The value of each row. None values are not set when
+                `field_name` is set.
+            field_name (str):
+                Optional. The FeatureValue field holding the values. If not
+                set, the field is inferred from each value.
+            generate_times (List[Optional[timestamp_pb2.Timestamp]]):
+                Optional. The generate time of each row.
+        """
+        is_array = field_name is not None and field_name.endswith("_array_value")
+        for index, (payload, value) in enumerate(zip(payloads, values)):
+            if field_name is None:
+                feature_value = payload.feature_values[feature_id]
+                feature_value.CopyFrom(
+                    cls._convert_value_to_gapic_feature_value(
+                        feature_id=feature_id, value=value
+                    )._pb
+                )
+            elif value is None:
+                continue
+            else:
+                feature_value = payload.feature_values[feature_id]
+                if is_array:
+                    getattr(feature_value, field_name).values.extend(value)
+                else:
+                    setattr(feature_value, field_name, value)
+            if generate_times is not None and generate_times[index] is not None:
+                feature_value.metadata.generate_time.CopyFrom(generate_times[index])
+
+    @staticmethod
+    def _convert_column_values(
+        column: "pd.Series",  # noqa: F821 - skip check for undefined name 'pd'
+        value_type: str,
+    ) -> List[Any]:
+        """Converts the values of a DataFrame column to the Python type of a
+        Feature value type.
+
+        Args:
+            column (pd.Series):
+                Required. The column.
+            value_type (str):
+                Required. The Feature value type, for example `INT64_ARRAY`.
+
+        Returns:
+            List[Any]: The converted values, None for missing values. Array
+            values are converted to lists.
+        """
+        values = column.tolist()
+        is_present = column.notna().tolist()
+
+        if value_type.endswith("_ARRAY"):
+            item_type = _FEATURE_VALUE_TYPE_TO_PYTHON_TYPE[value_type[: -len("_ARRAY")]]
+            return [
+                [
+                    item_type(item)
+                    for item in (value.tolist() if hasattr(value, "tolist") else value)
+                ]
+                if present
+                else None
+                for value, present in zip(values, is_present)
+            ]
+
+        python_type = _FEATURE_VALUE_TYPE_TO_PYTHON_TYPE[value_type]
+        return [
+            python_type(value) if present else None
+            for value, present in zip(values, is_present)
+        ]
+
+    @staticmethod
+    def _split_payloads(
+        payloads: List[_WriteFeatureValuesPayloadPb],
+    ) -> List[List[_WriteFeatureValuesPayloadPb]]:
+        """Splits raw payload messages into batches that fit in a request.
+
+        A batch is bounded in number of payloads, number of feature values and
+        serialized size. A payload exceeding a bound on its own gets its own
+        batch.
+
+        Args:
+            payloads (List[WriteFeatureValuesPayload]):
+                Required. The raw payload messages.
+
+        Returns:
+            List[List[WriteFeatureValuesPayload]]: The batches of payloads.
+        """
+        batches = []
+        batch = []
+        batch_value_count = 0
+        batch_byte_size = 0
+        for payload in payloads:
+            value_count = len(payload.feature_values)
+            byte_size = payload.ByteSize()
+            if batch and (
+                len(batch) >= _WRITE_FEATURE_VALUES_MAX_PAYLOADS_PER_REQUEST
+                or batch_value_count + value_count
+                > _WRITE_FEATURE_VALUES_MAX_VALUES_PER_REQUEST
+                or batch_byte_size + byte_size > _WRITE_FEATURE_VALUES_MAX_REQUEST_BYTES
+            ):
+                batches.append(batch)
+                batch = []
+                batch_value_count = 0
+                batch_byte_size = 0
+            batch.append(payload)
+            batch_value_count += value_count
+            batch_byte_size += byte_size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _write_payloads(
+        self,
+        payloads: List[_WriteFeatureValuesPayloadPb],
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        request_timeout: Optional[float] = None,
+    ) -> "_EntityType":
+        """Writes raw payload messages with concurrent WriteFeatureValues
+        requests.
+
+        Args:
+            payloads (List[WriteFeatureValuesPayload]):
+                Required. The raw payload messages to write.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the requests
+                as metadata.
+            request_timeout (float):
+                Optional. The timeout of each request in seconds.
+
+        Returns:
+            EntityType - The entityType resource object with feature values written.
+        """
+        request_class = gca_featurestore_online_service.WriteFeatureValuesRequest
+        requests = []
+        for batch in self._split_payloads(payloads):
+            request = request_class.pb()(entity_type=self.resource_name)
+            request.payloads.extend(batch)
+            requests.append(request_class.wrap(request))
+
+        _LOGGER.log_action_start_against_resource(
+            "Writing",
+            "feature values",
+            self,
+        )
+
+        if requests:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(_WRITE_FEATURE_VALUES_MAX_CONCURRENCY, len(requests))
+            ) as executor:
+                write_futures = [
+                    executor.submit(
+                        self._featurestore_online_client.write_feature_values,
+                        request=request,
+                        metadata=request_metadata,
+                        timeout=request_timeout,
+                    )
+                    for request in requests
+                ]
+                for write_future in write_futures:
+                    write_future.result()
+
+        _LOGGER.log_action_completed_against_resource("feature values", "written", self)
+
+        return self
+
     @staticmethod
     def _get_bq_schema_field(
         name: str, feature_value_type: str
@@ -1419,6 +1875,7 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             location_override=location,
         )
 
+    @instrumentation.recorded("EntityType.read")
     def read(
         self,
         entity_ids: Union[str, List[str]],
@@ -1459,13 +1916,14 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                     feature_selector=feature_selector,
                 )
             )
-            read_feature_values_response = (
-                self._featurestore_online_client.read_feature_values(
-                    request=read_feature_values_request,
-                    metadata=request_metadata,
-                    timeout=read_request_timeout,
+            with instrumentation.phase("rpc"):
+                read_feature_values_response = (
+                    self._featurestore_online_client.read_feature_values(
+                        request=read_feature_values_request,
+                        metadata=request_metadata,
+                        timeout=read_request_timeout,
+                    )
                 )
-            )
             header = read_feature_values_response.header
             entity_views = [read_feature_values_response.entity_view]
         elif isinstance(entity_ids, list):
@@ -1476,27 +1934,31 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                     feature_selector=feature_selector,
                 )
             )
-            streaming_read_feature_values_responses = list(
-                self._featurestore_online_client.streaming_read_feature_values(
-                    request=streaming_read_feature_values_request,
-                    metadata=request_metadata,
-                    timeout=read_request_timeout,
+            with instrumentation.phase("rpc"):
+                streaming_read_feature_values_responses = list(
+                    self._featurestore_online_client.streaming_read_feature_values(
+                        request=streaming_read_feature_values_request,
+                        metadata=request_metadata,
+                        timeout=read_request_timeout,
+                    )
                 )
-            )
+            instrumentation.set_response(streaming_read_feature_values_responses)
             header = streaming_read_feature_values_responses[0].header
             entity_views = [
                 response.entity_view
                 for response in streaming_read_feature_values_responses[1:]
             ]
 
-        feature_ids = [
-            feature_descriptor.id for feature_descriptor in header.feature_descriptors
-        ]
+        with instrumentation.phase("convert_response"):
+            feature_ids = [
+                feature_descriptor.id
+                for feature_descriptor in header.feature_descriptors
+            ]
 
-        return self._construct_dataframe(
-            feature_ids=feature_ids,
-            entity_views=entity_views,
-        )
+            return self._construct_dataframe(
+                feature_ids=feature_ids,
+                entity_views=entity_views,
+            )
 
     @staticmethod
     def _construct_dataframe(
@@ -1696,8 +2158,9 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                 or a pandas Dataframe, where the index column holds the unique entity
                 ID strings and each remaining column represents a feature.  Each row
                 in the pandas Dataframe represents an entity, which has an entity ID
-                and its associated feature values. Currently, a single payload can be
-                written in a single request.
+                and its associated feature values. DataFrames are converted column
+                by column. The payloads are split into size-bounded requests,
+                which are sent concurrently.
             feature_time Union[str, datetime.datetime]:
                 Optional. Either column name in DataFrame or Dict which contains timestamp value,
                 or datetime to apply to the entire DataFrame or Dict.
@@ -1708,31 +2171,27 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
         Returns:
             EntityType - The updated EntityType object.
         """
+        payload_class = gca_featurestore_online_service.WriteFeatureValuesPayload
         if isinstance(instances, Dict):
-            payloads = self._generate_payloads(
-                instances=instances, feature_time=feature_time
-            )
+            payloads = [
+                payload._pb
+                for payload in self._generate_payloads(
+                    instances=instances, feature_time=feature_time
+                )
+            ]
         elif isinstance(instances, List):
-            payloads = instances
+            payloads = [
+                payload
+                if isinstance(payload, _WriteFeatureValuesPayloadPb)
+                else payload_class.pb(payload)
+                for payload in instances
+            ]
         else:
-            instances_dict = instances.to_dict(orient="index")
-            payloads = self._generate_payloads(
-                instances=instances_dict, feature_time=feature_time
+            payloads = self._generate_payloads_from_df_index(
+                df=instances, feature_time=feature_time
             )
 
-        _LOGGER.log_action_start_against_resource(
-            "Writing",
-            "feature values",
-            self,
-        )
-
-        self._featurestore_online_client.write_feature_values(
-            entity_type=self.resource_name, payloads=payloads
-        )
-
-        _LOGGER.log_action_completed_against_resource("feature values", "written", self)
-
-        return self
+        return self._write_payloads(payloads=payloads)
 
     @classmethod
     def _generate_payloads(
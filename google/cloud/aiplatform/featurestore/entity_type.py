@@ -17,10 +17,14 @@
 
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform.featurestore import _entity_type
-from google.cloud.aiplatform.preview.featurestore import entity_type
 
 
 class EntityType(_entity_type._EntityType, base.PreviewMixin):
     """Public managed EntityType resource for Vertex AI."""
 
-    _preview_class = entity_type.EntityType
+    @property
+    def _preview_class(self):
+        # Imported on use, since the preview module imports this package.
+        from google.cloud.aiplatform.preview.featurestore import entity_type
+
+        return entity_type.EntityType
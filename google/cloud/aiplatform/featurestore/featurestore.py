@@ -15,7 +15,17 @@
 # limitations under the License.
 #
 
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+import contextlib
+import functools
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 import uuid
 
 from google.auth import credentials as auth_credentials
@@ -33,6 +43,7 @@ from google.cloud.aiplatform import featurestore
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.utils import (
+    concurrent_utils,
     featurestore_utils,
     resource_manager_utils,
 )
@@ -41,6 +52,13 @@ from google.cloud import bigquery
 
 _LOGGER = base.Logger(__name__)
 
+# Default maximum number of BigQuery Storage read streams read at the same time
+# by the Arrow batch serves.
+_BATCH_SERVE_MAX_CONCURRENT_STREAMS = 8
+
+# Maximum number of read batches buffered for each concurrent stream.
+_BATCH_SERVE_BUFFERED_BATCHES_PER_STREAM = 2
+
 
 class Featurestore(base.VertexAiResourceNounWithFutureManager):
     """Managed featurestore resource for Vertex AI."""
@@ -1119,6 +1137,8 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
         request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
         serve_request_timeout: Optional[float] = None,
         bq_dataset_id: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        max_concurrent_streams: int = _BATCH_SERVE_MAX_CONCURRENT_STREAMS,
     ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
         """Batch serves feature values to pandas DataFrame
 
@@ -1213,34 +1233,325 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
                 Optional. Excludes Feature values with feature generation timestamp before this timestamp. If not set, retrieve
                 oldest values kept in Feature Store. Timestamp, if present, must not have higher than millisecond precision.
 
+            columns (List[str]):
+                Optional. The output columns to read. Only these columns are
+                transferred from BigQuery. All columns are read if not set.
+
+            max_concurrent_streams (int):
+                Optional. The maximum number of BigQuery Storage read streams
+                read at the same time.
+
         Returns:
             pd.DataFrame: The pandas DataFrame containing feature values from batch serving.
 
         """
         try:
-            from google.cloud import bigquery_storage
+            import pandas as pd
         except ImportError:
             raise ImportError(
-                f"Google-Cloud-Bigquery-Storage is not installed. Please install google-cloud-bigquery-storage to use "
+                f"Pandas is not installed. Please install pandas to use "
                 f"{self.batch_serve_to_df.__name__}"
             )
 
+        table = self._batch_serve_to_arrow_table(
+            method_name=self.batch_serve_to_df.__name__,
+            serving_feature_ids=serving_feature_ids,
+            read_instances_df=read_instances_df,
+            pass_through_fields=pass_through_fields,
+            feature_destination_fields=feature_destination_fields,
+            start_time=start_time,
+            request_metadata=request_metadata,
+            serve_request_timeout=serve_request_timeout,
+            bq_dataset_id=bq_dataset_id,
+            columns=columns,
+            max_concurrent_streams=max_concurrent_streams,
+        )
+        if not table.num_columns:
+            return pd.DataFrame()
+        # Releases the Arrow buffers as the columns are converted, so that the
+        # result is not held twice in memory.
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
+    def batch_serve_to_arrow(
+        self,
+        serving_feature_ids: Dict[str, List[str]],
+        read_instances_df: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        pass_through_fields: Optional[List[str]] = None,
+        feature_destination_fields: Optional[Dict[str, str]] = None,
+        start_time: Optional[timestamp_pb2.Timestamp] = None,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        serve_request_timeout: Optional[float] = None,
+        bq_dataset_id: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        max_concurrent_streams: int = _BATCH_SERVE_MAX_CONCURRENT_STREAMS,
+    ) -> "pyarrow.Table":  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Batch serves feature values to a pyarrow Table.
+
+        The BigQuery Storage read streams of the served feature values are read
+        concurrently. The rows are not in a particular order.
+
+        Note:
+            Calling this method will automatically create and delete a temporary
+            bigquery dataset in the same GCP project, which will be used
+            as the intermediary storage for batch serve feature values
+            from featurestore to the table.
+
+        Args:
+            serving_feature_ids (Dict[str, List[str]]):
+                Required. A user defined dictionary to define the entity_types
+                and their features for batch serve/read. See `batch_serve_to_df`.
+            read_instances_df (pd.DataFrame):
+                Required. A pandas DataFrame containing the read instances. See
+                `batch_serve_to_df`.
+            pass_through_fields (List[str]):
+                Optional. Fields of the read instances joined as-is in the
+                output.
+            feature_destination_fields (Dict[str, str]):
+                Optional. Maps a feature's fully qualified resource name to its
+                destination field name.
+            start_time (timestamp_pb2.Timestamp):
+                Optional. Excludes Feature values with feature generation
+                timestamp before this timestamp.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the serve
+                request as metadata.
+            serve_request_timeout (float):
+                Optional. The timeout for the serve request in seconds.
+            bq_dataset_id (str):
+                Optional. The full dataset ID for the BigQuery dataset to use
+                for temporarily staging data.
+            columns (List[str]):
+                Optional. The output columns to read. Only these columns are
+                transferred from BigQuery. All columns are read if not set.
+            max_concurrent_streams (int):
+                Optional. The maximum number of BigQuery Storage read streams
+                read at the same time.
+
+        Returns:
+            pyarrow.Table: The table containing feature values from batch serving.
+        """
+        return self._batch_serve_to_arrow_table(
+            method_name=self.batch_serve_to_arrow.__name__,
+            serving_feature_ids=serving_feature_ids,
+            read_instances_df=read_instances_df,
+            pass_through_fields=pass_through_fields,
+            feature_destination_fields=feature_destination_fields,
+            start_time=start_time,
+            request_metadata=request_metadata,
+            serve_request_timeout=serve_request_timeout,
+            bq_dataset_id=bq_dataset_id,
+            columns=columns,
+            max_concurrent_streams=max_concurrent_streams,
+        )
+
+    def batch_serve_to_arrow_batches(
+        self,
+        serving_feature_ids: Dict[str, List[str]],
+        read_instances_df: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        pass_through_fields: Optional[List[str]] = None,
+        feature_destination_fields: Optional[Dict[str, str]] = None,
+        start_time: Optional[timestamp_pb2.Timestamp] = None,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        serve_request_timeout: Optional[float] = None,
+        bq_dataset_id: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        max_concurrent_streams: int = _BATCH_SERVE_MAX_CONCURRENT_STREAMS,
+    ) -> Iterator[
+        "pyarrow.RecordBatch"
+    ]:  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Batch serves feature values as an iterator of pyarrow RecordBatches.
+
+        The batches are yielded as they are read, so the feature values are
+        never all held in memory. The BigQuery Storage read streams are read
+        concurrently and the batches are not in a particular order.
+
+        The batch serve starts when the iteration starts. The temporary
+        BigQuery resources are deleted when the iterator is exhausted or
+        closed.
+
+        Example Usage:
+
+            batches = my_featurestore.batch_serve_to_arrow_batches(
+                serving_feature_ids=serving_feature_ids,
+                read_instances_df=read_instances_df,
+            )
+            with contextlib.closing(batches):
+                for batch in batches:
+                    ...
+
+        Args:
+            serving_feature_ids (Dict[str, List[str]]):
+                Required. A user defined dictionary to define the entity_types
+                and their features for batch serve/read. See `batch_serve_to_df`.
+            read_instances_df (pd.DataFrame):
+                Required. A pandas DataFrame containing the read instances. See
+                `batch_serve_to_df`.
+            pass_through_fields (List[str]):
+                Optional. Fields of the read instances joined as-is in the
+                output.
+            feature_destination_fields (Dict[str, str]):
+                Optional. Maps a feature's fully qualified resource name to its
+                destination field name.
+            start_time (timestamp_pb2.Timestamp):
+                Optional. Excludes Feature values with feature generation
+                timestamp before this timestamp.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the serve
+                request as metadata.
+            serve_request_timeout (float):
+                Optional. The timeout for the serve request in seconds.
+            bq_dataset_id (str):
+                Optional. The full dataset ID for the BigQuery dataset to use
+                for temporarily staging data.
+            columns (List[str]):
+                Optional. The output columns to read. Only these columns are
+                transferred from BigQuery. All columns are read if not set.
+            max_concurrent_streams (int):
+                Optional. The maximum number of BigQuery Storage read streams
+                read at the same time.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]: The batches of feature values.
+        """
+        # Validated before the iteration starts, so that errors are raised here.
+        self._validate_batch_serve_to_arrow_args(
+            self.batch_serve_to_arrow_batches.__name__, max_concurrent_streams
+        )
+
+        return self._batch_serve_to_arrow_batches(
+            serving_feature_ids=serving_feature_ids,
+            read_instances_df=read_instances_df,
+            pass_through_fields=pass_through_fields,
+            feature_destination_fields=feature_destination_fields,
+            start_time=start_time,
+            request_metadata=request_metadata,
+            serve_request_timeout=serve_request_timeout,
+            bq_dataset_id=bq_dataset_id,
+            columns=columns,
+            max_concurrent_streams=max_concurrent_streams,
+        )
+
+    def _validate_batch_serve_to_arrow_args(
+        self, method_name: str, max_concurrent_streams: int
+    ):
+        """Validates the dependencies and arguments of the Arrow batch serves.
+
+        Args:
+            method_name (str):
+                Required. The name of the method reported in the errors.
+            max_concurrent_streams (int):
+                Required. The maximum number of streams read at the same time.
+
+        Raises:
+            ImportError: If google-cloud-bigquery-storage or pyarrow is not
+                installed.
+            ValueError: If `max_concurrent_streams` is less than 1.
+        """
         try:
-            import pyarrow  # noqa: F401 - skip check for 'pyarrow' which is required when using 'google.cloud.bigquery'
+            from google.cloud import bigquery_storage  # noqa: F401
         except ImportError:
             raise ImportError(
-                f"Pyarrow is not installed. Please install pyarrow to use "
-                f"{self.batch_serve_to_df.__name__}"
+                f"Google-Cloud-Bigquery-Storage is not installed. Please install google-cloud-bigquery-storage to use "
+                f"{method_name}"
             )
 
         try:
-            import pandas as pd
+            import pyarrow  # noqa: F401 - skip check for 'pyarrow' which is required when using 'google.cloud.bigquery'
         except ImportError:
             raise ImportError(
-                f"Pandas is not installed. Please install pandas to use "
-                f"{self.batch_serve_to_df.__name__}"
+                f"Pyarrow is not installed. Please install pyarrow to use "
+                f"{method_name}"
+            )
+
+        if max_concurrent_streams < 1:
+            raise ValueError(
+                f"`max_concurrent_streams` must be at least 1, got {max_concurrent_streams}."
+            )
+
+    def _batch_serve_to_arrow_table(
+        self, method_name: str, **kwargs
+    ) -> "pyarrow.Table":  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Batch serves feature values to a pyarrow Table.
+
+        Args:
+            method_name (str):
+                Required. The name of the public method, reported in errors.
+            **kwargs:
+                Arguments of `_batch_serve_to_arrow_batches`.
+
+        Returns:
+            pyarrow.Table: The table, without columns if no rows were read.
+        """
+        self._validate_batch_serve_to_arrow_args(
+            method_name, kwargs["max_concurrent_streams"]
+        )
+
+        import pyarrow
+
+        batches = list(self._batch_serve_to_arrow_batches(**kwargs))
+        if not batches:
+            return pyarrow.table({})
+        return pyarrow.Table.from_batches(batches)
+
+    def _batch_serve_to_arrow_batches(
+        self,
+        serving_feature_ids: Dict[str, List[str]],
+        read_instances_df: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        pass_through_fields: Optional[List[str]],
+        feature_destination_fields: Optional[Dict[str, str]],
+        start_time: Optional[timestamp_pb2.Timestamp],
+        request_metadata: Optional[Sequence[Tuple[str, str]]],
+        serve_request_timeout: Optional[float],
+        bq_dataset_id: Optional[str],
+        columns: Optional[List[str]],
+        max_concurrent_streams: int,
+    ) -> Iterator[
+        "pyarrow.RecordBatch"
+    ]:  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Batch serves feature values to a temporary BigQuery table and
+        yields its rows as pyarrow RecordBatches.
+
+        The temporary BigQuery resources are deleted when the generator is
+        exhausted or closed.
+        """
+        with self._batch_serve_to_temp_bq_table(
+            serving_feature_ids=serving_feature_ids,
+            read_instances_df=read_instances_df,
+            pass_through_fields=pass_through_fields,
+            feature_destination_fields=feature_destination_fields,
+            start_time=start_time,
+            request_metadata=request_metadata,
+            serve_request_timeout=serve_request_timeout,
+            bq_dataset_id=bq_dataset_id,
+        ) as bq_table_path:
+            yield from self._read_bq_table_as_arrow_batches(
+                bq_table_path=bq_table_path,
+                columns=columns,
+                max_concurrent_streams=max_concurrent_streams,
             )
 
+    @contextlib.contextmanager
+    def _batch_serve_to_temp_bq_table(
+        self,
+        serving_feature_ids: Dict[str, List[str]],
+        read_instances_df: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        pass_through_fields: Optional[List[str]],
+        feature_destination_fields: Optional[Dict[str, str]],
+        start_time: Optional[timestamp_pb2.Timestamp],
+        request_metadata: Optional[Sequence[Tuple[str, str]]],
+        serve_request_timeout: Optional[float],
+        bq_dataset_id: Optional[str],
+    ) -> Iterator[str]:
+        """Batch serves feature values to a temporary BigQuery table.
+
+        The read instances are staged in a temporary table as well. If
+        `bq_dataset_id` is not set, both tables are created in an ephemeral
+        dataset. The temporary resources are deleted on exit.
+
+        Yields:
+            str: The path of the table with the served feature values, in the
+            format used by the BigQuery Storage API.
+        """
         bigquery_client = bigquery.Client(
             project=self.project, credentials=self.credentials
         )
@@ -1298,26 +1609,11 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
                 start_time=start_time,
             )
 
-            bigquery_storage_read_client = bigquery_storage.BigQueryReadClient(
-                credentials=self.credentials
+            yield "projects/{project}/datasets/{dataset}/tables/{table}".format(
+                project=self.project,
+                dataset=temp_bq_dataset.dataset_id,
+                table=temp_bq_batch_serve_table_name,
             )
-            read_session_proto = bigquery_storage_read_client.create_read_session(
-                parent=f"projects/{self.project}",
-                read_session=bigquery_storage.types.ReadSession(
-                    table="projects/{project}/datasets/{dataset}/tables/{table}".format(
-                        project=self.project,
-                        dataset=temp_bq_dataset.dataset_id,
-                        table=temp_bq_batch_serve_table_name,
-                    ),
-                    data_format=bigquery_storage.types.DataFormat.ARROW,
-                ),
-            )
-
-            frames = []
-            for stream in read_session_proto.streams:
-                reader = bigquery_storage_read_client.read_rows(stream.name)
-                for message in reader.rows().pages:
-                    frames.append(message.to_dataframe())
 
         finally:
             # clean up: if user didn't specify dataset, delete ephemeral dataset
@@ -1332,7 +1628,65 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
                 bigquery_client.delete_table(temp_bq_batch_serve_table_id)
                 bigquery_client.delete_table(temp_bq_read_instances_table_id)
 
-        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(frames)
+    def _read_bq_table_as_arrow_batches(
+        self,
+        bq_table_path: str,
+        columns: Optional[List[str]],
+        max_concurrent_streams: int,
+    ) -> Iterator[
+        "pyarrow.RecordBatch"
+    ]:  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Reads a BigQuery table with the BigQuery Storage API.
+
+        The read streams of the session are read concurrently.
+
+        Args:
+            bq_table_path (str):
+                Required. The path of the table, in the format
+                `projects/{project}/datasets/{dataset}/tables/{table}`.
+            columns (List[str]):
+                Optional. The columns to read. All columns are read if not set.
+            max_concurrent_streams (int):
+                Required. The maximum number of streams read at the same time.
+
+        Yields:
+            pyarrow.RecordBatch: The batches of rows, in no particular order.
+        """
+        from google.cloud import bigquery_storage
+
+        read_session = bigquery_storage.types.ReadSession(
+            table=bq_table_path,
+            data_format=bigquery_storage.types.DataFormat.ARROW,
+        )
+        if columns:
+            read_session.read_options = (
+                bigquery_storage.types.ReadSession.TableReadOptions(
+                    selected_fields=columns
+                )
+            )
+
+        bigquery_storage_read_client = bigquery_storage.BigQueryReadClient(
+            credentials=self.credentials
+        )
+        read_session_proto = bigquery_storage_read_client.create_read_session(
+            parent=f"projects/{self.project}",
+            read_session=read_session,
+        )
+
+        def read_stream(stream_name: str) -> Iterator["pyarrow.RecordBatch"]:
+            reader = bigquery_storage_read_client.read_rows(stream_name)
+            for page in reader.rows(read_session_proto).pages:
+                yield page.to_arrow()
+
+        yield from concurrent_utils.iter_concurrently(
+            [
+                functools.partial(read_stream, stream.name)
+                for stream in read_session_proto.streams
+            ],
+            max_workers=max_concurrent_streams,
+            max_buffered_items=max_concurrent_streams
+            * _BATCH_SERVE_BUFFERED_BATCHES_PER_STREAM,
+        )
 
     def _get_ephemeral_bq_full_dataset_id(
         self, featurestore_id: str, project_number: str
@@ -18,10 +18,13 @@
 
 from concurrent import futures
 import enum
+import datetime
 import functools
 import inspect
 import logging
 import os
+import sys
+import threading
 import types
 from typing import Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
@@ -35,8 +38,11 @@ from google.cloud.aiplatform import __version__
 from google.cloud.aiplatform import compat
 from google.cloud.aiplatform.constants import base as constants
 from google.cloud.aiplatform import utils
-from google.cloud.aiplatform.metadata import metadata
+from google.cloud.aiplatform.utils import grpc_utils
+from google.cloud.aiplatform.utils import instrumentation
 from google.cloud.aiplatform.utils import resource_manager_utils
+from google.cloud.aiplatform.utils import task_scheduler
+from google.cloud.aiplatform.utils import token_refresher
 from google.cloud.aiplatform.tensorboard import tensorboard_resource
 from google.cloud.aiplatform import telemetry
 
@@ -121,6 +127,10 @@ class _Config:
         self._api_transport = None
         self._request_metadata = None
         self._resource_type = None
+        self._prewarm = False
+        self._max_staleness = None
+        self._grpc_channel_options = {}
+        self._token_refresher = None
 
     def init(
         self,
@@ -141,6 +151,13 @@ class _Config:
         api_key: Optional[str] = None,
         api_transport: Optional[str] = None,
         request_metadata: Optional[Sequence[Tuple[str, str]]] = None,
+        prewarm: Optional[bool] = None,
+        grpc_keepalive_time_ms: Optional[int] = None,
+        grpc_keepalive_timeout_ms: Optional[int] = None,
+        grpc_client_idle_timeout_ms: Optional[int] = None,
+        background_token_refresh: Optional[bool] = None,
+        thread_pool_size: Optional[int] = None,
+        max_staleness: Optional[Union[float, datetime.timedelta]] = None,
     ):
         """Updates common initialization parameters with provided options.
 
@@ -208,6 +225,39 @@ class _Config:
                 beta state (preview).
             request_metadata:
                 Optional. Additional gRPC metadata to send with every client request.
+            prewarm (bool):
+                Optional. Whether to fetch an access token in the background
+                now, and to connect the prediction channel of each Endpoint and
+                GenerativeModel in the background when it is created. Otherwise
+                this happens on the first request.
+            grpc_keepalive_time_ms (int):
+                Optional. Interval between keepalive pings sent on the gRPC
+                connections of clients created afterwards, so that idle
+                connections are not dropped by proxies and load balancers.
+            grpc_keepalive_timeout_ms (int):
+                Optional. How long to wait for the acknowledgement of a
+                keepalive ping before reconnecting.
+            grpc_client_idle_timeout_ms (int):
+                Optional. How long a gRPC channel can stay without calls before
+                it releases its connection. The next call then reconnects.
+            background_token_refresh (bool):
+                Optional. Whether to refresh the access tokens of the
+                credentials used by the SDK clients in a background thread
+                before they expire. Otherwise a request that finds an expiring
+                token refreshes it and waits for the refresh. Refresh latency
+                and failures are reported by `token_refresher.metrics`.
+            thread_pool_size (int):
+                Optional. The number of threads running the operations of
+                methods called with `sync=False`. Operations already started
+                complete on the previous threads.
+            max_staleness (Union[float, datetime.timedelta]):
+                Optional. How old, either as a timedelta or in seconds, the
+                resource served by properties reading server-side state, such
+                as `Endpoint.traffic_split` or `_Job.state`, can be. Within
+                this bound, they do not retrieve the resource again. Use
+                `refresh()` on a resource to retrieve it regardless. Set to 0
+                to always retrieve the resource, which is the default, e.g. to
+                clear a value set by a previous call.
         Raises:
             ValueError:
                 If experiment_description is provided but experiment is not.
@@ -223,6 +273,8 @@ class _Config:
                 )
         if location:
             utils.validate_region(location)
+        if thread_pool_size is not None and thread_pool_size <= 0:
+            raise ValueError("thread_pool_size must be positive.")
         if experiment_description and experiment is None:
             raise ValueError(
                 "Experiment needs to be set in `init` in order to add experiment descriptions."
@@ -232,9 +284,11 @@ class _Config:
         if (project and project != self._project) or (
             location and location != self._location
         ):
-            if metadata._experiment_tracker.experiment_name:
-                logging.info("project/location updated, reset Experiment config.")
-            metadata._experiment_tracker.reset()
+            experiment_tracker = _get_experiment_tracker_if_imported()
+            if experiment_tracker:
+                if experiment_tracker.experiment_name:
+                    logging.info("project/location updated, reset Experiment config.")
+                experiment_tracker.reset()
 
         # Then we change the main state
         if api_endpoint is not None:
@@ -259,9 +313,32 @@ class _Config:
             self._request_metadata = request_metadata
         if api_key is not None:
             self._api_key = api_key
+        self._grpc_channel_options.update(
+            grpc_utils.get_channel_options(
+                keepalive_time_ms=grpc_keepalive_time_ms,
+                keepalive_timeout_ms=grpc_keepalive_timeout_ms,
+                client_idle_timeout_ms=grpc_client_idle_timeout_ms,
+            )
+        )
+        if prewarm is not None:
+            self._prewarm = prewarm
+        if thread_pool_size is not None:
+            _resize_global_pool(thread_pool_size)
+        if max_staleness is not None:
+            self._max_staleness = max_staleness
+        if background_token_refresh and self._token_refresher is None:
+            self._token_refresher = token_refresher.TokenRefresher()
+        elif background_token_refresh is False and self._token_refresher:
+            self._token_refresher.stop()
+            self._token_refresher = None
+        if self._token_refresher:
+            self._token_refresher.watch(self._credentials)
         self._resource_type = None
 
         # Finally, perform secondary state updates
+        if experiment_tensorboard or experiment:
+            from google.cloud.aiplatform.metadata import metadata
+
         if experiment_tensorboard and not isinstance(experiment_tensorboard, bool):
             metadata._experiment_tracker.set_tensorboard(
                 tensorboard=experiment_tensorboard,
@@ -277,6 +354,22 @@ class _Config:
                 backing_tensorboard=experiment_tensorboard,
             )
 
+        if prewarm:
+            threading.Thread(
+                target=self._refresh_credentials,
+                name="aiplatform-prewarm",
+                daemon=True,
+            ).start()
+
+    def _refresh_credentials(self):
+        """Fetches an access token for the default credentials."""
+        try:
+            grpc_utils.refresh_credentials(self.credentials)
+        except Exception as e:  # pylint: disable=broad-except
+            logging.getLogger(__name__).warning(
+                "Failed to refresh the default credentials: %s", e
+            )
+
     def get_encryption_spec(
         self,
         encryption_spec_key_name: Optional[str],
@@ -388,10 +481,26 @@ class _Config:
         """Default service account, if provided."""
         return self._service_account
 
+    @property
+    def token_refresher(self) -> Optional[token_refresher.TokenRefresher]:
+        """The background token refresher, if enabled."""
+        return self._token_refresher
+
+    @property
+    def max_staleness(self) -> Optional[Union[float, datetime.timedelta]]:
+        """Default max staleness of the resources, if provided."""
+        return self._max_staleness
+
+    @property
+    def prewarm(self) -> bool:
+        """Whether prediction clients are connected when they are created."""
+        return self._prewarm
+
     @property
     def experiment_name(self) -> Optional[str]:
         """Default experiment name, if provided."""
-        return metadata._experiment_tracker.experiment_name
+        experiment_tracker = _get_experiment_tracker_if_imported()
+        return experiment_tracker.experiment_name if experiment_tracker else None
 
     def get_resource_type(self) -> _Product:
         """Returns the resource type from environment variables."""
@@ -502,6 +611,7 @@ class _Config:
         api_path_override: Optional[str] = None,
         appended_user_agent: Optional[List[str]] = None,
         appended_gapic_version: Optional[str] = None,
+        grpc_channel_options: Optional[grpc_utils.ChannelOptions] = None,
     ) -> _TVertexAiServiceClientWithOverride:
         """Instantiates a given VertexAiServiceClient with optional
         overrides.
@@ -521,6 +631,9 @@ class _Config:
                 separated by spaces.
             appended_gapic_version (str):
                 Optional. GAPIC version suffix appended in the client info.
+            grpc_channel_options (Sequence[Tuple[str, Any]]):
+                Optional. gRPC channel arguments added to the ones set in
+                `init`. Ignored if the transport is "rest".
         Returns:
             client: Instantiated Vertex AI Service client with optional overrides
         """
@@ -578,7 +691,23 @@ class _Config:
             else:
                 kwargs["transport"] = self._api_transport
 
-        client = client_class(**kwargs)
+        channel_options = [
+            *self._grpc_channel_options.items(),
+            *(grpc_channel_options or ()),
+        ]
+        if channel_options and "transport" not in kwargs:
+            if issubclass(client_class, utils.ClientWithOverride):
+                kwargs["grpc_channel_options"] = channel_options
+            else:
+                kwargs["transport"] = grpc_utils.get_transport_factory(
+                    client_class, channel_options
+                )
+
+        if self._token_refresher:
+            self._token_refresher.watch(kwargs["credentials"])
+
+        with instrumentation.phase("create_client"):
+            client = client_class(**kwargs)
         # We only wrap the client if the request_metadata is set at the creation time.
         if self._request_metadata:
             client = _ClientWrapperThatAddsDefaultMetadata(client)
@@ -649,6 +778,30 @@ global_pool = futures.ThreadPoolExecutor(
     max_workers=min(32, max(4, (os.cpu_count() or 0) * 5))
 )
 
+# Runs the sync=False operations of resources on global_pool once the
+# operations they depend on have completed.
+global_scheduler = task_scheduler.TaskScheduler(lambda: global_pool)
+
+
+def _resize_global_pool(max_workers: int):
+    """Replaces global_pool with a pool of the given size."""
+    global global_pool
+    previous_pool = global_pool
+    global_pool = futures.ThreadPoolExecutor(max_workers=max_workers)
+    # Tasks already submitted still run on the previous pool.
+    previous_pool.shutdown(wait=False)
+
+
+def _get_experiment_tracker_if_imported():
+    """Returns the experiment tracker, or None if metadata was never imported.
+
+    Importing metadata loads most of the resource modules, so it is only
+    imported once experiments are used. Until then there is no experiment
+    state to read or reset.
+    """
+    metadata = sys.modules.get("google.cloud.aiplatform.metadata.metadata")
+    return metadata._experiment_tracker if metadata else None
+
 
 def _get_function_name_from_stack_frame(frame) -> str:
     """Gates fully qualified function or method name.
@@ -15,11 +15,24 @@
 # limitations under the License.
 #
 
-from typing import Iterable, Optional, Union, Sequence, Dict, List, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import abc
+import concurrent.futures
 import copy
 import datetime
+import functools
+import json
 import time
 import tempfile
 
@@ -54,7 +67,9 @@ from google.cloud.aiplatform import hyperparameter_tuning
 from google.cloud.aiplatform import model_monitoring
 from google.cloud.aiplatform import utils
 from google.cloud.aiplatform import _publisher_models
+from google.cloud.aiplatform.utils import concurrent_utils
 from google.cloud.aiplatform.utils import console_utils
+from google.cloud.aiplatform.utils import job_watcher
 from google.cloud.aiplatform.utils import source_utils
 from google.cloud.aiplatform.utils import worker_spec_utils
 
@@ -97,6 +112,10 @@ _JOB_PENDING_STATES = (
     gca_job_state_v1beta1.JobState.JOB_STATE_UPDATING,
 )
 
+# Batch prediction writes its results to files named `prediction.results-*`.
+_PREDICTION_RESULTS_FILE_PREFIX = "prediction.results"
+_PREDICTION_CHUNK_SIZE = 10000
+
 # _block_until_complete wait times
 _JOB_WAIT_TIME = 5  # start at five seconds
 _LOG_WAIT_TIME = 5
@@ -123,6 +142,8 @@ class _Job(base.VertexAiStatefulResource):
 
     # Required by the done() method
     _valid_done_states = _JOB_COMPLETE_STATES
+    # Required by the job watcher
+    _valid_error_states = _JOB_ERROR_STATES
 
     def __init__(
         self,
@@ -167,7 +188,7 @@ class _Job(base.VertexAiStatefulResource):
         """
 
         # Fetch the Job again for most up-to-date job state
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
 
         return self._gca_resource.state
 
@@ -175,21 +196,21 @@ class _Job(base.VertexAiStatefulResource):
     def start_time(self) -> Optional[datetime.datetime]:
         """Time when the Job resource entered the `JOB_STATE_RUNNING` for the
         first time."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "start_time")
 
     @property
     def end_time(self) -> Optional[datetime.datetime]:
         """Time when the Job resource entered the `JOB_STATE_SUCCEEDED`,
         `JOB_STATE_FAILED`, or `JOB_STATE_CANCELLED` state."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "end_time")
 
     @property
     def error(self) -> Optional[status_pb2.Status]:
         """Detailed error info for this Job resource. Only populated when the
         Job's state is `JOB_STATE_FAILED` or `JOB_STATE_CANCELLED`."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "error")
 
     @property
@@ -235,13 +256,15 @@ class _Job(base.VertexAiStatefulResource):
         log_wait = _LOG_WAIT_TIME
 
         previous_time = time.time()
-        while self.state not in _JOB_COMPLETE_STATES:
+        self._sync_gca_resource()
+        while self._gca_resource.state not in _JOB_COMPLETE_STATES:
             current_time = time.time()
             if current_time - previous_time >= log_wait:
                 self._log_job_state()
                 log_wait = min(log_wait * _WAIT_TIME_MULTIPLIER, _MAX_WAIT_TIME)
                 previous_time = current_time
             time.sleep(_JOB_WAIT_TIME)
+            self._sync_gca_resource()
 
         self._log_job_state()
 
@@ -260,6 +283,38 @@ class _Job(base.VertexAiStatefulResource):
         """
         self._block_until_complete()
 
+    def watch(
+        self, callback: Optional[Callable[["_Job"], None]] = None
+    ) -> concurrent.futures.Future:
+        """Watches this job for completion with the shared job watcher.
+
+        Unlike `wait_for_completion`, this does not block and does not poll the
+        job on its own: all watched jobs in a location are checked together
+        with a single filtered list call.
+
+        Example Usage:
+
+            futures = [job.watch() for job in jobs]
+            concurrent.futures.wait(futures)
+
+        Args:
+            callback (Callable[[_Job], None]):
+                Optional. Called with this job once it completes.
+
+        Returns:
+            concurrent.futures.Future: A future that resolves to this job once
+            it completes, or raises RuntimeError if it failed or was cancelled.
+        """
+        return job_watcher.get_default_watcher().watch(self, callback=callback)
+
+    async def wait_for_completion_async(self) -> None:
+        """Waits for job to complete without blocking the event loop.
+
+        Raises:
+            RuntimeError: If job failed or cancelled.
+        """
+        await job_watcher.get_default_watcher().wait_async(self)
+
     @classmethod
     def list(
         cls,
@@ -1455,15 +1510,7 @@ class BatchPredictionJob(_Job):
         from google.cloud import bigquery
         from google.cloud import storage
 
-        self._assert_gca_resource_is_available()
-
-        if self.state != gca_job_state.JobState.JOB_STATE_SUCCEEDED:
-            raise RuntimeError(
-                f"Cannot read outputs until BatchPredictionJob has succeeded, "
-                f"current state: {self._gca_resource.state}"
-            )
-
-        output_info = self._gca_resource.output_info
+        output_info = self._get_succeeded_output_info()
 
         # GCS Destination, return Blobs
         if output_info.gcs_output_directory:
@@ -1485,19 +1532,6 @@ class BatchPredictionJob(_Job):
         # BigQuery Destination, return RowIterator
         elif output_info.bigquery_output_dataset:
 
-            # Format of `bigquery_output_dataset` from service is `bq://projectId.bqDatasetId`
-            bq_dataset = output_info.bigquery_output_dataset
-            bq_table = output_info.bigquery_output_table
-
-            if not bq_table:
-                raise RuntimeError(
-                    "A BigQuery table with predictions was not found, this "
-                    f"might be due to errors. Visit {self._dashboard_uri()} for details."
-                )
-
-            if bq_dataset.startswith("bq://"):
-                bq_dataset = bq_dataset[5:]
-
             # Build a BigQuery Client using the same credentials as JobServiceClient
             bq_client = bigquery.Client(
                 project=self.project,
@@ -1505,7 +1539,8 @@ class BatchPredictionJob(_Job):
             )
 
             row_iterator = bq_client.list_rows(
-                table=f"{bq_dataset}.{bq_table}", max_results=bq_max_results
+                table=self._get_bigquery_output_table_id(output_info),
+                max_results=bq_max_results,
             )
 
             return row_iterator
@@ -1517,6 +1552,308 @@ class BatchPredictionJob(_Job):
                 f"on your prediction output:\n{output_info}"
             )
 
+    def _get_succeeded_output_info(
+        self,
+    ) -> gca_bp_job_compat.BatchPredictionJob.OutputInfo:
+        """Returns the output info of a BatchPredictionJob that has succeeded.
+
+        Raises:
+            RuntimeError:
+                If BatchPredictionJob is in a JobState other than SUCCEEDED.
+        """
+        self._assert_gca_resource_is_available()
+        self._sync_gca_resource()
+
+        if self._gca_resource.state != gca_job_state.JobState.JOB_STATE_SUCCEEDED:
+            raise RuntimeError(
+                f"Cannot read outputs until BatchPredictionJob has succeeded, "
+                f"current state: {self._gca_resource.state}"
+            )
+
+        return self._gca_resource.output_info
+
+    def _get_bigquery_output_table_id(
+        self,
+        output_info: gca_bp_job_compat.BatchPredictionJob.OutputInfo,
+    ) -> str:
+        """Returns the `projectId.datasetId.tableId` of the BigQuery output table."""
+        # Format of `bigquery_output_dataset` from service is `bq://projectId.bqDatasetId`
+        bq_dataset = output_info.bigquery_output_dataset
+        bq_table = output_info.bigquery_output_table
+
+        if not bq_table:
+            raise RuntimeError(
+                "A BigQuery table with predictions was not found, this "
+                f"might be due to errors. Visit {self._dashboard_uri()} for details."
+            )
+
+        if bq_dataset.startswith("bq://"):
+            bq_dataset = bq_dataset[5:]
+
+        return f"{bq_dataset}.{bq_table}"
+
+    def _iter_prediction_chunks(
+        self,
+        output_info: gca_bp_job_compat.BatchPredictionJob.OutputInfo,
+        chunksize: int,
+        max_workers: int,
+        max_buffered_chunks: int,
+    ) -> Iterator[List[Dict]]:
+        """Yields lists of at most `chunksize` parsed prediction records.
+
+        Prediction shards written to Cloud Storage are downloaded and parsed
+        concurrently. Records from different shards are interleaved.
+        """
+        # pylint: disable=g-import-not-at-top
+        from google.cloud import storage
+
+        if output_info.bigquery_output_dataset:
+            for record_batch in self._iter_bigquery_record_batches(
+                output_info, max_workers, max_buffered_chunks
+            ):
+                records = record_batch.to_pylist()
+                for i in range(0, len(records), chunksize):
+                    yield records[i : i + chunksize]
+            return
+
+        if not output_info.gcs_output_directory:
+            raise NotImplementedError(
+                f"Unsupported batch prediction output location, here are details"
+                f"on your prediction output:\n{output_info}"
+            )
+
+        storage_client = storage.Client(
+            project=self.project,
+            credentials=self.api_client._transport._credentials,
+        )
+        gcs_bucket, gcs_prefix = utils.extract_bucket_and_prefix_from_gcs_path(
+            output_info.gcs_output_directory
+        )
+        result_blobs = [
+            blob
+            for blob in storage_client.list_blobs(gcs_bucket, prefix=gcs_prefix)
+            if _PREDICTION_RESULTS_FILE_PREFIX in blob.name.rsplit("/", 1)[-1]
+        ]
+
+        def _read_shard(blob: "storage.Blob") -> Iterator[List[Dict]]:
+            chunk = []
+            with blob.open("rt") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    chunk.append(json.loads(line))
+                    if len(chunk) >= chunksize:
+                        yield chunk
+                        chunk = []
+            if chunk:
+                yield chunk
+
+        yield from concurrent_utils.iter_concurrently(
+            [functools.partial(_read_shard, blob) for blob in result_blobs],
+            max_workers=max_workers,
+            max_buffered_items=max_buffered_chunks,
+        )
+
+    def _iter_bigquery_record_batches(
+        self,
+        output_info: gca_bp_job_compat.BatchPredictionJob.OutputInfo,
+        max_workers: int,
+        max_buffered_chunks: int,
+    ) -> Iterator["pyarrow.RecordBatch"]:  # noqa: F821
+        """Reads the BigQuery output table with the Storage Read API."""
+        try:
+            from google.cloud import bigquery_storage
+        except ImportError:
+            raise ImportError(
+                "Google-Cloud-Bigquery-Storage is not installed. Please install "
+                "google-cloud-bigquery-storage to read BigQuery prediction outputs."
+            )
+
+        bq_project, bq_dataset, bq_table = self._get_bigquery_output_table_id(
+            output_info
+        ).rsplit(".", 2)
+        read_client = bigquery_storage.BigQueryReadClient(
+            credentials=self.api_client._transport._credentials,
+        )
+        read_session = read_client.create_read_session(
+            parent=f"projects/{self.project}",
+            read_session=bigquery_storage.types.ReadSession(
+                table=f"projects/{bq_project}/datasets/{bq_dataset}/tables/{bq_table}",
+                data_format=bigquery_storage.types.DataFormat.ARROW,
+            ),
+            max_stream_count=max_workers,
+        )
+
+        def _read_stream(stream_name: str) -> Iterator["pyarrow.RecordBatch"]:
+            reader = read_client.read_rows(stream_name)
+            for page in reader.rows(read_session).pages:
+                yield page.to_arrow()
+
+        yield from concurrent_utils.iter_concurrently(
+            [
+                functools.partial(_read_stream, stream.name)
+                for stream in read_session.streams
+            ],
+            max_workers=max_workers,
+            max_buffered_items=max_buffered_chunks,
+        )
+
+    def iter_predictions(
+        self,
+        max_workers: int = 8,
+        max_buffered_chunks: int = 16,
+    ) -> Iterator[Dict]:
+        """Returns an iterator over the parsed prediction records.
+
+        For Cloud Storage outputs, every `prediction.results-*` JSONL shard is
+        streamed and parsed concurrently and each line is yielded as a dict.
+        For BigQuery outputs, the prediction table is read through the
+        BigQuery Storage Read API and each row is yielded as a dict.
+
+        Memory use is bounded by `max_buffered_chunks` regardless of the size
+        of the output, and records from different shards may be interleaved.
+
+        Example Usage:
+            for prediction in batch_prediction_job.iter_predictions():
+                process(prediction["instance"], prediction["prediction"])
+
+        Args:
+            max_workers (int):
+                Optional. The maximum number of shards or read streams read
+                concurrently. Default is 8.
+            max_buffered_chunks (int):
+                Optional. The maximum number of parsed chunks held in memory
+                before readers are paused. Default is 16.
+
+        Returns:
+            Iterator[Dict]: The prediction records.
+
+        Raises:
+            RuntimeError:
+                If BatchPredictionJob is in a JobState other than SUCCEEDED.
+            NotImplementedError:
+                If BatchPredictionJob succeeded and output_info does not have a
+                GCS or BQ output provided.
+        """
+        for chunk in self._iter_prediction_chunks(
+            output_info=self._get_succeeded_output_info(),
+            chunksize=_PREDICTION_CHUNK_SIZE,
+            max_workers=max_workers,
+            max_buffered_chunks=max_buffered_chunks,
+        ):
+            yield from chunk
+
+    def iter_arrow_batches(
+        self,
+        chunksize: int = _PREDICTION_CHUNK_SIZE,
+        max_workers: int = 8,
+        max_buffered_chunks: int = 16,
+    ) -> Iterator["pyarrow.RecordBatch"]:  # noqa: F821
+        """Returns an iterator over the predictions as Arrow record batches.
+
+        Args:
+            chunksize (int):
+                Optional. The maximum number of rows in a record batch read
+                from Cloud Storage outputs. Batches read from BigQuery follow
+                the size chosen by the Storage Read API. Default is 10,000.
+            max_workers (int):
+                Optional. The maximum number of shards or read streams read
+                concurrently. Default is 8.
+            max_buffered_chunks (int):
+                Optional. The maximum number of parsed chunks held in memory
+                before readers are paused. Default is 16.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]: The prediction record batches.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError(
+                f"Pyarrow is not installed. Please install pyarrow to use "
+                f"{self.iter_arrow_batches.__name__}"
+            )
+
+        output_info = self._get_succeeded_output_info()
+        if output_info.bigquery_output_dataset:
+            yield from self._iter_bigquery_record_batches(
+                output_info, max_workers, max_buffered_chunks
+            )
+            return
+
+        for chunk in self._iter_prediction_chunks(
+            output_info=output_info,
+            chunksize=chunksize,
+            max_workers=max_workers,
+            max_buffered_chunks=max_buffered_chunks,
+        ):
+            yield pyarrow.RecordBatch.from_pylist(chunk)
+
+    def to_arrow(
+        self,
+        max_workers: int = 8,
+    ) -> "pyarrow.Table":  # noqa: F821
+        """Reads all predictions into a single Arrow table.
+
+        Args:
+            max_workers (int):
+                Optional. The maximum number of shards or read streams read
+                concurrently. Default is 8.
+
+        Returns:
+            pyarrow.Table: The predictions.
+        """
+        import pyarrow
+
+        record_batches = list(self.iter_arrow_batches(max_workers=max_workers))
+        if not record_batches:
+            return pyarrow.table({})
+        tables = [pyarrow.Table.from_batches([batch]) for batch in record_batches]
+        # Shards may infer slightly different schemas, e.g. a nullable field
+        # that is missing from every line of one shard.
+        try:
+            return pyarrow.concat_tables(tables, promote_options="default")
+        except TypeError:
+            # pyarrow < 14
+            return pyarrow.concat_tables(tables, promote=True)
+
+    def to_pandas(
+        self,
+        chunksize: Optional[int] = None,
+        max_workers: int = 8,
+    ) -> Union["pd.DataFrame", Iterator["pd.DataFrame"]]:  # noqa: F821
+        """Reads the predictions into pandas DataFrames.
+
+        Args:
+            chunksize (int):
+                Optional. If set, returns an iterator of DataFrames with at
+                most `chunksize` rows each instead of a single DataFrame, so
+                that outputs larger than memory can be processed.
+            max_workers (int):
+                Optional. The maximum number of shards or read streams read
+                concurrently. Default is 8.
+
+        Returns:
+            Union[pd.DataFrame, Iterator[pd.DataFrame]]: The predictions.
+        """
+        try:
+            import pandas  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                f"Pandas is not installed. Please install pandas to use "
+                f"{self.to_pandas.__name__}"
+            )
+
+        if chunksize is None:
+            return self.to_arrow(max_workers=max_workers).to_pandas()
+
+        return (
+            record_batch.to_pandas()
+            for record_batch in self.iter_arrow_batches(
+                chunksize=chunksize, max_workers=max_workers
+            )
+        )
+
     def wait_for_resource_creation(self) -> None:
         """Waits until resource has been created."""
         self._wait_for_resource_creation()
@@ -1597,7 +1934,7 @@ class _RunnableJob(_Job):
         """
 
         # Fetch the Job again for most up-to-date web access uris
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._get_web_access_uris()
 
     @abc.abstractmethod
@@ -1620,7 +1957,8 @@ class _RunnableJob(_Job):
         log_wait = _LOG_WAIT_TIME
 
         previous_time = time.time()
-        while self.state not in _JOB_COMPLETE_STATES:
+        self._sync_gca_resource()
+        while self._gca_resource.state not in _JOB_COMPLETE_STATES:
             current_time = time.time()
             if current_time - previous_time >= _LOG_WAIT_TIME:
                 self._log_job_state()
@@ -1628,6 +1966,7 @@ class _RunnableJob(_Job):
                 previous_time = current_time
             self._log_web_access_uris()
             time.sleep(_JOB_WAIT_TIME)
+            self._sync_gca_resource()
 
         self._log_job_state()
 
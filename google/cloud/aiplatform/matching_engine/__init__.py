@@ -26,6 +26,10 @@ from google.cloud.aiplatform.matching_engine.matching_engine_index_config import
 from google.cloud.aiplatform.matching_engine.matching_engine_index_endpoint import (
     MatchingEngineIndexEndpoint,
 )
+from google.cloud.aiplatform.matching_engine.index_writer import (
+    IndexWriter,
+    IndexWriteResult,
+)
 
 __all__ = (
     "MatchingEngineIndex",
@@ -33,4 +37,6 @@ __all__ = (
     "MatchingEngineIndexConfig",
     "MatchingEngineBruteForceAlgorithmConfig",
     "MatchingEngineTreeAhAlgorithmConfig",
+    "IndexWriter",
+    "IndexWriteResult",
 )
@@ -0,0 +1,485 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Bulk upserts and removals of the datapoints of streaming update indexes."""
+
+from concurrent import futures
+import dataclasses
+import itertools
+import random
+import threading
+import time
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from google.api_core import exceptions
+from google.cloud.aiplatform import base
+from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform.compat.services import index_service_client
+from google.cloud.aiplatform.compat.types import (
+    index_service as gca_index_service,
+    matching_engine_index as gca_matching_engine_index,
+)
+from google.cloud.aiplatform.matching_engine import matching_engine_index
+from google.cloud.aiplatform.matching_engine.matching_engine_index_endpoint import (
+    Namespace,
+    NumericNamespace,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_LOGGER = base.Logger(__name__)
+
+_IndexDatapointPb = gca_matching_engine_index.IndexDatapoint.pb()
+
+# Gives each channel its own connection. By default, gRPC shares the
+# connections of channels created with the same target and arguments.
+_SEPARATE_CONNECTION_CHANNEL_OPTIONS = (("grpc.use_local_subchannel_pool", 1),)
+
+_DEFAULT_NUM_CHANNELS = 4
+_DEFAULT_MAX_CONCURRENCY = 16
+_DEFAULT_MAX_DATAPOINTS_PER_REQUEST = 1000
+_DEFAULT_MAX_REQUEST_BYTES = 4 * 1024 * 1024
+_DEFAULT_MAX_ATTEMPTS = 5
+_DEFAULT_INITIAL_BACKOFF = 1.0
+_DEFAULT_MAX_BACKOFF = 60.0
+_BACKOFF_MULTIPLIER = 2.0
+
+# Number of vector rows converted to Python lists at once.
+_VECTOR_CONVERSION_CHUNK_SIZE = 1024
+
+# Upper bound of the bytes added to the request by the tag and length
+# prefix of a repeated message or string field.
+_FIELD_OVERHEAD_BYTES = 6
+
+_RETRYABLE_EXCEPTIONS = (
+    exceptions.Aborted,
+    exceptions.DeadlineExceeded,
+    exceptions.InternalServerError,
+    exceptions.ResourceExhausted,
+    exceptions.ServiceUnavailable,
+    exceptions.TooManyRequests,
+)
+
+
+@dataclasses.dataclass
+class IndexWriteResult:
+    """The outcome of an `IndexWriter.upsert` or `IndexWriter.remove` call.
+
+    Attributes:
+        written_count (int):
+            The number of datapoints upserted or removed.
+        failed_datapoint_ids (List[str]):
+            The ids of the datapoints of the requests that failed after all
+            their attempts.
+        errors (List[Exception]):
+            The last error of each failed request.
+        request_count (int):
+            The number of requests, not counting retries.
+        retry_count (int):
+            The number of retried attempts.
+        elapsed_seconds (float):
+            The duration of the call, in seconds.
+    """
+
+    written_count: int = 0
+    failed_datapoint_ids: List[str] = dataclasses.field(default_factory=list)
+    errors: List[Exception] = dataclasses.field(default_factory=list)
+    request_count: int = 0
+    retry_count: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def datapoints_per_second(self) -> float:
+        """The number of datapoints written per second."""
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.written_count / self.elapsed_seconds
+
+
+class IndexWriter:
+    """Upserts and removes the datapoints of a streaming update index in bulk.
+
+    Datapoints are split into requests bounded in number of datapoints and
+    serialized size, which are sent concurrently over several gRPC channels.
+    Requests failing with a transient error are retried with exponential
+    backoff. The ids of the datapoints of the requests that still fail are
+    reported in the result instead of raising.
+
+    Example Usage:
+
+        writer = IndexWriter(my_index)
+        result = writer.upsert(
+            datapoint_ids=ids,
+            vectors=embeddings,  # np.ndarray of shape (len(ids), dimensions)
+            restricts=[[Namespace("color", ["red"])] for _ in ids],
+        )
+        print(result.datapoints_per_second, result.failed_datapoint_ids)
+    """
+
+    def __init__(
+        self,
+        index: matching_engine_index.MatchingEngineIndex,
+        num_channels: int = _DEFAULT_NUM_CHANNELS,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        max_datapoints_per_request: int = _DEFAULT_MAX_DATAPOINTS_PER_REQUEST,
+        max_request_bytes: int = _DEFAULT_MAX_REQUEST_BYTES,
+        max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+        initial_backoff: float = _DEFAULT_INITIAL_BACKOFF,
+        max_backoff: float = _DEFAULT_MAX_BACKOFF,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        request_timeout: Optional[float] = None,
+    ):
+        """Creates an IndexWriter.
+
+        Args:
+            index (MatchingEngineIndex):
+                Required. The index to write to. Its index update method must
+                be "STREAM_UPDATE".
+            num_channels (int):
+                Optional. The number of gRPC channels the requests are spread
+                over. Each channel has its own connection.
+            max_concurrency (int):
+                Optional. The maximum number of requests in flight.
+            max_datapoints_per_request (int):
+                Optional. The maximum number of datapoints of a request.
+            max_request_bytes (int):
+                Optional. The maximum serialized size of a request. A single
+                datapoint larger than this is sent in its own request.
+            max_attempts (int):
+                Optional. The number of attempts of a request failing with a
+                transient error, including the first one.
+            initial_backoff (float):
+                Optional. The delay before the first retry, in seconds. The
+                delay doubles with each retry, up to `max_backoff`, and is
+                randomized.
+            max_backoff (float):
+                Optional. The maximum delay between attempts, in seconds.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the requests
+                as metadata.
+            request_timeout (float):
+                Optional. The timeout of each attempt in seconds.
+
+        Raises:
+            ValueError: If a bound is not positive.
+        """
+        for name, value in (
+            ("num_channels", num_channels),
+            ("max_concurrency", max_concurrency),
+            ("max_datapoints_per_request", max_datapoints_per_request),
+            ("max_request_bytes", max_request_bytes),
+            ("max_attempts", max_attempts),
+        ):
+            if value < 1:
+                raise ValueError(f"`{name}` must be positive, got {value}.")
+
+        self._index = index
+        self._max_concurrency = max_concurrency
+        self._max_datapoints_per_request = max_datapoints_per_request
+        self._max_request_bytes = max_request_bytes
+        self._max_attempts = max_attempts
+        self._initial_backoff = initial_backoff
+        self._max_backoff = max_backoff
+        self._request_metadata = request_metadata
+        self._request_timeout = request_timeout
+
+        # The client wrappers of this SDK create a client, and so a channel,
+        # for each call. The writer keeps its clients for its whole lifetime.
+        self._clients = [
+            initializer.global_config.create_client(
+                client_class=index_service_client.IndexServiceClient,
+                credentials=index.credentials,
+                location_override=index.location,
+                grpc_channel_options=_SEPARATE_CONNECTION_CHANNEL_OPTIONS,
+            )
+            for _ in range(num_channels)
+        ]
+        self._client_cycle = itertools.cycle(self._clients)
+        self._client_lock = threading.Lock()
+
+    def upsert(
+        self,
+        datapoint_ids: Sequence[str],
+        vectors: Union[Sequence[Sequence[float]], "np.ndarray"],
+        restricts: Optional[Sequence[Optional[Sequence[Namespace]]]] = None,
+        numeric_restricts: Optional[
+            Sequence[Optional[Sequence[NumericNamespace]]]
+        ] = None,
+        crowding_tags: Optional[Sequence[Optional[str]]] = None,
+    ) -> IndexWriteResult:
+        """Upserts datapoints to the index.
+
+        Args:
+            datapoint_ids (Sequence[str]):
+                Required. The ids of the datapoints.
+            vectors (Union[Sequence[Sequence[float]], np.ndarray]):
+                Required. The feature vectors of the datapoints, in the order of
+                `datapoint_ids`. Can be a 2-D numpy array of shape
+                (num_datapoints, dimensions).
+            restricts (Sequence[Sequence[Namespace]]):
+                Optional. The token restricts of each datapoint, in the order
+                of `datapoint_ids`. An item can be None.
+            numeric_restricts (Sequence[Sequence[NumericNamespace]]):
+                Optional. The numeric restricts of each datapoint, in the order
+                of `datapoint_ids`. An item can be None.
+            crowding_tags (Sequence[str]):
+                Optional. The crowding attribute of each datapoint, in the
+                order of `datapoint_ids`. An item can be None.
+
+        Returns:
+            IndexWriteResult: The outcome of the upsert.
+
+        Raises:
+            ValueError: If the lengths of the arguments do not match, or if
+                `vectors` is a numpy array that is not 2-D.
+        """
+        if np is not None and isinstance(vectors, np.ndarray) and vectors.ndim != 2:
+            raise ValueError(
+                "`vectors` must be a 2-D array of shape (num_datapoints, "
+                f"dimensions), got shape {vectors.shape}."
+            )
+        for name, values in (
+            ("vectors", vectors),
+            ("restricts", restricts),
+            ("numeric_restricts", numeric_restricts),
+            ("crowding_tags", crowding_tags),
+        ):
+            if values is not None and len(values) != len(datapoint_ids):
+                raise ValueError(
+                    f"`{name}` has {len(values)} items, expected one per "
+                    f"datapoint id ({len(datapoint_ids)})."
+                )
+
+        datapoints = self._generate_datapoint_pbs(
+            datapoint_ids=datapoint_ids,
+            vectors=vectors,
+            restricts=restricts,
+            numeric_restricts=numeric_restricts,
+            crowding_tags=crowding_tags,
+        )
+        return self._write(
+            "Upserting datapoints",
+            "Upserted datapoints",
+            batches=self._split(
+                (datapoint.datapoint_id, datapoint, datapoint.ByteSize())
+                for datapoint in datapoints
+            ),
+            send=self._send_upsert,
+        )
+
+    def remove(self, datapoint_ids: Sequence[str]) -> IndexWriteResult:
+        """Removes datapoints from the index.
+
+        Args:
+            datapoint_ids (Sequence[str]):
+                Required. The ids of the datapoints to remove.
+
+        Returns:
+            IndexWriteResult: The outcome of the removal.
+        """
+        return self._write(
+            "Removing datapoints",
+            "Removed datapoints",
+            batches=self._split(
+                (datapoint_id, datapoint_id, len(datapoint_id.encode("utf-8")))
+                for datapoint_id in datapoint_ids
+            ),
+            send=self._send_remove,
+        )
+
+    @staticmethod
+    def _generate_datapoint_pbs(
+        datapoint_ids: Sequence[str],
+        vectors: Union[Sequence[Sequence[float]], "np.ndarray"],
+        restricts: Optional[Sequence[Optional[Sequence[Namespace]]]],
+        numeric_restricts: Optional[Sequence[Optional[Sequence[NumericNamespace]]]],
+        crowding_tags: Optional[Sequence[Optional[str]]],
+    ) -> Iterator[_IndexDatapointPb]:
+        """Lazily builds raw IndexDatapoint messages.
+
+        Numpy vectors are converted to lists by chunks, so that the whole
+        array is never converted at once.
+        """
+        for start in range(0, len(datapoint_ids), _VECTOR_CONVERSION_CHUNK_SIZE):
+            end = start + _VECTOR_CONVERSION_CHUNK_SIZE
+            vector_chunk = vectors[start:end]
+            if np is not None and isinstance(vector_chunk, np.ndarray):
+                vector_chunk = vector_chunk.tolist()
+            for i, vector in enumerate(vector_chunk, start):
+                datapoint = _IndexDatapointPb(datapoint_id=datapoint_ids[i])
+                datapoint.feature_vector.extend(vector)
+                for namespace in (restricts[i] if restricts else None) or ():
+                    datapoint.restricts.add(
+                        namespace=namespace.name,
+                        allow_list=namespace.allow_tokens,
+                        deny_list=namespace.deny_tokens,
+                    )
+                for namespace in (
+                    numeric_restricts[i] if numeric_restricts else None
+                ) or ():
+                    restriction = datapoint.numeric_restricts.add(
+                        namespace=namespace.name
+                    )
+                    if namespace.value_int is not None:
+                        restriction.value_int = namespace.value_int
+                    if namespace.value_float is not None:
+                        restriction.value_float = namespace.value_float
+                    if namespace.value_double is not None:
+                        restriction.value_double = namespace.value_double
+                crowding_tag = crowding_tags[i] if crowding_tags else None
+                if crowding_tag is not None:
+                    datapoint.crowding_tag.crowding_attribute = crowding_tag
+                yield datapoint
+
+    def _split(
+        self, items: Iterator[Tuple[str, Any, int]]
+    ) -> Iterator[Tuple[List[str], List[Any]]]:
+        """Lazily groups items into batches that fit in a request.
+
+        Args:
+            items (Iterator[Tuple[str, Any, int]]):
+                Required. The datapoint id, request field value and serialized
+                size of each item.
+
+        Yields:
+            Tuple[List[str], List[Any]]: The datapoint ids and request field
+            values of a batch.
+        """
+        batch_ids = []
+        batch = []
+        batch_byte_size = len(self._index.resource_name) + _FIELD_OVERHEAD_BYTES
+        base_byte_size = batch_byte_size
+        for datapoint_id, value, byte_size in items:
+            byte_size += _FIELD_OVERHEAD_BYTES
+            if batch and (
+                len(batch) >= self._max_datapoints_per_request
+                or batch_byte_size + byte_size > self._max_request_bytes
+            ):
+                yield batch_ids, batch
+                batch_ids = []
+                batch = []
+                batch_byte_size = base_byte_size
+            batch_ids.append(datapoint_id)
+            batch.append(value)
+            batch_byte_size += byte_size
+        if batch:
+            yield batch_ids, batch
+
+    def _next_client(self) -> index_service_client.IndexServiceClient:
+        with self._client_lock:
+            return next(self._client_cycle)
+
+    def _send_upsert(self, datapoints: List[_IndexDatapointPb]) -> None:
+        request = gca_index_service.UpsertDatapointsRequest.pb()(
+            index=self._index.resource_name
+        )
+        request.datapoints.extend(datapoints)
+        self._call(
+            "upsert_datapoints",
+            gca_index_service.UpsertDatapointsRequest.wrap(request),
+        )
+
+    def _send_remove(self, datapoint_ids: List[str]) -> None:
+        self._call(
+            "remove_datapoints",
+            gca_index_service.RemoveDatapointsRequest(
+                index=self._index.resource_name, datapoint_ids=datapoint_ids
+            ),
+        )
+
+    def _call(self, method_name: str, request: Any) -> None:
+        getattr(self._next_client(), method_name)(
+            request=request,
+            metadata=self._request_metadata,
+            timeout=self._request_timeout,
+        )
+
+    def _send_with_retry(
+        self, send: Callable[[List[Any]], None], batch: List[Any]
+    ) -> Tuple[int, Optional[Exception]]:
+        """Sends a batch, retrying transient errors.
+
+        Returns:
+            Tuple[int, Optional[Exception]]: The number of retries, and the
+            last error if all attempts failed.
+        """
+        backoff = self._initial_backoff
+        for attempt in range(self._max_attempts):
+            try:
+                send(batch)
+            except _RETRYABLE_EXCEPTIONS as e:
+                if attempt + 1 == self._max_attempts:
+                    return attempt, e
+                time.sleep(random.uniform(0, min(backoff, self._max_backoff)))
+                backoff *= _BACKOFF_MULTIPLIER
+            except exceptions.GoogleAPICallError as e:
+                return attempt, e
+            else:
+                return attempt, None
+
+    def _write(
+        self,
+        action: str,
+        completed_action: str,
+        batches: Iterator[Tuple[List[str], List[Any]]],
+        send: Callable[[List[Any]], None],
+    ) -> IndexWriteResult:
+        """Sends batches concurrently and collects the outcome.
+
+        At most `2 * max_concurrency` batches are built ahead of the requests
+        in flight, so that large inputs are not converted at once.
+        """
+        _LOGGER.log_action_start_against_resource(action, "index", self._index)
+
+        result = IndexWriteResult()
+        start_time = time.perf_counter()
+        pending = {}
+
+        def collect(done):
+            for write_future in done:
+                batch_ids = pending.pop(write_future)
+                retry_count, error = write_future.result()
+                result.retry_count += retry_count
+                if error is None:
+                    result.written_count += len(batch_ids)
+                else:
+                    result.failed_datapoint_ids.extend(batch_ids)
+                    result.errors.append(error)
+
+        with futures.ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+            for batch_ids, batch in batches:
+                if len(pending) >= 2 * self._max_concurrency:
+                    done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                    collect(done)
+                pending[executor.submit(self._send_with_retry, send, batch)] = batch_ids
+                result.request_count += 1
+            collect(futures.wait(pending).done)
+
+        result.elapsed_seconds = time.perf_counter() - start_time
+
+        if result.failed_datapoint_ids:
+            _LOGGER.warning(
+                f"{len(result.failed_datapoint_ids)} datapoints of "
+                f"{len(result.errors)} requests failed. Last error: "
+                f"{result.errors[-1]}"
+            )
+        _LOGGER.log_action_completed_against_resource(
+            "index", completed_action, self._index
+        )
+        return result
@@ -23,6 +23,7 @@ from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import matching_engine
 from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.utils import instrumentation
 from google.cloud.aiplatform.compat.types import (
     machine_resources as gca_machine_resources_compat,
     matching_engine_index_endpoint as gca_matching_engine_index_endpoint,
@@ -39,6 +40,11 @@ from google.protobuf import field_mask_pb2
 
 import grpc
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 _LOGGER = base.Logger(__name__)
 
 
@@ -325,6 +331,64 @@ class MatchNeighbor:
         return self
 
 
+@dataclass
+class MatchNeighborArrays:
+    """The ids and distances of nearest neighbor matches for a batch of queries.
+
+    Rows correspond to queries and columns to neighbors, in the order returned
+    by the service. Queries with fewer neighbors than the widest row are
+    padded with `None` ids and `nan` distances.
+
+    Args:
+        ids (np.ndarray):
+            Required. An object array of shape (num_queries, max_neighbors)
+            with the ids of the neighbors.
+        distances (np.ndarray):
+            Required. A float32 array of shape (num_queries, max_neighbors)
+            with the distances between the neighbors and the dense query.
+        num_neighbors (np.ndarray):
+            Required. An int32 array of shape (num_queries,) with the number
+            of neighbors returned for each query.
+    """
+
+    ids: "np.ndarray"
+    distances: "np.ndarray"
+    num_neighbors: "np.ndarray"
+
+    @classmethod
+    def _from_neighbor_lists(
+        cls, neighbor_lists: List[List[Tuple[str, float]]]
+    ) -> "MatchNeighborArrays":
+        num_neighbors = np.fromiter(
+            (len(neighbors) for neighbors in neighbor_lists),
+            dtype=np.int32,
+            count=len(neighbor_lists),
+        )
+        width = int(num_neighbors.max()) if len(neighbor_lists) else 0
+        ids = np.full((len(neighbor_lists), width), None, dtype=object)
+        distances = np.full((len(neighbor_lists), width), np.nan, dtype=np.float32)
+        for i, neighbors in enumerate(neighbor_lists):
+            if neighbors:
+                row_ids, row_distances = zip(*neighbors)
+                ids[i, : len(neighbors)] = row_ids
+                distances[i, : len(neighbors)] = row_distances
+        return cls(ids=ids, distances=distances, num_neighbors=num_neighbors)
+
+
+def _queries_to_list(
+    queries: Optional[Union[List[List[float]], List[HybridQuery], "np.ndarray"]]
+) -> Optional[Union[List[List[float]], List[HybridQuery]]]:
+    """Converts a 2-D numpy array of dense queries to nested lists in bulk."""
+    if np is not None and isinstance(queries, np.ndarray):
+        if queries.ndim != 2:
+            raise ValueError(
+                "`queries` must be a 2-D array of shape (num_queries, dimensions), "
+                f"got shape {queries.shape}."
+            )
+        return queries.tolist()
+    return queries
+
+
 class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
     """Matching Engine index endpoint resource for Vertex AI."""
 
@@ -1374,11 +1438,14 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
         self._assert_gca_resource_is_available()
         return self._gca_resource.description
 
+    @instrumentation.recorded("MatchingEngineIndexEndpoint.find_neighbors")
     def find_neighbors(
         self,
         *,
         deployed_index_id: str,
-        queries: Optional[Union[List[List[float]], List[HybridQuery]]] = None,
+        queries: Optional[
+            Union[List[List[float]], List[HybridQuery], "np.ndarray"]
+        ] = None,
         num_neighbors: int = 10,
         filter: Optional[List[Namespace]] = None,
         per_crowding_attribute_neighbor_count: Optional[int] = None,
@@ -1387,7 +1454,8 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
         return_full_datapoint: bool = False,
         numeric_filter: Optional[List[NumericNamespace]] = None,
         embedding_ids: Optional[List[str]] = None,
-    ) -> List[List[MatchNeighbor]]:
+        return_arrays: bool = False,
+    ) -> Union[List[List[MatchNeighbor]], MatchNeighborArrays]:
         """Retrieves nearest neighbors for the given embedding queries on the
         specified deployed index which is deployed to either public or private
         endpoint.
@@ -1402,11 +1470,12 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
         Args:
             deployed_index_id (str):
                 Required. The ID of the DeployedIndex to match the queries against.
-            queries (Union[List[List[float]], List[HybridQuery]]):
+            queries (Union[List[List[float]], List[HybridQuery], np.ndarray]):
                 Optional. A list of queries.
 
                 For regular dense-only queries, each query is a list of floats,
-                representing a single embedding.
+                representing a single embedding. Dense-only queries can also be
+                passed as a 2-D numpy array of shape (num_queries, dimensions).
 
                 For hybrid queries, each query is a hybrid query of type
                 aiplatform.matching_engine.matching_engine_index_endpoint.HybridQuery.
@@ -1456,9 +1525,20 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
                `embedding_ids` to lookup embedding values from dataset, if embedding
                with `embedding_ids` exists in the dataset, do nearest neighbor search.
 
+            return_arrays (bool):
+                Optional. If set to true, returns the ids and distances of the
+                neighbors as numpy arrays in a `MatchNeighborArrays` instead of
+                `MatchNeighbor` objects. Requires numpy.
+
         Returns:
-            List[List[MatchNeighbor]] - A list of nearest neighbors for each query.
+            List[List[MatchNeighbor]] - A list of nearest neighbors for each query,
+            or MatchNeighborArrays if `return_arrays` is set.
         """
+        if return_arrays and np is None:
+            raise ImportError(
+                "numpy is not installed. Please install numpy to use `return_arrays`."
+            )
+        queries = _queries_to_list(queries)
 
         if not self._public_match_client:
             # Private endpoint
@@ -1471,6 +1551,7 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
                 approx_num_neighbors=approx_num_neighbors,
                 fraction_leaf_nodes_to_search_override=fraction_leaf_nodes_to_search_override,
                 numeric_filter=numeric_filter,
+                return_arrays=return_arrays,
             )
 
         # Create the FindNeighbors request
@@ -1514,56 +1595,77 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
                 "please specify `queries` or `embedding_ids` or `hybrid_queries`"
             )
 
+        # The query parameters and restricts are identical for every query, so
+        # build them once and copy the serialized template into each query.
+        query_template = gca_match_service_v1beta1.FindNeighborsRequest.Query(
+            neighbor_count=num_neighbors,
+            per_crowding_attribute_neighbor_count=per_crowding_attribute_neighbor_count,
+            approximate_neighbor_count=approx_num_neighbors,
+            fraction_leaf_nodes_to_search_override=fraction_leaf_nodes_to_search_override,
+        )
+        query_template.datapoint.restricts.extend(restricts)
+        query_template.datapoint.numeric_restricts.extend(numeric_restricts)
+        query_template_pb = gca_match_service_v1beta1.FindNeighborsRequest.Query.pb(
+            query_template
+        )
+        queries_pb = gca_match_service_v1beta1.FindNeighborsRequest.pb(
+            find_neighbors_request
+        ).queries
+
         for query in query_iterators:
-            find_neighbors_query = gca_match_service_v1beta1.FindNeighborsRequest.Query(
-                neighbor_count=num_neighbors,
-                per_crowding_attribute_neighbor_count=per_crowding_attribute_neighbor_count,
-                approximate_neighbor_count=approx_num_neighbors,
-                fraction_leaf_nodes_to_search_override=fraction_leaf_nodes_to_search_override,
-            )
+            query_pb = queries_pb.add()
+            query_pb.CopyFrom(query_template_pb)
+            datapoint_pb = query_pb.datapoint
             if query_by_id:
-                datapoint = gca_index_v1beta1.IndexDatapoint(
-                    datapoint_id=query,
-                )
+                datapoint_pb.datapoint_id = query
             elif query_is_hybrid:
-                datapoint = gca_index_v1beta1.IndexDatapoint(
-                    feature_vector=query.dense_embedding,
-                    sparse_embedding=gca_index_v1beta1.IndexDatapoint.SparseEmbedding(
-                        values=query.sparse_embedding_values,
-                        dimensions=query.sparse_embedding_dimensions,
-                    ),
-                )
-                if query.rrf_ranking_alpha:
-                    find_neighbors_query.rrf = (
-                        gca_match_service_v1beta1.FindNeighborsRequest.Query.RRF(
-                            alpha=query.rrf_ranking_alpha,
-                        )
+                if query.dense_embedding is not None:
+                    datapoint_pb.feature_vector.extend(query.dense_embedding)
+                datapoint_pb.sparse_embedding.SetInParent()
+                if query.sparse_embedding_values is not None:
+                    datapoint_pb.sparse_embedding.values.extend(
+                        query.sparse_embedding_values
+                    )
+                if query.sparse_embedding_dimensions is not None:
+                    datapoint_pb.sparse_embedding.dimensions.extend(
+                        query.sparse_embedding_dimensions
                     )
+                if query.rrf_ranking_alpha:
+                    query_pb.rrf.alpha = query.rrf_ranking_alpha
             else:
-                datapoint = gca_index_v1beta1.IndexDatapoint(
-                    feature_vector=query,
+                datapoint_pb.feature_vector.extend(query)
+
+        with instrumentation.phase("rpc"):
+            response = self._public_match_client.find_neighbors(find_neighbors_request)
+
+        with instrumentation.phase("convert_response"):
+            if return_arrays:
+                return MatchNeighborArrays._from_neighbor_lists(
+                    [
+                        [
+                            (neighbor.datapoint.datapoint_id, neighbor.distance)
+                            for neighbor in embedding_neighbors.neighbors
+                        ]
+                        for embedding_neighbors in gca_match_service_v1beta1.FindNeighborsResponse.pb(
+                            response
+                        ).nearest_neighbors
+                    ]
                 )
-            datapoint.restricts.extend(restricts)
-            datapoint.numeric_restricts.extend(numeric_restricts)
-            find_neighbors_query.datapoint = datapoint
-            find_neighbors_request.queries.append(find_neighbors_query)
 
-        response = self._public_match_client.find_neighbors(find_neighbors_request)
-
-        # Wrap the results in MatchNeighbor objects and return
-        return [
-            [
-                MatchNeighbor(
-                    id=neighbor.datapoint.datapoint_id,
-                    distance=neighbor.distance,
-                    sparse_distance=neighbor.sparse_distance
-                    if neighbor.sparse_distance
-                    else None,
-                ).from_index_datapoint(index_datapoint=neighbor.datapoint)
-                for neighbor in embedding_neighbors.neighbors
+            # Wrap the results in MatchNeighbor objects and return
+            return [
+                [
+                    MatchNeighbor(
+                        id=neighbor.datapoint.datapoint_id,
+                        distance=neighbor.distance,
+                        sparse_distance=neighbor.sparse_distance
+                        if neighbor.sparse_distance
+                        else None,
+                    ).from_index_datapoint(index_datapoint=neighbor.datapoint)
+                    for neighbor in embedding_neighbors.neighbors
+                ]
+                for embedding_neighbors in response.nearest_neighbors
             ]
-            for embedding_neighbors in response.nearest_neighbors
-        ]
 
     def read_index_datapoints(
         self,
@@ -1672,7 +1774,7 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
     def match(
         self,
         deployed_index_id: str,
-        queries: Union[List[List[float]], List[HybridQuery]] = None,
+        queries: Union[List[List[float]], List[HybridQuery], "np.ndarray"] = None,
         num_neighbors: int = 1,
         filter: Optional[List[Namespace]] = None,
         per_crowding_attribute_num_neighbors: Optional[int] = None,
@@ -1680,18 +1782,20 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
         fraction_leaf_nodes_to_search_override: Optional[float] = None,
         low_level_batch_size: int = 0,
         numeric_filter: Optional[List[NumericNamespace]] = None,
-    ) -> List[List[MatchNeighbor]]:
+        return_arrays: bool = False,
+    ) -> Union[List[List[MatchNeighbor]], MatchNeighborArrays]:
         """Retrieves nearest neighbors for the given embedding queries on the
         specified deployed index for private endpoint only.
 
         Args:
             deployed_index_id (str):
                 Required. The ID of the DeployedIndex to match the queries against.
-            queries (Union[List[List[float]], List[HybridQuery]]):
+            queries (Union[List[List[float]], List[HybridQuery], np.ndarray]):
                 Optional. A list of queries.
 
                 For regular dense-only queries, each query is a list of floats,
-                representing a single embedding.
+                representing a single embedding. Dense-only queries can also be
+                passed as a 2-D numpy array of shape (num_queries, dimensions).
 
                 For hybrid queries, each query is a hybrid query of type
                 aiplatform.matching_engine.matching_engine_index_endpoint.HybridQuery.
@@ -1729,10 +1833,21 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
                 results. For example:
                 [NumericNamespace(name="cost", value_int=5, op="GREATER")]
                 will match datapoints that its cost is greater than 5.
+            return_arrays (bool):
+                Optional. If set to true, returns the ids and distances of the
+                neighbors as numpy arrays in a `MatchNeighborArrays` instead of
+                `MatchNeighbor` objects. Requires numpy.
 
         Returns:
-            List[List[MatchNeighbor]] - A list of nearest neighbors for each query.
+            List[List[MatchNeighbor]] - A list of nearest neighbors for each query,
+            or MatchNeighborArrays if `return_arrays` is set.
         """
+        if return_arrays and np is None:
+            raise ImportError(
+                "numpy is not installed. Please install numpy to use `return_arrays`."
+            )
+        queries = _queries_to_list(queries)
+
         stub = self._instantiate_private_match_service_stub(
             deployed_index_id=deployed_index_id,
             ip_address=self._private_service_connect_ip_address,
@@ -1773,44 +1888,57 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
                     numeric_restrict.value_double = numeric_namespace.value_double
                 numeric_restricts.append(numeric_restrict)
 
-        requests = []
-        if queries:
-            query_is_hybrid = isinstance(queries[0], HybridQuery)
-            for query in queries:
-                request = match_service_pb2.MatchRequest(
-                    deployed_index_id=deployed_index_id,
-                    float_val=query.dense_embedding if query_is_hybrid else query,
-                    num_neighbors=num_neighbors,
-                    restricts=restricts,
-                    per_crowding_attribute_num_neighbors=per_crowding_attribute_num_neighbors,
-                    approx_num_neighbors=approx_num_neighbors,
-                    fraction_leaf_nodes_to_search_override=fraction_leaf_nodes_to_search_override,
-                    numeric_restricts=numeric_restricts,
-                    sparse_embedding=match_service_pb2.SparseEmbedding(
-                        float_val=query.sparse_embedding_values,
-                        dimension=query.sparse_embedding_dimensions,
-                    )
-                    if query_is_hybrid
-                    else None,
-                    rrf=match_service_pb2.MatchRequest.RRF(
-                        alpha=query.rrf_ranking_alpha,
-                    )
-                    if query_is_hybrid and query.rrf_ranking_alpha
-                    else None,
-                )
-                requests.append(request)
-        else:
+        if not queries:
             raise ValueError(
                 "To find neighbors using matching engine,"
                 "please specify `queries` or `embedding_ids`"
             )
 
-        batch_request_for_index.requests.extend(requests)
+        # The request parameters and restricts are identical for every query,
+        # so build them once and copy the template into each request.
+        request_template = match_service_pb2.MatchRequest(
+            deployed_index_id=deployed_index_id,
+            num_neighbors=num_neighbors,
+            restricts=restricts,
+            per_crowding_attribute_num_neighbors=per_crowding_attribute_num_neighbors,
+            approx_num_neighbors=approx_num_neighbors,
+            fraction_leaf_nodes_to_search_override=fraction_leaf_nodes_to_search_override,
+            numeric_restricts=numeric_restricts,
+        )
+        query_is_hybrid = isinstance(queries[0], HybridQuery)
+        for query in queries:
+            request = batch_request_for_index.requests.add()
+            request.CopyFrom(request_template)
+            if query_is_hybrid:
+                if query.dense_embedding is not None:
+                    request.float_val.extend(query.dense_embedding)
+                request.sparse_embedding.SetInParent()
+                if query.sparse_embedding_values is not None:
+                    request.sparse_embedding.float_val.extend(
+                        query.sparse_embedding_values
+                    )
+                if query.sparse_embedding_dimensions is not None:
+                    request.sparse_embedding.dimension.extend(
+                        query.sparse_embedding_dimensions
+                    )
+                if query.rrf_ranking_alpha:
+                    request.rrf.alpha = query.rrf_ranking_alpha
+            else:
+                request.float_val.extend(query)
+
         batch_request.requests.append(batch_request_for_index)
 
         # Perform the request
         response = stub.BatchMatch(batch_request)
 
+        if return_arrays:
+            return MatchNeighborArrays._from_neighbor_lists(
+                [
+                    [(neighbor.id, neighbor.distance) for neighbor in resp.neighbor]
+                    for resp in response.responses[0].responses
+                ]
+            )
+
         # Wrap the results in MatchNeighbor objects and return
         match_neighbors_response = []
         for resp in response.responses[0].responses:
@@ -14,3 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+
+# The modules of this package import each other and only import cleanly when
+# `metadata` is imported first, whichever module is requested.
+from google.cloud.aiplatform.metadata import metadata  # noqa: F401
@@ -598,7 +598,7 @@ def register_model(
     staging_bucket: Optional[str] = None,
     sync: Optional[bool] = True,
     upload_request_timeout: Optional[float] = None,
-) -> models.Model:
+) -> "models.Model":
     """Register an ExperimentModel to Model Registry and returns a Model representing the registered Model resource.
 
     Args:
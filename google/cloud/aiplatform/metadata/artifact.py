@@ -450,9 +450,14 @@ class Artifact(resource._Resource):
 
 
 class _VertexResourceArtifactResolver:
+    @staticmethod
+    def _resource_to_artifact_type() -> Dict[type, str]:
+        """Maps the supported Vertex resource types to their artifact schema.
 
-    # TODO(b/235594717) Add support for managed datasets
-    _resource_to_artifact_type = {models.Model: "google.VertexModel"}
+        Built on use because models imports this module indirectly.
+        """
+        # TODO(b/235594717) Add support for managed datasets
+        return {models.Model: "google.VertexModel"}
 
     @classmethod
     def supports_metadata(cls, resource: base.VertexAiResourceNoun) -> bool:
@@ -464,7 +469,7 @@ class _VertexResourceArtifactResolver:
         Returns:
             True if Vertex resource is supported in Vertex Metadata otherwise False.
         """
-        return type(resource) in cls._resource_to_artifact_type
+        return type(resource) in cls._resource_to_artifact_type()
 
     @classmethod
     def validate_resource_supports_metadata(cls, resource: base.VertexAiResourceNoun):
@@ -479,12 +484,12 @@ class _VertexResourceArtifactResolver:
         if not cls.supports_metadata(resource):
             raise ValueError(
                 f"Vertex {type(resource)} is not yet supported in Vertex Metadata."
-                f"Only {list(cls._resource_to_artifact_type.keys())} are supported"
+                f"Only {list(cls._resource_to_artifact_type().keys())} are supported"
             )
 
     @classmethod
     def resolve_vertex_resource(
-        cls, resource: Union[models.Model]
+        cls, resource: Union["models.Model"]
     ) -> Optional[Artifact]:
         """Resolves Vertex Metadata Artifact that represents this Vertex Resource.
 
@@ -499,7 +504,7 @@ class _VertexResourceArtifactResolver:
         """
         cls.validate_resource_supports_metadata(resource)
         resource.wait()
-        metadata_type = cls._resource_to_artifact_type[type(resource)]
+        metadata_type = cls._resource_to_artifact_type()[type(resource)]
         uri = rest_utils.make_gcp_resource_rest_url(resource=resource)
 
         artifacts = Artifact.list(
@@ -518,7 +523,9 @@ class _VertexResourceArtifactResolver:
             return artifacts[0]
 
     @classmethod
-    def create_vertex_resource_artifact(cls, resource: Union[models.Model]) -> Artifact:
+    def create_vertex_resource_artifact(
+        cls, resource: Union["models.Model"]
+    ) -> Artifact:
         """Creates Vertex Metadata Artifact that represents this Vertex Resource.
 
         Args:
@@ -530,7 +537,7 @@ class _VertexResourceArtifactResolver:
         cls.validate_resource_supports_metadata(resource)
         resource.wait()
 
-        metadata_type = cls._resource_to_artifact_type[type(resource)]
+        metadata_type = cls._resource_to_artifact_type()[type(resource)]
         uri = rest_utils.make_gcp_resource_rest_url(resource=resource)
 
         return Artifact.create(
@@ -548,7 +555,7 @@ class _VertexResourceArtifactResolver:
 
     @classmethod
     def resolve_or_create_resource_artifact(
-        cls, resource: Union[models.Model]
+        cls, resource: Union["models.Model"]
     ) -> Artifact:
         """Create of gets Vertex Metadata Artifact that represents this Vertex Resource.
 
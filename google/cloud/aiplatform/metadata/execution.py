@@ -275,7 +275,7 @@ class Execution(resource._Resource):
         self.update(state=state)
 
     def assign_input_artifacts(
-        self, artifacts: List[Union[artifact.Artifact, models.Model]]
+        self, artifacts: List[Union[artifact.Artifact, "models.Model"]]
     ):
         """Assigns Artifacts as inputs to this Executions.
 
@@ -286,7 +286,7 @@ class Execution(resource._Resource):
         self._add_artifact(artifacts=artifacts, input=True)
 
     def assign_output_artifacts(
-        self, artifacts: List[Union[artifact.Artifact, models.Model]]
+        self, artifacts: List[Union[artifact.Artifact, "models.Model"]]
     ):
         """Assigns Artifacts as outputs to this Executions.
 
@@ -298,7 +298,7 @@ class Execution(resource._Resource):
 
     def _add_artifact(
         self,
-        artifacts: List[Union[artifact.Artifact, models.Model]],
+        artifacts: List[Union[artifact.Artifact, "models.Model"]],
         input: bool,
     ):
         """Connect Artifact to a given Execution.
@@ -633,7 +633,7 @@ class ExperimentRun(
             }
         return {}
 
-    def _log_pipeline_job(self, pipeline_job: pipeline_jobs.PipelineJob):
+    def _log_pipeline_job(self, pipeline_job: "pipeline_jobs.PipelineJob"):
         """Associate this PipelineJob's Context to the current ExperimentRun Context as a child context.
 
         Args:
@@ -648,7 +648,7 @@ class ExperimentRun(
     def log(
         self,
         *,
-        pipeline_job: Optional[pipeline_jobs.PipelineJob] = None,
+        pipeline_job: Optional["pipeline_jobs.PipelineJob"] = None,
     ):
         """Log a Vertex Resource to this experiment run.
 
@@ -1270,9 +1270,17 @@ class ExperimentRun(
         return experiment_model
 
     @_v1_not_supported
-    def get_time_series_data_frame(self) -> "pd.DataFrame":  # noqa: F821
+    def get_time_series_data_frame(
+        self, max_points: Optional[int] = None
+    ) -> "pd.DataFrame":  # noqa: F821
         """Returns all time series in this Run as a DataFrame.
 
+        Args:
+            max_points (int):
+                Optional. The maximum number of data points read for each time
+                series. Longer time series are downsampled by the service. All
+                data points are read if not set.
+
         Returns:
             pd.DataFrame: Time series metrics in this Run as a Dataframe.
         """
@@ -1286,28 +1294,28 @@ class ExperimentRun(
 
         if not self._backing_tensorboard_run:
             return pd.DataFrame({})
-        data = self._backing_tensorboard_run.resource.read_time_series_data()
+        data = self._backing_tensorboard_run.resource.to_dataframe(
+            max_points=max_points
+        )
 
-        if not data:
+        if data.empty:
             return pd.DataFrame({})
 
-        return (
-            pd.DataFrame(
-                {
-                    name: entry.scalar.value,
-                    "step": entry.step,
-                    "wall_time": entry.wall_time,
-                }
-                for name, ts in data.items()
-                for entry in ts.values
-            )
-            .groupby(["step", "wall_time"])
+        # One column per time series, in the order of the time series.
+        time_series_names = list(dict.fromkeys(data["time_series"]))
+        data["time_series"] = data["time_series"].astype(str)
+        time_series_df = (
+            data.groupby(["step", "wall_time", "time_series"])["value"]
             .first()
+            .unstack("time_series")
+            .reindex(columns=time_series_names)
             .reset_index()
         )
+        time_series_df.columns.name = None
+        return time_series_df
 
     @_v1_not_supported
-    def get_logged_pipeline_jobs(self) -> List[pipeline_jobs.PipelineJob]:
+    def get_logged_pipeline_jobs(self) -> List["pipeline_jobs.PipelineJob"]:
         """Get all PipelineJobs associated to this experiment run.
 
         Returns:
@@ -1327,7 +1335,7 @@ class ExperimentRun(
         ]
 
     @_v1_not_supported
-    def get_logged_custom_jobs(self) -> List[jobs.CustomJob]:
+    def get_logged_custom_jobs(self) -> List["jobs.CustomJob"]:
         """Get all CustomJobs associated to this experiment run.
 
         Returns:
@@ -846,7 +846,7 @@ class _ExperimentTracker:
     def log(
         self,
         *,
-        pipeline_job: Optional[pipeline_jobs.PipelineJob] = None,
+        pipeline_job: Optional["pipeline_jobs.PipelineJob"] = None,
     ):
         """Log Vertex AI Resources to the current experiment run.
 
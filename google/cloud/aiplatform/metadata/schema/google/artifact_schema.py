@@ -23,7 +23,7 @@ from google.cloud.aiplatform.compat.types import artifact as gca_artifact
 from google.cloud.aiplatform.metadata import _models
 from google.cloud.aiplatform.metadata.schema import base_artifact
 from google.cloud.aiplatform.metadata.schema import utils
-from google.cloud.aiplatform.models import Model
+from google.cloud.aiplatform import models
 
 # The artifact property key for the resource_name
 _ARTIFACT_PROPERTY_KEY_RESOURCE_NAME = "resourceName"
@@ -807,7 +807,7 @@ class ExperimentModel(base_artifact.BaseArtifactSchema):
         staging_bucket: Optional[str] = None,
         sync: Optional[bool] = True,
         upload_request_timeout: Optional[float] = None,
-    ) -> Model:
+    ) -> "models.Model":
         """Register an ExperimentModel to Model Registry and returns a Model representing the registered Model resource.
 
         Example Usage:
@@ -14,12 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
+import functools
 import itertools
 import json
 import pathlib
 import re
 import shutil
 import tempfile
+import time
 import requests
 from typing import (
     Any,
@@ -52,6 +55,8 @@ from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.utils import gcs_utils
 from google.cloud.aiplatform.utils import _explanation_utils
 from google.cloud.aiplatform.utils import _ipython_utils
+from google.cloud.aiplatform.utils import grpc_utils
+from google.cloud.aiplatform.utils import instrumentation
 from google.cloud.aiplatform import model_evaluation
 from google.cloud.aiplatform.compat.services import endpoint_service_client
 from google.cloud.aiplatform.compat.services import (
@@ -91,6 +96,15 @@ _RAW_PREDICT_DEPLOYED_MODEL_ID_KEY = "X-Vertex-AI-Deployed-Model-Id"
 _RAW_PREDICT_MODEL_RESOURCE_KEY = "X-Vertex-AI-Model"
 _RAW_PREDICT_MODEL_VERSION_ID_KEY = "X-Vertex-AI-Model-Version-Id"
 
+# Connections kept open per host by the HTTP client of a PrivateEndpoint.
+# Requests made while all of them are in use open extra connections, which
+# are closed after the request unless `http_pool_block` is set.
+_PRIVATE_ENDPOINT_HTTP_POOL_MAXSIZE = 10
+# Number of hosts the HTTP client of a PrivateEndpoint keeps connections to.
+_PRIVATE_ENDPOINT_HTTP_NUM_POOLS = 10
+# Only the beginning of the body of a failed HTTP response is reported.
+_MAX_HTTP_ERROR_BODY_BYTES = 4096
+
 _LOGGER = base.Logger(__name__)
 
 
@@ -677,6 +691,10 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
         self.raw_predict_request_url = None
         self.stream_raw_predict_request_url = None
 
+        # Subclasses start the warm up once they are fully constructed.
+        if initializer.global_config.prewarm and type(self) is Endpoint:
+            grpc_utils.start_warm_up(self.warmup)
+
     @property
     def _prediction_client(self) -> utils.PredictionClientWithOverride:
         # The attribute might not exist due to issues in
@@ -707,6 +725,29 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
             )
         return self._prediction_async_client_value
 
+    def warmup(self, timeout: Optional[float] = None) -> None:
+        """Connects the client used to send prediction requests to this Endpoint.
+
+        Otherwise the prediction client is created by the first request, which
+        then also pays for fetching an access token and opening the connection.
+        Use `aiplatform.init(prewarm=True)` to warm up Endpoints in the
+        background when they are created.
+
+        Example usage:
+            endpoint = aiplatform.Endpoint("123")
+            endpoint.warmup(timeout=10)
+            prediction = endpoint.predict(instances=[...])
+
+        Args:
+            timeout (float):
+                Optional. How long to wait for the connection, in seconds.
+                Waits until it is connected if not set.
+
+        Raises:
+            grpc.FutureTimeoutError: If the connection was not established in time.
+        """
+        grpc_utils.warm_up_client(self._prediction_client, timeout=timeout)
+
     def _skipped_getter_call(self) -> bool:
         """Check if GAPIC resource was populated by call to get/list API methods
 
@@ -722,6 +763,7 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
             self._gca_resource = self._get_gca_resource(
                 resource_name=self._gca_resource.name
             )
+            self._gca_resource_sync_time = time.monotonic()
 
     def _assert_gca_resource_is_available(self) -> None:
         """Ensures Endpoint getter was called at least once before
@@ -739,7 +781,7 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
         The traffic percentage values must add up to 100, or map must be empty if
         the Endpoint is to not accept any traffic at a moment.
         """
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return dict(self._gca_resource.traffic_split)
 
     @property
@@ -1995,18 +2037,20 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
                     "Sum of all traffic within traffic split needs to be 100."
                 )
 
-        # Two or more models deployed to Endpoint and remaining traffic will be zero
-        elif (
-            len(self.traffic_split) > 1
-            and deployed_model_id in self._gca_resource.traffic_split
-            and self._gca_resource.traffic_split[deployed_model_id] == 100
-        ):
-            raise ValueError(
-                f"Undeploying deployed model '{deployed_model_id}' would leave the remaining "
-                "traffic split at 0%. Traffic split must add up to 100% when models are "
-                "deployed. Please undeploy the other models first or provide an updated "
-                "traffic_split."
-            )
+        else:
+            self._sync_gca_resource()
+            # Two or more models deployed to Endpoint and remaining traffic will be zero
+            if (
+                len(self._gca_resource.traffic_split) > 1
+                and deployed_model_id in self._gca_resource.traffic_split
+                and self._gca_resource.traffic_split[deployed_model_id] == 100
+            ):
+                raise ValueError(
+                    f"Undeploying deployed model '{deployed_model_id}' would leave the remaining "
+                    "traffic split at 0%. Traffic split must add up to 100% when models are "
+                    "deployed. Please undeploy the other models first or provide an updated "
+                    "traffic_split."
+                )
 
         self._undeploy(
             deployed_model_id=deployed_model_id,
@@ -2173,6 +2217,7 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
 
         return self
 
+    @instrumentation.recorded("Endpoint.predict")
     def predict(
         self,
         instances: List,
@@ -2290,27 +2335,31 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
             )
 
         else:
-            prediction_response = self._prediction_client.predict(
-                endpoint=self._gca_resource.name,
-                instances=instances,
-                parameters=parameters,
-                timeout=timeout,
-            )
-            if prediction_response._pb.metadata:
-                metadata = json_format.MessageToDict(prediction_response._pb.metadata)
-            else:
-                metadata = None
-
-            return Prediction(
-                predictions=[
-                    json_format.MessageToDict(item)
-                    for item in prediction_response.predictions.pb
-                ],
-                metadata=metadata,
-                deployed_model_id=prediction_response.deployed_model_id,
-                model_version_id=prediction_response.model_version_id,
-                model_resource_name=prediction_response.model,
-            )
+            with instrumentation.phase("rpc"):
+                prediction_response = self._prediction_client.predict(
+                    endpoint=self._gca_resource.name,
+                    instances=instances,
+                    parameters=parameters,
+                    timeout=timeout,
+                )
+            with instrumentation.phase("convert_response"):
+                if prediction_response._pb.metadata:
+                    metadata = json_format.MessageToDict(
+                        prediction_response._pb.metadata
+                    )
+                else:
+                    metadata = None
+
+                return Prediction(
+                    predictions=[
+                        json_format.MessageToDict(item)
+                        for item in prediction_response.predictions.pb
+                    ],
+                    metadata=metadata,
+                    deployed_model_id=prediction_response.deployed_model_id,
+                    model_version_id=prediction_response.model_version_id,
+                    model_resource_name=prediction_response.model,
+                )
 
     async def predict_async(
         self,
@@ -3018,7 +3067,7 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
             deployed_models (List[aiplatform.gapic.DeployedModel]):
                 A list of the models deployed in this Endpoint.
         """
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return list(self._gca_resource.deployed_models)
 
     def undeploy_all(self, sync: bool = True) -> "Endpoint":
@@ -3087,6 +3136,12 @@ class PrivateEndpoint(Endpoint):
         project: Optional[str] = None,
         location: Optional[str] = None,
         credentials: Optional[auth_credentials.Credentials] = None,
+        *,
+        http_pool_maxsize: int = _PRIVATE_ENDPOINT_HTTP_POOL_MAXSIZE,
+        http_num_pools: int = _PRIVATE_ENDPOINT_HTTP_NUM_POOLS,
+        http_pool_block: bool = False,
+        http_timeout: Optional[float] = None,
+        use_orjson: bool = False,
     ):
         """Retrieves a PrivateEndpoint resource.
 
@@ -3101,6 +3156,14 @@ class PrivateEndpoint(Endpoint):
                 endpoint_name="1234567891234567890"
             )
 
+            or (to serve many concurrent requests)
+
+            my_private_endpoint = aiplatform.PrivateEndpoint(
+                endpoint_name="1234567891234567890",
+                http_pool_maxsize=64,
+                use_orjson=True,
+            )
+
         Args:
             endpoint_name (str):
                 Required. A fully-qualified endpoint resource name or endpoint ID.
@@ -3115,13 +3178,30 @@ class PrivateEndpoint(Endpoint):
             credentials (auth_credentials.Credentials):
                 Optional. Custom credentials to use to upload this model. Overrides
                 credentials set in aiplatform.init.
+            http_pool_maxsize (int):
+                Optional. The number of connections kept open to each host.
+                `predict`, `raw_predict` and `health_check` reuse these
+                connections. Set it to the number of concurrent requests.
+            http_num_pools (int):
+                Optional. The number of hosts connections are kept open to.
+            http_pool_block (bool):
+                Optional. If set, a request waits for a free connection when
+                `http_pool_maxsize` connections are in use, instead of opening
+                a connection that is closed after the request.
+            http_timeout (float):
+                Optional. The connect and read timeout of the HTTP requests in
+                seconds. Requests do not time out if not set.
+            use_orjson (bool):
+                Optional. If set, `predict` encodes and decodes JSON with
+                orjson, which also serializes numpy arrays.
 
         Raises:
             ValueError: If the Endpoint being retrieved is not a PrivateEndpoint.
-            ImportError: If there is an issue importing the `urllib3` package.
+            ImportError: If there is an issue importing the `urllib3` package,
+                or the `orjson` package if `use_orjson` is set.
         """
         try:
-            import urllib3
+            import urllib3  # noqa: F401
         except ImportError:
             raise ImportError(
                 "Cannot import the urllib3 HTTP client. Please install google-cloud-aiplatform[private_endpoints]."
@@ -3139,7 +3219,88 @@ class PrivateEndpoint(Endpoint):
                 "Please ensure the Endpoint being retrieved is a PrivateEndpoint."
             )
 
-        self._http_client = urllib3.PoolManager(cert_reqs="CERT_NONE")
+        self._init_http_client(
+            http_pool_maxsize=http_pool_maxsize,
+            http_num_pools=http_num_pools,
+            http_pool_block=http_pool_block,
+            http_timeout=http_timeout,
+            use_orjson=use_orjson,
+        )
+
+        if initializer.global_config.prewarm:
+            grpc_utils.start_warm_up(self.warmup)
+
+    def _init_http_client(
+        self,
+        http_pool_maxsize: int = _PRIVATE_ENDPOINT_HTTP_POOL_MAXSIZE,
+        http_num_pools: int = _PRIVATE_ENDPOINT_HTTP_NUM_POOLS,
+        http_pool_block: bool = False,
+        http_timeout: Optional[float] = None,
+        use_orjson: bool = False,
+    ) -> None:
+        """Creates the HTTP client and the JSON codec of this PrivateEndpoint.
+
+        See `PrivateEndpoint.__init__` for the arguments.
+
+        Raises:
+            ImportError: If there is an issue importing the `urllib3` package,
+                or the `orjson` package if `use_orjson` is set.
+        """
+        try:
+            import urllib3
+        except ImportError:
+            raise ImportError(
+                "Cannot import the urllib3 HTTP client. Please install google-cloud-aiplatform[private_endpoints]."
+            )
+
+        if use_orjson:
+            try:
+                import orjson
+            except ImportError:
+                raise ImportError(
+                    "orjson is not installed. Please install orjson to use `use_orjson`."
+                )
+            self._json_dumps = functools.partial(
+                orjson.dumps, option=orjson.OPT_SERIALIZE_NUMPY
+            )
+            self._json_loads = orjson.loads
+        else:
+            self._json_dumps = json.dumps
+            self._json_loads = json.loads
+
+        pool_kwargs = {}
+        if http_timeout is not None:
+            pool_kwargs["timeout"] = urllib3.Timeout(total=http_timeout)
+        self._http_client = urllib3.PoolManager(
+            num_pools=http_num_pools,
+            maxsize=http_pool_maxsize,
+            block=http_pool_block,
+            cert_reqs="CERT_NONE",
+            **pool_kwargs,
+        )
+
+    def warmup(self, timeout: Optional[float] = None) -> None:
+        """Opens a connection to this PrivateEndpoint.
+
+        PrivateEndpoints are called over HTTP inside the peered network, so
+        there is no gRPC channel to connect. Instead, a health check request
+        opens a connection that is kept in the pool for the next requests.
+        This is only done for PSA based private endpoints with a deployed
+        model, since PSC based private endpoints are only reachable through
+        the `endpoint_override` of each request.
+
+        Args:
+            timeout (float):
+                Optional. Unused, accepted for compatibility with
+                `Endpoint.warmup`.
+        """
+        self._sync_gca_resource_if_skipped()
+        if (
+            self.private_service_connect_config
+            or not self._gca_resource.deployed_models
+        ):
+            return
+        self.health_check()
 
     @property
     def predict_http_uri(self) -> Optional[str]:
@@ -3367,13 +3528,6 @@ class PrivateEndpoint(Endpoint):
         Raises:
             ImportError: If there is an issue importing the `urllib3` package.
         """
-        try:
-            import urllib3
-        except ImportError:
-            raise ImportError(
-                "Cannot import the urllib3 HTTP client. Please install google-cloud-aiplatform[private_endpoints]."
-            )
-
         endpoint = super()._construct_sdk_resource_from_gapic(
             gapic_resource=gapic_resource,
             project=project,
@@ -3381,7 +3535,7 @@ class PrivateEndpoint(Endpoint):
             credentials=credentials,
         )
 
-        endpoint._http_client = urllib3.PoolManager(cert_reqs="CERT_NONE")
+        endpoint._init_http_client()
 
         return endpoint
 
@@ -3389,7 +3543,7 @@ class PrivateEndpoint(Endpoint):
         self,
         method: str,
         url: str,
-        body: Optional[Dict[Any, Any]] = None,
+        body: Optional[Union[str, bytes]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> "urllib3.response.HTTPResponse":  # type: ignore # noqa: F821
         """Helper function used to perform HTTP requests for PrivateEndpoint.
@@ -3399,7 +3553,7 @@ class PrivateEndpoint(Endpoint):
                 Required. The HTTP request method to use. Example: "POST" or "GET"
             url (str):
                 Required. The url used to send requests and get responses from.
-            body (Dict[Any, Any]):
+            body (Union[str, bytes]):
                 Optional. Data sent to the url in the HTTP request. For a PrivateEndpoint,
                 an instance is sent and a prediction response is expected.
             headers (Dict[str, str]):
@@ -3432,7 +3586,9 @@ class PrivateEndpoint(Endpoint):
             else:
                 raise RuntimeError(
                     f"{response.status} - Failed to make request, see response: "
-                    + response.data.decode("utf-8")
+                    + response.data[:_MAX_HTTP_ERROR_BODY_BYTES].decode(
+                        "utf-8", errors="replace"
+                    )
                 )
 
         except urllib3.exceptions.MaxRetryError as exc:
@@ -3530,10 +3686,10 @@ class PrivateEndpoint(Endpoint):
             response = self._http_request(
                 method="POST",
                 url=self.predict_http_uri,
-                body=json.dumps({"instances": instances}),
+                body=self._json_dumps({"instances": instances}),
                 headers={"Content-Type": "application/json"},
             )
-            prediction_response = json.loads(response.data)
+            prediction_response = self._json_loads(response.data)
 
             return Prediction(
                 predictions=prediction_response.get("predictions"),
@@ -3567,11 +3723,11 @@ class PrivateEndpoint(Endpoint):
             response = self._http_request(
                 method="POST",
                 url=url,
-                body=json.dumps({"instances": instances}),
+                body=self._json_dumps({"instances": instances}),
                 headers=headers,
             )
 
-            prediction_response = json.loads(response.data)
+            prediction_response = self._json_loads(response.data)
 
             return Prediction(
                 predictions=prediction_response.get("predictions"),
@@ -3581,6 +3737,51 @@ class PrivateEndpoint(Endpoint):
                 model_version_id=prediction_response.get("modelVersionId"),
             )
 
+    async def predict_async(
+        self,
+        instances: List,
+        *,
+        parameters: Optional[Dict] = None,
+        endpoint_override: Optional[str] = None,
+    ) -> Prediction:
+        """Make an asynchronous prediction against this PrivateEndpoint.
+
+        The HTTP request is made in the default executor of the running event
+        loop, over the connections shared with `predict`. Set
+        `http_pool_maxsize` to the number of concurrent requests so that
+        connections are reused.
+
+        Example usage:
+            ```
+            response = await my_private_endpoint.predict_async(instances=[...])
+            my_predictions = response.predictions
+            ```
+
+        Args:
+            instances (List):
+                Required. The instances that are the input to the
+                prediction call. See `PrivateEndpoint.predict`.
+            parameters (Dict):
+                Optional. The parameters that govern the prediction. See
+                `PrivateEndpoint.predict`.
+            endpoint_override (Optional[str]):
+                The Private Service Connect endpoint's IP address or DNS that
+                points to the endpoint's service attachment.
+
+        Returns:
+            prediction (aiplatform.Prediction):
+                Prediction object with returned predictions and Model ID.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.predict,
+                instances=instances,
+                parameters=parameters,
+                endpoint_override=endpoint_override,
+            ),
+        )
+
     def raw_predict(
         self,
         body: bytes,
@@ -5439,7 +5640,7 @@ class Model(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
         create_request_timeout: Optional[float] = None,
         batch_size: Optional[int] = None,
         service_account: Optional[str] = None,
-    ) -> jobs.BatchPredictionJob:
+    ) -> "jobs.BatchPredictionJob":
         """Creates a batch prediction job using this Model and outputs
         prediction results to the provided destination prefix in the specified
         `predictions_format`. One source and one destination prefix are
@@ -6722,7 +6923,7 @@ class Model(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
     def get_model_evaluation(
         self,
         evaluation_id: Optional[str] = None,
-    ) -> Optional[model_evaluation.ModelEvaluation]:
+    ) -> Optional["model_evaluation.ModelEvaluation"]:
         """Returns a ModelEvaluation resource and instantiates its representation.
         If no evaluation_id is passed, it will return the first evaluation associated
         with this model. If the aiplatform.Model resource was instantiated with a
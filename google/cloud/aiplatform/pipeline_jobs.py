@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 
+import concurrent.futures
 import datetime
 import logging
 import re
@@ -37,6 +38,7 @@ from google.cloud.aiplatform.metadata import execution
 from google.cloud.aiplatform.metadata import experiment_resources
 from google.cloud.aiplatform.metadata import utils as metadata_utils
 from google.cloud.aiplatform.utils import gcs_utils
+from google.cloud.aiplatform.utils import job_watcher
 from google.cloud.aiplatform.utils import pipeline_utils
 from google.cloud.aiplatform.utils import yaml_utils
 from google.protobuf import field_mask_pb2 as field_mask
@@ -120,6 +122,8 @@ class PipelineJob(
 
     # Required by the done() method
     _valid_done_states = _PIPELINE_COMPLETE_STATES
+    # Required by the job watcher
+    _valid_error_states = _PIPELINE_ERROR_STATES
 
     def __init__(
         self,
@@ -629,6 +633,29 @@ class PipelineJob(
         else:
             super().wait()
 
+    def watch(
+        self, callback: Optional[Callable[["PipelineJob"], None]] = None
+    ) -> concurrent.futures.Future:
+        """Watches this PipelineJob for completion with the shared job watcher.
+
+        Unlike `wait`, this does not block and does not poll the pipeline on
+        its own: all watched pipelines in a location are checked together with
+        a single filtered list call.
+
+        Args:
+            callback (Callable[[PipelineJob], None]):
+                Optional. Called with this PipelineJob once it completes.
+
+        Returns:
+            concurrent.futures.Future: A future that resolves to this
+            PipelineJob once it completes, or raises RuntimeError if it failed.
+        """
+        return job_watcher.get_default_watcher().watch(self, callback=callback)
+
+    async def wait_async(self):
+        """Wait for this PipelineJob to complete without blocking the event loop."""
+        await job_watcher.get_default_watcher().wait_async(self)
+
     def batch_delete(
         self,
         project: str,
@@ -740,12 +767,12 @@ class PipelineJob(
     @property
     def state(self) -> Optional[gca_pipeline_state.PipelineState]:
         """Current pipeline state."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._gca_resource.state
 
     @property
     def task_details(self) -> List[gca_pipeline_job.PipelineTaskDetail]:
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return list(self._gca_resource.job_detail.task_details)
 
     @property
@@ -772,7 +799,8 @@ class PipelineJob(
         multiplier = _WAIT_TIME_MULTIPLIER  # scale wait by 2 every iteration
 
         previous_time = time.time()
-        while self.state not in _PIPELINE_COMPLETE_STATES:
+        self._sync_gca_resource()
+        while self._gca_resource.state not in _PIPELINE_COMPLETE_STATES:
             current_time = time.time()
             if current_time - previous_time >= log_wait:
                 _LOGGER.info(
@@ -786,6 +814,7 @@ class PipelineJob(
                 log_wait = min(log_wait * multiplier, max_wait)
                 previous_time = current_time
             time.sleep(wait)
+            self._sync_gca_resource()
 
         # Error is only populated when the job state is
         # JOB_STATE_FAILED or JOB_STATE_CANCELLED.
@@ -917,6 +946,7 @@ class PipelineJob(
         if not self._gca_resource:
             return False
 
+        self._sync_gca_resource_if_cached()
         return self.state in _PIPELINE_COMPLETE_STATES
 
     def _get_context(self) -> context.Context:
@@ -932,11 +962,13 @@ class PipelineJob(
         pipeline_run_context = self._gca_resource.job_detail.pipeline_run_context
 
         # PipelineJob context is created asynchronously so we need to poll until it exists.
-        while not self.done():
+        self._sync_gca_resource()
+        while self._gca_resource.state not in _PIPELINE_COMPLETE_STATES:
             pipeline_run_context = self._gca_resource.job_detail.pipeline_run_context
             if pipeline_run_context:
                 break
             time.sleep(1)
+            self._sync_gca_resource()
 
         if not pipeline_run_context:
             if self.has_failed:
@@ -153,7 +153,7 @@ class _Schedule(
         Returns:
             Schedule state.
         """
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._gca_resource.state
 
     @property
@@ -163,7 +163,7 @@ class _Schedule(
         Returns:
             Schedule max_run_count.
         """
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._gca_resource.max_run_count
 
     @property
@@ -173,7 +173,7 @@ class _Schedule(
         Returns:
             Schedule cron.
         """
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._gca_resource.cron
 
     @property
@@ -183,7 +183,7 @@ class _Schedule(
         Returns:
             Schedule max_concurrent_run_count.
         """
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._gca_resource.max_concurrent_run_count
 
     @property
@@ -193,7 +193,7 @@ class _Schedule(
         Returns:
             Schedule allow_queueing.
         """
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._gca_resource.allow_queueing
 
     def _block_until_complete(self) -> None:
@@ -205,7 +205,8 @@ class _Schedule(
         multiplier = 2  # scale wait by 2 every iteration
 
         previous_time = time.time()
-        while self.state not in _SCHEDULE_COMPLETE_STATES:
+        self._sync_gca_resource()
+        while self._gca_resource.state not in _SCHEDULE_COMPLETE_STATES:
             current_time = time.time()
             if current_time - previous_time >= log_wait:
                 _LOGGER.info(
@@ -219,6 +220,7 @@ class _Schedule(
                 log_wait = min(log_wait * multiplier, max_wait)
                 previous_time = current_time
             time.sleep(wait)
+            self._sync_gca_resource()
 
         # Error is only populated when the schedule state is STATE_UNSPECIFIED.
         if self._gca_resource.state in _SCHEDULE_ERROR_STATES:
@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 
+from concurrent import futures
 from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from google.auth import credentials as auth_credentials
@@ -586,6 +587,8 @@ class TensorboardRun(_TensorboardServiceResource):
     _parse_resource_name_method = "parse_tensorboard_run_path"
     _format_resource_name_method = "tensorboard_run_path"
     READ_TIME_SERIES_BATCH_SIZE = 20
+    READ_TIME_SERIES_MAX_CONCURRENCY = 8
+    TIME_SERIES_DATAFRAME_COLUMNS = ("time_series", "step", "wall_time", "value")
 
     def __init__(
         self,
@@ -1005,18 +1008,156 @@ class TensorboardRun(_TensorboardServiceResource):
 
         return tb_time_series
 
-    def read_time_series_data(self) -> Dict[str, gca_tensorboard_data.TimeSeriesData]:
+    def read_time_series_data(
+        self, max_points: Optional[int] = None
+    ) -> Dict[str, gca_tensorboard_data.TimeSeriesData]:
         """Read the time series data of this run.
 
+        The time series are read with concurrent requests.
+
         ```py
         time_series_data = tensorboard_run.read_time_series_data()
 
         print(time_series_data['loss'].values[-1].scalar.value)
         ```
 
+        Args:
+            max_points (int):
+                Optional. The maximum number of data points read for each time
+                series. Longer time series are downsampled by the service. All
+                data points are read if not set.
+
         Returns:
             Dictionary of time series metric id to TimeSeriesData.
         """
+        return {
+            display_name: gca_tensorboard_data.TimeSeriesData.wrap(data)
+            for display_name, data in self._read_time_series_data_pbs(
+                max_points=max_points
+            ).items()
+        }
+
+    def to_dataframe(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        max_points: Optional[int] = None,
+    ) -> "pd.DataFrame":  # noqa: F821
+        """Returns the time series data of this run as a long-format DataFrame.
+
+        The DataFrame has a row for each data point. It is built directly from
+        the response messages, without a Python object per data point.
+
+        ```py
+        df = tensorboard_run.to_dataframe(columns=["time_series", "step", "value"])
+
+        print(df[df.time_series == "loss"].value.min())
+        ```
+
+        Args:
+            columns (Sequence[str]):
+                Optional. The columns of the DataFrame, among:
+
+                -  ``time_series``: The display name of the time series, as a
+                   categorical column.
+                -  ``step``: The step of the data point.
+                -  ``wall_time``: The wall time of the data point, in UTC.
+                -  ``value``: The value of scalar data points. Data points of
+                   other time series have a missing value.
+
+                Defaults to all columns.
+            max_points (int):
+                Optional. The maximum number of data points read for each time
+                series. Longer time series are downsampled by the service. All
+                data points are read if not set.
+
+        Returns:
+            pd.DataFrame: The data points of the time series of this run.
+
+        Raises:
+            ValueError: If a column is not supported.
+        """
+        try:
+            import numpy as np
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "Pandas is not installed and is required to get dataframe as the return format. "
+                'Please install the SDK using "pip install google-cloud-aiplatform[metadata]"'
+            )
+
+        columns = list(columns or self.TIME_SERIES_DATAFRAME_COLUMNS)
+        unsupported_columns = set(columns) - set(self.TIME_SERIES_DATAFRAME_COLUMNS)
+        if unsupported_columns:
+            raise ValueError(
+                f"Unsupported columns {sorted(unsupported_columns)}. Supported "
+                f"columns are {list(self.TIME_SERIES_DATAFRAME_COLUMNS)}."
+            )
+
+        time_series_data = self._read_time_series_data_pbs(max_points=max_points)
+        display_names = list(time_series_data.keys())
+        point_lists = [data.values for data in time_series_data.values()]
+        counts = [len(points) for points in point_lists]
+        total_count = sum(counts)
+
+        def gather(get_value, dtype) -> "np.ndarray":
+            return np.fromiter(
+                (get_value(point) for points in point_lists for point in points),
+                dtype=dtype,
+                count=total_count,
+            )
+
+        df_columns = {}
+        for column in columns:
+            if column == "time_series":
+                df_columns[column] = pd.Categorical.from_codes(
+                    np.repeat(np.arange(len(display_names)), counts),
+                    categories=display_names,
+                )
+            elif column == "step":
+                df_columns[column] = gather(lambda point: point.step, np.int64)
+            elif column == "wall_time":
+                epoch_nanos = gather(
+                    lambda point: point.wall_time.seconds * 1_000_000_000
+                    + point.wall_time.nanos,
+                    np.int64,
+                )
+                df_columns[column] = pd.to_datetime(epoch_nanos, unit="ns", utc=True)
+            else:
+                is_scalar = [
+                    data.value_type
+                    == gca_tensorboard_time_series.TensorboardTimeSeries.ValueType.SCALAR
+                    for data in time_series_data.values()
+                ]
+                values = gather(lambda point: point.scalar.value, np.float64)
+                values[~np.repeat(is_scalar, counts).astype(bool)] = np.nan
+                df_columns[column] = values
+        return pd.DataFrame(df_columns, columns=columns)
+
+    def _read_time_series_data_pbs(
+        self, max_points: Optional[int] = None
+    ) -> Dict[str, "tensorboard_data_pb2.TimeSeriesData"]:  # noqa: F821
+        """Reads the time series data of this run as raw messages.
+
+        Without `max_points`, the time series are read in batches of
+        `READ_TIME_SERIES_BATCH_SIZE`. With `max_points`, each time series is
+        read with its own request, as batch reads do not downsample. At most
+        `READ_TIME_SERIES_MAX_CONCURRENCY` requests are sent at the same time.
+
+        Args:
+            max_points (int):
+                Optional. The maximum number of data points read for each time
+                series.
+
+        Returns:
+            Dictionary of time series display name to raw TimeSeriesData
+            messages, in the order of the time series.
+
+        Raises:
+            ValueError: If `max_points` is not positive.
+        """
+        if max_points is not None and max_points < 1:
+            raise ValueError(f"`max_points` must be positive, got {max_points}.")
+
         self._sync_time_series_display_name_to_id_mapping()
 
         resource_name_parts = self._parse_resource_name(self.resource_name)
@@ -1039,24 +1180,51 @@ class TensorboardRun(_TensorboardServiceResource):
             **resource_name_parts
         )
 
-        batch_size = self.READ_TIME_SERIES_BATCH_SIZE
-        time_series_data_dict = {}
-        for i in range(0, len(time_series_resource_names), batch_size):
-            one_batch_time_series_names = time_series_resource_names[i : i + batch_size]
-            read_response = self.api_client.batch_read_tensorboard_time_series_data(
+        def batch_read(time_series_names: List[str]):
+            response = self.api_client.batch_read_tensorboard_time_series_data(
                 request=gca_tensorboard_service.BatchReadTensorboardTimeSeriesDataRequest(
                     tensorboard=tensorboard_resource_name,
-                    time_series=one_batch_time_series_names,
+                    time_series=time_series_names,
                 )
             )
+            return type(response).pb(response).time_series_data
 
-            time_series_data_dict.update(
-                {
-                    inverted_mapping[data.tensorboard_time_series_id]: data
-                    for data in read_response.time_series_data
-                }
+        def read(time_series_name: str):
+            response = self.api_client.read_tensorboard_time_series_data(
+                request=gca_tensorboard_service.ReadTensorboardTimeSeriesDataRequest(
+                    tensorboard_time_series=time_series_name,
+                    max_data_points=max_points,
+                )
             )
-        return time_series_data_dict
+            data = type(response).pb(response).time_series_data
+            if not data.tensorboard_time_series_id:
+                data.tensorboard_time_series_id = time_series_name.split("/")[-1]
+            return [data]
+
+        if max_points is None:
+            batch_size = self.READ_TIME_SERIES_BATCH_SIZE
+            read_function = batch_read
+            read_args = [
+                time_series_resource_names[i : i + batch_size]
+                for i in range(0, len(time_series_resource_names), batch_size)
+            ]
+        else:
+            read_function = read
+            read_args = time_series_resource_names
+
+        if not read_args:
+            return {}
+
+        with futures.ThreadPoolExecutor(
+            max_workers=min(self.READ_TIME_SERIES_MAX_CONCURRENCY, len(read_args))
+        ) as executor:
+            responses = list(executor.map(read_function, read_args))
+
+        return {
+            inverted_mapping[data.tensorboard_time_series_id]: data
+            for time_series_data in responses
+            for data in time_series_data
+        }
 
 
 class TensorboardTimeSeries(_TensorboardServiceResource):
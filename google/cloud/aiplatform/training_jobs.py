@@ -191,7 +191,7 @@ class _TrainingJob(base.VertexAiStatefulResource):
     def start_time(self) -> Optional[datetime.datetime]:
         """Optional. The time when the training job first entered the
         `PIPELINE_STATE_RUNNING` state."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "start_time")
 
     @property
@@ -199,7 +199,7 @@ class _TrainingJob(base.VertexAiStatefulResource):
         """Optional. The time when the training job entered the
         `PIPELINE_STATE_SUCCEEDED`, `PIPELINE_STATE_FAILED`, or
         `PIPELINE_STATE_CANCELLED` state."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "end_time")
 
     @property
@@ -207,7 +207,7 @@ class _TrainingJob(base.VertexAiStatefulResource):
         """Optional. Detailed error information for this training job resource.
         Error information is created only when the state of the training job is
         `PIPELINE_STATE_FAILED` or `PIPELINE_STATE_CANCELLED`."""
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return getattr(self._gca_resource, "error")
 
     @classmethod
@@ -880,7 +880,7 @@ class _TrainingJob(base.VertexAiStatefulResource):
         if self._assert_has_run():
             return
 
-        self._sync_gca_resource()
+        self._sync_gca_resource_if_stale()
         return self._gca_resource.state
 
     def get_model(self, sync=True) -> models.Model:
@@ -965,7 +965,8 @@ class _TrainingJob(base.VertexAiStatefulResource):
 
         previous_time = time.time()
 
-        while self.state not in _PIPELINE_COMPLETE_STATES:
+        self._sync_gca_resource()
+        while self._gca_resource.state not in _PIPELINE_COMPLETE_STATES:
             current_time = time.time()
             if current_time - previous_time >= log_wait:
                 _LOGGER.info(
@@ -980,12 +981,17 @@ class _TrainingJob(base.VertexAiStatefulResource):
                 previous_time = current_time
             self._wait_callback()
             time.sleep(_JOB_WAIT_TIME)
+            self._sync_gca_resource()
 
         self._raise_failure()
 
         _LOGGER.log_action_completed_against_resource("run", "completed", self)
 
-        if self._gca_resource.model_to_upload and not self.has_failed:
+        if (
+            self._gca_resource.model_to_upload
+            and self._gca_resource.state
+            != gca_pipeline_state.PipelineState.PIPELINE_STATE_FAILED
+        ):
             _LOGGER.info(
                 "Model available at %s" % self._gca_resource.model_to_upload.name
             )
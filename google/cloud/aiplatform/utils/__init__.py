@@ -34,6 +34,8 @@ from google.cloud import storage
 from google.cloud.aiplatform import compat
 from google.cloud.aiplatform.constants import base as constants
 from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform.utils import grpc_utils
+from google.cloud.aiplatform.utils import instrumentation
 
 from google.cloud.aiplatform.compat.services import (
     dataset_service_client_v1beta1,
@@ -488,7 +490,8 @@ class ClientWithOverride:
             if self._api_transport is not None:
                 kwargs["transport"] = self._api_transport
 
-            temporary_client = self._client_class(**kwargs)
+            with instrumentation.phase("create_client"):
+                temporary_client = self._client_class(**kwargs)
 
             return getattr(temporary_client, name)
 
@@ -525,6 +528,7 @@ class ClientWithOverride:
         client_info: gapic_v1.client_info.ClientInfo,
         credentials: Optional[auth_credentials.Credentials] = None,
         transport: Optional[str] = None,
+        grpc_channel_options: Optional[grpc_utils.ChannelOptions] = None,
     ):
         """Stores parameters needed to instantiate client.
 
@@ -539,32 +543,53 @@ class ClientWithOverride:
                 Optional. Transport type to pass to client.
                 NOTE: "rest" transport functionality is currently in a
                 beta state (preview).
+            grpc_channel_options (Sequence[Tuple[str, Any]]):
+                Optional. Additional arguments of the gRPC channels. Ignored
+                if transport is "rest".
         """
-        kwargs = dict(
-            credentials=credentials,
-            client_options=client_options,
-            client_info=client_info,
-        )
-
-        if transport is not None:
-            kwargs["transport"] = transport
 
-        self._clients = {
-            version: self.WrappedClient(
-                client_class=client_class,
+        def _get_transport(client_class):
+            if grpc_channel_options and transport in (None, "grpc"):
+                return grpc_utils.get_transport_factory(
+                    client_class, grpc_channel_options
+                )
+            return transport
+
+        self._clients = {}
+        for version, client_class in self._version_map:
+            version_transport = _get_transport(client_class)
+            if self._is_temporary:
+                self._clients[version] = self.WrappedClient(
+                    client_class=client_class,
+                    client_options=client_options,
+                    client_info=client_info,
+                    credentials=credentials,
+                    transport=version_transport,
+                )
+                continue
+            kwargs = dict(
+                credentials=credentials,
                 client_options=client_options,
                 client_info=client_info,
-                credentials=credentials,
-                transport=transport,
             )
-            if self._is_temporary
-            else client_class(**kwargs)
-            for version, client_class in self._version_map
-        }
+            if version_transport is not None:
+                kwargs["transport"] = version_transport
+            self._clients[version] = client_class(**kwargs)
 
     def __getattr__(self, name: str) -> Any:
-        """Instantiates client and returns attribute of the client."""
-        return getattr(self._clients[self._default_version], name)
+        """Instantiates client and returns attribute of the client.
+
+        While instrumentation is enabled, the RPC methods of the client
+        record their calls.
+        """
+        attribute = getattr(self._clients[self._default_version], name)
+        if instrumentation.is_enabled():
+            client_class = self.get_gapic_client_class()
+            if instrumentation.is_rpc_method(client_class, name):
+                return instrumentation.instrument_rpc(
+                    attribute, f"{client_class.__name__}.{name}"
+                )
+        return attribute
 
     def select_version(self, version: str) -> VertexAiServiceClient:
         return self._clients[version]
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Utilities to consume several iterables concurrently."""
+
+from concurrent import futures
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
+
+# Interval at which blocked producers check whether the consumer stopped, in
+# seconds.
+_PRODUCER_POLL_INTERVAL = 0.1
+
+_T = TypeVar("_T")
+
+
+def iter_concurrently(
+    producers: Sequence[Callable[[], Iterable[_T]]],
+    max_workers: int,
+    max_buffered_items: int,
+) -> Iterator[_T]:
+    """Runs producers in a thread pool and yields their items as they come.
+
+    The items of a producer keep their order, the items of different producers
+    are interleaved. At most `max_buffered_items` items wait to be consumed:
+    producers are paused while the buffer is full. Closing the iterator, or an
+    error raised by a producer, stops the running producers at their next item
+    and cancels the producers that have not started.
+
+    Args:
+        producers (Sequence[Callable[[], Iterable[_T]]]):
+            Required. Callables returning the iterables to consume.
+        max_workers (int):
+            Required. The maximum number of producers running at the same time.
+        max_buffered_items (int):
+            Required. The maximum number of items waiting to be consumed.
+
+    Yields:
+        _T: The items of the producers.
+
+    Raises:
+        Exception: The first exception raised by a producer.
+    """
+    if not producers:
+        return
+    items = queue.Queue(maxsize=max(1, max_buffered_items))
+    stopped = threading.Event()
+    # Marks the end of a producer in the queue.
+    done = object()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=_PRODUCER_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(producer: Callable[[], Iterable[_T]]):
+        try:
+            for item in producer():
+                if not put((item, None)):
+                    return
+        except Exception as e:  # pylint: disable=broad-except
+            put((done, e))
+        else:
+            put((done, None))
+
+    executor = futures.ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(producers)))
+    )
+    tasks = []
+    try:
+        tasks = [executor.submit(produce, producer) for producer in producers]
+        remaining = len(tasks)
+        while remaining:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is done:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        stopped.set()
+        # Running producers return at their next item, so there is no need to
+        # wait for them.
+        for task in tasks:
+            task.cancel()
+        executor.shutdown(wait=False)
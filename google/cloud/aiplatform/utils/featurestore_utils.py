@@ -45,6 +45,18 @@ FEATURE_STORE_VALUE_TYPE_TO_BQ_DATA_TYPE_MAP = {
     "BYTES": {"field_type": "BYTES"},
 }
 
+FEATURE_STORE_VALUE_TYPE_TO_FEATURE_VALUE_FIELD_MAP = {
+    "BOOL": "bool_value",
+    "BOOL_ARRAY": "bool_array_value",
+    "DOUBLE": "double_value",
+    "DOUBLE_ARRAY": "double_array_value",
+    "INT64": "int64_value",
+    "INT64_ARRAY": "int64_array_value",
+    "STRING": "string_value",
+    "STRING_ARRAY": "string_array_value",
+    "BYTES": "bytes_value",
+}
+
 
 def validate_id(resource_id: str) -> None:
     """Validates feature store resource ID pattern.
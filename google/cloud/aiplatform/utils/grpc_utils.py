@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Helpers to configure and warm up the gRPC channels of GAPIC clients."""
+
+import logging
+import threading
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import grpc
+
+from google.auth import credentials as auth_credentials
+from google.auth.transport import requests as google_auth_requests
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bound of the time spent by a background warm up, in seconds.
+_BACKGROUND_WARM_UP_TIMEOUT = 60
+
+ChannelOptions = Sequence[Tuple[str, Any]]
+
+
+def get_channel_options(
+    keepalive_time_ms: Optional[int] = None,
+    keepalive_timeout_ms: Optional[int] = None,
+    client_idle_timeout_ms: Optional[int] = None,
+) -> List[Tuple[str, int]]:
+    """Returns the gRPC channel arguments for keepalive and idle settings.
+
+    Args:
+        keepalive_time_ms (int):
+            Optional. Interval between keepalive pings sent on an open
+            connection. Pings are also sent while no call is in progress, so
+            that proxies and load balancers do not drop idle connections.
+        keepalive_timeout_ms (int):
+            Optional. How long to wait for the acknowledgement of a keepalive
+            ping before the connection is closed and re-established.
+        client_idle_timeout_ms (int):
+            Optional. How long a channel can stay without calls before it
+            releases its connection. The next call then reconnects.
+
+    Returns:
+        List[Tuple[str, int]]: The channel arguments.
+    """
+    options = []
+    if keepalive_time_ms is not None:
+        options.append(("grpc.keepalive_time_ms", keepalive_time_ms))
+        options.append(("grpc.keepalive_permit_without_calls", 1))
+    if keepalive_timeout_ms is not None:
+        options.append(("grpc.keepalive_timeout_ms", keepalive_timeout_ms))
+    if client_idle_timeout_ms is not None:
+        options.append(("grpc.client_idle_timeout_ms", client_idle_timeout_ms))
+    return options
+
+
+def get_transport_factory(
+    client_class: Any, channel_options: ChannelOptions
+) -> Callable[..., Any]:
+    """Returns a callable creating a gRPC transport with extra channel options.
+
+    The callable can be passed as the `transport` of a GAPIC client.
+
+    Args:
+        client_class (Any):
+            Required. The GAPIC client class the transport is created for.
+        channel_options (Sequence[Tuple[str, Any]]):
+            Required. Channel arguments added to the ones of the transport.
+
+    Returns:
+        Callable[..., Any]: A transport factory.
+    """
+    transport_name = "grpc_asyncio" if "Async" in client_class.__name__ else "grpc"
+    transport_class = client_class.get_transport_class(transport_name)
+
+    def create_channel(*args, options: ChannelOptions = (), **kwargs):
+        return transport_class.create_channel(
+            *args, options=[*options, *channel_options], **kwargs
+        )
+
+    def create_transport(**kwargs):
+        return transport_class(channel=create_channel, **kwargs)
+
+    return create_transport
+
+
+def refresh_credentials(credentials: Optional[auth_credentials.Credentials]) -> None:
+    """Fetches an access token if the credentials do not have a valid one."""
+    if credentials is not None and not credentials.valid:
+        credentials.refresh(google_auth_requests.Request())
+
+
+def warm_up_client(client: Any, timeout: Optional[float] = None) -> None:
+    """Refreshes the credentials and connects the channel of a GAPIC client.
+
+    Args:
+        client (Any):
+            Required. A GAPIC client or a client wrapper of this SDK.
+        timeout (float):
+            Optional. How long to wait for the channel to connect, in seconds.
+            Waits until it is connected if not set.
+
+    Raises:
+        grpc.FutureTimeoutError: If the channel did not connect in time.
+    """
+    transport = client._transport
+    refresh_credentials(getattr(transport, "_credentials", None))
+    # The REST transport and the asynchronous gRPC transport connect lazily.
+    channel = getattr(transport, "grpc_channel", None)
+    if isinstance(channel, grpc.Channel):
+        grpc.channel_ready_future(channel).result(timeout=timeout)
+
+
+def start_warm_up(
+    warm_up: Callable[..., None],
+    timeout: Optional[float] = _BACKGROUND_WARM_UP_TIMEOUT,
+) -> threading.Thread:
+    """Runs a warm up in a background thread.
+
+    Failures are logged and otherwise ignored: the next request connects as
+    if there had been no warm up.
+
+    Args:
+        warm_up (Callable[..., None]):
+            Required. The warm up, for example `Endpoint.warmup`. It is called
+            with the `timeout` keyword argument.
+        timeout (float):
+            Optional. How long the warm up waits for the connection, in seconds.
+
+    Returns:
+        threading.Thread: The started thread.
+    """
+
+    def _warm_up():
+        try:
+            warm_up(timeout=timeout)
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to warm up the client: %s", e)
+
+    thread = threading.Thread(target=_warm_up, name="aiplatform-warm-up", daemon=True)
+    thread.start()
+    return thread
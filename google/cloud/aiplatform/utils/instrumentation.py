@@ -0,0 +1,551 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Hooks reporting where the time goes inside SDK calls.
+
+Instrumented calls produce a `CallRecord` with the timings of their phases
+(for example client creation, request building, the RPC and the response
+conversion), the sizes of the request and response messages, and the number
+of retries. Records are passed to the registered callbacks, and can be
+exported as OpenTelemetry spans.
+
+Nothing is recorded while no callback is registered.
+
+Example Usage:
+
+    from google.cloud.aiplatform.utils import instrumentation
+
+    instrumentation.add_callback(lambda record: print(record.phase_seconds))
+    # or
+    instrumentation.enable_opentelemetry()
+"""
+
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from google.api_core import retry as api_core_retry
+from google.protobuf import message as protobuf_message
+import proto
+
+_LOGGER = logging.getLogger(__name__)
+
+# The callbacks are replaced, never mutated, so that they can be read without
+# a lock.
+_callbacks: tuple = ()
+_callbacks_lock = threading.Lock()
+
+_active_recorder: "contextvars.ContextVar[Optional[_Recorder]]" = (
+    contextvars.ContextVar("aiplatform_instrumentation_recorder", default=None)
+)
+
+
+@dataclasses.dataclass
+class Phase:
+    """A timed phase of an SDK call.
+
+    Attributes:
+        name (str):
+            The name of the phase, for example "rpc".
+        start_time_ns (int):
+            The start of the phase, in nanoseconds since the epoch.
+        duration_ns (int):
+            The duration of the phase, in nanoseconds.
+    """
+
+    name: str
+    start_time_ns: int
+    duration_ns: int
+
+
+@dataclasses.dataclass
+class CallRecord:
+    """The timings and sizes of an SDK call.
+
+    Attributes:
+        operation (str):
+            The name of the call, for example "Endpoint.predict".
+        start_time_ns (int):
+            The start of the call, in nanoseconds since the epoch.
+        duration_ns (int):
+            The duration of the call, in nanoseconds.
+        phases (List[Phase]):
+            The timed phases of the call, in order.
+        request_bytes (int):
+            The serialized size of the request, if known.
+        response_bytes (int):
+            The serialized size of the response, if known.
+        retry_count (int):
+            The number of retried attempts.
+        error (BaseException):
+            The error raised by the call, if any.
+        attributes (Dict[str, Any]):
+            Other properties of the call.
+    """
+
+    operation: str
+    start_time_ns: int
+    duration_ns: int = 0
+    phases: List[Phase] = dataclasses.field(default_factory=list)
+    request_bytes: Optional[int] = None
+    response_bytes: Optional[int] = None
+    retry_count: int = 0
+    error: Optional[BaseException] = None
+    attributes: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    @property
+    def phase_seconds(self) -> Dict[str, float]:
+        """The total duration of each phase name, in seconds."""
+        seconds = {}
+        for phase in self.phases:
+            seconds[phase.name] = seconds.get(phase.name, 0.0) + phase.duration_ns / 1e9
+        return seconds
+
+
+def _byte_size(message: Any) -> Optional[int]:
+    """Returns the serialized size of a message, or None if unknown."""
+    if isinstance(message, proto.Message):
+        return type(message).pb(message).ByteSize()
+    if isinstance(message, protobuf_message.Message):
+        return message.ByteSize()
+    if isinstance(message, bytes):
+        return len(message)
+    if isinstance(message, list):
+        sizes = [_byte_size(item) for item in message]
+        return None if None in sizes else sum(sizes)
+    return None
+
+
+class _Recorder:
+    """Records the phases of a call."""
+
+    enabled = True
+
+    def __init__(self, operation: str, attributes: Dict[str, Any]):
+        self._perf_start_ns = time.perf_counter_ns()
+        self.record = CallRecord(
+            operation=operation,
+            start_time_ns=time.time_ns(),
+            attributes=attributes,
+        )
+
+    def _now_ns(self) -> int:
+        """Returns the wall clock time, measured with the monotonic clock."""
+        return self.record.start_time_ns + (
+            time.perf_counter_ns() - self._perf_start_ns
+        )
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times a phase of the call."""
+        start_time_ns = self._now_ns()
+        try:
+            yield
+        finally:
+            self.record.phases.append(
+                Phase(
+                    name=name,
+                    start_time_ns=start_time_ns,
+                    duration_ns=self._now_ns() - start_time_ns,
+                )
+            )
+
+    def set_request(self, message: Any) -> None:
+        """Records the size of the request message."""
+        self.record.request_bytes = _byte_size(message)
+
+    def set_response(self, message: Any) -> None:
+        """Records the size of the response message."""
+        self.record.response_bytes = _byte_size(message)
+
+    def add_retries(self, count: int = 1) -> None:
+        """Records retried attempts."""
+        self.record.retry_count += count
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Records a property of the call."""
+        self.record.attributes[key] = value
+
+    def _finish(self, error: Optional[BaseException]) -> None:
+        self.record.duration_ns = time.perf_counter_ns() - self._perf_start_ns
+        self.record.error = error
+        for callback in _callbacks:
+            try:
+                callback(self.record)
+            except Exception as e:  # pylint: disable=broad-except
+                _LOGGER.warning("Instrumentation callback failed: %s", e)
+
+
+class _NoopRecorder:
+    """Stands in for a recorder while instrumentation is disabled."""
+
+    enabled = False
+
+    _null_context = contextlib.nullcontext()
+
+    def phase(self, name: str) -> contextlib.AbstractContextManager:
+        return self._null_context
+
+    def set_request(self, message: Any) -> None:
+        pass
+
+    def set_response(self, message: Any) -> None:
+        pass
+
+    def add_retries(self, count: int = 1) -> None:
+        pass
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_RECORDER = _NoopRecorder()
+_NOOP_RECORD_CONTEXT = contextlib.nullcontext(_NOOP_RECORDER)
+
+
+class _RecordContext:
+    """Makes a recorder the active recorder while a call is recorded."""
+
+    def __init__(self, operation: str, attributes: Dict[str, Any]):
+        self._recorder = _Recorder(operation, attributes)
+        self._token = None
+
+    def __enter__(self) -> _Recorder:
+        self._token = _active_recorder.set(self._recorder)
+        return self._recorder
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        _active_recorder.reset(self._token)
+        self._recorder._finish(exc_value)
+
+
+def is_enabled() -> bool:
+    """Returns whether a callback is registered."""
+    return bool(_callbacks)
+
+
+def add_callback(callback: Callable[[CallRecord], None]) -> None:
+    """Registers a callback called with the record of each instrumented call.
+
+    Callbacks are called in the thread of the call, once it completes.
+    Errors raised by callbacks are logged and ignored.
+
+    Args:
+        callback (Callable[[CallRecord], None]):
+            Required. The callback.
+    """
+    global _callbacks
+    with _callbacks_lock:
+        _callbacks = _callbacks + (callback,)
+
+
+def remove_callback(callback: Callable[[CallRecord], None]) -> None:
+    """Unregisters a callback registered with `add_callback`.
+
+    Args:
+        callback (Callable[[CallRecord], None]):
+            Required. The callback.
+    """
+    global _callbacks
+    with _callbacks_lock:
+        _callbacks = tuple(c for c in _callbacks if c != callback)
+
+
+def record(operation: str, **attributes: Any) -> contextlib.AbstractContextManager:
+    """Records an SDK call.
+
+    Example Usage:
+
+        with instrumentation.record("Endpoint.predict") as recorder:
+            with recorder.phase("rpc"):
+                response = client.predict(...)
+            recorder.set_response(response)
+
+    Args:
+        operation (str):
+            Required. The name of the call.
+        **attributes (Any):
+            Properties of the call.
+
+    Returns:
+        A context manager returning the recorder of the call. The recorder
+        does nothing if instrumentation is disabled.
+    """
+    if not _callbacks:
+        return _NOOP_RECORD_CONTEXT
+    return _RecordContext(operation, attributes)
+
+
+def phase(name: str) -> contextlib.AbstractContextManager:
+    """Times a phase of the call being recorded.
+
+    Outside of a recorded call, the phase is recorded as a call of its own.
+
+    Args:
+        name (str):
+            Required. The name of the phase.
+
+    Returns:
+        A context manager timing the phase.
+    """
+    if not _callbacks:
+        return _NOOP_RECORDER.phase(name)
+    recorder = _active_recorder.get()
+    if recorder is not None:
+        return recorder.phase(name)
+    return _standalone_phase(name)
+
+
+def set_response(message: Any) -> None:
+    """Records the size of the response of the call being recorded.
+
+    Does nothing outside of a recorded call.
+
+    Args:
+        message (Any):
+            Required. The response message, or a list of streamed messages.
+    """
+    recorder = _active_recorder.get()
+    if recorder is not None:
+        recorder.set_response(message)
+
+
+def recorded(operation: str) -> Callable[[Callable], Callable]:
+    """Decorates a function to record each of its calls.
+
+    The phases of the call are timed with `phase`.
+
+    Example Usage:
+
+        @instrumentation.recorded("Endpoint.predict")
+        def predict(self, instances):
+            with instrumentation.phase("rpc"):
+                response = client.predict(...)
+
+    Args:
+        operation (str):
+            Required. The name of the call.
+
+    Returns:
+        Callable[[Callable], Callable]: The decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with record(operation):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextlib.contextmanager
+def _standalone_phase(name: str) -> Iterator[None]:
+    with record(name) as recorder:
+        with recorder.phase(name):
+            yield
+
+
+def _with_retry_counter(
+    retry: api_core_retry.Retry, recorder: _Recorder
+) -> Callable[..., Callable]:
+    """Returns a retry decorator that also counts the retried attempts.
+
+    GAPIC methods call the retry with the function making a single attempt,
+    so the attempts after the first one are counted by wrapping it.
+    """
+
+    def counting_retry(func: Callable, *args, **kwargs) -> Callable:
+        attempted = False
+
+        @functools.wraps(func)
+        def attempt(*func_args, **func_kwargs):
+            nonlocal attempted
+            if attempted:
+                recorder.add_retries()
+            attempted = True
+            return func(*func_args, **func_kwargs)
+
+        return retry(attempt, *args, **kwargs)
+
+    return counting_retry
+
+
+@functools.lru_cache(maxsize=None)
+def is_rpc_method(client_class: type, name: str) -> bool:
+    """Returns whether a GAPIC client method calls an RPC.
+
+    The path helpers and the constructors of the clients are static and class
+    methods. The streaming methods of the async clients are plain functions
+    returning awaitables, and are not instrumented.
+
+    Args:
+        client_class (type):
+            Required. The GAPIC client class.
+        name (str):
+            Required. The name of the attribute.
+
+    Returns:
+        bool: Whether the attribute is a method calling an RPC.
+    """
+    if name.startswith("_"):
+        return False
+    try:
+        attribute = inspect.getattr_static(client_class, name)
+    except AttributeError:
+        return False
+    if not inspect.isfunction(attribute):
+        return False
+    if "Async" in client_class.__name__:
+        return inspect.iscoroutinefunction(attribute)
+    return True
+
+
+def instrument_rpc(method: Callable[..., Any], operation: str) -> Callable[..., Any]:
+    """Wraps a GAPIC client method to record its calls.
+
+    Inside a recorded call, the wrapper adds the request and response sizes
+    and the retries to the record of that call, whose phases are timed by
+    the caller. Otherwise the RPC is recorded as a call of its own.
+
+    Args:
+        method (Callable[..., Any]):
+            Required. The bound GAPIC client method.
+        operation (str):
+            Required. The name the RPC is recorded with.
+
+    Returns:
+        Callable[..., Any]: The wrapped method.
+    """
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(*args, **kwargs):
+            recorder = _active_recorder.get()
+            if recorder is not None:
+                kwargs = _before_rpc(recorder, args, kwargs)
+                return _after_rpc(recorder, await method(*args, **kwargs))
+            with record(operation) as recorder:
+                with recorder.phase("rpc"):
+                    kwargs = _before_rpc(recorder, args, kwargs)
+                    return _after_rpc(recorder, await method(*args, **kwargs))
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        recorder = _active_recorder.get()
+        if recorder is not None:
+            kwargs = _before_rpc(recorder, args, kwargs)
+            return _after_rpc(recorder, method(*args, **kwargs))
+        with record(operation) as recorder:
+            with recorder.phase("rpc"):
+                kwargs = _before_rpc(recorder, args, kwargs)
+                return _after_rpc(recorder, method(*args, **kwargs))
+
+    return wrapper
+
+
+def _before_rpc(recorder, args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Records the request size and counts the retries of a GAPIC call.
+
+    Returns:
+        The keyword arguments to call the GAPIC method with.
+    """
+    if not recorder.enabled:
+        return kwargs
+    if isinstance(kwargs.get("retry"), api_core_retry.Retry):
+        kwargs = dict(kwargs, retry=_with_retry_counter(kwargs["retry"], recorder))
+    request = kwargs.get("request", args[0] if args else None)
+    if request is not None and recorder.record.request_bytes is None:
+        recorder.set_request(request)
+    return kwargs
+
+
+def _after_rpc(recorder, response: Any) -> Any:
+    """Records the response size of a GAPIC call."""
+    if recorder.enabled and recorder.record.response_bytes is None:
+        recorder.set_response(response)
+    return response
+
+
+def enable_opentelemetry(tracer_provider: Optional[Any] = None) -> Callable:
+    """Exports the records of SDK calls as OpenTelemetry spans.
+
+    Each call becomes a span, with a child span per phase. The spans are
+    children of the span that is current when the call is made.
+
+    Args:
+        tracer_provider (opentelemetry.trace.TracerProvider):
+            Optional. The tracer provider. The global tracer provider is
+            used if not set.
+
+    Returns:
+        Callable: The registered callback, which can be passed to
+        `remove_callback`.
+
+    Raises:
+        ImportError: If opentelemetry-api is not installed.
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        raise ImportError(
+            "opentelemetry-api is not installed. Please install "
+            "opentelemetry-api to use `enable_opentelemetry`."
+        )
+
+    tracer = trace.get_tracer(__name__, tracer_provider=tracer_provider)
+
+    def _export(call_record: CallRecord) -> None:
+        attributes = {
+            f"aiplatform.{key}": value
+            for key, value in call_record.attributes.items()
+            if isinstance(value, (bool, str, bytes, int, float))
+        }
+        attributes["aiplatform.retry_count"] = call_record.retry_count
+        if call_record.request_bytes is not None:
+            attributes["aiplatform.request_bytes"] = call_record.request_bytes
+        if call_record.response_bytes is not None:
+            attributes["aiplatform.response_bytes"] = call_record.response_bytes
+        span = tracer.start_span(
+            call_record.operation,
+            start_time=call_record.start_time_ns,
+            attributes=attributes,
+        )
+        context = trace.set_span_in_context(span)
+        for call_phase in call_record.phases:
+            tracer.start_span(
+                call_phase.name,
+                context=context,
+                start_time=call_phase.start_time_ns,
+            ).end(end_time=call_phase.start_time_ns + call_phase.duration_ns)
+        if call_record.error is not None:
+            span.record_exception(call_record.error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+        span.end(end_time=call_record.start_time_ns + call_record.duration_ns)
+
+    add_callback(_export)
+    return _export
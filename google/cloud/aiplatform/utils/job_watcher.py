@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Shared, list-based completion watcher for long-running jobs."""
+
+import asyncio
+import concurrent.futures
+import dataclasses
+import datetime
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# Polling intervals, in seconds.
+_MIN_POLL_INTERVAL = 5
+_PENDING_POLL_INTERVAL = 30
+_MAX_POLL_INTERVAL = 60
+_POLL_INTERVAL_MULTIPLIER = 1.5
+
+# Job and pipeline states that rarely change quickly.
+_SLOW_STATE_NAME_MARKERS = ("QUEUED", "PENDING")
+
+# Lists only return the jobs updated since the previous list of their group,
+# minus this margin for the skew between the local and the service clocks.
+_LIST_FILTER_CLOCK_SKEW = datetime.timedelta(seconds=30)
+
+
+@dataclasses.dataclass
+class _WatchedJob:
+    job: Any
+    future: concurrent.futures.Future
+    last_update_time: Optional[datetime.datetime]
+    # Changes of the job after this time have not been listed yet.
+    list_since: datetime.datetime
+    interval: float
+    next_check: float
+
+
+def _utcnow() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _format_timestamp(timestamp: datetime.datetime) -> str:
+    """Formats a datetime as an RFC 3339 timestamp accepted by list filters."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(datetime.timezone.utc)
+    return timestamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class JobWatcher:
+    """Waits on many jobs with a bounded number of list calls.
+
+    Instead of issuing one `get` call per job per polling interval, the watcher
+    groups watched jobs by resource type, location and credentials, and issues
+    a single `list` call per group filtered to the jobs updated since the
+    previous list of the group. Each job backs off independently while its
+    state stays the same, and jobs in queued or pending states are polled less
+    frequently.
+
+    Example Usage:
+
+        watcher = JobWatcher()
+        futures = [watcher.watch(job) for job in jobs]
+        concurrent.futures.wait(futures)
+    """
+
+    def __init__(
+        self,
+        min_poll_interval: float = _MIN_POLL_INTERVAL,
+        pending_poll_interval: float = _PENDING_POLL_INTERVAL,
+        max_poll_interval: float = _MAX_POLL_INTERVAL,
+        poll_interval_multiplier: float = _POLL_INTERVAL_MULTIPLIER,
+    ):
+        """Creates a JobWatcher.
+
+        Args:
+            min_poll_interval (float):
+                Optional. Interval between checks of a job whose state just
+                changed, in seconds.
+            pending_poll_interval (float):
+                Optional. Interval between checks of a queued or pending job,
+                in seconds.
+            max_poll_interval (float):
+                Optional. Upper bound of the interval between checks of a job,
+                in seconds.
+            poll_interval_multiplier (float):
+                Optional. Factor applied to the interval of a job each time a
+                check finds its state unchanged.
+        """
+        self._min_poll_interval = min_poll_interval
+        self._pending_poll_interval = pending_poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._poll_interval_multiplier = poll_interval_multiplier
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._watched: Dict[Tuple[str, str, int], Dict[str, _WatchedJob]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(
+        self,
+        job: Any,
+        callback: Optional[Callable[[Any], None]] = None,
+    ) -> concurrent.futures.Future:
+        """Starts watching a job.
+
+        Args:
+            job (Any):
+                Required. A job or pipeline job whose resource has been created.
+            callback (Callable[[Any], None]):
+                Optional. Called with the job once it reaches a completed state.
+
+        Returns:
+            concurrent.futures.Future: A future that resolves to the job once
+            it completes, or raises RuntimeError if the job failed.
+        """
+        job._assert_gca_resource_is_available()
+
+        future = concurrent.futures.Future()
+        if not self._resolve_if_done(job, future):
+            group_key = self._group_key(job)
+            state_interval = self._base_interval(job)
+            with self._lock:
+                group = self._watched.setdefault(group_key, {})
+                existing = group.get(job.resource_name)
+                if existing is not None:
+                    # Share the in-flight wait between callers.
+                    future = existing.future
+                else:
+                    update_time = job._gca_resource.update_time
+                    group[job.resource_name] = _WatchedJob(
+                        job=job,
+                        future=future,
+                        last_update_time=update_time,
+                        list_since=update_time or _utcnow() - _LIST_FILTER_CLOCK_SKEW,
+                        interval=state_interval,
+                        next_check=time.monotonic() + state_interval,
+                    )
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(
+                        target=self._run, name="aiplatform-job-watcher", daemon=True
+                    )
+                    self._thread.start()
+            self._wakeup.set()
+
+        if callback is not None:
+            future.add_done_callback(lambda _: callback(job))
+        return future
+
+    async def wait_async(self, job: Any) -> Any:
+        """Waits for a job to complete without blocking the event loop.
+
+        Args:
+            job (Any):
+                Required. A job or pipeline job whose resource has been created.
+
+        Returns:
+            The completed job.
+
+        Raises:
+            RuntimeError: If the job failed.
+        """
+        return await asyncio.wrap_future(self.watch(job))
+
+    def stop(self) -> None:
+        """Stops watching all jobs and cancels their pending futures."""
+        with self._lock:
+            watched_jobs = [
+                watched
+                for group in self._watched.values()
+                for watched in group.values()
+            ]
+            self._watched.clear()
+        for watched in watched_jobs:
+            watched.future.cancel()
+        self._wakeup.set()
+
+    @property
+    def watched_count(self) -> int:
+        """The number of jobs that have not completed yet."""
+        with self._lock:
+            return sum(len(group) for group in self._watched.values())
+
+    @staticmethod
+    def _group_key(job: Any) -> Tuple[str, str, int]:
+        # "projects/{project}/locations/{location}/..."
+        parent = "/".join(job.resource_name.split("/")[:4])
+        return (job._list_method, parent, id(job.credentials))
+
+    def _base_interval(self, job: Any) -> float:
+        state_name = getattr(job._gca_resource.state, "name", "")
+        if any(marker in state_name for marker in _SLOW_STATE_NAME_MARKERS):
+            return self._pending_poll_interval
+        return self._min_poll_interval
+
+    @staticmethod
+    def _resolve_if_done(job: Any, future: concurrent.futures.Future) -> bool:
+        state = job._gca_resource.state
+        if state not in job._valid_done_states:
+            return False
+        if future.done():
+            # Cancelled by `stop`.
+            return True
+        if state in getattr(job, "_valid_error_states", ()):
+            future.set_exception(
+                RuntimeError("Job failed with:\n%s" % job._gca_resource.error)
+            )
+        else:
+            future.set_result(job)
+        return True
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._watched:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                due_groups = [
+                    (group_key, list(group.values()))
+                    for group_key, group in self._watched.items()
+                    if any(watched.next_check <= now for watched in group.values())
+                ]
+
+            for group_key, watched_jobs in due_groups:
+                self._check_group(group_key, watched_jobs)
+
+            with self._lock:
+                next_checks = [
+                    watched.next_check
+                    for group in self._watched.values()
+                    for watched in group.values()
+                ]
+            if next_checks:
+                self._wakeup.wait(max(0, min(next_checks) - time.monotonic()))
+                self._wakeup.clear()
+
+    def _check_group(
+        self, group_key: Tuple[str, str, int], watched_jobs: List[_WatchedJob]
+    ):
+        list_method, parent, _ = group_key
+        since = min(w.list_since for w in watched_jobs)
+        api_client = watched_jobs[0].job.api_client
+        now = time.monotonic()
+        list_time = _utcnow()
+        try:
+            updated_resources = {
+                gca_resource.name: gca_resource
+                for gca_resource in getattr(api_client, list_method)(
+                    request={
+                        "parent": parent,
+                        "filter": f'update_time>"{_format_timestamp(since)}"',
+                    }
+                )
+            }
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to list jobs under %s: %s", parent, e)
+            for watched in watched_jobs:
+                self._back_off(watched, now)
+            return
+
+        for watched in watched_jobs:
+            watched.list_since = list_time - _LIST_FILTER_CLOCK_SKEW
+            gca_resource = updated_resources.get(watched.job.resource_name)
+            if (
+                gca_resource is None
+                or gca_resource.update_time == watched.last_update_time
+            ):
+                if watched.next_check <= now:
+                    self._back_off(watched, now)
+                continue
+
+            watched.job._gca_resource = gca_resource
+            watched.last_update_time = gca_resource.update_time
+            if gca_resource.state in watched.job._valid_done_states:
+                with self._lock:
+                    group = self._watched.get(group_key, {})
+                    group.pop(watched.job.resource_name, None)
+                    if not group:
+                        self._watched.pop(group_key, None)
+                self._resolve_if_done(watched.job, watched.future)
+                continue
+
+            watched.interval = self._base_interval(watched.job)
+            watched.next_check = now + watched.interval
+
+    def _back_off(self, watched: _WatchedJob, now: float):
+        watched.interval = min(
+            watched.interval * self._poll_interval_multiplier,
+            self._max_poll_interval,
+        )
+        watched.next_check = now + watched.interval
+
+
+_default_watcher: Optional[JobWatcher] = None
+_default_watcher_lock = threading.Lock()
+
+
+def get_default_watcher() -> JobWatcher:
+    """Returns the process-wide JobWatcher shared by all jobs."""
+    global _default_watcher
+    with _default_watcher_lock:
+        if _default_watcher is None:
+            _default_watcher = JobWatcher()
+        return _default_watcher
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Dependency-aware scheduling of tasks on a thread pool."""
+
+from concurrent import futures
+import dataclasses
+import enum
+import itertools
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+class TaskState(enum.Enum):
+    """The state of a scheduled task."""
+
+    # Waiting for its dependencies to complete.
+    PENDING = "PENDING"
+    # Submitted to the thread pool, waiting for a free worker.
+    QUEUED = "QUEUED"
+    # Running on a worker of the thread pool.
+    RUNNING = "RUNNING"
+
+
+@dataclasses.dataclass(frozen=True)
+class TaskInfo:
+    """A snapshot of a scheduled task that has not completed.
+
+    Attributes:
+        task_id (int):
+            The identifier of the task, in submission order.
+        name (str):
+            The name the task was submitted with.
+        state (TaskState):
+            The state of the task.
+        pending_dependency_count (int):
+            The number of dependencies that have not completed yet.
+    """
+
+    task_id: int
+    name: str
+    state: TaskState
+    pending_dependency_count: int
+
+
+class _Task:
+    def __init__(
+        self,
+        task_id: int,
+        name: str,
+        fn: Callable[[], Any],
+        dependency_count: int,
+    ):
+        self.task_id = task_id
+        self.name = name
+        self.fn = fn
+        self.future = futures.Future()
+        self.state = TaskState.PENDING
+        self.pending_dependency_count = dependency_count
+        self.failed_dependency: Optional[futures.Future] = None
+
+
+class TaskScheduler:
+    """Runs tasks on a thread pool once their dependencies have completed.
+
+    A task only takes a worker of the pool when all its dependencies have
+    completed. Tasks waiting on dependencies do not hold a worker, so large
+    dependency graphs cannot exhaust or deadlock the pool.
+
+    If a dependency fails or is cancelled, the task is not run and its future
+    raises the exception of the dependency.
+
+    Example Usage:
+
+        scheduler = TaskScheduler(lambda: pool)
+        train = scheduler.submit(train_model, name="train")
+        deploy = scheduler.submit(deploy_model, dependencies=[train])
+    """
+
+    def __init__(self, get_executor: Callable[[], futures.Executor]):
+        """Creates a TaskScheduler.
+
+        Args:
+            get_executor (Callable[[], futures.Executor]):
+                Required. Returns the executor that runs the tasks. It is
+                called each time a task becomes ready, so the executor can be
+                replaced.
+        """
+        self._get_executor = get_executor
+        self._lock = threading.Lock()
+        self._task_ids = itertools.count()
+        self._tasks: Dict[int, _Task] = {}
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        dependencies: Optional[Sequence[futures.Future]] = None,
+        name: Optional[str] = None,
+    ) -> futures.Future:
+        """Schedules a task to run once its dependencies have completed.
+
+        Args:
+            fn (Callable[[], Any]):
+                Required. The task.
+            dependencies (Sequence[futures.Future]):
+                Optional. Futures that must complete before the task runs.
+            name (str):
+                Optional. Name of the task, reported by `get_tasks`.
+
+        Returns:
+            futures.Future: The future of the task result.
+        """
+        unique_dependencies = list(dict.fromkeys(dependencies or ()))
+        task = _Task(
+            task_id=next(self._task_ids),
+            name=name or getattr(fn, "__qualname__", repr(fn)),
+            fn=fn,
+            dependency_count=len(unique_dependencies),
+        )
+        with self._lock:
+            self._tasks[task.task_id] = task
+        # Removes the task if it is cancelled.
+        task.future.add_done_callback(lambda _: self._remove(task))
+
+        if not unique_dependencies:
+            self._enqueue(task)
+        for dependency in unique_dependencies:
+            dependency.add_done_callback(
+                lambda dependency: self._on_dependency_done(task, dependency)
+            )
+        return task.future
+
+    def get_tasks(self) -> List[TaskInfo]:
+        """Returns the tasks that have not completed, in submission order."""
+        with self._lock:
+            return [
+                TaskInfo(
+                    task_id=task.task_id,
+                    name=task.name,
+                    state=task.state,
+                    pending_dependency_count=task.pending_dependency_count,
+                )
+                for task in sorted(self._tasks.values(), key=lambda t: t.task_id)
+            ]
+
+    @property
+    def pending_count(self) -> int:
+        """The number of tasks waiting for their dependencies."""
+        return self._count(TaskState.PENDING)
+
+    @property
+    def queued_count(self) -> int:
+        """The number of ready tasks waiting for a worker."""
+        return self._count(TaskState.QUEUED)
+
+    @property
+    def running_count(self) -> int:
+        """The number of running tasks."""
+        return self._count(TaskState.RUNNING)
+
+    def _count(self, state: TaskState) -> int:
+        with self._lock:
+            return sum(1 for task in self._tasks.values() if task.state is state)
+
+    def _remove(self, task: _Task):
+        with self._lock:
+            self._tasks.pop(task.task_id, None)
+
+    def _on_dependency_done(self, task: _Task, dependency: futures.Future):
+        with self._lock:
+            task.pending_dependency_count -= 1
+            if task.failed_dependency is None and (
+                dependency.cancelled() or dependency.exception() is not None
+            ):
+                task.failed_dependency = dependency
+            ready = task.pending_dependency_count == 0
+        if ready:
+            self._enqueue(task)
+
+    def _enqueue(self, task: _Task):
+        if task.failed_dependency is not None:
+            if task.future.set_running_or_notify_cancel():
+                if task.failed_dependency.cancelled():
+                    self._set_exception(task, futures.CancelledError())
+                else:
+                    self._set_exception(task, task.failed_dependency.exception())
+            return
+
+        with self._lock:
+            task.state = TaskState.QUEUED
+        try:
+            self._get_executor().submit(self._run, task)
+        except Exception as e:  # pylint: disable=broad-except
+            # For example, the executor has been shut down.
+            if task.future.set_running_or_notify_cancel():
+                self._set_exception(task, e)
+
+    def _run(self, task: _Task):
+        if not task.future.set_running_or_notify_cancel():
+            return
+        with self._lock:
+            task.state = TaskState.RUNNING
+        try:
+            result = task.fn()
+        except BaseException as e:  # pylint: disable=broad-except
+            self._set_exception(task, e)
+        else:
+            # Removed first, so that the task is not reported once its
+            # future is done.
+            self._remove(task)
+            task.future.set_result(result)
+
+    def _set_exception(self, task: _Task, exception: BaseException):
+        self._remove(task)
+        task.future.set_exception(exception)
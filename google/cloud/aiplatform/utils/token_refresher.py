@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Background refresh of the access tokens of credentials."""
+
+import dataclasses
+import datetime
+import logging
+import threading
+import time
+from typing import Optional
+import weakref
+
+from google.auth import credentials as auth_credentials
+from google.auth.transport import requests as google_auth_requests
+
+_LOGGER = logging.getLogger(__name__)
+
+# Tokens are refreshed this long before they expire. This must be more than
+# the threshold used by google-auth (3 minutes 45 seconds), so that requests
+# never find an expired token and refresh it themselves.
+_REFRESH_MARGIN = datetime.timedelta(minutes=5)
+
+# Delay before retrying a failed refresh, in seconds.
+_RETRY_INTERVAL = 10
+
+# Upper bound of the time between checks, in seconds.
+_MAX_CHECK_INTERVAL = 60
+
+
+def _utcnow() -> datetime.datetime:
+    # google-auth stores expiry as a naive UTC datetime.
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+@dataclasses.dataclass
+class TokenRefreshMetrics:
+    """Counters of the refreshes done by a TokenRefresher.
+
+    Attributes:
+        refresh_count (int):
+            The number of successful refreshes.
+        failure_count (int):
+            The number of failed refreshes.
+        total_refresh_seconds (float):
+            The time spent in successful refreshes, in seconds.
+        max_refresh_seconds (float):
+            The duration of the slowest successful refresh, in seconds.
+        last_error (str):
+            The error of the last failed refresh, if any.
+    """
+
+    refresh_count: int = 0
+    failure_count: int = 0
+    total_refresh_seconds: float = 0.0
+    max_refresh_seconds: float = 0.0
+    last_error: Optional[str] = None
+
+    @property
+    def average_refresh_seconds(self) -> float:
+        """The average duration of a successful refresh, in seconds."""
+        if not self.refresh_count:
+            return 0.0
+        return self.total_refresh_seconds / self.refresh_count
+
+
+class TokenRefresher:
+    """Refreshes the access tokens of credentials before they expire.
+
+    google-auth refreshes a token when a request finds it close to its
+    expiry, so that request waits for the token endpoint. The refresher
+    refreshes the watched credentials in a background thread a bit earlier,
+    so requests always find a valid token.
+
+    Credentials are watched through weak references and are dropped once
+    they are no longer used.
+
+    Example Usage:
+
+        refresher = TokenRefresher()
+        refresher.watch(credentials)
+        ...
+        print(refresher.metrics.average_refresh_seconds)
+    """
+
+    def __init__(
+        self,
+        refresh_margin: datetime.timedelta = _REFRESH_MARGIN,
+        retry_interval: float = _RETRY_INTERVAL,
+    ):
+        """Creates a TokenRefresher.
+
+        Args:
+            refresh_margin (datetime.timedelta):
+                Optional. How long before their expiry tokens are refreshed.
+                Tokens whose lifetime is shorter than twice the margin are
+                refreshed at half of their lifetime.
+            retry_interval (float):
+                Optional. Delay before retrying a failed refresh, in seconds.
+        """
+        self._refresh_margin = refresh_margin
+        self._retry_interval = retry_interval
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        # Maps the watched credentials to the time of their next retry after
+        # a failed refresh, or to None.
+        self._watched: "weakref.WeakKeyDictionary[auth_credentials.Credentials, Optional[float]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Maps the credentials refreshed by the refresher to the time of their
+        # last successful refresh, which tells the lifetime of their tokens.
+        self._refresh_times: "weakref.WeakKeyDictionary[auth_credentials.Credentials, datetime.datetime]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._metrics = TokenRefreshMetrics()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, credentials: Optional[auth_credentials.Credentials]) -> None:
+        """Starts refreshing credentials in the background.
+
+        Args:
+            credentials (auth_credentials.Credentials):
+                Optional. The credentials to refresh. Ignored if None,
+                anonymous or already watched.
+        """
+        if credentials is None or isinstance(
+            credentials, auth_credentials.AnonymousCredentials
+        ):
+            return
+        with self._lock:
+            if self._stopped or credentials in self._watched:
+                return
+            self._watched[credentials] = None
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="aiplatform-token-refresher", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """Stops refreshing all credentials."""
+        with self._lock:
+            self._stopped = True
+            self._watched.clear()
+            self._refresh_times.clear()
+        self._wakeup.set()
+
+    @property
+    def watched_count(self) -> int:
+        """The number of watched credentials."""
+        with self._lock:
+            return len(self._watched)
+
+    @property
+    def metrics(self) -> TokenRefreshMetrics:
+        """A snapshot of the refresh metrics."""
+        with self._lock:
+            return dataclasses.replace(self._metrics)
+
+    def _seconds_until_refresh(
+        self,
+        credentials: auth_credentials.Credentials,
+        retry_time: Optional[float],
+        refresh_time: Optional[datetime.datetime],
+    ) -> Optional[float]:
+        """Returns the delay before the next refresh, or None if never needed."""
+        if retry_time is not None:
+            return retry_time - time.monotonic()
+        if not credentials.token:
+            return 0
+        if credentials.expiry is None:
+            # The token does not expire.
+            return None
+        refresh_margin = self._refresh_margin
+        if refresh_time is not None:
+            # Short-lived tokens would otherwise be due again right after
+            # each refresh.
+            refresh_margin = min(
+                refresh_margin, (credentials.expiry - refresh_time) / 2
+            )
+        return (credentials.expiry - refresh_margin - _utcnow()).total_seconds()
+
+    def _refresh(self, credentials: auth_credentials.Credentials) -> None:
+        refresh_time = _utcnow()
+        start_time = time.perf_counter()
+        try:
+            credentials.refresh(google_auth_requests.Request())
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to refresh credentials: %s", e)
+            with self._lock:
+                self._metrics.failure_count += 1
+                self._metrics.last_error = str(e)
+                if credentials in self._watched:
+                    self._watched[credentials] = time.monotonic() + self._retry_interval
+            return
+        refresh_seconds = time.perf_counter() - start_time
+        with self._lock:
+            self._metrics.refresh_count += 1
+            self._metrics.total_refresh_seconds += refresh_seconds
+            self._metrics.max_refresh_seconds = max(
+                self._metrics.max_refresh_seconds, refresh_seconds
+            )
+            if credentials in self._watched:
+                self._watched[credentials] = None
+                self._refresh_times[credentials] = refresh_time
+
+    def _refresh_due_credentials(self) -> float:
+        """Refreshes the credentials that are due and returns the next delay."""
+        with self._lock:
+            watched = [
+                (credentials, retry_time, self._refresh_times.get(credentials))
+                for credentials, retry_time in self._watched.items()
+            ]
+
+        wait_seconds = _MAX_CHECK_INTERVAL
+        for credentials, retry_time, refresh_time in watched:
+            delay = self._seconds_until_refresh(credentials, retry_time, refresh_time)
+            if delay is None:
+                continue
+            if delay <= 0:
+                self._refresh(credentials)
+                with self._lock:
+                    retry_time = self._watched.get(credentials)
+                    refresh_time = self._refresh_times.get(credentials)
+                delay = self._seconds_until_refresh(
+                    credentials, retry_time, refresh_time
+                )
+                if delay is None:
+                    continue
+                if delay <= 0:
+                    # The refreshed token is already expired.
+                    delay = self._retry_interval
+            wait_seconds = min(wait_seconds, delay)
+        return max(wait_seconds, 0)
+
+    def _run(self):
+        while True:
+            self._wakeup.clear()
+            with self._lock:
+                if self._stopped:
+                    self._thread = None
+                    return
+            self._wakeup.wait(self._refresh_due_credentials())
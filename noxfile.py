@@ -196,6 +196,13 @@ def default(session):
         os.path.join("tests", "unit", "architecture", "test_vertexai_import.py"),
         *session.posargs,
     )
+    session.run(
+        "py.test",
+        "--quiet",
+        f"--junitxml=unit_{session.python}_test_aiplatform_import_sponge_log.xml",
+        os.path.join("tests", "unit", "architecture", "test_aiplatform_import.py"),
+        *session.posargs,
+    )
 
 
 @nox.session(python=UNIT_TEST_PYTHON_VERSIONS)
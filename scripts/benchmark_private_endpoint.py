@@ -0,0 +1,181 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Load benchmark of PrivateEndpoint.predict against a local HTTP server.
+
+The server stands in for the HTTP predict route of a PSA based private
+endpoint and echoes the instances as predictions. It runs in its own process,
+so that it does not compete with the client for the GIL. The benchmark
+compares HTTP client settings by throughput and by the number of connections
+opened.
+
+Usage:
+    python scripts/benchmark_private_endpoint.py --requests 5000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+from concurrent import futures
+from http import server
+import json
+import multiprocessing
+import time
+
+from google.auth import credentials as auth_credentials
+from google.cloud.aiplatform import models
+from google.cloud.aiplatform.compat.types import endpoint as gca_endpoint
+from google.protobuf import timestamp_pb2
+
+
+class _PredictHandler(server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # A multiprocessing.Value shared with the benchmark process.
+    connection_count = None
+
+    def setup(self):
+        super().setup()
+        with self.connection_count.get_lock():
+            self.connection_count.value += 1
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        response = json.dumps(
+            {"predictions": json.loads(body)["instances"], "deployedModelId": "1"}
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(port, connection_count):
+    _PredictHandler.connection_count = connection_count
+    http_server = server.ThreadingHTTPServer(("127.0.0.1", 0), _PredictHandler)
+    http_server.daemon_threads = True
+    port.value = http_server.server_address[1]
+    http_server.serve_forever()
+
+
+def make_endpoint(port: int, **http_options) -> models.PrivateEndpoint:
+    endpoint = models.PrivateEndpoint._construct_sdk_resource_from_gapic(
+        gca_endpoint.Endpoint(
+            name="projects/test/locations/us-central1/endpoints/1",
+            # Marks the resource as fully populated, so it is not fetched.
+            create_time=timestamp_pb2.Timestamp(seconds=1),
+            network="projects/test/global/networks/test",
+            deployed_models=[
+                gca_endpoint.DeployedModel(
+                    id="1",
+                    private_endpoints=gca_endpoint.PrivateEndpoints(
+                        predict_http_uri=f"http://127.0.0.1:{port}/predict"
+                    ),
+                )
+            ],
+        ),
+        project="test",
+        location="us-central1",
+        credentials=auth_credentials.AnonymousCredentials(),
+    )
+    endpoint._init_http_client(**http_options)
+    return endpoint
+
+
+def run_threads(endpoint, instances, requests: int, concurrency: int):
+    with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in executor.map(
+            lambda _: endpoint.predict(instances=instances), range(requests)
+        ):
+            pass
+
+
+def run_async(endpoint, instances, requests: int, concurrency: int):
+    async def run():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def predict():
+            async with semaphore:
+                await endpoint.predict_async(instances=instances)
+
+        await asyncio.gather(*(predict() for _ in range(requests)))
+
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(futures.ThreadPoolExecutor(max_workers=concurrency))
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--instances", type=int, default=16)
+    parser.add_argument("--dimensions", type=int, default=64)
+    args = parser.parse_args()
+
+    port = multiprocessing.Value("i", 0)
+    connection_count = multiprocessing.Value("i", 0)
+    server_process = multiprocessing.Process(
+        target=serve, args=(port, connection_count), daemon=True
+    )
+    server_process.start()
+    while not port.value:
+        time.sleep(0.01)
+
+    instances = [
+        [float(i * j) for j in range(args.dimensions)] for i in range(args.instances)
+    ]
+    configurations = [
+        ("pool maxsize 1 (previous default)", run_threads, {"http_pool_maxsize": 1}),
+        ("pool maxsize 10 (default)", run_threads, {}),
+        (
+            f"pool maxsize {args.concurrency}",
+            run_threads,
+            {"http_pool_maxsize": args.concurrency},
+        ),
+        (
+            f"pool maxsize {args.concurrency}, orjson",
+            run_threads,
+            {"http_pool_maxsize": args.concurrency, "use_orjson": True},
+        ),
+        (
+            f"pool maxsize {args.concurrency}, orjson, predict_async",
+            run_async,
+            {"http_pool_maxsize": args.concurrency, "use_orjson": True},
+        ),
+    ]
+    print(
+        f"{args.requests} requests, {args.concurrency} concurrent, "
+        f"{args.instances}x{args.dimensions} instances"
+    )
+    for name, run, http_options in configurations:
+        endpoint = make_endpoint(port.value, **http_options)
+        connection_count.value = 0
+        start_time = time.perf_counter()
+        run(endpoint, instances, args.requests, args.concurrency)
+        duration = time.perf_counter() - start_time
+        print(
+            f"  {name:<45} {args.requests / duration:8,.0f} requests/s, "
+            f"{connection_count.value} connections"
+        )
+    server_process.terminate()
+
+
+if __name__ == "__main__":
+    main()
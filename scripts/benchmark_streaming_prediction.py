@@ -0,0 +1,123 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Benchmarks the client side of tensor based streaming predictions.
+
+Streams token arrays through
+`predict_stream_of_tensor_lists_from_single_tensor_list` and its async
+counterpart with an in-process stand-in for the prediction service, and
+converts the inputs and outputs with `value_to_tensor` and `tensor_to_value`.
+Compares numeric lists converted element by element, packed numeric lists
+and numpy arrays. No request is sent.
+
+Usage:
+    python scripts/benchmark_streaming_prediction.py --tokens 4096 --responses 200
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from google.cloud.aiplatform import _streaming_prediction
+from google.cloud.aiplatform_v1.types import (
+    prediction_service as gca_prediction_service,
+)
+
+
+class _FakeClient:
+    def __init__(self, responses):
+        self._responses = responses
+
+    def server_streaming_predict(self, request):
+        return iter(self._responses)
+
+
+class _FakeAsyncClient:
+    def __init__(self, responses):
+        self._responses = responses
+
+    async def server_streaming_predict(self, request):
+        async def stream():
+            for response in self._responses:
+                yield response
+
+        return stream()
+
+
+def run_sync(value, responses, pack_numeric_lists, numpy_arrays):
+    tensor_list = [_streaming_prediction.value_to_tensor(value, pack_numeric_lists)]
+    for (
+        outputs
+    ) in _streaming_prediction.predict_stream_of_tensor_lists_from_single_tensor_list(
+        prediction_service_client=_FakeClient(responses),
+        endpoint_name="projects/123/locations/us-central1/endpoints/456",
+        tensor_list=tensor_list,
+    ):
+        for output in outputs:
+            _streaming_prediction.tensor_to_value(output._pb, numpy_arrays)
+
+
+def run_async(value, responses, pack_numeric_lists, numpy_arrays):
+    async def run():
+        tensor_list = [_streaming_prediction.value_to_tensor(value, pack_numeric_lists)]
+        async for outputs in _streaming_prediction.predict_stream_of_tensor_lists_from_single_tensor_list_async(
+            prediction_service_async_client=_FakeAsyncClient(responses),
+            endpoint_name="projects/123/locations/us-central1/endpoints/456",
+            tensor_list=tensor_list,
+        ):
+            for output in outputs:
+                _streaming_prediction.tensor_to_value(output._pb, numpy_arrays)
+
+    asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=4096)
+    parser.add_argument("--responses", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    token_array = rng.integers(0, 32000, args.tokens, dtype=np.int32)
+    token_list = token_array.tolist()
+    configurations = [
+        ("element-wise lists", token_list, False, False),
+        ("packed lists", token_list, True, False),
+        ("numpy arrays", token_array, True, True),
+    ]
+    print(f"{args.responses} responses of {args.tokens} tokens")
+    for name, value, pack_numeric_lists, numpy_arrays in configurations:
+        output = _streaming_prediction.value_to_tensor(
+            {"tokens": value}, pack_numeric_lists
+        )
+        responses = [
+            gca_prediction_service.StreamingPredictResponse(outputs=[output])
+            for _ in range(args.responses)
+        ]
+        for mode, run in [("sync", run_sync), ("async", run_async)]:
+            durations = []
+            for _ in range(args.repeats):
+                start_time = time.perf_counter()
+                run({"tokens": value}, responses, pack_numeric_lists, numpy_arrays)
+                durations.append(time.perf_counter() - start_time)
+            best = min(durations)
+            tokens = args.tokens * (args.responses + 1)
+            print(f"  {name:<20} {mode:<6} {tokens / best:14,.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Benchmarks the payload generation of EntityType.write_feature_values.
+
+Compares the per-value conversion of `DataFrame.to_dict` output with the
+column-wise conversion of the DataFrame, including the split of the payloads
+into requests. No request is sent.
+
+Usage:
+    python scripts/benchmark_write_feature_values.py --rows 100000 --features 10
+"""
+
+import argparse
+import datetime
+import time
+
+import numpy as np
+import pandas as pd
+
+from google.cloud.aiplatform.featurestore import _entity_type
+
+
+def make_dataframe(rows: int, features: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    columns = {}
+    for i in range(features):
+        kind = i % 4
+        if kind == 0:
+            columns[f"int_feature_{i}"] = rng.integers(0, 1000, rows)
+        elif kind == 1:
+            columns[f"double_feature_{i}"] = rng.random(rows)
+        elif kind == 2:
+            columns[f"bool_feature_{i}"] = rng.random(rows) > 0.5
+        else:
+            columns[f"string_feature_{i}"] = [f"value_{j}" for j in range(rows)]
+    columns["feature_time"] = pd.Timestamp("2024-01-01") + pd.to_timedelta(
+        np.arange(rows), unit="s"
+    )
+    return pd.DataFrame(columns, index=[f"entity_{j}" for j in range(rows)])
+
+
+def per_value(df: pd.DataFrame, feature_time):
+    payloads = _entity_type._EntityType._generate_payloads(
+        instances=df.to_dict(orient="index"), feature_time=feature_time
+    )
+    return _entity_type._EntityType._split_payloads(
+        [payload._pb for payload in payloads]
+    )
+
+
+def column_wise(df: pd.DataFrame, feature_time):
+    payloads = _entity_type._EntityType._generate_payloads_from_df_index(
+        df=df, feature_time=feature_time
+    )
+    return _entity_type._EntityType._split_payloads(payloads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--features", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_dataframe(args.rows, args.features)
+    feature_values = args.rows * args.features
+    for feature_time in ["feature_time", datetime.datetime(2024, 1, 1)]:
+        frame = (
+            df if feature_time == "feature_time" else df.drop(columns="feature_time")
+        )
+        print(f"feature_time={feature_time!r}, {feature_values} feature values")
+        for name, generate in [("per-value", per_value), ("column-wise", column_wise)]:
+            durations = []
+            for _ in range(args.repeats):
+                start_time = time.perf_counter()
+                requests = generate(frame, feature_time)
+                durations.append(time.perf_counter() - start_time)
+            best = min(durations)
+            print(
+                f"  {name:<12} best={best:.3f}s "
+                f"({feature_values / best:,.0f} values/s, {len(requests)} requests)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ from typing import Optional
 
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform.utils import task_scheduler
 
 
 _TEST_LOGGER_NAME = "test_logger"
@@ -204,6 +205,31 @@ class TestFutureManager:
         assert isinstance(b, _TestClassDownStream)
         assert isinstance(c, _TestClass)
 
+    def test_dependent_task_waits_without_taking_a_worker(self):
+        initializer.global_config.init(thread_pool_size=1)
+
+        a = _TestClass.create(10, sync=False)
+        b = _TestClass.create(7, sync=False)
+        b.add(a, sync=False)
+
+        tasks = initializer.global_scheduler.get_tasks()
+        assert [task.name for task in tasks] == [
+            "_TestClass.create",
+            "_TestClass.create",
+            "_TestClass.add",
+        ]
+        assert tasks[2].state is task_scheduler.TaskState.PENDING
+        assert tasks[2].pending_dependency_count == 2
+        assert initializer.global_scheduler.running_count <= 1
+
+        b.wait()
+        assert b.x == 17
+        assert not initializer.global_scheduler.get_tasks()
+
+    def test_init_thread_pool_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            initializer.global_config.init(thread_pool_size=0)
+
 
 class TestLogger:
     def test_logger_handler(self):
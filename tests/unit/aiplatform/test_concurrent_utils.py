@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import functools
+import threading
+import time
+
+import pytest
+
+from google.cloud.aiplatform.utils import concurrent_utils
+
+
+def _produce(started, index, count, error=None):
+    started.append(index)
+    yield from range(index * 1000, index * 1000 + count)
+    if error:
+        raise error
+
+
+class TestIterConcurrently:
+    def test_yields_every_item_in_producer_order(self):
+        started = []
+
+        items = list(
+            concurrent_utils.iter_concurrently(
+                [functools.partial(_produce, started, i, 50) for i in range(4)],
+                max_workers=2,
+                max_buffered_items=3,
+            )
+        )
+
+        assert sorted(items) == [i * 1000 + j for i in range(4) for j in range(50)]
+        for i in range(4):
+            assert [item for item in items if item // 1000 == i] == list(
+                range(i * 1000, i * 1000 + 50)
+            )
+
+    def test_no_producers(self):
+        assert list(concurrent_utils.iter_concurrently([], 2, 2)) == []
+
+    def test_close_stops_producers(self):
+        started = []
+        iterator = concurrent_utils.iter_concurrently(
+            [functools.partial(_produce, started, 0, 100)]
+            + [functools.partial(_produce, started, i, 0) for i in range(1, 5)],
+            max_workers=1,
+            max_buffered_items=1,
+        )
+        assert next(iterator) == 0
+
+        closer = threading.Thread(target=iterator.close)
+        closer.start()
+        closer.join(timeout=5)
+
+        assert not closer.is_alive()
+        time.sleep(0.5)
+        assert started == [0]
+
+    def test_producer_error_is_raised(self):
+        started = []
+        iterator = concurrent_utils.iter_concurrently(
+            [
+                functools.partial(_produce, started, 0, 100),
+                functools.partial(_produce, started, 1, 0, ValueError("failed")),
+            ]
+            + [functools.partial(_produce, started, i, 0) for i in range(2, 5)],
+            max_workers=2,
+            max_buffered_items=1,
+        )
+
+        with pytest.raises(ValueError, match="failed"):
+            list(iterator)
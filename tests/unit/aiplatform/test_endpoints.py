@@ -15,13 +15,18 @@
 # limitations under the License.
 #
 
+from concurrent import futures
 import copy
 from datetime import datetime, timedelta
 from importlib import reload
 import requests
 import json
+import threading
+import time
 from unittest import mock
 
+import grpc
+
 from google.api_core import operation as ga_operation
 from google.auth import credentials as auth_credentials
 from google.auth.transport import requests as google_auth_requests
@@ -31,6 +36,8 @@ from google.cloud.aiplatform import explain
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import models
 from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.utils import grpc_utils
+from google.cloud.aiplatform.utils import instrumentation
 from google.cloud.aiplatform.compat.services import (
     deployment_resource_pool_service_client_v1,
     deployment_resource_pool_service_client_v1beta1,
@@ -995,6 +1002,85 @@ class TestEndpoint:
             name=_TEST_ENDPOINT_NAME, retry=base._DEFAULT_RETRY
         )
 
+    def test_traffic_split_with_max_staleness(self, get_endpoint_mock):
+        aiplatform.init(max_staleness=timedelta(minutes=1))
+        ep = models.Endpoint(_TEST_ENDPOINT_NAME)
+        get_endpoint_mock.return_value.create_time = datetime.now()
+        ep.traffic_split
+        get_endpoint_mock.reset_mock()
+
+        ep.traffic_split
+        ep.list_models()
+        get_endpoint_mock.assert_not_called()
+
+        assert ep.refresh() is ep
+        get_endpoint_mock.assert_called_once()
+
+    def test_traffic_split_with_max_staleness_cleared(self, get_endpoint_mock):
+        aiplatform.init(max_staleness=60)
+        aiplatform.init(max_staleness=0)
+        ep = models.Endpoint(_TEST_ENDPOINT_NAME)
+        get_endpoint_mock.return_value.create_time = datetime.now()
+        ep.traffic_split
+        get_endpoint_mock.reset_mock()
+
+        ep.traffic_split
+        ep.traffic_split
+        assert get_endpoint_mock.call_count == 2
+
+    def test_traffic_split_with_class_max_staleness(self, get_endpoint_mock):
+        ep = models.Endpoint(_TEST_ENDPOINT_NAME)
+        get_endpoint_mock.return_value.create_time = datetime.now()
+        ep.traffic_split
+        get_endpoint_mock.reset_mock()
+
+        with mock.patch.object(models.Endpoint, "max_staleness", 0):
+            ep.traffic_split
+            ep.traffic_split
+        assert get_endpoint_mock.call_count == 2
+
+        with mock.patch.object(models.Endpoint, "max_staleness", 60):
+            ep.traffic_split
+        assert get_endpoint_mock.call_count == 2
+
+    def test_traffic_split_with_max_staleness_shares_get_call(self, get_endpoint_mock):
+        aiplatform.init(max_staleness=60)
+        ep = models.Endpoint(_TEST_ENDPOINT_NAME)
+        get_endpoint_mock.return_value.create_time = datetime.now()
+        ep.traffic_split
+        get_endpoint_mock.reset_mock()
+        ep._gca_resource_sync_time -= 120
+
+        release = threading.Event()
+        get_endpoint_mock.side_effect = lambda **kwargs: (
+            release.wait(5) and get_endpoint_mock.return_value
+        )
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            reads = [executor.submit(ep.list_models) for _ in range(4)]
+            time.sleep(0.1)
+            release.set()
+            for read in reads:
+                assert read.result(timeout=5) == []
+
+        get_endpoint_mock.assert_called_once()
+
+    def test_traffic_split_with_max_staleness_refreshes_in_background(
+        self, get_endpoint_mock
+    ):
+        aiplatform.init(max_staleness=60)
+        ep = models.Endpoint(_TEST_ENDPOINT_NAME)
+        get_endpoint_mock.return_value.create_time = datetime.now()
+        ep.traffic_split
+        get_endpoint_mock.reset_mock()
+
+        # Older than half of max_staleness.
+        ep._gca_resource_sync_time -= 40
+        ep.traffic_split
+        initializer.global_pool.shutdown(wait=True)
+
+        get_endpoint_mock.assert_called_once()
+        assert ep._gca_resource_sync_time > time.monotonic() - 40
+
     def test_lazy_constructor_with_custom_project(self, get_endpoint_mock):
         ep = models.Endpoint(endpoint_name=_TEST_ID, project=_TEST_PROJECT_2)
         test_endpoint_resource_name = (
@@ -2271,6 +2357,44 @@ class TestEndpoint:
             timeout=None,
         )
 
+    @pytest.mark.usefixtures("get_endpoint_mock", "predict_client_predict_mock")
+    def test_predict_records_phases(self):
+        records = []
+        instrumentation.add_callback(records.append)
+        try:
+            test_endpoint = models.Endpoint(_TEST_ID)
+            test_endpoint.predict(instances=_TEST_INSTANCES)
+        finally:
+            instrumentation.remove_callback(records.append)
+
+        (record,) = [r for r in records if r.operation == "Endpoint.predict"]
+        # The prediction client is created by the first prediction.
+        assert [phase.name for phase in record.phases] == [
+            "create_client",
+            "rpc",
+            "convert_response",
+        ]
+        assert record.error is None
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_warmup(self):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        with mock.patch.object(grpc, "channel_ready_future") as ready_future_mock:
+            test_endpoint.warmup(timeout=10)
+
+        ready_future_mock.assert_called_once_with(
+            test_endpoint._prediction_client._transport.grpc_channel
+        )
+        ready_future_mock.return_value.result.assert_called_once_with(timeout=10)
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_constructor_with_prewarm_starts_warm_up(self):
+        aiplatform.init(prewarm=True)
+        with mock.patch.object(grpc_utils, "start_warm_up") as start_warm_up_mock:
+            test_endpoint = models.Endpoint(_TEST_ID)
+
+        start_warm_up_mock.assert_called_once_with(test_endpoint.warmup)
+
     @pytest.mark.usefixtures("get_dedicated_endpoint_mock")
     def test_predict_dedicated_endpoint(self, predict_endpoint_http_mock):
         test_endpoint = models.Endpoint(_TEST_ENDPOINT_NAME)
@@ -3195,6 +3319,69 @@ class TestPrivateEndpoint:
             },
         )
 
+    @pytest.mark.usefixtures("get_psa_private_endpoint_with_model_mock")
+    def test_psa_predict_with_orjson(self, predict_private_endpoint_mock):
+        test_endpoint = models.PrivateEndpoint(_TEST_ID, use_orjson=True)
+        test_prediction = test_endpoint.predict(instances=_TEST_INSTANCES)
+
+        assert test_prediction.predictions == _TEST_PREDICTION
+        predict_private_endpoint_mock.assert_called_once_with(
+            method="POST",
+            url="",
+            body=b'{"instances":[[1.0,2.0,3.0],[1.0,3.0,4.0]]}',
+            headers={"Content-Type": "application/json"},
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_psa_private_endpoint_with_model_mock")
+    async def test_psa_predict_async(self, predict_private_endpoint_mock):
+        test_endpoint = models.PrivateEndpoint(_TEST_ID)
+        test_prediction = await test_endpoint.predict_async(instances=_TEST_INSTANCES)
+
+        true_prediction = models.Prediction(
+            predictions=_TEST_PREDICTION,
+            deployed_model_id=_TEST_ID,
+            metadata=_TEST_METADATA,
+        )
+
+        assert true_prediction == test_prediction
+        predict_private_endpoint_mock.assert_called_once_with(
+            method="POST",
+            url="",
+            body='{"instances": [[1.0, 2.0, 3.0], [1.0, 3.0, 4.0]]}',
+            headers={"Content-Type": "application/json"},
+        )
+
+    @pytest.mark.usefixtures("get_psa_private_endpoint_with_model_mock")
+    def test_http_client_options(self):
+        test_endpoint = models.PrivateEndpoint(
+            _TEST_ID,
+            http_pool_maxsize=64,
+            http_num_pools=2,
+            http_pool_block=True,
+            http_timeout=5.0,
+        )
+
+        http_client = test_endpoint._http_client
+        assert http_client.connection_pool_kw["maxsize"] == 64
+        assert http_client.connection_pool_kw["block"]
+        assert http_client.connection_pool_kw["timeout"].total == 5.0
+        assert http_client.pools._maxsize == 2
+
+    @pytest.mark.usefixtures("get_psa_private_endpoint_with_model_mock")
+    def test_http_request_error_truncates_response(self):
+        test_endpoint = models.PrivateEndpoint(_TEST_ID)
+
+        with mock.patch.object(urllib3.PoolManager, "request") as request_mock:
+            request_mock.return_value = urllib3.response.HTTPResponse(
+                status=500, body=b"x" * (models._MAX_HTTP_ERROR_BODY_BYTES + 10)
+            )
+            with pytest.raises(RuntimeError) as err:
+                test_endpoint.predict(instances=_TEST_INSTANCES)
+
+        assert str(err.value).endswith("x" * models._MAX_HTTP_ERROR_BODY_BYTES)
+        assert "x" * (models._MAX_HTTP_ERROR_BODY_BYTES + 1) not in str(err.value)
+
     @pytest.mark.usefixtures("get_psc_private_endpoint_mock")
     def test_psc_predict_without_endpoint_override(self):
         test_endpoint = models.PrivateEndpoint(
@@ -3241,6 +3428,42 @@ class TestPrivateEndpoint:
             method="GET", url="", body=None, headers=None
         )
 
+    @pytest.mark.usefixtures("get_psa_private_endpoint_with_model_mock")
+    def test_psa_warmup(self, health_check_private_endpoint_mock):
+        test_endpoint = models.PrivateEndpoint(_TEST_ID)
+        test_endpoint.warmup()
+
+        health_check_private_endpoint_mock.assert_called_once_with(
+            method="GET", url="", body=None, headers=None
+        )
+
+    @pytest.mark.usefixtures("get_psa_private_endpoint_with_model_mock")
+    def test_constructor_with_prewarm_sends_psa_health_check(
+        self, health_check_private_endpoint_mock
+    ):
+        aiplatform.init(prewarm=True)
+        start_warm_up = grpc_utils.start_warm_up
+        with mock.patch.object(
+            grpc_utils,
+            "start_warm_up",
+            side_effect=lambda warm_up: start_warm_up(warm_up).join(),
+        ) as start_warm_up_mock:
+            test_endpoint = models.PrivateEndpoint(_TEST_ID)
+
+        start_warm_up_mock.assert_called_once_with(test_endpoint.warmup)
+        health_check_private_endpoint_mock.assert_called_once_with(
+            method="GET", url="", body=None, headers=None
+        )
+
+    @pytest.mark.usefixtures("get_psc_private_endpoint_mock")
+    def test_psc_warmup(self, health_check_private_endpoint_mock):
+        test_endpoint = models.PrivateEndpoint(
+            project=_TEST_PROJECT, location=_TEST_LOCATION, endpoint_name=_TEST_ID
+        )
+        test_endpoint.warmup()
+
+        health_check_private_endpoint_mock.assert_not_called()
+
     @pytest.mark.usefixtures("get_psc_private_endpoint_mock")
     def test_psc_health_check(self):
         test_endpoint = models.PrivateEndpoint(
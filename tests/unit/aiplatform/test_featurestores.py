@@ -18,7 +18,10 @@
 import copy
 import pytest
 import datetime
+import numpy as np
 import pandas as pd
+import pyarrow
+import threading
 import uuid
 
 from unittest import mock
@@ -35,6 +38,7 @@ from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.utils import resource_manager_utils
 
 from google.cloud.aiplatform.utils import featurestore_utils
+from google.cloud.aiplatform.featurestore import _entity_type
 from google.cloud.aiplatform.featurestore.feature import Feature
 from google.cloud.aiplatform.compat.services import (
     featurestore_service_client,
@@ -291,6 +295,16 @@ _TEST_GCS_SOURCE_TYPE_AVRO = "avro"
 _TEST_GCS_SOURCE_TYPE_INVALID = "json"
 
 _TEST_BATCH_SERVE_START_TIME = datetime.datetime.now()
+_TEST_READ_STREAM_NAMES = ["stream_1", "stream_2"]
+_TEST_STREAM_BATCHES = {
+    "stream_1": [
+        pyarrow.record_batch({"entity_id": ["a", "b"], "feature": [1, 2]}),
+        pyarrow.record_batch({"entity_id": ["c"], "feature": [3]}),
+    ],
+    "stream_2": [
+        pyarrow.record_batch({"entity_id": ["d"], "feature": [4]}),
+    ],
+}
 _TEST_BQ_DESTINATION_URI = "bq://project.dataset.table_name"
 _TEST_GCS_OUTPUT_URI_PREFIX = "gs://my_bucket/path/to_prefix"
 
@@ -478,6 +492,39 @@ def bqs_create_read_session(bqs_client_mock):
         yield bqs_create_read_session
 
 
+def _get_read_rows_mock(stream_batches, on_page=None):
+    """Returns a read_rows mock returning the record batches of each stream."""
+
+    def read_rows(stream_name):
+        def pages():
+            for batch in stream_batches[stream_name]:
+                if on_page:
+                    on_page()
+                page = mock.Mock()
+                page.to_arrow.return_value = batch
+                yield page
+
+        reader = mock.Mock()
+        reader.rows.return_value.pages = pages()
+        return reader
+
+    return read_rows
+
+
+@pytest.fixture
+def bqs_create_read_session_with_two_streams(bqs_client_mock):
+    with patch.object(
+        bqs_client_mock, "create_read_session"
+    ) as bqs_create_read_session:
+        read_session_proto = gcbqs_stream.ReadSession()
+        read_session_proto.streams = [
+            gcbqs_stream.ReadStream(name=_TEST_READ_STREAM_NAMES[0]),
+            gcbqs_stream.ReadStream(name=_TEST_READ_STREAM_NAMES[1]),
+        ]
+        bqs_create_read_session.return_value = read_session_proto
+        yield bqs_create_read_session
+
+
 @pytest.fixture
 def bq_schema_field_mock():
     mock = MagicMock(bigquery.SchemaField)
@@ -717,6 +764,20 @@ def get_feature_mock():
         yield get_feature_mock
 
 
+@pytest.fixture
+def list_importing_features_mock():
+    with patch.object(
+        featurestore_service_client.FeaturestoreServiceClient, "list_features"
+    ) as list_importing_features_mock:
+        list_importing_features_mock.return_value = [
+            gca_feature.Feature(
+                name=f"{_TEST_ENTITY_TYPE_NAME}/features/{_TEST_IMPORTING_FEATURE_ID}",
+                value_type=_TEST_FEATURE_VALUE_TYPE,
+            ),
+        ]
+        yield list_importing_features_mock
+
+
 @pytest.fixture
 def update_feature_mock():
     with patch.object(
@@ -2034,6 +2095,155 @@ class TestFeaturestore:
             timeout=None,
         )
 
+    @pytest.mark.usefixtures(
+        "get_featurestore_mock",
+        "batch_read_feature_values_mock",
+        "bq_init_client_mock",
+        "bq_init_dataset_mock",
+        "bq_create_dataset_mock",
+        "bq_load_table_from_dataframe_mock",
+        "bq_delete_dataset_mock",
+        "bqs_init_client_mock",
+        "get_project_mock",
+    )
+    def test_batch_serve_to_arrow_reads_streams_concurrently(
+        self, bqs_client_mock, bqs_create_read_session_with_two_streams
+    ):
+        aiplatform.init(project=_TEST_PROJECT_DIFF)
+        my_featurestore = aiplatform.Featurestore(
+            featurestore_name=_TEST_FEATURESTORE_NAME
+        )
+        # Every stream waits for the other one before yielding a page, so
+        # reading the streams one after the other breaks the barrier.
+        barrier = threading.Barrier(len(_TEST_READ_STREAM_NAMES), timeout=5)
+        bqs_client_mock.read_rows.side_effect = _get_read_rows_mock(
+            {name: batches[:1] for name, batches in _TEST_STREAM_BATCHES.items()},
+            on_page=barrier.wait,
+        )
+
+        table = my_featurestore.batch_serve_to_arrow(
+            serving_feature_ids=_TEST_SERVING_FEATURE_IDS,
+            read_instances_df=pd.DataFrame(),
+            columns=["entity_id", "feature"],
+        )
+
+        assert sorted(table.column("entity_id").to_pylist()) == ["a", "b", "d"]
+        read_session = bqs_create_read_session_with_two_streams.call_args.kwargs[
+            "read_session"
+        ]
+        assert list(read_session.read_options.selected_fields) == [
+            "entity_id",
+            "feature",
+        ]
+        assert read_session.data_format == bigquery_storage.types.DataFormat.ARROW
+
+    @pytest.mark.usefixtures(
+        "get_featurestore_mock",
+        "batch_read_feature_values_mock",
+        "bq_init_client_mock",
+        "bq_init_dataset_mock",
+        "bq_create_dataset_mock",
+        "bq_load_table_from_dataframe_mock",
+        "bq_delete_dataset_mock",
+        "bqs_init_client_mock",
+        "bqs_create_read_session_with_two_streams",
+        "get_project_mock",
+    )
+    def test_batch_serve_to_df_reads_all_streams(self, bqs_client_mock):
+        aiplatform.init(project=_TEST_PROJECT_DIFF)
+        my_featurestore = aiplatform.Featurestore(
+            featurestore_name=_TEST_FEATURESTORE_NAME
+        )
+        bqs_client_mock.read_rows.side_effect = _get_read_rows_mock(
+            _TEST_STREAM_BATCHES
+        )
+
+        df = my_featurestore.batch_serve_to_df(
+            serving_feature_ids=_TEST_SERVING_FEATURE_IDS,
+            read_instances_df=pd.DataFrame(),
+        )
+
+        assert list(df.columns) == ["entity_id", "feature"]
+        assert sorted(df["feature"].tolist()) == [1, 2, 3, 4]
+
+    @pytest.mark.usefixtures(
+        "get_featurestore_mock",
+        "batch_read_feature_values_mock",
+        "bq_init_client_mock",
+        "bq_init_dataset_mock",
+        "bq_create_dataset_mock",
+        "bq_load_table_from_dataframe_mock",
+        "bqs_init_client_mock",
+        "bqs_create_read_session_with_two_streams",
+        "get_project_mock",
+    )
+    def test_batch_serve_to_arrow_batches_cleans_up_on_close(
+        self, bqs_client_mock, bq_delete_dataset_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT_DIFF)
+        my_featurestore = aiplatform.Featurestore(
+            featurestore_name=_TEST_FEATURESTORE_NAME
+        )
+        bqs_client_mock.read_rows.side_effect = _get_read_rows_mock(
+            _TEST_STREAM_BATCHES
+        )
+
+        batches = my_featurestore.batch_serve_to_arrow_batches(
+            serving_feature_ids=_TEST_SERVING_FEATURE_IDS,
+            read_instances_df=pd.DataFrame(),
+            max_concurrent_streams=1,
+        )
+        bq_delete_dataset_mock.assert_not_called()
+
+        assert isinstance(next(batches), pyarrow.RecordBatch)
+        batches.close()
+
+        bq_delete_dataset_mock.assert_called_once()
+
+    @pytest.mark.usefixtures(
+        "get_featurestore_mock",
+        "batch_read_feature_values_mock",
+        "bq_init_client_mock",
+        "bq_init_dataset_mock",
+        "bq_create_dataset_mock",
+        "bq_load_table_from_dataframe_mock",
+        "bqs_init_client_mock",
+        "bqs_create_read_session_with_two_streams",
+        "get_project_mock",
+    )
+    def test_batch_serve_to_arrow_raises_stream_error(
+        self, bqs_client_mock, bq_delete_dataset_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT_DIFF)
+        my_featurestore = aiplatform.Featurestore(
+            featurestore_name=_TEST_FEATURESTORE_NAME
+        )
+        bqs_client_mock.read_rows.side_effect = RuntimeError("stream failed")
+
+        with pytest.raises(RuntimeError, match="stream failed"):
+            my_featurestore.batch_serve_to_arrow(
+                serving_feature_ids=_TEST_SERVING_FEATURE_IDS,
+                read_instances_df=pd.DataFrame(),
+            )
+
+        bq_delete_dataset_mock.assert_called_once()
+
+    @pytest.mark.usefixtures("get_featurestore_mock")
+    def test_batch_serve_to_arrow_batches_with_invalid_max_concurrent_streams(
+        self,
+    ):
+        aiplatform.init(project=_TEST_PROJECT_DIFF)
+        my_featurestore = aiplatform.Featurestore(
+            featurestore_name=_TEST_FEATURESTORE_NAME
+        )
+
+        with pytest.raises(ValueError, match="max_concurrent_streams"):
+            my_featurestore.batch_serve_to_arrow_batches(
+                serving_feature_ids=_TEST_SERVING_FEATURE_IDS,
+                read_instances_df=pd.DataFrame(),
+                max_concurrent_streams=0,
+            )
+
 
 @pytest.mark.usefixtures("google_auth_mock")
 class TestEntityType:
@@ -2467,7 +2677,7 @@ class TestEntityType:
 
     @pytest.mark.usefixtures(
         "get_entity_type_mock",
-        "get_feature_mock",
+        "list_importing_features_mock",
         "bq_init_client_mock",
         "bq_init_dataset_mock",
         "bq_create_dataset_mock",
@@ -2492,6 +2702,7 @@ class TestEntityType:
             df_source=df_source,
             feature_source_fields=_TEST_IMPORTING_FEATURE_SOURCE_FIELDS,
             ingest_request_timeout=None,
+            streaming_row_threshold=0,
         )
         expected_temp_bq_dataset_name = (
             f"temp_{_TEST_FEATURESTORE_ID}_{uuid.uuid4()}".replace("-", "_")
@@ -2533,7 +2744,7 @@ class TestEntityType:
 
     @pytest.mark.usefixtures(
         "get_entity_type_mock",
-        "get_feature_mock",
+        "list_importing_features_mock",
         "bq_init_client_mock",
         "bq_init_dataset_mock",
         "bq_create_dataset_mock",
@@ -2558,6 +2769,7 @@ class TestEntityType:
             df_source=df_source,
             feature_source_fields=_TEST_IMPORTING_FEATURE_SOURCE_FIELDS,
             ingest_request_timeout=None,
+            streaming_row_threshold=0,
         )
 
         expected_temp_bq_dataset_name = (
@@ -2601,6 +2813,131 @@ class TestEntityType:
             timeout=None,
         )
 
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock",
+        "list_importing_features_mock",
+    )
+    def test_ingest_from_df_with_streaming_writes(
+        self,
+        write_feature_values_mock,
+        bq_init_client_mock,
+        import_feature_values_mock,
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        df_source = pd.DataFrame(
+            {
+                "entity_id": ["entity_1", "entity_2"],
+                _TEST_IMPORTING_FEATURE_SOURCE_FIELD: [1.0, float("nan")],
+                _TEST_FEATURE_TIME_FIELD: [
+                    _TEST_FEATURE_TIME_DATETIME,
+                    _TEST_FEATURE_TIME_DATETIME,
+                ],
+            }
+        )
+
+        my_entity_type.ingest_from_df(
+            feature_ids=_TEST_IMPORTING_FEATURE_IDS,
+            feature_time=_TEST_FEATURE_TIME_FIELD,
+            df_source=df_source,
+            feature_source_fields=_TEST_IMPORTING_FEATURE_SOURCE_FIELDS,
+            ingest_request_timeout=10,
+        )
+
+        write_feature_values_mock.assert_called_once_with(
+            request=gca_featurestore_online_service.WriteFeatureValuesRequest(
+                entity_type=_TEST_ENTITY_TYPE_NAME,
+                payloads=[
+                    gca_featurestore_online_service.WriteFeatureValuesPayload(
+                        entity_id="entity_1",
+                        feature_values={
+                            _TEST_IMPORTING_FEATURE_ID: gca_featurestore_online_service.FeatureValue(
+                                int64_value=1,
+                                metadata=gca_featurestore_online_service.FeatureValue.Metadata(
+                                    generate_time=_TEST_FEATURE_TIME_DATETIME_UTC
+                                ),
+                            ),
+                        },
+                    ),
+                ],
+            ),
+            metadata=_TEST_REQUEST_METADATA,
+            timeout=10,
+        )
+        bq_init_client_mock.assert_not_called()
+        import_feature_values_mock.assert_not_called()
+
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock",
+        "list_importing_features_mock",
+    )
+    def test_ingest_from_df_with_streaming_writes_splits_requests(
+        self, write_feature_values_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        df_source = pd.DataFrame(
+            {
+                "entity_id": [f"entity_{i}" for i in range(5)],
+                _TEST_IMPORTING_FEATURE_ID: list(range(5)),
+            }
+        )
+
+        with patch.object(
+            _entity_type, "_WRITE_FEATURE_VALUES_MAX_PAYLOADS_PER_REQUEST", 2
+        ):
+            my_entity_type.ingest_from_df(
+                feature_ids=_TEST_IMPORTING_FEATURE_IDS,
+                feature_time=_TEST_FEATURE_TIME_DATETIME,
+                df_source=df_source,
+            )
+
+        assert write_feature_values_mock.call_count == 3
+        written_entity_ids = sorted(
+            payload.entity_id
+            for call in write_feature_values_mock.call_args_list
+            for payload in call.kwargs["request"].payloads
+        )
+        assert written_entity_ids == [f"entity_{i}" for i in range(5)]
+
+    @pytest.mark.usefixtures(
+        "get_entity_type_mock",
+        "list_importing_features_mock",
+    )
+    def test_ingest_from_df_with_unknown_feature_raises(
+        self, write_feature_values_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+
+        with pytest.raises(ValueError, match="unknown_feature_id"):
+            my_entity_type.ingest_from_df(
+                feature_ids=["unknown_feature_id"],
+                feature_time=_TEST_FEATURE_TIME_DATETIME,
+                df_source=pd.DataFrame({"entity_id": ["entity_1"]}),
+            )
+        write_feature_values_mock.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "values, value_type, expected_values",
+        [
+            ([True, None], "BOOL", [True, None]),
+            ([1.5, float("nan")], "DOUBLE", [1.5, None]),
+            ([1.0, float("nan")], "INT64", [1, None]),
+            (["a", None], "STRING", ["a", None]),
+            ([b"a", None], "BYTES", [b"a", None]),
+            ([[1, 2], None], "INT64_ARRAY", [[1, 2], None]),
+            ([np.array([0.5, 1.5]), None], "DOUBLE_ARRAY", [[0.5, 1.5], None]),
+        ],
+    )
+    def test_convert_column_values(self, values, value_type, expected_values):
+        assert (
+            _entity_type._EntityType._convert_column_values(
+                pd.Series(values), value_type
+            )
+            == expected_values
+        )
+
     @pytest.mark.parametrize(
         "feature_value_type, expected_field_type, expected_mode",
         [
@@ -3112,14 +3449,89 @@ class TestEntityType:
         )
 
         write_feature_values_mock.assert_called_once_with(
-            entity_type=my_entity_type.resource_name,
-            payloads=[
-                gca_featurestore_online_service.WriteFeatureValuesPayload(
-                    entity_id=entity_id, feature_values=expected_feature_values
-                )
-            ],
+            request=gca_featurestore_online_service.WriteFeatureValuesRequest(
+                entity_type=my_entity_type.resource_name,
+                payloads=[
+                    gca_featurestore_online_service.WriteFeatureValuesPayload(
+                        entity_id=entity_id, feature_values=expected_feature_values
+                    )
+                ],
+            ),
+            metadata=(),
+            timeout=None,
+        )
+
+    @pytest.mark.parametrize(
+        "feature_time",
+        [None, _TEST_FEATURE_TIME_DATETIME, "feature_timestamp"],
+    )
+    def test_generate_payloads_from_df_index_matches_generate_payloads(
+        self, feature_time
+    ):
+        df = pd.DataFrame(
+            {
+                "int_feature": [1, 2],
+                "double_feature": [0.5, 1.5],
+                "bool_feature": [True, False],
+                "string_feature": ["a", "b"],
+                "bytes_feature": [b"a", b"b"],
+                "int_array_feature": [[1, 2], [3]],
+                "mixed_feature": [1, 2.5],
+                "feature_timestamp": [
+                    _TEST_FEATURE_TIME_DATETIME,
+                    _TEST_FEATURE_TIME_DATETIME + datetime.timedelta(microseconds=5),
+                ],
+            },
+            index=["entity_1", "entity_2"],
+        ).astype({"mixed_feature": object})
+        if feature_time != "feature_timestamp":
+            df = df.drop(columns="feature_timestamp")
+
+        expected_payloads = [
+            payload._pb
+            for payload in _entity_type._EntityType._generate_payloads(
+                instances=df.to_dict(orient="index"), feature_time=feature_time
+            )
+        ]
+
+        assert (
+            _entity_type._EntityType._generate_payloads_from_df_index(
+                df=df, feature_time=feature_time
+            )
+            == expected_payloads
         )
 
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_write_feature_values_splits_requests(self, write_feature_values_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        df = pd.DataFrame(
+            {"int_feature": [1, 2, 3]}, index=["entity_1", "entity_2", "entity_3"]
+        )
+
+        with patch.object(_entity_type, "_WRITE_FEATURE_VALUES_MAX_REQUEST_BYTES", 1):
+            my_entity_type.write_feature_values(instances=df)
+
+        assert write_feature_values_mock.call_count == 3
+        written_entity_ids = sorted(
+            payload.entity_id
+            for call in write_feature_values_mock.call_args_list
+            for payload in call.kwargs["request"].payloads
+        )
+        assert written_entity_ids == ["entity_1", "entity_2", "entity_3"]
+
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_write_feature_values_with_duplicate_entity_ids_raises(
+        self, write_feature_values_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        df = pd.DataFrame({"int_feature": [1, 2]}, index=["entity_1", "entity_1"])
+
+        with pytest.raises(ValueError, match="index must be unique"):
+            my_entity_type.write_feature_values(instances=df)
+        write_feature_values_mock.assert_not_called()
+
     @pytest.mark.usefixtures("get_entity_type_mock")
     @pytest.mark.parametrize(
         "feature_id, test_value, expected_feature_value",
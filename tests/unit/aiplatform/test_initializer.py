@@ -17,6 +17,7 @@
 
 import importlib
 import os
+import threading
 from typing import Optional
 from unittest import mock
 from unittest.mock import patch
@@ -24,6 +25,7 @@ from unittest.mock import patch
 import pytest
 
 import google.auth
+from google.api_core import grpc_helpers
 from google.auth import credentials
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform.metadata.metadata import _experiment_tracker
@@ -527,6 +529,56 @@ class TestInit:
             for metadata_key in ["global_param", "request_param"]:
                 assert metadata_key in headers
 
+    @pytest.mark.parametrize(
+        "client_class",
+        [
+            utils.PredictionClientWithOverride,
+            prediction_service_client_v1beta1.PredictionServiceClient,
+        ],
+    )
+    def test_create_client_with_grpc_channel_options(self, client_class):
+        initializer.global_config.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+            grpc_keepalive_time_ms=30000,
+            grpc_keepalive_timeout_ms=10000,
+            grpc_client_idle_timeout_ms=600000,
+        )
+        with patch.object(grpc_helpers, "create_channel") as create_channel_mock:
+            initializer.global_config.create_client(client_class=client_class)
+
+        options = create_channel_mock.call_args[1]["options"]
+        assert ("grpc.keepalive_time_ms", 30000) in options
+        assert ("grpc.keepalive_permit_without_calls", 1) in options
+        assert ("grpc.keepalive_timeout_ms", 10000) in options
+        assert ("grpc.client_idle_timeout_ms", 600000) in options
+        # The default options of the transport are kept.
+        assert ("grpc.max_receive_message_length", -1) in options
+
+    def test_create_client_with_grpc_channel_options_and_rest_transport(self):
+        initializer.global_config.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+            api_transport="rest",
+            grpc_keepalive_time_ms=30000,
+        )
+        client = initializer.global_config.create_client(
+            client_class=prediction_service_client_v1beta1.PredictionServiceClient
+        )
+        assert client._transport.kind == "rest"
+
+    def test_init_prewarm_refreshes_credentials(self):
+        creds = mock.Mock(spec=credentials.Credentials, valid=False)
+        refreshed = threading.Event()
+        creds.refresh.side_effect = lambda request: refreshed.set()
+
+        initializer.global_config.init(
+            project=_TEST_PROJECT, credentials=creds, prewarm=True
+        )
+
+        assert initializer.global_config.prewarm
+        assert refreshed.wait(timeout=5)
+
 
 class TestThreadPool:
     def teardown_method(self):
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from unittest import mock
+
+import pytest
+
+from google.api_core import client_options
+from google.api_core import exceptions
+from google.api_core import gapic_v1
+from google.api_core import retry as api_core_retry
+from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.compat.types import (
+    prediction_service as gca_prediction_service,
+)
+from google.cloud.aiplatform.utils import instrumentation
+
+_TEST_ENDPOINT_NAME = "projects/123/locations/us-central1/endpoints/456"
+
+
+@pytest.fixture
+def records():
+    records = []
+    instrumentation.add_callback(records.append)
+    yield records
+    instrumentation.remove_callback(records.append)
+
+
+@pytest.fixture
+def prediction_client():
+    return utils.PredictionClientWithOverride(
+        client_options=client_options.ClientOptions(),
+        client_info=gapic_v1.client_info.ClientInfo(),
+    )
+
+
+@pytest.fixture
+def predict_mock():
+    with mock.patch.object(
+        utils.PredictionClientWithOverride.get_gapic_client_class(),
+        "predict",
+        autospec=True,
+    ) as predict_mock:
+        predict_mock.return_value = gca_prediction_service.PredictResponse(
+            deployed_model_id="1"
+        )
+        yield predict_mock
+
+
+class TestRecord:
+    def test_record_is_noop_without_callbacks(self):
+        assert not instrumentation.is_enabled()
+
+        with instrumentation.record("op") as recorder:
+            with recorder.phase("rpc"):
+                pass
+            recorder.add_retries()
+
+        assert not recorder.enabled
+
+    def test_record_reports_phases(self, records):
+        request = gca_prediction_service.PredictRequest(endpoint=_TEST_ENDPOINT_NAME)
+
+        with instrumentation.record("op", model="gemini") as recorder:
+            with recorder.phase("build_request"):
+                pass
+            with recorder.phase("rpc"):
+                pass
+            recorder.set_request(request)
+            recorder.add_retries(2)
+
+        (record,) = records
+        assert record.operation == "op"
+        assert record.attributes == {"model": "gemini"}
+        assert [phase.name for phase in record.phases] == ["build_request", "rpc"]
+        assert record.phases[0].start_time_ns >= record.start_time_ns
+        assert sum(phase.duration_ns for phase in record.phases) <= record.duration_ns
+        assert set(record.phase_seconds) == {"build_request", "rpc"}
+        assert (
+            record.request_bytes
+            == gca_prediction_service.PredictRequest.pb(request).ByteSize()
+        )
+        assert record.retry_count == 2
+        assert record.error is None
+
+    def test_record_reports_error(self, records):
+        with pytest.raises(ValueError):
+            with instrumentation.record("op"):
+                raise ValueError("failed")
+
+        assert isinstance(records[0].error, ValueError)
+
+    def test_failing_callback_does_not_fail_call(self, records):
+        failing_callback = mock.Mock(side_effect=RuntimeError("failed"))
+        instrumentation.add_callback(failing_callback)
+        try:
+            with instrumentation.record("op"):
+                pass
+        finally:
+            instrumentation.remove_callback(failing_callback)
+
+        failing_callback.assert_called_once()
+        assert len(records) == 1
+
+    def test_phase_outside_record_is_recorded_on_its_own(self, records):
+        with instrumentation.phase("create_client"):
+            pass
+
+        (record,) = records
+        assert record.operation == "create_client"
+        assert [phase.name for phase in record.phases] == ["create_client"]
+
+    def test_recorded_function_reports_phases(self, records):
+        response = gca_prediction_service.PredictResponse(deployed_model_id="1")
+
+        @instrumentation.recorded("op")
+        def call():
+            with instrumentation.phase("rpc"):
+                instrumentation.set_response(response)
+            return response
+
+        assert call() is response
+        (record,) = records
+        assert record.operation == "op"
+        assert [phase.name for phase in record.phases] == ["rpc"]
+        assert (
+            record.response_bytes
+            == gca_prediction_service.PredictResponse.pb(response).ByteSize()
+        )
+
+
+@pytest.mark.usefixtures("google_auth_mock")
+class TestInstrumentedClient:
+    def test_client_method_is_not_wrapped_when_disabled(
+        self, prediction_client, predict_mock
+    ):
+        assert prediction_client.predict == predict_mock.__get__(
+            prediction_client._clients[prediction_client._default_version]
+        )
+
+    def test_client_call_is_recorded(self, records, prediction_client, predict_mock):
+        request = gca_prediction_service.PredictRequest(endpoint=_TEST_ENDPOINT_NAME)
+
+        response = prediction_client.predict(request=request)
+
+        assert response == predict_mock.return_value
+        (record,) = records
+        assert record.operation == "PredictionServiceClient.predict"
+        assert [phase.name for phase in record.phases] == ["rpc"]
+        assert record.request_bytes > 0
+        assert record.response_bytes > 0
+
+    def test_client_call_adds_to_active_record(
+        self, records, prediction_client, predict_mock
+    ):
+        with instrumentation.record("Endpoint.predict") as recorder:
+            with recorder.phase("rpc"):
+                prediction_client.predict(endpoint=_TEST_ENDPOINT_NAME)
+
+        (record,) = records
+        assert record.operation == "Endpoint.predict"
+        assert record.response_bytes > 0
+
+    def test_client_call_counts_retries(self, records, prediction_client, predict_mock):
+        attempts = iter(
+            [exceptions.ServiceUnavailable("unavailable")] * 2
+            + [predict_mock.return_value]
+        )
+
+        def predict(client, **kwargs):
+            def attempt():
+                result = next(attempts)
+                if isinstance(result, Exception):
+                    raise result
+                return result
+
+            return kwargs["retry"](attempt)()
+
+        predict_mock.side_effect = predict
+        retry = api_core_retry.Retry(
+            predicate=api_core_retry.if_exception_type(exceptions.ServiceUnavailable),
+            initial=0.001,
+            maximum=0.001,
+        )
+
+        prediction_client.predict(endpoint=_TEST_ENDPOINT_NAME, retry=retry)
+
+        assert records[0].retry_count == 2
+
+    def test_path_helpers_are_not_recorded(self, records, prediction_client):
+        endpoint_name = prediction_client.endpoint_path("123", "us-central1", "456")
+        prediction_client.parse_endpoint_path(endpoint_name)
+        prediction_client.common_project_path("123")
+
+        assert records == []
+
+    def test_async_streaming_methods_are_not_wrapped(self):
+        async_client_class = (
+            utils.PredictionAsyncClientWithOverride.get_gapic_client_class()
+        )
+
+        assert instrumentation.is_rpc_method(async_client_class, "predict")
+        assert not instrumentation.is_rpc_method(
+            async_client_class, "server_streaming_predict"
+        )
+        assert not instrumentation.is_rpc_method(async_client_class, "endpoint_path")
+
+    @pytest.mark.asyncio
+    async def test_async_client_call_is_recorded(self, records):
+        async_client = utils.PredictionAsyncClientWithOverride(
+            client_options=client_options.ClientOptions(),
+            client_info=gapic_v1.client_info.ClientInfo(),
+        )
+
+        async def predict(client, **kwargs):
+            return gca_prediction_service.PredictResponse(deployed_model_id="1")
+
+        with mock.patch.object(
+            utils.PredictionAsyncClientWithOverride.get_gapic_client_class(),
+            "predict",
+            new=predict,
+        ):
+            await async_client.predict(endpoint=_TEST_ENDPOINT_NAME)
+
+        (record,) = [r for r in records if r.operation.endswith(".predict")]
+        assert record.operation == "PredictionServiceAsyncClient.predict"
+        assert record.response_bytes > 0
+
+
+class TestOpenTelemetry:
+    def test_record_is_exported_as_spans(self):
+        tracer_provider = mock.Mock()
+        tracer = tracer_provider.get_tracer.return_value
+        callback = instrumentation.enable_opentelemetry(tracer_provider)
+        try:
+            with pytest.raises(ValueError):
+                with instrumentation.record("Endpoint.predict") as recorder:
+                    with recorder.phase("rpc"):
+                        pass
+                    recorder.add_retries()
+                    raise ValueError("failed")
+        finally:
+            instrumentation.remove_callback(callback)
+
+        assert not instrumentation.is_enabled()
+        span_names = [call.args[0] for call in tracer.start_span.call_args_list]
+        assert span_names == ["Endpoint.predict", "rpc"]
+        assert tracer.start_span.call_args_list[0].kwargs["attributes"] == {
+            "aiplatform.retry_count": 1
+        }
+        span = tracer.start_span.return_value
+        span.record_exception.assert_called_once()
+        span.set_status.assert_called_once()
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import datetime
+from importlib import reload
+import time
+from unittest import mock
+
+import pytest
+
+from google.cloud import aiplatform
+from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform import jobs
+from google.cloud.aiplatform.compat.services import job_service_client
+from google.cloud.aiplatform.compat.types import (
+    batch_prediction_job as gca_batch_prediction_job_compat,
+    job_state as gca_job_state_compat,
+)
+from google.cloud.aiplatform.utils import job_watcher
+from google.rpc import status_pb2
+
+import constants as test_constants
+
+_TEST_PROJECT = test_constants.ProjectConstants._TEST_PROJECT
+_TEST_LOCATION = test_constants.ProjectConstants._TEST_LOCATION
+_TEST_PARENT = f"projects/{_TEST_PROJECT}/locations/{_TEST_LOCATION}"
+_TEST_JOB_NAMES = [f"{_TEST_PARENT}/batchPredictionJobs/{i}" for i in range(3)]
+_TEST_START_TIME = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+_TEST_END_TIME = datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc)
+
+
+def _make_gca_job(name, state, update_time=_TEST_START_TIME, error=None):
+    return gca_batch_prediction_job_compat.BatchPredictionJob(
+        name=name,
+        state=state,
+        update_time=update_time,
+        error=error,
+    )
+
+
+@pytest.fixture
+def get_batch_prediction_job_mock():
+    with mock.patch.object(
+        job_service_client.JobServiceClient, "get_batch_prediction_job"
+    ) as get_mock:
+        get_mock.side_effect = lambda name, retry: _make_gca_job(
+            name, gca_job_state_compat.JobState.JOB_STATE_RUNNING
+        )
+        yield get_mock
+
+
+@pytest.fixture
+def list_batch_prediction_jobs_mock():
+    with mock.patch.object(
+        job_service_client.JobServiceClient, "list_batch_prediction_jobs"
+    ) as list_mock:
+        list_mock.return_value = [
+            _make_gca_job(
+                _TEST_JOB_NAMES[0],
+                gca_job_state_compat.JobState.JOB_STATE_SUCCEEDED,
+                update_time=_TEST_END_TIME,
+            ),
+            _make_gca_job(
+                _TEST_JOB_NAMES[1],
+                gca_job_state_compat.JobState.JOB_STATE_FAILED,
+                update_time=_TEST_END_TIME,
+                error=status_pb2.Status(code=13, message="internal"),
+            ),
+        ]
+        yield list_mock
+
+
+@pytest.mark.usefixtures("google_auth_mock")
+class TestJobWatcher:
+    def setup_method(self):
+        reload(initializer)
+        reload(aiplatform)
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+
+    def teardown_method(self):
+        initializer.global_pool.shutdown(wait=True)
+
+    @pytest.mark.usefixtures("get_batch_prediction_job_mock")
+    def test_watch_resolves_jobs_with_one_list_call_per_tick(
+        self, list_batch_prediction_jobs_mock
+    ):
+        watcher = job_watcher.JobWatcher(min_poll_interval=0.01, max_poll_interval=0.05)
+        watched_jobs = [
+            jobs.BatchPredictionJob(batch_prediction_job_name=name)
+            for name in _TEST_JOB_NAMES
+        ]
+        # All jobs share credentials so they are checked together.
+        for job in watched_jobs[1:]:
+            job.credentials = watched_jobs[0].credentials
+
+        completed = []
+        futures = [
+            watcher.watch(job, callback=completed.append) for job in watched_jobs
+        ]
+
+        assert futures[0].result(timeout=5) is watched_jobs[0]
+        with pytest.raises(RuntimeError, match="Job failed with"):
+            futures[1].result(timeout=5)
+        assert not futures[2].done()
+        assert watcher.watched_count == 1
+        assert completed == watched_jobs[:2] or completed == watched_jobs[1::-1]
+        assert (
+            watched_jobs[0]._gca_resource.state
+            == gca_job_state_compat.JobState.JOB_STATE_SUCCEEDED
+        )
+
+        list_request = list_batch_prediction_jobs_mock.call_args_list[0][1]["request"]
+        assert list_request["parent"] == _TEST_PARENT
+        assert list_request["filter"] == 'update_time>"2024-01-01T00:00:00.000000Z"'
+
+        watcher.stop()
+        assert futures[2].cancelled()
+        assert watcher.watched_count == 0
+
+    @pytest.mark.usefixtures("get_batch_prediction_job_mock")
+    def test_list_filter_advances_to_previous_list(
+        self, list_batch_prediction_jobs_mock
+    ):
+        list_batch_prediction_jobs_mock.return_value = []
+        watcher = job_watcher.JobWatcher(min_poll_interval=0.01, max_poll_interval=0.01)
+        job = jobs.BatchPredictionJob(batch_prediction_job_name=_TEST_JOB_NAMES[0])
+        before_first_list = datetime.datetime.now(datetime.timezone.utc)
+
+        watcher.watch(job)
+        deadline = time.monotonic() + 5
+        while list_batch_prediction_jobs_mock.call_count < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        watcher.stop()
+
+        filters = [
+            call[1]["request"]["filter"]
+            for call in list_batch_prediction_jobs_mock.call_args_list
+        ]
+        assert filters[0] == 'update_time>"2024-01-01T00:00:00.000000Z"'
+        assert filters[1] >= 'update_time>"{}"'.format(
+            job_watcher._format_timestamp(
+                before_first_list - job_watcher._LIST_FILTER_CLOCK_SKEW
+            )
+        )
+
+    def test_watch_returns_completed_job_without_polling(
+        self, list_batch_prediction_jobs_mock
+    ):
+        with mock.patch.object(
+            job_service_client.JobServiceClient,
+            "get_batch_prediction_job",
+            return_value=_make_gca_job(
+                _TEST_JOB_NAMES[0],
+                gca_job_state_compat.JobState.JOB_STATE_SUCCEEDED,
+            ),
+        ):
+            job = jobs.BatchPredictionJob(batch_prediction_job_name=_TEST_JOB_NAMES[0])
+
+        future = job_watcher.JobWatcher().watch(job)
+
+        assert future.result(timeout=0) is job
+        list_batch_prediction_jobs_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures(
+        "get_batch_prediction_job_mock", "list_batch_prediction_jobs_mock"
+    )
+    async def test_wait_async(self):
+        watcher = job_watcher.JobWatcher(min_poll_interval=0.01)
+        job = jobs.BatchPredictionJob(batch_prediction_job_name=_TEST_JOB_NAMES[0])
+
+        assert await watcher.wait_async(job) is job
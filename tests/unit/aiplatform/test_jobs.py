@@ -17,6 +17,8 @@
 
 import pytest
 import copy
+import io
+import json
 
 from unittest import mock
 from importlib import reload
@@ -24,6 +26,8 @@ from unittest.mock import patch
 
 from google.cloud import storage
 from google.cloud import bigquery
+from google.cloud import bigquery_storage
+from google.cloud.bigquery_storage_v1.types import stream as gcbqs_stream
 
 from google.api_core import operation
 from google.auth import credentials as auth_credentials
@@ -165,6 +169,14 @@ _TEST_GCS_BLOBS = [
     storage.Blob(name="some/path/prediction.jsonl", bucket=_TEST_GCS_BUCKET_NAME)
 ]
 
+_TEST_PREDICTION_RESULTS = [
+    [
+        {"instance": {"x": 1}, "prediction": 0.1},
+        {"instance": {"x": 2}, "prediction": 0.2},
+    ],
+    [{"instance": {"x": 3}, "prediction": 0.3}],
+]
+
 _TEST_MACHINE_TYPE = "n1-standard-4"
 _TEST_ACCELERATOR_TYPE = "NVIDIA_TESLA_P100"
 _TEST_ACCELERATOR_COUNT = 2
@@ -597,6 +609,61 @@ def storage_list_blobs_mock():
         yield list_blobs_mock
 
 
+def _make_jsonl_blob_mock(name, records):
+    blob = mock.Mock(storage.Blob)
+    blob.name = name
+    blob.open.side_effect = lambda mode: io.StringIO(
+        "".join(json.dumps(record) + "\n" for record in records)
+    )
+    return blob
+
+
+@pytest.fixture
+def storage_list_prediction_blobs_mock():
+    with patch.object(storage.Client, "list_blobs") as list_blobs_mock:
+        list_blobs_mock.return_value = [
+            _make_jsonl_blob_mock(
+                "some/path/prediction.results-00000-of-00002",
+                _TEST_PREDICTION_RESULTS[0],
+            ),
+            _make_jsonl_blob_mock(
+                "some/path/prediction.results-00001-of-00002",
+                _TEST_PREDICTION_RESULTS[1],
+            ),
+            _make_jsonl_blob_mock(
+                "some/path/prediction.errors_stats-00000-of-00001",
+                [{"error": "ignored"}],
+            ),
+        ]
+        yield list_blobs_mock
+
+
+@pytest.fixture
+def bqs_read_client_mock():
+    import pyarrow
+
+    with patch.object(bigquery_storage, "BigQueryReadClient") as read_client_mock:
+        read_session = gcbqs_stream.ReadSession(
+            streams=[
+                gcbqs_stream.ReadStream(name="stream-0"),
+                gcbqs_stream.ReadStream(name="stream-1"),
+            ]
+        )
+        read_client_mock.return_value.create_read_session.return_value = read_session
+
+        def _read_rows(stream_name):
+            page = mock.Mock()
+            page.to_arrow.return_value = pyarrow.RecordBatch.from_pylist(
+                [{"stream": stream_name, "prediction": 0.5}]
+            )
+            reader = mock.Mock()
+            reader.rows.return_value.pages = [page]
+            return reader
+
+        read_client_mock.return_value.read_rows.side_effect = _read_rows
+        yield read_client_mock
+
+
 @pytest.fixture
 def bq_list_rows_mock():
     with patch.object(bigquery.Client, "list_rows") as list_rows_mock:
@@ -644,6 +711,36 @@ class TestBatchPredictionJob:
         assert bp.done() is False
         assert get_batch_prediction_job_mock.call_count == 2
 
+    def test_batch_prediction_job_done_ignores_max_staleness(
+        self, get_batch_prediction_job_mock
+    ):
+        aiplatform.init(
+            project=_TEST_PROJECT, location=_TEST_LOCATION, max_staleness=60
+        )
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        bp.done()
+        bp.done()
+        assert get_batch_prediction_job_mock.call_count == 3
+
+    @mock.patch.object(jobs, "_JOB_WAIT_TIME", 1)
+    def test_batch_prediction_job_wait_ignores_max_staleness(
+        self, get_batch_prediction_job_mock
+    ):
+        aiplatform.init(
+            project=_TEST_PROJECT, location=_TEST_LOCATION, max_staleness=60
+        )
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        bp.wait_for_completion()
+
+        assert get_batch_prediction_job_mock.call_count == 3
+        assert bp.state == _TEST_JOB_STATE_SUCCESS
+
     @pytest.mark.usefixtures("get_batch_prediction_job_gcs_output_mock")
     def test_batch_prediction_iter_dirs_gcs(self, storage_list_blobs_mock):
         bp = jobs.BatchPredictionJob(
@@ -670,6 +767,67 @@ class TestBatchPredictionJob:
             max_results=_TEST_BQ_MAX_RESULTS,
         )
 
+    @pytest.mark.usefixtures("get_batch_prediction_job_gcs_output_mock")
+    def test_batch_prediction_iter_predictions_gcs(
+        self, storage_list_prediction_blobs_mock
+    ):
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        predictions = list(bp.iter_predictions(max_workers=2))
+
+        storage_list_prediction_blobs_mock.assert_called_once_with(
+            _TEST_GCS_OUTPUT_INFO.gcs_output_directory, prefix=None
+        )
+        expected = [record for shard in _TEST_PREDICTION_RESULTS for record in shard]
+        assert sorted(predictions, key=lambda p: p["instance"]["x"]) == expected
+
+    @pytest.mark.usefixtures(
+        "get_batch_prediction_job_gcs_output_mock",
+        "storage_list_prediction_blobs_mock",
+    )
+    def test_batch_prediction_to_arrow_and_pandas_gcs(self):
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        table = bp.to_arrow()
+        assert table.num_rows == 3
+        assert sorted(table.column("prediction").to_pylist()) == [0.1, 0.2, 0.3]
+
+        df = bp.to_pandas()
+        assert sorted(df["prediction"].tolist()) == [0.1, 0.2, 0.3]
+
+        chunks = list(bp.to_pandas(chunksize=1))
+        assert len(chunks) == 3
+        assert all(len(chunk) == 1 for chunk in chunks)
+
+    @pytest.mark.usefixtures("get_batch_prediction_job_bq_output_mock")
+    def test_batch_prediction_iter_predictions_bq(self, bqs_read_client_mock):
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        predictions = list(bp.iter_predictions(max_workers=2))
+
+        create_read_session = bqs_read_client_mock.return_value.create_read_session
+        create_read_session.assert_called_once()
+        assert create_read_session.call_args[1]["read_session"].table == (
+            f"projects/{_TEST_BQ_PROJECT_ID}/datasets/{_TEST_BQ_DATASET_ID}"
+            f"/tables/{_TEST_BQ_TABLE_NAME}"
+        )
+        assert sorted(p["stream"] for p in predictions) == ["stream-0", "stream-1"]
+        assert bp.to_arrow().num_rows == 2
+
+    @pytest.mark.usefixtures("get_batch_prediction_job_running_bq_output_mock")
+    def test_batch_prediction_iter_predictions_while_running(self):
+        bp = jobs.BatchPredictionJob(
+            batch_prediction_job_name=_TEST_BATCH_PREDICTION_JOB_NAME
+        )
+        with pytest.raises(RuntimeError):
+            list(bp.iter_predictions())
+
     @pytest.mark.usefixtures("get_batch_prediction_job_incomplete_bq_output_mock")
     def test_batch_prediction_iter_dirs_bq_raises_on_empty(self, bq_list_rows_mock):
         bp = jobs.BatchPredictionJob(
@@ -24,6 +24,7 @@ from unittest import mock
 from urllib import request as urllib_request
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 from google.cloud import storage
 
@@ -4649,6 +4650,106 @@ class TestLanguageModels:
         with pytest.raises(TypeError):
             model.get_embeddings("What is life?")
 
+    def test_text_embedding_batched(self):
+        """Tests splitting text embedding requests into batches."""
+        aiplatform.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+        )
+        with mock.patch.object(
+            target=model_garden_service_client.ModelGardenServiceClient,
+            attribute="get_publisher_model",
+            return_value=gca_publisher_model.PublisherModel(
+                _TEXT_EMBEDDING_GECKO_PUBLISHER_MODEL_DICT
+            ),
+        ):
+            model = language_models.TextEmbeddingModel.from_pretrained(
+                "textembedding-gecko@001"
+            )
+
+        def _predict(instances, **kwargs):
+            gca_predict_response = gca_prediction_service.PredictResponse()
+            for _ in instances:
+                gca_predict_response.predictions.append(_TEST_TEXT_EMBEDDING_PREDICTION)
+            return gca_predict_response
+
+        texts = (f"text {i}" for i in range(5))
+        with mock.patch.object(
+            target=prediction_service_client.PredictionServiceClient,
+            attribute="predict",
+            side_effect=_predict,
+        ) as mock_predict:
+            embeddings = model.get_embeddings_batched(
+                texts, batch_size=2, max_concurrency=2, output_dimensionality=3
+            )
+            assert mock_predict.call_count == 3
+            assert sorted(
+                len(call[1]["instances"]) for call in mock_predict.call_args_list
+            ) == [1, 2, 2]
+            assert mock_predict.call_args[1]["parameters"]["outputDimensionality"] == 3
+
+        assert isinstance(embeddings, language_models.TextEmbeddingBatch)
+        assert len(embeddings) == 5
+        assert embeddings.values.shape == (5, _TEXT_EMBEDDING_VECTOR_LENGTH)
+        assert embeddings.values.dtype == np.float32
+        assert embeddings.token_counts.tolist() == [4] * 5
+        assert not embeddings.truncated.any()
+
+        # Texts are also split by the token budget.
+        with mock.patch.object(
+            target=prediction_service_client.PredictionServiceClient,
+            attribute="predict",
+            side_effect=_predict,
+        ) as mock_predict:
+            embeddings = model.get_embeddings_batched(
+                ["a", "b", "c"],
+                max_tokens_per_request=2,
+                token_counter=lambda text: 1,
+                as_numpy=False,
+            )
+            assert mock_predict.call_count == 2
+        assert len(embeddings) == 3
+        assert embeddings[0].values == (
+            _TEST_TEXT_EMBEDDING_PREDICTION["embeddings"]["values"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_text_embedding_batched_async(self):
+        """Tests splitting asynchronous text embedding requests into batches."""
+        aiplatform.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+        )
+        with mock.patch.object(
+            target=model_garden_service_client.ModelGardenServiceClient,
+            attribute="get_publisher_model",
+            return_value=gca_publisher_model.PublisherModel(
+                _TEXT_EMBEDDING_GECKO_PUBLISHER_MODEL_DICT
+            ),
+        ):
+            model = language_models.TextEmbeddingModel.from_pretrained(
+                "textembedding-gecko@001"
+            )
+
+        def _predict(instances, **kwargs):
+            gca_predict_response = gca_prediction_service.PredictResponse()
+            for _ in instances:
+                gca_predict_response.predictions.append(_TEST_TEXT_EMBEDDING_PREDICTION)
+            return gca_predict_response
+
+        with mock.patch.object(
+            target=prediction_service_async_client.PredictionServiceAsyncClient,
+            attribute="predict",
+            side_effect=_predict,
+        ) as mock_predict:
+            embeddings = await model.get_embeddings_batched_async(
+                [f"text {i}" for i in range(7)], batch_size=3, max_concurrency=2
+            )
+            assert mock_predict.call_count == 3
+
+        assert embeddings.values.shape == (7, _TEXT_EMBEDDING_VECTOR_LENGTH)
+        assert embeddings.values.dtype == np.float32
+
     def test_batch_prediction(
         self,
         get_endpoint_mock,
@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 
+import numpy as np
 import pytest
 import uuid
 
@@ -22,12 +23,18 @@ from unittest import mock
 from importlib import reload
 from unittest.mock import patch
 
+from google.api_core import exceptions
 from google.api_core import operation
 from google.protobuf import field_mask_pb2
 
 from google.cloud import aiplatform
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform.matching_engine import index_writer
+from google.cloud.aiplatform.matching_engine.matching_engine_index_endpoint import (
+    Namespace,
+    NumericNamespace,
+)
 from google.cloud.aiplatform.compat.services import (
     index_service_client,
 )
@@ -768,3 +775,172 @@ class TestMatchingEngineIndex:
         )
 
         remove_datapoints_mock.assert_called_once_with(remove_datapoints_request)
+
+
+@pytest.mark.usefixtures("google_auth_mock", "get_index_mock")
+class TestIndexWriter:
+    def setup_method(self):
+        reload(initializer)
+        reload(aiplatform)
+
+    def teardown_method(self):
+        initializer.global_pool.shutdown(wait=True)
+
+    def test_upsert(self, upsert_datapoints_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_index = aiplatform.MatchingEngineIndex(index_name=_TEST_INDEX_ID)
+        writer = index_writer.IndexWriter(my_index, num_channels=2)
+
+        result = writer.upsert(
+            datapoint_ids=["1", "2"],
+            vectors=np.array([[0.5, 1.0], [1.5, 2.0]], dtype=np.float32),
+            restricts=[[Namespace("color", ["red"], ["blue"])], None],
+            numeric_restricts=[None, [NumericNamespace("cost", value_int=3)]],
+            crowding_tags=["a", None],
+        )
+
+        upsert_datapoints_mock.assert_called_once_with(
+            request=gca_index_service.UpsertDatapointsRequest(
+                index=_TEST_INDEX_NAME,
+                datapoints=[
+                    gca_index.IndexDatapoint(
+                        datapoint_id="1",
+                        feature_vector=[0.5, 1.0],
+                        restricts=[
+                            gca_index.IndexDatapoint.Restriction(
+                                namespace="color",
+                                allow_list=["red"],
+                                deny_list=["blue"],
+                            )
+                        ],
+                        crowding_tag=gca_index.IndexDatapoint.CrowdingTag(
+                            crowding_attribute="a"
+                        ),
+                    ),
+                    gca_index.IndexDatapoint(
+                        datapoint_id="2",
+                        feature_vector=[1.5, 2.0],
+                        numeric_restricts=[
+                            gca_index.IndexDatapoint.NumericRestriction(
+                                namespace="cost", value_int=3
+                            )
+                        ],
+                    ),
+                ],
+            ),
+            metadata=(),
+            timeout=None,
+        )
+        assert result.written_count == 2
+        assert result.request_count == 1
+        assert result.failed_datapoint_ids == []
+        assert result.datapoints_per_second > 0
+
+    def test_upsert_splits_requests(self, upsert_datapoints_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_index = aiplatform.MatchingEngineIndex(index_name=_TEST_INDEX_ID)
+        writer = index_writer.IndexWriter(
+            my_index, max_datapoints_per_request=3, max_concurrency=2
+        )
+        datapoint_ids = [str(i) for i in range(10)]
+
+        result = writer.upsert(
+            datapoint_ids=datapoint_ids, vectors=np.ones((10, 4), dtype=np.float32)
+        )
+
+        assert upsert_datapoints_mock.call_count == 4
+        assert result.request_count == 4
+        assert result.written_count == 10
+        assert sorted(
+            datapoint.datapoint_id
+            for call in upsert_datapoints_mock.call_args_list
+            for datapoint in call.kwargs["request"].datapoints
+        ) == sorted(datapoint_ids)
+
+    def test_upsert_splits_requests_by_size(self, upsert_datapoints_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_index = aiplatform.MatchingEngineIndex(index_name=_TEST_INDEX_ID)
+        max_request_bytes = 2048
+        writer = index_writer.IndexWriter(my_index, max_request_bytes=max_request_bytes)
+
+        writer.upsert(
+            datapoint_ids=[str(i) for i in range(20)],
+            vectors=np.ones((20, 100), dtype=np.float32),
+        )
+
+        assert upsert_datapoints_mock.call_count > 1
+        for call in upsert_datapoints_mock.call_args_list:
+            request = call.kwargs["request"]
+            assert (
+                gca_index_service.UpsertDatapointsRequest.pb(request).ByteSize()
+                <= max_request_bytes
+            )
+
+    def test_upsert_retries_transient_errors(self, upsert_datapoints_mock):
+        upsert_datapoints_mock.side_effect = [
+            exceptions.ServiceUnavailable("unavailable"),
+            gca_index_service.UpsertDatapointsResponse(),
+        ]
+        aiplatform.init(project=_TEST_PROJECT)
+        my_index = aiplatform.MatchingEngineIndex(index_name=_TEST_INDEX_ID)
+        writer = index_writer.IndexWriter(my_index, initial_backoff=0)
+
+        result = writer.upsert(datapoint_ids=["1"], vectors=[[1.0, 2.0]])
+
+        assert upsert_datapoints_mock.call_count == 2
+        assert result.retry_count == 1
+        assert result.written_count == 1
+        assert result.failed_datapoint_ids == []
+
+    def test_upsert_reports_failed_datapoint_ids(self, upsert_datapoints_mock):
+        error = exceptions.InvalidArgument("invalid")
+        upsert_datapoints_mock.side_effect = [
+            gca_index_service.UpsertDatapointsResponse(),
+            error,
+        ]
+        aiplatform.init(project=_TEST_PROJECT)
+        my_index = aiplatform.MatchingEngineIndex(index_name=_TEST_INDEX_ID)
+        writer = index_writer.IndexWriter(
+            my_index, max_datapoints_per_request=2, max_concurrency=1
+        )
+
+        result = writer.upsert(
+            datapoint_ids=["1", "2", "3"], vectors=[[1.0], [2.0], [3.0]]
+        )
+
+        assert upsert_datapoints_mock.call_count == 2
+        assert result.written_count == 2
+        assert result.failed_datapoint_ids == ["3"]
+        assert result.errors == [error]
+
+    def test_upsert_with_mismatched_lengths(self):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_index = aiplatform.MatchingEngineIndex(index_name=_TEST_INDEX_ID)
+        writer = index_writer.IndexWriter(my_index)
+
+        with pytest.raises(ValueError, match="restricts"):
+            writer.upsert(datapoint_ids=["1"], vectors=[[1.0]], restricts=[[], []])
+
+    def test_remove(self, remove_datapoints_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_index = aiplatform.MatchingEngineIndex(index_name=_TEST_INDEX_ID)
+        writer = index_writer.IndexWriter(
+            my_index, max_datapoints_per_request=2, max_concurrency=1
+        )
+
+        result = writer.remove(datapoint_ids=_TEST_DATAPOINT_IDS)
+
+        remove_datapoints_mock.assert_has_calls(
+            [
+                mock.call(
+                    request=gca_index_service.RemoveDatapointsRequest(
+                        index=_TEST_INDEX_NAME,
+                        datapoint_ids=_TEST_DATAPOINT_IDS[i : i + 2],
+                    ),
+                    metadata=(),
+                    timeout=None,
+                )
+                for i in range(0, len(_TEST_DATAPOINT_IDS), 2)
+            ]
+        )
+        assert result.written_count == len(_TEST_DATAPOINT_IDS)
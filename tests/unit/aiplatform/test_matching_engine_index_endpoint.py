@@ -29,6 +29,7 @@ from google.cloud.aiplatform.matching_engine.matching_engine_index_endpoint impo
     Namespace,
     NumericNamespace,
     MatchNeighbor,
+    MatchNeighborArrays,
     HybridQuery,
 )
 from google.cloud.aiplatform.compat.types import (
@@ -51,6 +52,7 @@ from google.protobuf import field_mask_pb2
 
 import grpc
 
+import numpy as np
 import pytest
 
 # project
@@ -1253,6 +1255,54 @@ class TestMatchingEngineIndexEndpoint:
 
         index_endpoint_match_queries_mock.assert_called_with(batch_request)
 
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_private_service_access_index_endpoint_match_numpy_queries(
+        self, index_endpoint_match_queries_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        neighbors = my_index_endpoint.match(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+            num_neighbors=_TEST_NUM_NEIGHBOURS,
+            filter=_TEST_FILTER,
+            queries=np.array(_TEST_QUERIES),
+            numeric_filter=_TEST_NUMERIC_FILTER,
+            return_arrays=True,
+        )
+
+        batch_request = match_service_pb2.BatchMatchRequest(
+            requests=[
+                match_service_pb2.BatchMatchRequest.BatchMatchRequestPerIndex(
+                    deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                    requests=[
+                        match_service_pb2.MatchRequest(
+                            num_neighbors=_TEST_NUM_NEIGHBOURS,
+                            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                            float_val=query,
+                            restricts=[
+                                match_service_pb2.Namespace(
+                                    name="class",
+                                    allow_tokens=["token_1"],
+                                    deny_tokens=["token_2"],
+                                )
+                            ],
+                            numeric_restricts=_TEST_NUMERIC_NAMESPACE,
+                        )
+                        for query in _TEST_QUERIES
+                    ],
+                )
+            ]
+        )
+        index_endpoint_match_queries_mock.assert_called_with(batch_request)
+
+        assert neighbors.ids.tolist() == [["1", "2"]]
+        np.testing.assert_allclose(neighbors.distances, [[0.1, 0.1]])
+        assert neighbors.num_neighbors.tolist() == [2]
+
     @pytest.mark.usefixtures("get_index_endpoint_mock")
     def test_index_private_service_access_endpoint_find_neighbor_queries(
         self, index_endpoint_match_queries_mock
@@ -1400,6 +1450,69 @@ class TestMatchingEngineIndexEndpoint:
             find_neighbors_request
         )
 
+    @pytest.mark.usefixtures("get_index_public_endpoint_mock")
+    def test_index_public_endpoint_find_neighbors_numpy_queries(
+        self, index_public_endpoint_match_queries_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_public_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        queries = np.array(_TEST_QUERIES * 3, dtype=np.float64)
+        neighbors = my_public_index_endpoint.find_neighbors(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+            queries=queries,
+            num_neighbors=_TEST_NUM_NEIGHBOURS,
+            filter=_TEST_FILTER,
+            return_arrays=True,
+        )
+
+        find_neighbors_request = gca_match_service_v1beta1.FindNeighborsRequest(
+            index_endpoint=my_public_index_endpoint.resource_name,
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+            queries=[
+                gca_match_service_v1beta1.FindNeighborsRequest.Query(
+                    neighbor_count=_TEST_NUM_NEIGHBOURS,
+                    datapoint=gca_index_v1beta1.IndexDatapoint(
+                        feature_vector=_TEST_QUERIES[0],
+                        restricts=[
+                            gca_index_v1beta1.IndexDatapoint.Restriction(
+                                namespace="class",
+                                allow_list=["token_1"],
+                                deny_list=["token_2"],
+                            )
+                        ],
+                    ),
+                )
+            ]
+            * 3,
+        )
+        index_public_endpoint_match_queries_mock.assert_called_with(
+            find_neighbors_request
+        )
+
+        assert isinstance(neighbors, MatchNeighborArrays)
+        assert neighbors.ids.tolist() == [["1"]]
+        np.testing.assert_allclose(neighbors.distances, [[0.1]])
+        assert neighbors.distances.dtype == np.float32
+        assert neighbors.num_neighbors.tolist() == [1]
+
+    @pytest.mark.usefixtures("get_index_public_endpoint_mock")
+    def test_index_public_endpoint_find_neighbors_rejects_1d_numpy_queries(self):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_public_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        with pytest.raises(ValueError, match="2-D array"):
+            my_public_index_endpoint.find_neighbors(
+                deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                queries=np.array(_TEST_QUERIES[0]),
+            )
+
     @pytest.mark.usefixtures("get_index_public_endpoint_mock")
     def test_index_public_endpoint_find_neighbors_queries(
         self, index_public_endpoint_match_queries_mock
@@ -119,3 +119,65 @@ class TestModelGardenModels:
                 name="publishers/google/models/textembedding-gecko@003",
                 retry=base._DEFAULT_RETRY,
             )
+
+    def test_from_pretrained_uses_publisher_model_cache(self):
+        aiplatform.init(
+            project=test_constants.ProjectConstants._TEST_PROJECT,
+            location=test_constants.ProjectConstants._TEST_LOCATION,
+        )
+        _model_garden_models.configure_publisher_model_cache(ttl_seconds=3600)
+        try:
+            with mock.patch.object(
+                target=model_garden_service_client_v1.ModelGardenServiceClient,
+                attribute="get_publisher_model",
+                return_value=gca_publisher_model.PublisherModel(
+                    _TEXT_BISON_PUBLISHER_MODEL_DICT
+                ),
+            ) as mock_get_publisher_model:
+                self.FakeModelGardenBisonModel.from_pretrained("text-bison@001")
+                model = self.FakeModelGardenBisonModel.from_pretrained(
+                    "text-bison@001"
+                )
+                mock_get_publisher_model.assert_called_once()
+                assert model._endpoint_name == (
+                    f"projects/{test_constants.ProjectConstants._TEST_PROJECT}"
+                    f"/locations/{test_constants.ProjectConstants._TEST_LOCATION}"
+                    "/publishers/google/models/text-bison@001"
+                )
+
+                _model_garden_models.clear_publisher_model_cache("text-bison@001")
+                self.FakeModelGardenBisonModel.from_pretrained("text-bison@001")
+                assert mock_get_publisher_model.call_count == 2
+        finally:
+            _model_garden_models.configure_publisher_model_cache(ttl_seconds=None)
+
+    def test_publisher_model_cache_persists_to_file(self, tmp_path):
+        aiplatform.init(
+            project=test_constants.ProjectConstants._TEST_PROJECT,
+            location=test_constants.ProjectConstants._TEST_LOCATION,
+        )
+        cache_file = str(tmp_path / "publisher_models.json")
+        _model_garden_models.configure_publisher_model_cache(
+            ttl_seconds=3600, persist_path=cache_file
+        )
+        try:
+            with mock.patch.object(
+                target=model_garden_service_client_v1.ModelGardenServiceClient,
+                attribute="get_publisher_model",
+                return_value=gca_publisher_model.PublisherModel(
+                    _EMBEDDING_GECKO_PUBLISHER_MODEL_DICT
+                ),
+            ) as mock_get_publisher_model:
+                self.FakeModelGardenGeckoModel.from_pretrained(
+                    "textembedding-gecko@003"
+                )
+                # Reconfiguring drops the in-memory entries and reloads the file.
+                _model_garden_models.configure_publisher_model_cache(
+                    ttl_seconds=3600, persist_path=cache_file
+                )
+                self.FakeModelGardenGeckoModel.from_pretrained(
+                    "textembedding-gecko@003"
+                )
+                mock_get_publisher_model.assert_called_once()
+        finally:
+            _model_garden_models.configure_publisher_model_cache(ttl_seconds=None)
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import random
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from google.cloud.aiplatform import _streaming_prediction
+from google.cloud.aiplatform_v1.types import (
+    prediction_service as gca_prediction_service,
+)
+from google.cloud.aiplatform_v1.types import types as gca_types
+
+_TEST_ENDPOINT_NAME = "projects/123/locations/us-central1/endpoints/456"
+
+
+def _random_value(rng: random.Random, max_list_int: int, depth: int = 0):
+    """Returns a random value that survives a round trip through a Tensor.
+
+    Floats are multiples of 1/8, so that they are exact in 32 bits. Empty
+    lists and dicts, and bools, are not generated since they are not
+    preserved by scalar tensors. Only packed lists can hold ints of more than
+    32 bits.
+    """
+    kinds = ["int", "float", "str", "none", "int_list", "float_list"]
+    if depth < 3:
+        kinds += ["list", "dict"]
+    kind = rng.choice(kinds)
+    length = rng.randint(1, 5)
+    if kind == "int":
+        return rng.randint(-(2**31), 2**31 - 1)
+    elif kind == "float":
+        return rng.randint(-1000, 1000) / 8
+    elif kind == "str":
+        return rng.choice(["", "a", "token"])
+    elif kind == "none":
+        return None
+    elif kind == "int_list":
+        return [rng.randint(-max_list_int, max_list_int) for _ in range(length)]
+    elif kind == "float_list":
+        return [rng.randint(-1000, 1000) / 8 for _ in range(length)]
+    elif kind == "list":
+        return [_random_value(rng, max_list_int, depth + 1) for _ in range(length)]
+    return {
+        f"key_{i}": _random_value(rng, max_list_int, depth + 1) for i in range(length)
+    }
+
+
+class TestValueToTensor:
+    @pytest.mark.parametrize("seed", range(50))
+    @pytest.mark.parametrize("pack_numeric_lists", [True, False])
+    def test_round_trip(self, seed, pack_numeric_lists):
+        value = {
+            "instance": _random_value(
+                random.Random(seed),
+                max_list_int=2**40 if pack_numeric_lists else 2**31 - 1,
+            )
+        }
+
+        tensor = _streaming_prediction.value_to_tensor(
+            value, pack_numeric_lists=pack_numeric_lists
+        )
+
+        assert _streaming_prediction.tensor_to_value(tensor._pb) == value
+
+    def test_pack_numeric_lists(self):
+        tensor = _streaming_prediction.value_to_tensor(
+            {
+                "tokens": [1, 2, 3],
+                "ids": [2**40],
+                "scores": [0.5, 1.5],
+                "mixed": [1, 0.5],
+            },
+            pack_numeric_lists=True,
+        )
+
+        assert tensor == gca_types.Tensor(
+            struct_val={
+                "tokens": gca_types.Tensor(
+                    dtype=gca_types.Tensor.DataType.INT32,
+                    shape=[3],
+                    int_val=[1, 2, 3],
+                ),
+                "ids": gca_types.Tensor(
+                    dtype=gca_types.Tensor.DataType.INT64,
+                    shape=[1],
+                    int64_val=[2**40],
+                ),
+                "scores": gca_types.Tensor(
+                    dtype=gca_types.Tensor.DataType.FLOAT,
+                    shape=[2],
+                    float_val=[0.5, 1.5],
+                ),
+                "mixed": gca_types.Tensor(
+                    list_val=[
+                        gca_types.Tensor(int_val=[1]),
+                        gca_types.Tensor(float_val=[0.5]),
+                    ]
+                ),
+            }
+        )
+
+    def test_numeric_lists_are_not_packed_by_default(self):
+        tensor = _streaming_prediction.value_to_tensor([1, 2])
+
+        assert tensor == gca_types.Tensor(
+            list_val=[gca_types.Tensor(int_val=[1]), gca_types.Tensor(int_val=[2])]
+        )
+
+    @pytest.mark.parametrize(
+        "dtype",
+        [
+            np.bool_,
+            np.float32,
+            np.float64,
+            np.int8,
+            np.int16,
+            np.int32,
+            np.int64,
+            np.uint8,
+            np.uint16,
+            np.uint32,
+            np.uint64,
+        ],
+    )
+    @pytest.mark.parametrize("shape", [(6,), (2, 3), (3, 1, 2), (0, 3), (2, 0)])
+    def test_numpy_array_round_trip(self, dtype, shape):
+        array = (np.arange(np.prod(shape)) % 2).astype(dtype).reshape(shape)
+
+        tensor = _streaming_prediction.value_to_tensor(array)
+
+        assert list(tensor.shape) == list(shape)
+        as_array = _streaming_prediction.tensor_to_value(tensor._pb, numpy_arrays=True)
+        assert as_array.dtype == array.dtype
+        np.testing.assert_array_equal(as_array, array)
+        assert _streaming_prediction.tensor_to_value(tensor._pb) == array.tolist()
+
+    def test_unsupported_value_type(self):
+        with pytest.raises(TypeError, match="Unsupported value type"):
+            _streaming_prediction.value_to_tensor(object())
+
+
+class TestPredictStream:
+    def test_predict_stream_of_tensor_lists(self):
+        client = mock.Mock()
+        client.server_streaming_predict.return_value = iter(
+            [
+                gca_prediction_service.StreamingPredictResponse(
+                    outputs=[_streaming_prediction.value_to_tensor(i)]
+                )
+                for i in range(3)
+            ]
+        )
+        inputs = [_streaming_prediction.value_to_tensor([1, 2], True)]
+        parameters = _streaming_prediction.value_to_tensor({"temperature": 0.5})
+
+        outputs = list(
+            _streaming_prediction.predict_stream_of_tensor_lists_from_single_tensor_list(
+                prediction_service_client=client,
+                endpoint_name=_TEST_ENDPOINT_NAME,
+                tensor_list=inputs,
+                parameters_tensor=parameters,
+            )
+        )
+
+        client.server_streaming_predict.assert_called_once_with(
+            request=gca_prediction_service.StreamingPredictRequest(
+                endpoint=_TEST_ENDPOINT_NAME,
+                inputs=inputs,
+                parameters=parameters,
+            )
+        )
+        assert outputs == [[_streaming_prediction.value_to_tensor(i)] for i in range(3)]
+
+    @pytest.mark.asyncio
+    async def test_predict_stream_of_dict_lists_async(self):
+        async def responses():
+            yield gca_prediction_service.StreamingPredictResponse(
+                outputs=[
+                    _streaming_prediction.value_to_tensor(
+                        {"tokens": np.array([[1, 2]], dtype=np.int32)}
+                    )
+                ]
+            )
+
+        client = mock.Mock()
+        client.server_streaming_predict = mock.AsyncMock(return_value=responses())
+
+        outputs = [
+            dict_list
+            async for dict_list in _streaming_prediction.predict_stream_of_dict_lists_from_single_dict_list_async(
+                prediction_service_async_client=client,
+                endpoint_name=_TEST_ENDPOINT_NAME,
+                dict_list=[{"prompt": [1, 2, 3]}],
+                pack_numeric_lists=True,
+                numpy_arrays=True,
+            )
+        ]
+
+        request = client.server_streaming_predict.call_args.kwargs["request"]
+        assert list(request.inputs[0].struct_val["prompt"].int_val) == [1, 2, 3]
+        assert len(outputs) == 1
+        np.testing.assert_array_equal(outputs[0][0]["tokens"], [[1, 2]])
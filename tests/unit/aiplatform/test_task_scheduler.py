@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+
+import pytest
+
+from google.cloud.aiplatform.utils import task_scheduler
+
+
+@pytest.fixture
+def pool():
+    pool = futures.ThreadPoolExecutor(max_workers=1)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+class TestTaskScheduler:
+    def test_dependent_tasks_do_not_hold_workers(self, pool):
+        scheduler = task_scheduler.TaskScheduler(lambda: pool)
+        dependency = futures.Future()
+        order = []
+
+        # With a single worker, a task blocking on its dependency in the
+        # worker would prevent the task resolving the dependency from running.
+        dependent = scheduler.submit(
+            lambda: order.append("dependent"),
+            dependencies=[dependency],
+            name="dependent",
+        )
+        (task,) = scheduler.get_tasks()
+        assert task.name == "dependent"
+        assert task.state is task_scheduler.TaskState.PENDING
+        assert task.pending_dependency_count == 1
+        assert scheduler.pending_count == 1
+
+        resolver = scheduler.submit(
+            lambda: order.append("resolver") or dependency.set_result(None)
+        )
+
+        resolver.result(timeout=5)
+        dependent.result(timeout=5)
+        assert order == ["resolver", "dependent"]
+        assert scheduler.get_tasks() == []
+        assert scheduler.running_count == 0
+
+    def test_failed_dependency_fails_task(self, pool):
+        scheduler = task_scheduler.TaskScheduler(lambda: pool)
+        ran = []
+
+        failed = scheduler.submit(lambda: 1 / 0)
+        dependent = scheduler.submit(lambda: ran.append(True), dependencies=[failed])
+
+        with pytest.raises(ZeroDivisionError):
+            dependent.result(timeout=5)
+        assert not ran
+
+    def test_cancel_pending_task(self, pool):
+        scheduler = task_scheduler.TaskScheduler(lambda: pool)
+        dependency = futures.Future()
+        ran = []
+
+        task = scheduler.submit(lambda: ran.append(True), dependencies=[dependency])
+
+        assert task.cancel()
+        dependency.set_result(None)
+        assert not ran
+        assert scheduler.get_tasks() == []
+
+    def test_shut_down_executor_fails_task(self, pool):
+        scheduler = task_scheduler.TaskScheduler(lambda: pool)
+        pool.shutdown()
+
+        with pytest.raises(RuntimeError):
+            scheduler.submit(lambda: None).result(timeout=5)
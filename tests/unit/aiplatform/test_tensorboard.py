@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 
+import pandas as pd
 import pytest
 
 from unittest import mock
@@ -340,6 +341,36 @@ _TEST_TENSORBOARD_TIME_SERIES_DATA = gca_tensorboard_data.TimeSeriesData(
 )
 
 
+@pytest.fixture
+def read_tensorboard_time_series_mock():
+    with patch.object(
+        tensorboard_service_client.TensorboardServiceClient,
+        "read_tensorboard_time_series_data",
+    ) as read_tensorboard_time_series_data_mock:
+        read_tensorboard_time_series_data_mock.return_value = (
+            gca_tensorboard_service.ReadTensorboardTimeSeriesDataResponse(
+                time_series_data=_TEST_TENSORBOARD_TIME_SERIES_DATA
+            )
+        )
+        yield read_tensorboard_time_series_data_mock
+
+
+@pytest.fixture
+def list_many_tensorboard_time_series_mock():
+    with patch.object(
+        tensorboard_service_client.TensorboardServiceClient,
+        "list_tensorboard_time_series",
+    ) as list_tensorboard_time_series_mock:
+        list_tensorboard_time_series_mock.return_value = [
+            gca_tensorboard_time_series.TensorboardTimeSeries(
+                name=f"{_TEST_TENSORBOARD_RUN_NAME}/timeSeries/time-series-{i}",
+                display_name=f"metric_{i}",
+            )
+            for i in range(5)
+        ]
+        yield list_tensorboard_time_series_mock
+
+
 @pytest.fixture
 def batch_read_tensorboard_time_series_mock():
     with patch.object(
@@ -1048,6 +1079,124 @@ class TestTensorboardRun:
 
         assert ts_data == true_ts_data
 
+    @pytest.mark.usefixtures(
+        "get_tensorboard_run_mock", "list_many_tensorboard_time_series_mock"
+    )
+    def test_read_tensorboard_time_series_in_concurrent_batches(
+        self, batch_read_tensorboard_time_series_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        tb_run = tensorboard.TensorboardRun(
+            tensorboard_run_name=_TEST_TENSORBOARD_RUN_NAME
+        )
+
+        def batch_read(request):
+            return gca_tensorboard_service.BatchReadTensorboardTimeSeriesDataResponse(
+                time_series_data=[
+                    gca_tensorboard_data.TimeSeriesData(
+                        tensorboard_time_series_id=name.split("/")[-1]
+                    )
+                    for name in request.time_series
+                ]
+            )
+
+        batch_read_tensorboard_time_series_mock.side_effect = batch_read
+
+        with patch.object(tensorboard.TensorboardRun, "READ_TIME_SERIES_BATCH_SIZE", 2):
+            ts_data = tb_run.read_time_series_data()
+
+        assert batch_read_tensorboard_time_series_mock.call_count == 3
+        assert list(ts_data.keys()) == [f"metric_{i}" for i in range(5)]
+        assert ts_data["metric_3"].tensorboard_time_series_id == "time-series-3"
+
+    @pytest.mark.usefixtures(
+        "get_tensorboard_run_mock", "list_tensorboard_time_series_mock"
+    )
+    def test_read_tensorboard_time_series_with_max_points(
+        self,
+        read_tensorboard_time_series_mock,
+        batch_read_tensorboard_time_series_mock,
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        tb_run = tensorboard.TensorboardRun(
+            tensorboard_run_name=_TEST_TENSORBOARD_RUN_NAME
+        )
+
+        ts_data = tb_run.read_time_series_data(max_points=100)
+
+        read_tensorboard_time_series_mock.assert_called_once_with(
+            request=gca_tensorboard_service.ReadTensorboardTimeSeriesDataRequest(
+                tensorboard_time_series=_TEST_TENSORBOARD_TIME_SERIES_NAME,
+                max_data_points=100,
+            )
+        )
+        batch_read_tensorboard_time_series_mock.assert_not_called()
+        assert ts_data == {
+            _TEST_TIME_SERIES_DISPLAY_NAME: _TEST_TENSORBOARD_TIME_SERIES_DATA
+        }
+
+    @pytest.mark.usefixtures(
+        "get_tensorboard_run_mock", "list_tensorboard_time_series_mock"
+    )
+    def test_read_tensorboard_time_series_with_invalid_max_points(self):
+        aiplatform.init(project=_TEST_PROJECT)
+        tb_run = tensorboard.TensorboardRun(
+            tensorboard_run_name=_TEST_TENSORBOARD_RUN_NAME
+        )
+
+        with pytest.raises(ValueError, match="max_points"):
+            tb_run.read_time_series_data(max_points=0)
+
+    @pytest.mark.usefixtures(
+        "get_tensorboard_run_mock",
+        "list_tensorboard_time_series_mock",
+        "batch_read_tensorboard_time_series_mock",
+    )
+    def test_tensorboard_run_to_dataframe(self):
+        aiplatform.init(project=_TEST_PROJECT)
+        tb_run = tensorboard.TensorboardRun(
+            tensorboard_run_name=_TEST_TENSORBOARD_RUN_NAME
+        )
+
+        df = tb_run.to_dataframe()
+
+        data_point = _TEST_TENSORBOARD_TIME_SERIES_DATA.values[0]
+        expected_df = pd.DataFrame(
+            {
+                "time_series": pd.Categorical([_TEST_TIME_SERIES_DISPLAY_NAME]),
+                "step": [data_point.step],
+                "wall_time": pd.to_datetime(
+                    [
+                        data_point.wall_time.timestamp_pb().seconds * 1_000_000_000
+                        + data_point.wall_time.timestamp_pb().nanos
+                    ],
+                    unit="ns",
+                    utc=True,
+                ),
+                "value": [data_point.scalar.value],
+            }
+        )
+        pd.testing.assert_frame_equal(df, expected_df)
+
+    @pytest.mark.usefixtures(
+        "get_tensorboard_run_mock",
+        "list_tensorboard_time_series_mock",
+        "batch_read_tensorboard_time_series_mock",
+    )
+    def test_tensorboard_run_to_dataframe_with_columns(self):
+        aiplatform.init(project=_TEST_PROJECT)
+        tb_run = tensorboard.TensorboardRun(
+            tensorboard_run_name=_TEST_TENSORBOARD_RUN_NAME
+        )
+
+        df = tb_run.to_dataframe(columns=["step", "value"])
+
+        assert list(df.columns) == ["step", "value"]
+        assert df["value"].tolist() == [1.0]
+
+        with pytest.raises(ValueError, match="Unsupported columns"):
+            tb_run.to_dataframe(columns=["step", "unknown"])
+
 
 @pytest.mark.usefixtures("google_auth_mock")
 class TestTensorboardTimeSeries:
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import datetime
+from importlib import reload
+import threading
+import time
+
+import pytest
+
+from google.auth import credentials as auth_credentials
+from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.utils import token_refresher
+
+import constants as test_constants
+
+_TEST_PROJECT = test_constants.ProjectConstants._TEST_PROJECT
+_TEST_LOCATION = test_constants.ProjectConstants._TEST_LOCATION
+
+
+class _FakeCredentials(auth_credentials.Credentials):
+    def __init__(
+        self, token=None, expiry=None, error=None, lifetime=datetime.timedelta(hours=1)
+    ):
+        super().__init__()
+        self.token = token
+        self.expiry = expiry
+        self.error = error
+        self.lifetime = lifetime
+        self.refresh_count = 0
+        self.refreshed = threading.Event()
+
+    def refresh(self, request):
+        self.refresh_count += 1
+        self.refreshed.set()
+        if self.error:
+            raise self.error
+        self.token = f"token-{self.refresh_count}"
+        self.expiry = token_refresher._utcnow() + self.lifetime
+
+
+class TestTokenRefresher:
+    def test_watch_refreshes_credentials_without_token(self):
+        refresher = token_refresher.TokenRefresher()
+        credentials = _FakeCredentials()
+
+        refresher.watch(credentials)
+
+        assert credentials.refreshed.wait(timeout=5)
+        refresher.stop()
+        assert credentials.token == "token-1"
+        metrics = refresher.metrics
+        assert metrics.refresh_count == 1
+        assert metrics.failure_count == 0
+        assert metrics.average_refresh_seconds >= 0
+
+    def test_watch_refreshes_credentials_before_expiry(self):
+        refresher = token_refresher.TokenRefresher(
+            refresh_margin=datetime.timedelta(minutes=5)
+        )
+        expiring_credentials = _FakeCredentials(
+            token="token-0",
+            expiry=token_refresher._utcnow() + datetime.timedelta(minutes=4),
+        )
+        valid_credentials = _FakeCredentials(
+            token="token-0",
+            expiry=token_refresher._utcnow() + datetime.timedelta(minutes=30),
+        )
+
+        refresher.watch(valid_credentials)
+        refresher.watch(expiring_credentials)
+
+        assert expiring_credentials.refreshed.wait(timeout=5)
+        refresher.stop()
+        assert valid_credentials.refresh_count == 0
+
+    def test_watch_refreshes_short_lived_token_at_half_lifetime(self):
+        refresher = token_refresher.TokenRefresher(
+            refresh_margin=datetime.timedelta(minutes=5), retry_interval=0.01
+        )
+        credentials = _FakeCredentials(lifetime=datetime.timedelta(minutes=2))
+
+        refresher.watch(credentials)
+
+        assert credentials.refreshed.wait(timeout=5)
+        time.sleep(0.5)
+        refresher.stop()
+        assert credentials.refresh_count == 1
+        delay = refresher._seconds_until_refresh(
+            credentials, None, credentials.expiry - credentials.lifetime
+        )
+        assert 0 < delay <= 60
+
+    def test_watch_retries_failed_refresh(self):
+        refresher = token_refresher.TokenRefresher(retry_interval=0.01)
+        credentials = _FakeCredentials(error=RuntimeError("token endpoint"))
+
+        refresher.watch(credentials)
+
+        for _ in range(500):
+            if refresher.metrics.failure_count >= 2:
+                break
+            time.sleep(0.01)
+        refresher.stop()
+        metrics = refresher.metrics
+        assert metrics.failure_count >= 2
+        assert metrics.refresh_count == 0
+        assert metrics.last_error == "token endpoint"
+
+    def test_watch_ignores_anonymous_credentials(self):
+        refresher = token_refresher.TokenRefresher()
+
+        refresher.watch(auth_credentials.AnonymousCredentials())
+        refresher.watch(None)
+
+        assert refresher.watched_count == 0
+
+
+@pytest.mark.usefixtures("google_auth_mock")
+class TestInitTokenRefresher:
+    def setup_method(self):
+        reload(initializer)
+
+    def teardown_method(self):
+        if initializer.global_config.token_refresher:
+            initializer.global_config.token_refresher.stop()
+        initializer.global_pool.shutdown(wait=True)
+
+    def test_create_client_watches_credentials(self):
+        credentials = _FakeCredentials(
+            token="token-0",
+            expiry=token_refresher._utcnow() + datetime.timedelta(hours=1),
+        )
+        client_credentials = _FakeCredentials(
+            token="token-0",
+            expiry=token_refresher._utcnow() + datetime.timedelta(hours=1),
+        )
+        initializer.global_config.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+            credentials=credentials,
+            background_token_refresh=True,
+        )
+        refresher = initializer.global_config.token_refresher
+        assert refresher.watched_count == 1
+
+        initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride,
+            credentials=client_credentials,
+        )
+        assert refresher.watched_count == 2
+
+        initializer.global_config.init(background_token_refresh=False)
+        assert initializer.global_config.token_refresher is None
+        assert refresher.watched_count == 0
+
+    def test_token_refresher_is_disabled_by_default(self):
+        initializer.global_config.init(project=_TEST_PROJECT)
+        assert initializer.global_config.token_refresher is None
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Guards the startup cost of importing the aiplatform package."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that `import google.cloud.aiplatform` must not load. They are only
+# imported when the corresponding attribute of the package is first accessed.
+_DEFERRED_MODULES = (
+    "google.cloud.aiplatform.datasets",
+    "google.cloud.aiplatform.featurestore",
+    "google.cloud.aiplatform.gapic",
+    "google.cloud.aiplatform.matching_engine",
+    "google.cloud.aiplatform.pipeline_job_schedules",
+    "google.cloud.aiplatform.tensorboard.uploader_tracker",
+    "google.cloud.aiplatform.training_jobs",
+)
+
+# Modules that `import google.cloud.aiplatform` must not load either, but that
+# are loaded together with the resource classes, e.g. by `models`.
+_RESOURCE_MODULES = (
+    "google.cloud.aiplatform.jobs",
+    "google.cloud.aiplatform.metadata.metadata",
+    "google.cloud.aiplatform.models",
+    "google.cloud.aiplatform.pipeline_jobs",
+)
+
+# Upper bound of the cumulative import time of the aiplatform package, in
+# microseconds. About three times the time measured with the deferred modules
+# left unloaded, which is well below the time taken by eager imports.
+_MAX_IMPORT_TIME_US = 4_500_000
+
+# Initializes the SDK and constructs an Endpoint without calling the API.
+_INIT_AND_GET_ENDPOINT = """
+from unittest import mock
+from google.auth import credentials as auth_credentials
+from google.cloud import aiplatform
+from google.cloud.aiplatform.compat.services import endpoint_service_client
+from google.cloud.aiplatform.compat.types import endpoint as gca_endpoint
+
+endpoint_name = "projects/123/locations/us-central1/endpoints/456"
+aiplatform.init(
+    project="123",
+    location="us-central1",
+    credentials=auth_credentials.AnonymousCredentials(),
+)
+with mock.patch.object(
+    endpoint_service_client.EndpointServiceClient,
+    "get_endpoint",
+    return_value=gca_endpoint.Endpoint(name=endpoint_name),
+):
+    aiplatform.Endpoint(endpoint_name)
+"""
+
+
+def _import_in_new_interpreter(statement):
+    """Runs `statement` with `python -X importtime` in a new interpreter.
+
+    Returns:
+        A tuple of the names of the loaded modules and the cumulative import
+        time of the aiplatform package in microseconds.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_time_us = None
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.endswith(
+            "| google.cloud.aiplatform"
+        ):
+            import_time_us = int(line.split("|")[1])
+    return set(result.stdout.split()), import_time_us
+
+
+@pytest.mark.skipif(
+    sys.executable is None, reason="requires python path to invoke subprocess"
+)
+class TestAiplatformImport:
+    def test_import_aiplatform_defers_resource_modules(self, record_property):
+        modules, import_time_us = _import_in_new_interpreter(
+            "import google.cloud.aiplatform"
+        )
+        # Reported in the JUnit XML output to track the startup cost over time.
+        record_property("aiplatform_import_time_us", import_time_us)
+
+        assert "google.cloud.aiplatform.initializer" in modules
+        assert [
+            module
+            for module in _DEFERRED_MODULES + _RESOURCE_MODULES
+            if module in modules
+        ] == []
+        assert import_time_us is not None
+        assert import_time_us < _MAX_IMPORT_TIME_US
+
+    def test_init_and_endpoint_defer_resource_modules(self):
+        modules, _ = _import_in_new_interpreter(_INIT_AND_GET_ENDPOINT)
+
+        assert "google.cloud.aiplatform.models" in modules
+        assert [module for module in _DEFERRED_MODULES if module in modules] == []
+
+    def test_import_vertexai_defers_resource_modules(self):
+        modules, _ = _import_in_new_interpreter("import vertexai")
+
+        assert [module for module in _DEFERRED_MODULES if module in modules] == []
+
+    def test_attributes_are_imported_on_first_access(self):
+        modules, _ = _import_in_new_interpreter(
+            "from google.cloud import aiplatform\naiplatform.TabularDataset"
+        )
+
+        assert "google.cloud.aiplatform.datasets" in modules
+        assert "google.cloud.aiplatform.training_jobs" not in modules
+
+    def test_public_surface_is_available(self):
+        from google.cloud import aiplatform
+        from google.cloud.aiplatform import datasets
+        from google.cloud.aiplatform.metadata import metadata
+
+        assert aiplatform.TabularDataset is datasets.TabularDataset
+        assert aiplatform.log_params == metadata._experiment_tracker.log_params
+        for name in aiplatform.__all__:
+            assert getattr(aiplatform, name) is not None
+            assert name in dir(aiplatform)
+        # Submodules that are not part of `__all__` are still accessible.
+        assert aiplatform.schedules.__name__ == "google.cloud.aiplatform.schedules"
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        from google.cloud import aiplatform
+
+        with pytest.raises(AttributeError, match="has no attribute"):
+            aiplatform.NotAnAttribute
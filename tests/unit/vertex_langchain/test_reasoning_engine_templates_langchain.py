@@ -221,6 +221,20 @@ class TestLangchainAgent:
             [mock.call.invoke.invoke(input={"input": "test query"}, config=None)]
         )
 
+    def test_stream_query(self, langchain_dump_mock):
+        agent = reasoning_engines.LangchainAgent(
+            model=_TEST_MODEL,
+            prompt=self.prompt,
+            output_parser=self.output_parser,
+        )
+        agent._runnable = mock.Mock()
+        agent._runnable.stream.return_value = [{"output": "a"}, {"output": "b"}]
+        chunks = list(agent.stream_query(input="test query"))
+        agent._runnable.stream.assert_called_once_with(
+            input={"input": "test query"}, config=None
+        )
+        assert len(chunks) == 2
+
     @pytest.mark.usefixtures("caplog")
     def test_enable_tracing(
         self,
@@ -1096,3 +1096,27 @@ class TestGenerateSchema(parameterized.TestCase):
     def test_generate_schemas(self, func, required, expected_operation):
         result = _utils.generate_schema(func, required=required)
         self.assertDictEqual(result, expected_operation)
+
+
+class TestStructConversion:
+    # Bound at import time, before the module-scoped `to_dict_mock` patches it.
+    to_dict = staticmethod(_utils.to_dict)
+
+    def test_to_dict_converts_query_response_directly(self):
+        response = types.QueryReasoningEngineResponse(
+            output={"answer": ["a", 1, None, {"nested": True}]},
+        )
+        with mock.patch.object(_utils.json_format, "MessageToJson") as to_json_mock:
+            result = self.to_dict(response)
+        to_json_mock.assert_not_called()
+        assert result == {"output": {"answer": ["a", 1.0, None, {"nested": True}]}}
+
+    def test_to_proto_does_not_share_default_message(self):
+        first = _utils.to_proto({"a": 1})
+        second = _utils.to_proto({"b": 2})
+        assert self.to_dict(first) == {"a": 1.0}
+        assert self.to_dict(second) == {"b": 2.0}
+
+    def test_dict_to_struct_roundtrip(self):
+        obj = {"query": "hello", "options": {"k": [1.0, 2.0], "flag": False}}
+        assert _utils.struct_to_dict(_utils.dict_to_struct(obj)) == obj
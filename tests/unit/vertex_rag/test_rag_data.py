@@ -14,7 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import http.server
 import importlib
+import json
+import threading
 from google.api_core import operation as ga_operation
 from vertexai.preview import rag
 from vertexai.preview.rag.utils._gapic_utils import (
@@ -27,6 +30,7 @@ from google.cloud.aiplatform_v1beta1 import (
     ListRagCorporaResponse,
     ListRagFilesResponse,
 )
+from google.auth import credentials as auth_credentials
 from google.cloud import aiplatform
 import mock
 from unittest.mock import patch
@@ -100,6 +104,48 @@ def open_file_mock():
         yield open_file_mock
 
 
+class _RagFileUploadHandler(http.server.BaseHTTPRequestHandler):
+    """A local stand-in for the RagFile upload endpoint."""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.uploads.append(body)
+        if self.server.unauthorized_count:
+            self.server.unauthorized_count -= 1
+            self.send_response(401)
+            payload = b"{}"
+        elif b"missing" in body:
+            self.send_response(404)
+            payload = b"{}"
+        else:
+            self.send_response(200)
+            payload = json.dumps(tc.TEST_RAG_FILE_JSON).encode("utf-8")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def rag_upload_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _RagFileUploadHandler)
+    server.uploads = []
+    # Number of requests rejected with 401 before the uploads are accepted.
+    server.unauthorized_count = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    upload_request_uri = "http://127.0.0.1:{}/upload".format(server.server_port)
+    with mock.patch.object(
+        rag.rag_data, "_get_upload_request_uri", return_value=upload_request_uri
+    ):
+        yield server
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def import_files_mock():
     with mock.patch.object(
@@ -295,6 +341,130 @@ class TestRagDataManagement:
             )
         e.match("Failed in indexing the RagFile due to")
 
+    def test_upload_files_resumes_from_manifest(self, rag_upload_server, tmp_path):
+        aiplatform.init(
+            project=tc.TEST_PROJECT,
+            location=tc.TEST_REGION,
+            credentials=auth_credentials.AnonymousCredentials(),
+        )
+        paths = []
+        for i in range(3):
+            path = tmp_path / "file_{}.txt".format(i)
+            path.write_text("content {}".format(i))
+            paths.append(str(path))
+        manifest_path = str(tmp_path / "manifest.jsonl")
+
+        response = rag.upload_files(
+            corpus_name=tc.TEST_RAG_CORPUS_RESOURCE_NAME,
+            paths=paths,
+            max_concurrency=2,
+            manifest_path=manifest_path,
+        )
+
+        assert sorted(response.rag_files) == paths
+        assert not response.failed_files
+        assert response.skipped_file_count == 0
+        assert response.uploaded_bytes == 3 * len("content 0")
+        rag_file_eq(response.rag_files[paths[0]], tc.TEST_RAG_FILE)
+        assert len(rag_upload_server.uploads) == 3
+        assert all(
+            b"content " in body and b'name="metadata"' in body
+            for body in rag_upload_server.uploads
+        )
+
+        # Only the modified file is uploaded again.
+        with open(paths[1], "a") as f:
+            f.write(" modified")
+        response = rag.upload_files(
+            corpus_name=tc.TEST_RAG_CORPUS_RESOURCE_NAME,
+            paths=paths,
+            manifest_path=manifest_path,
+        )
+
+        assert sorted(response.rag_files) == paths
+        assert response.skipped_file_count == 2
+        assert len(rag_upload_server.uploads) == 4
+        assert b"content 1 modified" in rag_upload_server.uploads[-1]
+
+    def test_upload_files_reports_files_moved_since_manifest(
+        self, rag_upload_server, tmp_path
+    ):
+        aiplatform.init(
+            project=tc.TEST_PROJECT,
+            location=tc.TEST_REGION,
+            credentials=auth_credentials.AnonymousCredentials(),
+        )
+        kept_path = tmp_path / "kept.txt"
+        kept_path.write_text("kept")
+        moved_path = tmp_path / "moved.txt"
+        moved_path.write_text("moved")
+        paths = [str(kept_path), str(moved_path)]
+        manifest_path = str(tmp_path / "manifest.jsonl")
+        rag.upload_files(
+            corpus_name=tc.TEST_RAG_CORPUS_RESOURCE_NAME,
+            paths=paths,
+            manifest_path=manifest_path,
+        )
+        moved_path.rename(tmp_path / "elsewhere.txt")
+
+        response = rag.upload_files(
+            corpus_name=tc.TEST_RAG_CORPUS_RESOURCE_NAME,
+            paths=paths,
+            manifest_path=manifest_path,
+        )
+
+        assert list(response.rag_files) == [str(kept_path)]
+        assert response.skipped_file_count == 1
+        assert list(response.failed_files) == [str(moved_path)]
+        assert len(rag_upload_server.uploads) == 2
+
+    def test_upload_files_resends_body_after_refresh(self, rag_upload_server, tmp_path):
+        credentials = mock.Mock(spec=auth_credentials.Credentials)
+        credentials.token = "token"
+        aiplatform.init(
+            project=tc.TEST_PROJECT,
+            location=tc.TEST_REGION,
+            credentials=credentials,
+        )
+        path = tmp_path / "file.txt"
+        path.write_text("content")
+        rag_upload_server.unauthorized_count = 1
+
+        response = rag.upload_files(
+            corpus_name=tc.TEST_RAG_CORPUS_RESOURCE_NAME,
+            paths=[str(path)],
+        )
+
+        assert list(response.rag_files) == [str(path)]
+        assert not response.failed_files
+        credentials.refresh.assert_called_once()
+        first_body, second_body = rag_upload_server.uploads
+        assert b"content" in second_body
+        assert len(second_body) == len(first_body)
+
+    def test_upload_files_reports_failures(self, rag_upload_server, tmp_path):
+        aiplatform.init(
+            project=tc.TEST_PROJECT,
+            location=tc.TEST_REGION,
+            credentials=auth_credentials.AnonymousCredentials(),
+        )
+        found_path = tmp_path / "found.txt"
+        found_path.write_text("found")
+        missing_path = tmp_path / "missing.txt"
+        missing_path.write_text("missing")
+        manifest_path = tmp_path / "manifest.jsonl"
+
+        response = rag.upload_files(
+            corpus_name=tc.TEST_RAG_CORPUS_RESOURCE_NAME,
+            paths=[str(found_path), str(missing_path)],
+            manifest_path=str(manifest_path),
+        )
+
+        assert list(response.rag_files) == [str(found_path)]
+        assert list(response.failed_files) == [str(missing_path)]
+        assert response.uploaded_bytes == len("found")
+        assert len(manifest_path.read_text().splitlines()) == 1
+
     def test_import_files(self, import_files_mock):
         response = rag.import_files(
             corpus_name=tc.TEST_RAG_CORPUS_RESOURCE_NAME,
@@ -32,6 +32,9 @@ from google.cloud.aiplatform.compat.services import (
     feature_online_store_admin_service_client,
     feature_online_store_service_client,
 )
+from google.cloud.aiplatform.compat.types import (
+    feature_online_store_service as fos_service,
+)
 from vertexai.resources.preview.feature_store import (
     feature_view,
 )
@@ -462,6 +465,65 @@ def test_fetch_feature_values_optimized_no_endpoint(
         FeatureView(_TEST_OPTIMIZED_FV2_PATH).read(key=["key1"]).to_dict()
 
 
+def test_read_many_bigtable(get_fos_mock, get_fv_mock, fetch_feature_values_mock):
+    def fetch_feature_values(feature_view, data_key, timeout):
+        key = data_key.composite_key.parts[0]
+        features = [
+            {"name": "name", "value": {"string_value": f"name_{key}"}},
+            {"name": "scores", "value": {"double_array_value": {"values": [0.5]}}},
+        ]
+        if key == "key1":
+            features.append({"name": "age", "value": {"int64_value": 7}})
+        return fos_service.FetchFeatureValuesResponse(key_values={"features": features})
+
+    fetch_feature_values_mock.side_effect = fetch_feature_values
+    cache = fs_utils.FeatureViewReadCache(max_entries=10, ttl_seconds=60)
+    fv = FeatureView(_TEST_FV1_PATH)
+
+    fv_dict = fv.read_many(keys=[["key1"], ["key2"]], cache=cache).to_dict()
+
+    assert fv_dict == {
+        "key": [["key1"], ["key2"]],
+        "name": ["name_key1", "name_key2"],
+        "scores": [[0.5], [0.5]],
+        "age": [7, None],
+    }
+    assert fetch_feature_values_mock.call_count == 2
+    assert len(cache) == 2
+
+    # Cached keys are not read again.
+    responses = fv.read_many(keys=[["key2"], ["key3"]], cache=cache).to_proto()
+
+    assert fetch_feature_values_mock.call_count == 3
+    assert responses[0].key_values.features[0].value.string_value == "name_key2"
+    assert responses[1].key_values.features[0].value.string_value == "name_key3"
+
+
+def test_read_many_with_connection_options_skips_online_store_lookup(
+    get_psc_optimized_fos_mock,
+    get_optimized_fv_mock,
+    transport_mock,
+    grpc_insecure_channel_mock,
+    fetch_feature_values_mock,
+):
+    fv = FeatureView(_TEST_OPTIMIZED_FV1_PATH)
+    get_psc_optimized_fos_mock.reset_mock()
+
+    df = fv.read_many(
+        keys=[["key1"], ["key2"], ["key3"]],
+        connection_options=fs_utils.ConnectionOptions(
+            host="1.2.3.4",
+            transport=fs_utils.ConnectionOptions.InsecureGrpcChannel(),
+        ),
+        max_concurrency=2,
+    ).to_pandas()
+
+    assert df["key1"].tolist() == ["value1"] * 3
+    assert fetch_feature_values_mock.call_count == 3
+    grpc_insecure_channel_mock.assert_called_once_with("1.2.3.4:10002")
+    get_psc_optimized_fos_mock.assert_not_called()
+
+
 def test_ffv_optimized_psc_with_no_connection_options_raises_error(
     get_psc_optimized_fos_mock,
     get_optimized_fv_mock,
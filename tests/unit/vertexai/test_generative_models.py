@@ -21,8 +21,10 @@ import pytest
 from typing import Iterable, MutableSequence, Optional
 from unittest import mock
 
+import grpc
 import vertexai
 from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform.utils import grpc_utils
 from vertexai import generative_models
 from vertexai.preview import (
     generative_models as preview_generative_models,
@@ -41,6 +43,7 @@ from google.cloud.aiplatform_v1beta1.services import (
     gen_ai_cache_service,
 )
 from vertexai.generative_models import _function_calling_utils
+from vertexai.generative_models import _generative_models
 from vertexai.preview import caching
 
 
@@ -489,6 +492,28 @@ class TestGenerativeModels:
             == "cached-content-id-in-from-cached-content-test"
         )
 
+    @pytest.mark.parametrize(
+        "generative_models",
+        [generative_models, preview_generative_models],
+    )
+    def test_warmup(self, generative_models: generative_models):
+        model = generative_models.GenerativeModel("gemini-pro")
+        with mock.patch.object(grpc, "channel_ready_future") as ready_future_mock:
+            model.warmup(timeout=10)
+
+        ready_future_mock.assert_called_once_with(
+            model._prediction_client._transport.grpc_channel
+        )
+        ready_future_mock.return_value.result.assert_called_once_with(timeout=10)
+
+    def test_generative_model_constructor_with_prewarm_starts_warm_up(self):
+        with mock.patch.object(
+            initializer.global_config, "_prewarm", True
+        ), mock.patch.object(grpc_utils, "start_warm_up") as start_warm_up_mock:
+            model = generative_models.GenerativeModel("gemini-pro")
+
+        start_warm_up_mock.assert_called_once_with(model.warmup)
+
     @mock.patch.object(
         target=prediction_service.PredictionServiceClient,
         attribute="generate_content",
@@ -616,6 +641,196 @@ class TestGenerativeModels:
         for chunk in stream:
             assert chunk.text
 
+    @pytest.mark.parametrize(
+        "generative_models",
+        [generative_models, preview_generative_models],
+    )
+    def test_prepare_request_reuses_compiled_defaults(
+        self, generative_models: generative_models
+    ):
+        weather_tool = generative_models.Tool(
+            function_declarations=[
+                generative_models.FunctionDeclaration.from_func(get_current_weather)
+            ],
+        )
+        model = generative_models.GenerativeModel(
+            "gemini-pro",
+            generation_config={"temperature": 0.1},
+            safety_settings={
+                generative_models.HarmCategory.HARM_CATEGORY_HATE_SPEECH: (
+                    generative_models.HarmBlockThreshold.BLOCK_ONLY_HIGH
+                ),
+            },
+            tools=[weather_tool],
+            system_instruction=["Be brief."],
+        )
+
+        request1 = model._prepare_request("Why is sky blue?")
+        template = model._request_template
+        request2 = model._prepare_request("Why is grass green?")
+
+        assert model._request_template is template
+        assert request1.contents[0].parts[0].text == "Why is sky blue?"
+        assert request2.contents[0].parts[0].text == "Why is grass green?"
+        assert len(request2.contents) == 1
+        assert request2.system_instruction.parts[0].text == "Be brief."
+        assert request2.tools[0].function_declarations[0].name == (
+            "get_current_weather"
+        )
+        assert request2.generation_config.temperature == pytest.approx(0.1)
+        assert len(request2.safety_settings) == 1
+        # Requests do not share state with the template.
+        assert not template.contents
+
+        overridden = model._prepare_request(
+            "Why is sky blue?",
+            generation_config={"temperature": 0.5},
+            tools=[],
+        )
+        assert overridden.generation_config.temperature == pytest.approx(0.5)
+        # Falsy overrides fall back to the model defaults.
+        assert overridden.tools[0].function_declarations[0].name == (
+            "get_current_weather"
+        )
+        assert model._request_template is template
+
+        model._system_instruction = "Be verbose."
+        request3 = model._prepare_request("Why is sky blue?")
+        assert model._request_template is not template
+        assert request3.system_instruction.parts[0].text == "Be verbose."
+
+    def test_prepare_request_copies_mutable_defaults(self):
+        generation_config = {"temperature": 0.1}
+        system_instruction = ["Be brief."]
+        model = generative_models.GenerativeModel(
+            "gemini-pro",
+            generation_config=generation_config,
+            system_instruction=system_instruction,
+        )
+        model._prepare_request("Why is sky blue?")
+        template = model._request_template
+
+        generation_config["temperature"] = 0.5
+        system_instruction.append("Be verbose.")
+        request = model._prepare_request("Why is sky blue?")
+
+        assert model._request_template is template
+        assert request.generation_config.temperature == pytest.approx(0.1)
+        assert len(request.system_instruction.parts) == 1
+
+    def test_prepare_request_compiles_defaults_once(self):
+        model = generative_models.GenerativeModel(
+            "gemini-pro",
+            generation_config={"temperature": 0.1, "max_output_tokens": 100},
+            tools=[
+                generative_models.Tool(
+                    function_declarations=[
+                        generative_models.FunctionDeclaration.from_func(
+                            get_current_weather
+                        )
+                    ]
+                )
+            ],
+        )
+        with mock.patch.object(
+            _generative_models,
+            "_generation_config_to_gapic",
+            wraps=_generative_models._generation_config_to_gapic,
+        ) as generation_config_to_gapic_mock, mock.patch.object(
+            _generative_models,
+            "_tool_types_to_gapic_tools",
+            wraps=_generative_models._tool_types_to_gapic_tools,
+        ) as tool_types_to_gapic_tools_mock:
+            for _ in range(5):
+                model._prepare_request("Why is sky blue?")
+
+            assert generation_config_to_gapic_mock.call_count == 1
+            assert tool_types_to_gapic_tools_mock.call_count == 1
+
+            model._generation_config = {"temperature": 0.5}
+            request = model._prepare_request("Why is sky blue?")
+
+            assert generation_config_to_gapic_mock.call_count == 2
+            assert tool_types_to_gapic_tools_mock.call_count == 2
+            assert request.generation_config.temperature == pytest.approx(0.5)
+
+    def test_generate_content_with_response_cache(self):
+        response_cache = preview_generative_models.InMemoryResponseCache()
+        with mock.patch.object(
+            prediction_service.PredictionServiceClient,
+            "generate_content",
+            autospec=True,
+            side_effect=mock_generate_content,
+        ) as generate_content_mock, mock.patch.object(
+            prediction_service.PredictionServiceClient,
+            "stream_generate_content",
+            autospec=True,
+            side_effect=mock_stream_generate_content,
+        ) as stream_generate_content_mock:
+            model = preview_generative_models.GenerativeModel(
+                "gemini-pro",
+                generation_config={"temperature": 0},
+                response_cache=response_cache,
+            )
+            response1 = model.generate_content("Why is sky blue?")
+            response2 = model.generate_content("Why is sky blue?")
+            model.generate_content("Why is grass green?")
+
+            assert response2.text == response1.text
+            assert generate_content_mock.call_count == 2
+            assert (response_cache.hits, response_cache.misses) == (1, 2)
+
+            chunks1 = list(model.generate_content("Why is sky blue?", stream=True))
+            chunks2 = list(model.generate_content("Why is sky blue?", stream=True))
+
+            assert [chunk.text for chunk in chunks2] == [
+                chunk.text for chunk in chunks1
+            ]
+            assert stream_generate_content_mock.call_count == 1
+            assert len(response_cache) == 3
+
+    def test_sqlite_response_cache_eviction_and_ttl(self, tmp_path):
+        model = generative_models.GenerativeModel("gemini-pro")
+        requests = [model._prepare_request(contents=f"Question {i}") for i in range(3)]
+        responses = [
+            gapic_prediction_service_types.GenerateContentResponse(
+                candidates=[
+                    gapic_content_types.Candidate(
+                        content=gapic_content_types.Content(
+                            role="model", parts=[{"text": f"Answer {i}"}]
+                        )
+                    )
+                ]
+            )
+            for i in range(3)
+        ]
+        cache_path = str(tmp_path / "responses.db")
+        response_cache = preview_generative_models.SqliteResponseCache(
+            cache_path, max_entries=2
+        )
+        for request, response in zip(requests, responses):
+            response_cache.put(request, [response])
+        response_cache.close()
+
+        # The cache persists across instances and evicts the oldest entries.
+        response_cache = preview_generative_models.SqliteResponseCache(
+            cache_path, max_entries=2
+        )
+        assert len(response_cache) == 2
+        assert response_cache.get(requests[0]) is None
+        assert response_cache.get(requests[2]) == [responses[2]]
+        assert response_cache.get(requests[2], stream=True) is None
+        assert (response_cache.hits, response_cache.misses) == (1, 2)
+        response_cache.close()
+
+        expired_cache = preview_generative_models.SqliteResponseCache(
+            str(tmp_path / "expired.db"), ttl=-1
+        )
+        expired_cache.put(requests[0], [responses[0]])
+        assert expired_cache.get(requests[0]) is None
+        assert len(expired_cache) == 0
+        expired_cache.close()
+
     @mock.patch.object(
         target=prediction_service.PredictionServiceClient,
         attribute="generate_content",
@@ -685,6 +900,84 @@ class TestGenerativeModels:
         response2 = chat.send_message("Is sky blue on other planets?")
         assert response2.text
 
+    @pytest.mark.parametrize(
+        "generative_models",
+        [generative_models, preview_generative_models],
+    )
+    def test_chat_send_message_reuses_converted_history(
+        self, generative_models: generative_models
+    ):
+        with mock.patch.object(
+            prediction_service.PredictionServiceClient,
+            "generate_content",
+            autospec=True,
+            side_effect=mock_generate_content,
+        ) as generate_content_mock:
+            model = generative_models.GenerativeModel("gemini-pro")
+            chat = model.start_chat()
+            chat.send_message("Why is sky blue?")
+            chat.send_message("Is sky blue on other planets?")
+
+            request = generate_content_mock.call_args[1]["request"]
+            assert [content.role for content in request.contents] == [
+                "user",
+                "model",
+                "user",
+            ]
+            assert request.contents[2].parts[0].text == "Is sky blue on other planets?"
+            assert chat._history_buffer._buffered_history == chat.history[:2]
+
+            # Editing the history rebuilds the converted history.
+            chat.history.clear()
+            chat.send_message("Why is sky blue?")
+            request = generate_content_mock.call_args[1]["request"]
+            assert len(request.contents) == 1
+            assert len(chat.history) == 2
+
+    @pytest.mark.usefixtures("mock_get_cached_content_fixture")
+    def test_chat_send_message_auto_cache_after_tokens(self):
+        def create_cached_content(self, request):
+            del self
+            return GapicCachedContent(
+                name="projects/123/locations/us-central1/cachedContents/chat",
+                model=request.cached_content.model,
+            )
+
+        with mock.patch.object(
+            prediction_service.PredictionServiceClient,
+            "generate_content",
+            autospec=True,
+            side_effect=mock_generate_content,
+        ) as generate_content_mock, mock.patch.object(
+            gen_ai_cache_service.client.GenAiCacheServiceClient,
+            "create_cached_content",
+            autospec=True,
+            side_effect=create_cached_content,
+        ) as create_cached_content_mock:
+            model = preview_generative_models.GenerativeModel(
+                "gemini-pro", system_instruction=["Be brief."]
+            )
+            chat = model.start_chat(auto_cache_after_tokens=10)
+            chat.send_message("Why is sky blue?")
+
+            cache_request = create_cached_content_mock.call_args[0][1]
+            assert len(cache_request.cached_content.contents) == 2
+            assert cache_request.cached_content.system_instruction.parts[0].text == (
+                "Be brief."
+            )
+
+            chat.send_message("Is sky blue on other planets?")
+            request = generate_content_mock.call_args[1]["request"]
+            assert request.cached_content == (
+                "projects/123/locations/us-central1/cachedContents/chat"
+            )
+            assert not request.system_instruction.parts
+            assert len(request.contents) == 1
+            assert len(chat.history) == 4
+
+        with pytest.raises(ValueError):
+            model.start_chat(auto_cache_after_tokens=0)
+
     @mock.patch.object(
         target=prediction_service.PredictionServiceClient,
         attribute="stream_generate_content",
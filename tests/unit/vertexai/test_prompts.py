@@ -458,6 +458,57 @@ class TestPrompt:
         with pytest.raises(ValueError):
             prompt.assemble_contents(day="Tuesday")
 
+    def test_string_prompt_assemble_empty_variable(self):
+        # An empty variable value would produce an empty text Part
+        prompt = Prompt(prompt_data="{movie1}")
+        with pytest.raises(TypeError, match="must not be empty"):
+            prompt.assemble_contents(movie1="")
+        with pytest.raises(TypeError, match="must not be empty"):
+            prompt.assemble_contents_batch([{"movie1": "Up"}, {"movie1": ""}])
+
+    def test_prompt_assemble_contents_batch(self):
+        image = create_image()
+        prompt = Prompt(
+            prompt_data=["Compare {movie1} with {movie2}", "{poster}", "{movie1}!"],
+        )
+        variables_list = [
+            {"movie1": "The Avengers", "movie2": "Frozen", "poster": [image]},
+            {"movie1": "Up", "poster": "no poster"},
+            {},
+        ]
+        assembled_prompts = prompt.assemble_contents_batch(variables_list)
+
+        assert len(assembled_prompts) == 3
+        for assembled_prompt, variables in zip(assembled_prompts, variables_list):
+            if variables:
+                assert_prompt_contents_equal(
+                    assembled_prompt, prompt.assemble_contents(**variables)
+                )
+        assert_prompt_contents_equal(
+            assembled_prompts[1],
+            [
+                Content(
+                    parts=[Part.from_text("Compare Up with {movie2}no posterUp!")],
+                    role="user",
+                )
+            ],
+        )
+        assert assembled_prompts[2][0].parts[0].text == "Compare {movie1} with {movie2}"
+
+        with pytest.raises(ValueError):
+            list(prompt.iter_assembled_contents([{"day": "Tuesday"}]))
+
+    def test_prompt_data_setter_recompiles_template(self):
+        prompt = Prompt(prompt_data="Rate the movie {movie1}")
+        prompt.prompt_data = "Rate the movie {movie2}"
+
+        assert_prompt_contents_equal(
+            prompt.assemble_contents(movie2="Frozen"),
+            [Content(parts=[Part.from_text("Rate the movie Frozen")], role="user")],
+        )
+        with pytest.raises(ValueError):
+            prompt.assemble_contents(movie1="Frozen")
+
     @mock.patch.object(
         target=prediction_service.PredictionServiceClient,
         attribute="generate_content",
@@ -16,7 +16,11 @@
 """Base class for working with Model Garden models."""
 
 import dataclasses
-from typing import Dict, Optional, Type, TypeVar
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple, Type, TypeVar
 from google.auth import exceptions as auth_exceptions
 
 from google.cloud import aiplatform
@@ -24,6 +28,9 @@ from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer as aiplatform_initializer
 from google.cloud.aiplatform import models as aiplatform_models
 from google.cloud.aiplatform import _publisher_models
+from google.cloud.aiplatform.compat.types import (
+    publisher_model as gca_publisher_model,
+)
 
 _SUPPORTED_PUBLISHERS = ["google"]
 
@@ -52,6 +59,180 @@ T = TypeVar("T", bound="_ModelGardenModel")
 _SUBCLASSES = {}
 
 
+class _PublisherModelCache:
+    """Process-wide TTL cache of PublisherModel resources.
+
+    Entries are keyed by the full publisher model resource name together with
+    the project and location that were active when the resource was fetched.
+    The cache is disabled until `configure_publisher_model_cache` is called.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[
+            Tuple[str, str, str], Tuple[float, gca_publisher_model.PublisherModel]
+        ] = {}
+        self._ttl_seconds: Optional[float] = None
+        self._persist_path: Optional[str] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds is not None
+
+    def configure(
+        self,
+        ttl_seconds: Optional[float],
+        persist_path: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._ttl_seconds = ttl_seconds
+            self._persist_path = persist_path
+            self._entries.clear()
+            if ttl_seconds is not None and persist_path:
+                self._load()
+
+    def get(
+        self, key: Tuple[str, str, str]
+    ) -> Optional[gca_publisher_model.PublisherModel]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            fetched_at, publisher_model_res = entry
+            if time.time() - fetched_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            return publisher_model_res
+
+    def put(
+        self,
+        key: Tuple[str, str, str],
+        publisher_model_res: gca_publisher_model.PublisherModel,
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), publisher_model_res)
+            self._save()
+
+    def invalidate(self, model_id: Optional[str] = None) -> None:
+        with self._lock:
+            if model_id is None:
+                self._entries.clear()
+            else:
+                model_id = _full_publisher_model_id(model_id)
+                for key in [k for k in self._entries if k[0] == model_id]:
+                    del self._entries[key]
+            self._save()
+
+    def _load(self) -> None:
+        if not os.path.exists(self._persist_path):
+            return
+        try:
+            with open(self._persist_path, "r") as f:
+                serialized_entries = json.load(f)
+            for entry in serialized_entries:
+                self._entries[tuple(entry["key"])] = (
+                    entry["fetched_at"],
+                    gca_publisher_model.PublisherModel.from_json(entry["resource"]),
+                )
+        except (OSError, ValueError, KeyError) as e:
+            _LOGGER.warning(
+                f"Ignoring unreadable publisher model cache file "
+                f"{self._persist_path}: {e}"
+            )
+            self._entries.clear()
+
+    def _save(self) -> None:
+        if not self._persist_path:
+            return
+        serialized_entries = [
+            {
+                "key": list(key),
+                "fetched_at": fetched_at,
+                "resource": gca_publisher_model.PublisherModel.to_json(
+                    publisher_model_res
+                ),
+            }
+            for key, (fetched_at, publisher_model_res) in self._entries.items()
+        ]
+        try:
+            tmp_path = f"{self._persist_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(serialized_entries, f)
+            os.replace(tmp_path, self._persist_path)
+        except OSError as e:
+            _LOGGER.warning(
+                f"Failed to write publisher model cache file "
+                f"{self._persist_path}: {e}"
+            )
+
+
+_PUBLISHER_MODEL_CACHE = _PublisherModelCache()
+
+
+def configure_publisher_model_cache(
+    ttl_seconds: Optional[float] = 3600,
+    persist_path: Optional[str] = None,
+) -> None:
+    """Enables or disables caching of Model Garden publisher model metadata.
+
+    When enabled, `from_pretrained` resolves a model id to its publisher model
+    resource with a single `get_publisher_model` call per project and location,
+    and serves subsequent lookups from memory until the entry expires.
+
+    Args:
+        ttl_seconds (float):
+            Optional. How long a cached entry is considered fresh, in seconds.
+            Pass `None` to disable the cache.
+        persist_path (str):
+            Optional. Path of a local JSON file used to persist cached entries
+            so that new processes can start with a warm cache.
+    """
+    _PUBLISHER_MODEL_CACHE.configure(ttl_seconds=ttl_seconds, persist_path=persist_path)
+
+
+def clear_publisher_model_cache(model_id: Optional[str] = None) -> None:
+    """Invalidates cached publisher model metadata.
+
+    Args:
+        model_id (str):
+            Optional. Identifier of a Model Garden Model, for example
+            "text-bison@001". If not set, all cached entries are removed.
+    """
+    _PUBLISHER_MODEL_CACHE.invalidate(model_id=model_id)
+
+
+def _full_publisher_model_id(model_id: str) -> str:
+    # The default publisher is Google
+    if "/" not in model_id:
+        model_id = "publishers/google/models/" + model_id
+    return model_id
+
+
+def _get_publisher_model_resource(
+    model_id: str,
+) -> gca_publisher_model.PublisherModel:
+    """Gets the PublisherModel resource, consulting the cache when enabled."""
+    if not _PUBLISHER_MODEL_CACHE.enabled:
+        return _publisher_models._PublisherModel(  # pylint: disable=protected-access
+            resource_name=model_id
+        )._gca_resource
+
+    cache_key = (
+        model_id,
+        aiplatform_initializer.global_config.project,
+        aiplatform_initializer.global_config.location,
+    )
+    publisher_model_res = _PUBLISHER_MODEL_CACHE.get(cache_key)
+    if publisher_model_res is None:
+        publisher_model_res = (
+            _publisher_models._PublisherModel(  # pylint: disable=protected-access
+                resource_name=model_id
+            )._gca_resource
+        )
+        _PUBLISHER_MODEL_CACHE.put(cache_key, publisher_model_res)
+    return publisher_model_res
+
+
 def _get_model_class_from_schema_uri(
     schema_uri: str,
 ) -> "_ModelGardenModel":
@@ -112,16 +293,10 @@ def _get_model_info(
             If the model's schema uri is not in the provided schema_to_class_map
     """
 
-    # The default publisher is Google
-    if "/" not in model_id:
-        model_id = "publishers/google/models/" + model_id
+    model_id = _full_publisher_model_id(model_id)
 
     if not publisher_model_res:
-        publisher_model_res = (
-            _publisher_models._PublisherModel(  # pylint: disable=protected-access
-                resource_name=model_id
-            )._gca_resource
-        )
+        publisher_model_res = _get_publisher_model_resource(model_id)
 
     if not publisher_model_res.name.startswith("publishers/google/models/"):
         raise ValueError(
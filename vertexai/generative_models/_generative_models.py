@@ -35,8 +35,11 @@ from typing import (
     TYPE_CHECKING,
 )
 
+from google.cloud.aiplatform import base as aiplatform_base
 from google.cloud.aiplatform import initializer as aiplatform_initializer
 from google.cloud.aiplatform import utils as aiplatform_utils
+from google.cloud.aiplatform.utils import grpc_utils
+from google.cloud.aiplatform.utils import instrumentation
 from google.cloud.aiplatform_v1beta1 import types as aiplatform_types
 from google.cloud.aiplatform_v1beta1.services import prediction_service
 from google.cloud.aiplatform_v1beta1.services import llm_utility_service
@@ -52,8 +55,11 @@ from google.protobuf import json_format
 import warnings
 
 if TYPE_CHECKING:
+    from vertexai.generative_models import _response_cache
     from vertexai.preview import caching
 
+_LOGGER = aiplatform_base.Logger(__name__)
+
 try:
     from PIL import Image as PIL_Image  # pylint: disable=g-import-not-at-top
 except ImportError:
@@ -269,6 +275,62 @@ def _tool_types_to_gapic_tools(
     return gapic_tools
 
 
+def _generation_config_to_gapic(
+    generation_config: Optional[GenerationConfigType],
+) -> Optional[gapic_content_types.GenerationConfig]:
+    """Converts a generation config to a gapic_content_types.GenerationConfig object."""
+    if not generation_config:
+        return None
+    if isinstance(generation_config, gapic_content_types.GenerationConfig):
+        return generation_config
+    elif isinstance(generation_config, GenerationConfig):
+        return generation_config._raw_generation_config
+    elif isinstance(generation_config, Dict):
+        return gapic_content_types.GenerationConfig(**generation_config)
+    return None
+
+
+def _safety_settings_to_gapic(
+    safety_settings: Optional[SafetySettingsType],
+) -> Optional[List[gapic_content_types.SafetySetting]]:
+    """Converts safety settings to a list of gapic_content_types.SafetySetting objects."""
+    if not safety_settings:
+        return None
+    if isinstance(safety_settings, Sequence):
+        gapic_safety_settings = []
+        for safety_setting in safety_settings:
+            if isinstance(safety_setting, gapic_content_types.SafetySetting):
+                gapic_safety_settings.append(safety_setting)
+            elif isinstance(safety_setting, SafetySetting):
+                gapic_safety_settings.append(safety_setting._raw_safety_setting)
+        return gapic_safety_settings
+    elif isinstance(safety_settings, dict):
+        return [
+            gapic_content_types.SafetySetting(
+                category=gapic_content_types.HarmCategory(category),
+                threshold=gapic_content_types.SafetySetting.HarmBlockThreshold(
+                    threshold
+                ),
+            )
+            for category, threshold in safety_settings.items()
+        ]
+    return None
+
+
+# The attributes of _GenerativeModel that its request template is compiled from.
+_REQUEST_TEMPLATE_ATTRIBUTES = frozenset(
+    [
+        "_prediction_resource_name",
+        "_generation_config",
+        "_safety_settings",
+        "_tools",
+        "_tool_config",
+        "_system_instruction",
+        "_cached_content",
+    ]
+)
+
+
 class _GenerativeModel:
     r"""A model that can generate content.
 
@@ -351,6 +413,8 @@ class _GenerativeModel:
         self._tool_config = tool_config
         self._system_instruction = system_instruction
         self._cached_content: Optional["caching.CachedContent"] = None
+        # _response_cache is currently only set by PreviewGenerativeModel
+        self._response_cache: Optional["_response_cache.ResponseCache"] = None
 
         # Validating the parameters
         _validate_generate_content_parameters(
@@ -362,6 +426,9 @@ class _GenerativeModel:
             system_instruction=system_instruction,
         )
 
+        if aiplatform_initializer.global_config.prewarm:
+            grpc_utils.start_warm_up(self.warmup)
+
     @property
     def _prediction_client(self) -> prediction_service.PredictionServiceClient:
         # Switch to @functools.cached_property once its available.
@@ -418,6 +485,76 @@ class _GenerativeModel:
             )
         return self._llm_utility_async_client_value
 
+    def warmup(self, timeout: Optional[float] = None) -> None:
+        """Connects the client used to send requests to the model.
+
+        Otherwise the client is created by the first request, which then also
+        pays for fetching an access token and opening the connection.
+        Use `vertexai.init(prewarm=True)` to warm up models in the background
+        when they are created.
+
+        Usage:
+            ```
+            model = GenerativeModel("gemini-pro")
+            model.warmup(timeout=10)
+            print(model.generate_content("Hello"))
+            ```
+
+        Args:
+            timeout: How long to wait for the connection, in seconds.
+                Waits until it is connected if not set.
+
+        Raises:
+            grpc.FutureTimeoutError: If the connection was not established in time.
+        """
+        grpc_utils.warm_up_client(self._prediction_client, timeout=timeout)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _REQUEST_TEMPLATE_ATTRIBUTES:
+            # Dicts and lists are copied so that changing them after they are
+            # passed to the model cannot make the request template stale.
+            if isinstance(value, dict):
+                value = copy.deepcopy(value)
+            elif isinstance(value, list):
+                value = list(value)
+            self.__dict__.pop("_request_template", None)
+        super().__setattr__(name, value)
+
+    def _get_request_template(
+        self,
+    ) -> gapic_prediction_service_types.GenerateContentRequest:
+        """Returns a request prototype compiled from the model defaults.
+
+        The defaults are converted to GAPIC messages once and reused by every
+        request. The prototype is dropped by `__setattr__` when a default is
+        replaced.
+        """
+        if self.__dict__.get("_request_template") is None:
+            cached_content = self._cached_content
+            self._request_template = gapic_prediction_service_types.GenerateContentRequest(
+                # The `model` parameter now needs to be set for the vision models.
+                # Always need to pass the resource via the `model` parameter.
+                # Even when resource is an endpoint.
+                model=self._prediction_resource_name,
+                generation_config=_generation_config_to_gapic(self._generation_config),
+                safety_settings=_safety_settings_to_gapic(self._safety_settings),
+                tools=(
+                    _tool_types_to_gapic_tools(self._tools) if self._tools else None
+                ),
+                tool_config=(
+                    self._tool_config._gapic_tool_config if self._tool_config else None
+                ),
+                system_instruction=(
+                    _to_content(self._system_instruction)
+                    if self._system_instruction
+                    else None
+                ),
+                cached_content=(
+                    cached_content.resource_name if cached_content else None
+                ),
+            )
+        return self._request_template
+
     def _prepare_request(
         self,
         contents: ContentsType,
@@ -432,13 +569,8 @@ class _GenerativeModel:
         if not contents:
             raise TypeError("contents must not be empty")
 
-        generation_config = generation_config or self._generation_config
-        safety_settings = safety_settings or self._safety_settings
-        tools = tools or self._tools
-        tool_config = tool_config or self._tool_config
-        system_instruction = system_instruction or self._system_instruction
-        cached_content = self._cached_content
-
+        # The model defaults were validated in the constructor, so only the
+        # per-call overrides need to be validated here.
         _validate_generate_content_parameters(
             contents=contents,
             generation_config=generation_config,
@@ -446,67 +578,36 @@ class _GenerativeModel:
             tools=tools,
             tool_config=tool_config,
             system_instruction=system_instruction,
-            cached_content=cached_content,
+            cached_content=self._cached_content,
         )
 
-        contents = _content_types_to_gapic_contents(contents)
-
-        gapic_system_instruction: Optional[gapic_content_types.Content] = None
-        if system_instruction:
-            gapic_system_instruction = _to_content(system_instruction)
+        template_pb = gapic_prediction_service_types.GenerateContentRequest.pb(
+            self._get_request_template()
+        )
+        if isinstance(contents, _ChatRequestContents):
+            # The chat history has already been converted.
+            request_pb = contents.request_pb
+            request_pb.MergeFrom(template_pb)
+        else:
+            request_pb = type(template_pb)()
+            request_pb.CopyFrom(template_pb)
+            request_pb.contents.extend(
+                gapic_content_types.Content.pb(content)
+                for content in _content_types_to_gapic_contents(contents)
+            )
+        request = gapic_prediction_service_types.GenerateContentRequest.wrap(request_pb)
 
-        gapic_generation_config: Optional[gapic_content_types.GenerationConfig] = None
         if generation_config:
-            if isinstance(generation_config, gapic_content_types.GenerationConfig):
-                gapic_generation_config = generation_config
-            elif isinstance(generation_config, GenerationConfig):
-                gapic_generation_config = generation_config._raw_generation_config
-            elif isinstance(generation_config, Dict):
-                gapic_generation_config = gapic_content_types.GenerationConfig(
-                    **generation_config
-                )
-
-        gapic_safety_settings = None
+            request.generation_config = _generation_config_to_gapic(generation_config)
         if safety_settings:
-            if isinstance(safety_settings, Sequence):
-                gapic_safety_settings = []
-                for safety_setting in safety_settings:
-                    if isinstance(safety_setting, gapic_content_types.SafetySetting):
-                        gapic_safety_settings.append(safety_setting)
-                    elif isinstance(safety_setting, SafetySetting):
-                        gapic_safety_settings.append(safety_setting._raw_safety_setting)
-            elif isinstance(safety_settings, dict):
-                gapic_safety_settings = [
-                    gapic_content_types.SafetySetting(
-                        category=gapic_content_types.HarmCategory(category),
-                        threshold=gapic_content_types.SafetySetting.HarmBlockThreshold(
-                            threshold
-                        ),
-                    )
-                    for category, threshold in safety_settings.items()
-                ]
-
-        gapic_tools = None
+            request.safety_settings = _safety_settings_to_gapic(safety_settings)
         if tools:
-            gapic_tools = _tool_types_to_gapic_tools(tools)
-
-        gapic_tool_config = None
+            request.tools = _tool_types_to_gapic_tools(tools)
         if tool_config:
-            gapic_tool_config = tool_config._gapic_tool_config
-
-        return gapic_prediction_service_types.GenerateContentRequest(
-            # The `model` parameter now needs to be set for the vision models.
-            # Always need to pass the resource via the `model` parameter.
-            # Even when resource is an endpoint.
-            model=self._prediction_resource_name,
-            contents=contents,
-            generation_config=gapic_generation_config,
-            safety_settings=gapic_safety_settings,
-            tools=gapic_tools,
-            tool_config=gapic_tool_config,
-            system_instruction=gapic_system_instruction,
-            cached_content=cached_content.resource_name if cached_content else None,
-        )
+            request.tool_config = tool_config._gapic_tool_config
+        if system_instruction:
+            request.system_instruction = _to_content(system_instruction)
+        return request
 
     def _parse_response(
         self,
@@ -636,15 +737,31 @@ class _GenerativeModel:
         Returns:
             A single GenerationResponse object
         """
-        request = self._prepare_request(
-            contents=contents,
-            generation_config=generation_config,
-            safety_settings=safety_settings,
-            tools=tools,
-            tool_config=tool_config,
-        )
-        gapic_response = self._prediction_client.generate_content(request=request)
-        return self._parse_response(gapic_response)
+        with instrumentation.record("GenerativeModel.generate_content") as recorder:
+            with recorder.phase("build_request"):
+                request = self._prepare_request(
+                    contents=contents,
+                    generation_config=generation_config,
+                    safety_settings=safety_settings,
+                    tools=tools,
+                    tool_config=tool_config,
+                )
+            recorder.set_request(request)
+            if self._response_cache is not None:
+                cached_responses = self._response_cache.get(request)
+                if cached_responses:
+                    recorder.set_attribute("cache_hit", True)
+                    with recorder.phase("convert_response"):
+                        return self._parse_response(cached_responses[0])
+            with recorder.phase("rpc"):
+                gapic_response = self._prediction_client.generate_content(
+                    request=request
+                )
+            recorder.set_response(gapic_response)
+            if self._response_cache is not None:
+                self._response_cache.put(request, [gapic_response])
+            with recorder.phase("convert_response"):
+                return self._parse_response(gapic_response)
 
     async def _generate_content_async(
         self,
@@ -673,17 +790,33 @@ class _GenerativeModel:
         Returns:
             An awaitable for a single GenerationResponse object
         """
-        request = self._prepare_request(
-            contents=contents,
-            generation_config=generation_config,
-            safety_settings=safety_settings,
-            tools=tools,
-            tool_config=tool_config,
-        )
-        gapic_response = await self._prediction_async_client.generate_content(
-            request=request
-        )
-        return self._parse_response(gapic_response)
+        with instrumentation.record(
+            "GenerativeModel.generate_content_async"
+        ) as recorder:
+            with recorder.phase("build_request"):
+                request = self._prepare_request(
+                    contents=contents,
+                    generation_config=generation_config,
+                    safety_settings=safety_settings,
+                    tools=tools,
+                    tool_config=tool_config,
+                )
+            recorder.set_request(request)
+            if self._response_cache is not None:
+                cached_responses = self._response_cache.get(request)
+                if cached_responses:
+                    recorder.set_attribute("cache_hit", True)
+                    with recorder.phase("convert_response"):
+                        return self._parse_response(cached_responses[0])
+            with recorder.phase("rpc"):
+                gapic_response = await self._prediction_async_client.generate_content(
+                    request=request
+                )
+            recorder.set_response(gapic_response)
+            if self._response_cache is not None:
+                self._response_cache.put(request, [gapic_response])
+            with recorder.phase("convert_response"):
+                return self._parse_response(gapic_response)
 
     def _generate_content_streaming(
         self,
@@ -719,11 +852,22 @@ class _GenerativeModel:
             tools=tools,
             tool_config=tool_config,
         )
+        if self._response_cache is not None:
+            cached_chunks = self._response_cache.get(request, stream=True)
+            if cached_chunks is not None:
+                for chunk in cached_chunks:
+                    yield self._parse_response(chunk)
+                return
         response_stream = self._prediction_client.stream_generate_content(
             request=request
         )
+        chunks = []
         for chunk in response_stream:
+            chunks.append(chunk)
             yield self._parse_response(chunk)
+        # Only streams that were read to the end are cached.
+        if self._response_cache is not None:
+            self._response_cache.put(request, chunks, stream=True)
 
     async def _generate_content_streaming_async(
         self,
@@ -759,13 +903,28 @@ class _GenerativeModel:
             tools=tools,
             tool_config=tool_config,
         )
+        if self._response_cache is not None:
+            cached_chunks = self._response_cache.get(request, stream=True)
+            if cached_chunks is not None:
+
+                async def cached_async_generator():
+                    for chunk in cached_chunks:
+                        yield self._parse_response(chunk)
+
+                return cached_async_generator()
+
         response_stream = await self._prediction_async_client.stream_generate_content(
             request=request
         )
 
         async def async_generator():
+            chunks = []
             async for chunk in response_stream:
+                chunks.append(chunk)
                 yield self._parse_response(chunk)
+            # Only streams that were read to the end are cached.
+            if self._response_cache is not None:
+                self._response_cache.put(request, chunks, stream=True)
 
         return async_generator()
 
@@ -954,6 +1113,62 @@ def _validate_response(
         )
 
 
+class _ChatRequestContents:
+    """Chat history and new messages already converted for a single request."""
+
+    def __init__(self, request_pb: Any):
+        # The raw protobuf GenerateContentRequest holding only the contents.
+        self.request_pb = request_pb
+
+    def __len__(self) -> int:
+        return len(self.request_pb.contents)
+
+
+class _ChatHistoryBuffer:
+    """Chat history kept in its converted GAPIC form.
+
+    Each history message is copied into the buffer once, so building a request
+    for a new turn only converts the new messages instead of the whole
+    conversation.
+    """
+
+    def __init__(self):
+        self._contents_pb = gapic_prediction_service_types.GenerateContentRequest.pb(
+            gapic_prediction_service_types.GenerateContentRequest()
+        )
+        self._buffered_history: List["Content"] = []
+
+    def sync(self, history: List["Content"]) -> None:
+        """Brings the buffer in line with the given history.
+
+        New messages at the end of the history are appended. If the history was
+        otherwise modified, the buffer is rebuilt.
+        """
+        buffered_count = len(self._buffered_history)
+        if len(history) < buffered_count or any(
+            message is not buffered_message
+            for message, buffered_message in zip(history, self._buffered_history)
+        ):
+            del self._contents_pb.contents[:]
+            self._buffered_history = []
+            buffered_count = 0
+        for message in history[buffered_count:]:
+            self._contents_pb.contents.add().CopyFrom(
+                gapic_content_types.Content.pb(message._raw_content)
+            )
+            self._buffered_history.append(message)
+
+    def request_contents(self, new_messages: List["Content"]) -> _ChatRequestContents:
+        """Returns the buffered history followed by the new messages."""
+        request_pb = type(self._contents_pb)()
+        request_pb.CopyFrom(self._contents_pb)
+        for message in new_messages:
+            request_pb.contents.add().CopyFrom(
+                gapic_content_types.Content.pb(message._raw_content)
+            )
+        return _ChatRequestContents(request_pb)
+
+
 class ChatSession:
     """Chat session holds the chat history."""
 
@@ -973,14 +1188,94 @@ class ChatSession:
 
         self._model = model
         self._history = history or []
+        self._history_buffer = _ChatHistoryBuffer()
         self._response_validator = _validate_response if response_validation else None
         # _responder is currently only set by PreviewChatSession
         self._responder: Optional["AutomaticFunctionCallingResponder"] = None
+        # Automatic context caching is currently only enabled by PreviewChatSession
+        self._auto_cache_after_tokens: Optional[int] = None
+        self._uncached_model = model
+        self._auto_cached_content: Optional["caching.CachedContent"] = None
+        self._cached_history: List["Content"] = []
+        self._cached_token_count = 0
 
     @property
     def history(self) -> List["Content"]:
         return self._history
 
+    def _prepare_request_contents(
+        self, new_messages: List["Content"]
+    ) -> _ChatRequestContents:
+        """Returns the request contents for the uncached history and new messages."""
+        cached_count = len(self._cached_history)
+        if cached_count and (
+            len(self._history) < cached_count
+            or any(
+                message is not cached_message
+                for message, cached_message in zip(self._history, self._cached_history)
+            )
+        ):
+            # The history was modified, so the cached prefix is no longer valid.
+            self._drop_auto_cached_content()
+            cached_count = 0
+        self._history_buffer.sync(self._history[cached_count:])
+        return self._history_buffer.request_contents(new_messages)
+
+    def _maybe_cache_history(self, response: "GenerationResponse") -> None:
+        """Moves the history into a cached content once it grows large enough.
+
+        Args:
+            response: The last response of the chat. Its usage metadata is
+                used as the size of the conversation.
+        """
+        if not self._auto_cache_after_tokens:
+            return
+        total_token_count = response.usage_metadata.total_token_count
+        if total_token_count - self._cached_token_count < self._auto_cache_after_tokens:
+            return
+
+        from vertexai.preview import caching
+
+        model = self._uncached_model
+        try:
+            cached_content = caching.CachedContent.create(
+                model_name=model._model_name,
+                system_instruction=model._system_instruction,
+                tools=model._tools,
+                tool_config=model._tool_config,
+                contents=self._history,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                "Failed to cache the chat history, automatic context caching "
+                f"is disabled for this chat session: {e}"
+            )
+            self._auto_cache_after_tokens = None
+            return
+
+        self._drop_auto_cached_content()
+        self._model = type(model).from_cached_content(
+            cached_content,
+            generation_config=model._generation_config,
+            safety_settings=model._safety_settings,
+        )
+        self._auto_cached_content = cached_content
+        self._cached_history = list(self._history)
+        self._cached_token_count = total_token_count
+
+    def _drop_auto_cached_content(self) -> None:
+        """Deletes the automatically created cached content, if any."""
+        if self._auto_cached_content is None:
+            return
+        try:
+            self._auto_cached_content.delete()
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.warning(f"Failed to delete the cached chat history: {e}")
+        self._model = self._uncached_model
+        self._auto_cached_content = None
+        self._cached_history = []
+        self._cached_token_count = 0
+
     def send_message(
         self,
         content: PartsType,
@@ -1106,7 +1401,7 @@ class ChatSession:
 
         message_responder = (
             self._responder._create_responder_for_message(
-                tools=tools or self._model._tools
+                tools=tools or self._uncached_model._tools
             )
             if self._responder
             else None
@@ -1115,7 +1410,7 @@ class ChatSession:
         while True:
             request_history = self._history + history_delta
             response = self._model._generate_content(
-                contents=request_history,
+                contents=self._prepare_request_contents(history_delta),
                 generation_config=generation_config,
                 safety_settings=safety_settings,
                 tools=tools,
@@ -1146,6 +1441,7 @@ class ChatSession:
                 break
 
         self._history.extend(history_delta)
+        self._maybe_cache_history(response)
         return response
 
     async def _send_message_async(
@@ -1183,7 +1479,7 @@ class ChatSession:
         request_history.append(request_message)
 
         response = await self._model._generate_content_async(
-            contents=request_history,
+            contents=self._prepare_request_contents([request_message]),
             generation_config=generation_config,
             safety_settings=safety_settings,
             tools=tools,
@@ -1202,6 +1498,7 @@ class ChatSession:
         response_message.role = self._MODEL_ROLE
         self._history.append(request_message)
         self._history.append(response_message)
+        self._maybe_cache_history(response)
         return response
 
     def _send_message_streaming(
@@ -1239,7 +1536,7 @@ class ChatSession:
         request_history.append(request_message)
 
         stream = self._model._generate_content_streaming(
-            contents=request_history,
+            contents=self._prepare_request_contents([request_message]),
             generation_config=generation_config,
             safety_settings=safety_settings,
             tools=tools,
@@ -1269,6 +1566,7 @@ class ChatSession:
         response_message.role = self._MODEL_ROLE
         self._history.append(request_message)
         self._history.append(response_message)
+        self._maybe_cache_history(full_response)
 
     async def _send_message_streaming_async(
         self,
@@ -1304,7 +1602,7 @@ class ChatSession:
         request_history.append(request_message)
 
         stream = await self._model._generate_content_streaming_async(
-            contents=request_history,
+            contents=self._prepare_request_contents([request_message]),
             generation_config=generation_config,
             safety_settings=safety_settings,
             tools=tools,
@@ -1335,6 +1633,7 @@ class ChatSession:
             response_message.role = self._MODEL_ROLE
             self._history.append(request_message)
             self._history.append(response_message)
+            self._maybe_cache_history(full_response)
 
         return async_generator()
 
@@ -1352,9 +1651,18 @@ class _PreviewChatSession(ChatSession):
         response_validation: bool = True,
         # Preview features:
         responder: Optional["AutomaticFunctionCallingResponder"] = None,
+        auto_cache_after_tokens: Optional[int] = None,
         # Deprecated
         raise_on_blocked: Optional[bool] = None,
     ):
+        if auto_cache_after_tokens is not None:
+            if auto_cache_after_tokens <= 0:
+                raise ValueError("auto_cache_after_tokens must be positive.")
+            if model._cached_content:
+                raise ValueError(
+                    "auto_cache_after_tokens cannot be used with a model created "
+                    "from cached content."
+                )
         if raise_on_blocked is not None:
             warnings.warn(
                 message="Use `response_validation` instead of `raise_on_blocked`."
@@ -1370,6 +1678,7 @@ class _PreviewChatSession(ChatSession):
             response_validation=response_validation,
         )
         self._responder = responder
+        self._auto_cache_after_tokens = auto_cache_after_tokens
 
 
 class ResponseBlockedError(Exception):
@@ -2658,6 +2967,53 @@ class _PreviewGenerativeModel(_GenerativeModel):
     __name__ = "GenerativeModel"
     __module__ = "vertexai.preview.generative_models"
 
+    def __init__(
+        self,
+        model_name: str,
+        *,
+        generation_config: Optional[GenerationConfigType] = None,
+        safety_settings: Optional[SafetySettingsType] = None,
+        tools: Optional[List["Tool"]] = None,
+        tool_config: Optional["ToolConfig"] = None,
+        system_instruction: Optional[PartsType] = None,
+        # Preview features:
+        response_cache: Optional["_response_cache.ResponseCache"] = None,
+    ):
+        r"""Initializes GenerativeModel.
+
+        Usage:
+            ```
+            model = GenerativeModel("gemini-pro")
+            print(model.generate_content("Hello"))
+            ```
+
+        Args:
+            model_name: Model Garden model resource name.
+                Alternatively, a tuned model endpoint resource name can be provided.
+            generation_config: Default generation config to use in generate_content.
+            safety_settings: Default safety settings to use in generate_content.
+            tools: Default tools to use in generate_content.
+            tool_config: Default tool config to use in generate_content.
+            system_instruction: Default system instruction to use in generate_content.
+                Note: Only text should be used in parts.
+                Content of each part will become a separate paragraph.
+            response_cache: A cache of the model responses, for example an
+                `InMemoryResponseCache` or a `SqliteResponseCache`. Requests
+                that exactly match a cached request are answered from the
+                cache, including streamed requests, which replay the cached
+                chunks. Only use it for requests that are expected to return
+                the same response, for example with a temperature of 0.
+        """
+        super().__init__(
+            model_name=model_name,
+            generation_config=generation_config,
+            safety_settings=safety_settings,
+            tools=tools,
+            tool_config=tool_config,
+            system_instruction=system_instruction,
+        )
+        self._response_cache = response_cache
+
     def start_chat(
         self,
         *,
@@ -2665,6 +3021,7 @@ class _PreviewGenerativeModel(_GenerativeModel):
         response_validation: bool = True,
         # Preview features:
         responder: Optional["AutomaticFunctionCallingResponder"] = None,
+        auto_cache_after_tokens: Optional[int] = None,
     ) -> "ChatSession":
         """Creates a stateful chat session.
 
@@ -2681,6 +3038,15 @@ class _PreviewGenerativeModel(_GenerativeModel):
             responder: An responder object that can automatically respond to
                 some model messages. Supported responder classes:
                 `AutomaticFunctionCallingResponder`.
+            auto_cache_after_tokens: When set, once the conversation grows by
+                this many tokens since it was last cached, the chat history is
+                moved into a `CachedContent` and the chat continues with a
+                model created from it. Only the messages after the cached
+                prefix are sent with each request. The cached content is
+                replaced each time the threshold is reached again and deleted
+                if the history is modified. Per-message `tools` cannot be used
+                once the history is cached. Note that the service requires a
+                minimum number of tokens for cached content.
 
         Returns:
             A ChatSession object.
@@ -2690,6 +3056,7 @@ class _PreviewGenerativeModel(_GenerativeModel):
             history=history,
             response_validation=response_validation,
             responder=responder,
+            auto_cache_after_tokens=auto_cache_after_tokens,
         )
 
     @classmethod
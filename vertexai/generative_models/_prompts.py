@@ -39,12 +39,15 @@ from vertexai.generative_models._generative_models import (
     SafetySettingsType,
 )
 
+import collections
 import re
 from typing import (
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
+    NamedTuple,
     Optional,
     Union,
 )
@@ -54,6 +57,26 @@ _LOGGER = base.Logger(__name__)
 VARIABLE_NAME_REGEX = r"(\{[^\W0-9]\w*\})"
 
 
+class _TemplateVariable(NamedTuple):
+    """A variable placeholder in a compiled prompt template."""
+
+    name: str
+
+
+# A compiled prompt template is a list of literal text, variable placeholders
+# and non-text parts, in prompt order.
+_TemplateSegment = Union[str, _TemplateVariable, Part]
+
+
+def _get_part_text(part: Part) -> Optional[str]:
+    """Returns the text of a text Part or None for other parts."""
+    try:
+        text = part.text
+    except AttributeError:
+        return None
+    return text if isinstance(text, str) else None
+
+
 class Prompt:
     """A prompt which may be a template with variables.
 
@@ -150,6 +173,8 @@ class Prompt:
             tool_config: A ToolConfig object for function calling.
         """
         self._prompt_data = None
+        self._segments: List[_TemplateSegment] = []
+        self._template_variable_counts: Dict[str, int] = {}
         self._variables = None
         self._model_name = None
         self._generation_config = None
@@ -208,6 +233,7 @@ class Prompt:
         """
         self._validate_parts_type_data(prompt_data)
         self._prompt_data = prompt_data
+        self._compile_prompt_data()
 
     @variables.setter
     def variables(self, variables: List[Dict[str, PartsType]]) -> None:
@@ -353,6 +379,110 @@ class Prompt:
         # Rely on type checks in _to_content.
         _to_content(value=data)
 
+    def _compile_prompt_data(self) -> None:
+        """Compiles prompt_data into template segments.
+
+        The template is split into literal text, variable placeholders and
+        non-text parts once, so assembling a prompt does not need to parse the
+        template again.
+        """
+        # prompt_data must have been previously validated using _validate_parts_type_data.
+        prompt_data_parts = (
+            self._prompt_data
+            if isinstance(self._prompt_data, list)
+            else [self._prompt_data]
+        )
+        segments: List[_TemplateSegment] = []
+        template_variable_counts = collections.Counter()
+        for prompt_data_part in prompt_data_parts:
+            if isinstance(prompt_data_part, Image):
+                # Templating is not supported for Image prompt_data.
+                segments.append(Part.from_image(prompt_data_part))
+                continue
+            if isinstance(prompt_data_part, Part):
+                text = _get_part_text(prompt_data_part)
+                if text is None:
+                    segments.append(prompt_data_part)
+                    continue
+            else:
+                text = prompt_data_part
+            # Odd items of the split are the variable placeholders.
+            for i, piece in enumerate(re.split(VARIABLE_NAME_REGEX, text)):
+                if i % 2:
+                    variable_name = piece[1:-1]
+                    segments.append(_TemplateVariable(variable_name))
+                    template_variable_counts[variable_name] += 1
+                elif piece:
+                    segments.append(piece)
+
+        self._segments = segments
+        self._template_variable_counts = dict(template_variable_counts)
+
+    @staticmethod
+    def _format_variable_value(value: PartsType) -> Union[str, List[Part]]:
+        """Formats a variable value as a string or a List[Part].
+
+        Raises:
+            TypeError: If the value is empty or not a PartsType Object.
+        """
+        if isinstance(value, str) and value:
+            return value
+        # Disallow Content as variable value.
+        if isinstance(value, Content):
+            raise TypeError("Variable values must be a PartsType object, not Content")
+        # Rely on type checks in _to_content for validation.
+        return Content._from_gapic(_to_content(value=value)).parts
+
+    def _assemble_parts(self, variables_dict: Dict[str, PartsType]) -> List[Part]:
+        """Assembles the compiled template with the variables.
+
+        Adjacent text, from both the template and the variable values, is
+        merged into a single text Part.
+
+        Raises:
+            TypeError: If a variable value is not a PartsType Object.
+            ValueError: If a variable is not present in prompt_data.
+        """
+        formatted_variables = {
+            key: Prompt._format_variable_value(value)
+            for key, value in variables_dict.items()
+        }
+        for key in formatted_variables:
+            if key not in self._template_variable_counts:
+                raise ValueError(f"Variable {key} is not present in prompt_data.")
+
+        assembled_parts: List[Part] = []
+        pending_text: List[str] = []
+
+        def flush_pending_text():
+            if pending_text:
+                assembled_parts.append(Part.from_text("".join(pending_text)))
+                pending_text.clear()
+
+        for segment in self._segments:
+            if isinstance(segment, str):
+                pending_text.append(segment)
+            elif isinstance(segment, _TemplateVariable):
+                value = formatted_variables.get(segment.name)
+                if value is None:
+                    # Unassembled variables are kept as is.
+                    pending_text.append(f"{{{segment.name}}}")
+                elif isinstance(value, str):
+                    pending_text.append(value)
+                else:
+                    for part in value:
+                        text = _get_part_text(part)
+                        if text is None:
+                            flush_pending_text()
+                            assembled_parts.append(part)
+                        else:
+                            pending_text.append(text)
+            else:
+                flush_pending_text()
+                assembled_parts.append(segment)
+        flush_pending_text()
+        return assembled_parts
+
     def assemble_contents(self, **variables_dict: PartsType) -> List[Content]:
         """Returns the prompt data, as a List[Content], assembled with variables if applicable.
         Can be ingested into model.generate_content to make API calls.
@@ -370,127 +500,88 @@ class Prompt:
             )
             ```
         """
-        variables_dict = variables_dict.copy()
-
         # If there are no variables, return the prompt_data as a Content object.
         if not variables_dict:
             return [Content._from_gapic(_to_content(value=self.prompt_data))]
 
-        # Step 1) Convert the variables values to List[Part].
-        Prompt._format_variable_value_to_parts(variables_dict)
-
-        # Step 2) Assemble the prompt.
-        # prompt_data must have been previously validated using _validate_parts_type_data.
-        assembled_prompt = []
-        assembled_variables_cnt = {}
-        if isinstance(self.prompt_data, list):
-            # User inputted a List of Parts as prompt_data.
-            for part in self.prompt_data:
-                assembled_prompt.extend(
-                    self._assemble_singular_part(
-                        part, variables_dict, assembled_variables_cnt
-                    )
-                )
-        else:
-            # User inputted a single str, Image, or Part as prompt_data.
-            assembled_prompt.extend(
-                self._assemble_singular_part(
-                    self.prompt_data, variables_dict, assembled_variables_cnt
-                )
-            )
-
-        # Step 3) Simplify adjacent string Parts
-        simplified_assembled_prompt = [assembled_prompt[0]]
-        for i in range(1, len(assembled_prompt)):
-            # If the previous Part and current Part is a string, concatenate them.
-            try:
-                prev_text = simplified_assembled_prompt[-1].text
-                curr_text = assembled_prompt[i].text
-                if isinstance(prev_text, str) and isinstance(curr_text, str):
-                    simplified_assembled_prompt[-1] = Part.from_text(
-                        prev_text + curr_text
-                    )
-                else:
-                    simplified_assembled_prompt.append(assembled_prompt[i])
-            except AttributeError:
-                simplified_assembled_prompt.append(assembled_prompt[i])
-                continue
+        assembled_parts = self._assemble_parts(variables_dict)
 
-        # Step 4) Validate that all variables were used, if specified.
-        for key in variables_dict:
-            if key not in assembled_variables_cnt:
-                raise ValueError(f"Variable {key} is not present in prompt_data.")
-
-        assemble_cnt_msg = "Assembled prompt replacing: "
-        for key in assembled_variables_cnt:
-            assemble_cnt_msg += (
-                f"{assembled_variables_cnt[key]} instances of variable {key}, "
-            )
-        if assemble_cnt_msg[-2:] == ", ":
-            assemble_cnt_msg = assemble_cnt_msg[:-2]
+        assemble_cnt_msg = "Assembled prompt replacing: " + ", ".join(
+            f"{count} instances of variable {key}"
+            for key, count in self._template_variable_counts.items()
+            if key in variables_dict
+        )
         _LOGGER.info(assemble_cnt_msg)
 
-        # Step 5) Wrap List[Part] as a single Content object.
+        # Wrap List[Part] as a single Content object.
         return [
             Content(
-                parts=simplified_assembled_prompt,
+                parts=assembled_parts,
                 role="user",
             )
         ]
 
-    def _assemble_singular_part(
-        self,
-        prompt_data_part: Union[str, Image, Part],
-        formatted_variables_set: Dict[str, List[Part]],
-        assembled_variables_cnt: Dict[str, int],
-    ) -> List[Part]:
-        """Assemble a str, Image, or Part."""
-        if isinstance(prompt_data_part, Image):
-            # Templating is not supported for Image prompt_data.
-            return [Part.from_image(prompt_data_part)]
-        elif isinstance(prompt_data_part, str):
-            # Assemble a single string
-            return self._assemble_single_str(
-                prompt_data_part, formatted_variables_set, assembled_variables_cnt
-            )
-        elif isinstance(prompt_data_part, Part):
-            # If the Part is a text Part, assemble it.
-            try:
-                text = prompt_data_part.text
-            except AttributeError:
-                return [prompt_data_part]
-            return self._assemble_single_str(
-                text, formatted_variables_set, assembled_variables_cnt
-            )
+    def iter_assembled_contents(
+        self, variables_list: Iterable[Dict[str, PartsType]]
+    ) -> Iterator[List[Content]]:
+        """Assembles the prompt for each set of variables, one at a time.
 
-    def _assemble_single_str(
-        self,
-        prompt_data_str: str,
-        formatted_variables_set: Dict[str, List[Part]],
-        assembled_variables_cnt: Dict[str, int],
-    ) -> List[Part]:
-        """Assemble a single string with 0 or more variables within the string."""
-        # Step 1) Find and isolate variables as their own string.
-        prompt_data_str_split = re.split(VARIABLE_NAME_REGEX, prompt_data_str)
-
-        assembled_data = []
-        # Step 2) Assemble variables with their values, creating a list of Parts.
-        for s in prompt_data_str_split:
-            if not s:
-                continue
-            variable_name = s[1:-1]
-            if (
-                re.match(VARIABLE_NAME_REGEX, s)
-                and variable_name in formatted_variables_set
+        Unlike `assemble_contents`, no message is logged per assembled prompt,
+        which makes this suitable for assembling a large number of prompts.
+
+        Args:
+            variables_list: An iterable of dictionaries containing the variable
+                names and values.
+
+        Yields:
+            A List[Content] prompt for each set of variables.
+
+        Usage:
+            ```
+            prompt = Prompt(prompt_data="Rate the movie {movie}")
+
+            for contents in prompt.iter_assembled_contents(
+                {"movie": movie} for movie in movies
             ):
-                assembled_data.extend(formatted_variables_set[variable_name])
-                assembled_variables_cnt[variable_name] = (
-                    assembled_variables_cnt.get(variable_name, 0) + 1
-                )
+                model.generate_content(contents=contents)
+            ```
+        """
+        for variables_dict in variables_list:
+            if not variables_dict:
+                yield [Content._from_gapic(_to_content(value=self.prompt_data))]
             else:
-                assembled_data.append(Part.from_text(s))
+                yield [
+                    Content(
+                        parts=self._assemble_parts(variables_dict),
+                        role="user",
+                    )
+                ]
+
+    def assemble_contents_batch(
+        self, variables_list: Iterable[Dict[str, PartsType]]
+    ) -> List[List[Content]]:
+        """Assembles the prompt for each set of variables.
+
+        Args:
+            variables_list: An iterable of dictionaries containing the variable
+                names and values.
 
-        return assembled_data
+        Returns:
+            A List[Content] prompt for each set of variables, in order.
+
+        Usage:
+            ```
+            prompt = Prompt(
+                prompt_data="Hello, {name}! Today is {day}.",
+                variables=[
+                    {"name": "Alice", "day": "Monday"},
+                    {"name": "Bob", "day": "Tuesday"},
+                ],
+            )
+            contents_list = prompt.assemble_contents_batch(prompt.variables)
+            ```
+        """
+        return list(self.iter_assembled_contents(variables_list))
 
     def generate_content(
         self,
@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Exact-match response caches for generate_content."""
+
+import abc
+import collections
+import datetime
+import hashlib
+import sqlite3
+import struct
+import threading
+import time
+from typing import List, Optional, Tuple, Union
+
+from google.cloud.aiplatform_v1beta1.types import (
+    prediction_service as gapic_prediction_service_types,
+)
+
+_DEFAULT_MAX_ENTRIES = 1024
+
+
+def _pack_responses(responses: List[bytes]) -> bytes:
+    """Joins serialized responses into a single length-prefixed blob."""
+    return b"".join(
+        struct.pack(">I", len(response)) + response for response in responses
+    )
+
+
+def _unpack_responses(blob: bytes) -> List[bytes]:
+    """Splits a blob created by `_pack_responses`."""
+    responses = []
+    offset = 0
+    while offset < len(blob):
+        (length,) = struct.unpack_from(">I", blob, offset)
+        offset += 4
+        responses.append(blob[offset : offset + length])
+        offset += length
+    return responses
+
+
+def _ttl_seconds(ttl: Optional[Union[float, datetime.timedelta]]) -> Optional[float]:
+    if isinstance(ttl, datetime.timedelta):
+        return ttl.total_seconds()
+    return ttl
+
+
+class ResponseCache(abc.ABC):
+    """Base class of the response caches used by GenerativeModel.
+
+    A response cache maps a `GenerateContentRequest` to the responses the
+    model returned for it. Requests are matched exactly: the key is a hash of
+    the deterministically serialized request, so any difference in the model,
+    contents, tools or configs results in a cache miss.
+
+    Caching is only useful for requests whose responses are expected to be
+    the same, for example when using a temperature of 0.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        ttl: Optional[Union[float, datetime.timedelta]] = None,
+    ):
+        """Initializes the cache.
+
+        Args:
+            max_entries: The maximum number of cached requests. The least
+                recently used entries are evicted first.
+            ttl: How long an entry stays valid, either as a timedelta or in
+                seconds. Entries never expire if not set.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive.")
+        self._max_entries = max_entries
+        self._ttl = _ttl_seconds(ttl)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups that found a cached response."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups that did not find a cached response."""
+        return self._misses
+
+    @staticmethod
+    def _make_key(
+        request: gapic_prediction_service_types.GenerateContentRequest,
+        stream: bool,
+    ) -> str:
+        request_bytes = gapic_prediction_service_types.GenerateContentRequest.pb(
+            request
+        ).SerializeToString(deterministic=True)
+        kind = b"stream" if stream else b"unary"
+        return hashlib.sha256(kind + b":" + request_bytes).hexdigest()
+
+    def get(
+        self,
+        request: gapic_prediction_service_types.GenerateContentRequest,
+        *,
+        stream: bool = False,
+    ) -> Optional[List[gapic_prediction_service_types.GenerateContentResponse]]:
+        """Returns the cached responses for a request.
+
+        Args:
+            request: The request sent to the model.
+            stream: Whether the responses are the chunks of a streamed response.
+
+        Returns:
+            The cached responses or None if the request is not cached.
+        """
+        serialized_responses = self._get(self._make_key(request, stream))
+        with self._lock:
+            if serialized_responses is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return [
+            gapic_prediction_service_types.GenerateContentResponse.deserialize(
+                serialized_response
+            )
+            for serialized_response in serialized_responses
+        ]
+
+    def put(
+        self,
+        request: gapic_prediction_service_types.GenerateContentRequest,
+        responses: List[gapic_prediction_service_types.GenerateContentResponse],
+        *,
+        stream: bool = False,
+    ) -> None:
+        """Caches the responses for a request.
+
+        Args:
+            request: The request sent to the model.
+            responses: The responses returned by the model.
+            stream: Whether the responses are the chunks of a streamed response.
+        """
+        expire_time = time.time() + self._ttl if self._ttl is not None else None
+        self._put(
+            self._make_key(request, stream),
+            [
+                gapic_prediction_service_types.GenerateContentResponse.serialize(
+                    response
+                )
+                for response in responses
+            ],
+            expire_time,
+        )
+
+    @abc.abstractmethod
+    def _get(self, key: str) -> Optional[List[bytes]]:
+        """Returns the serialized responses stored under the key."""
+
+    @abc.abstractmethod
+    def _put(
+        self, key: str, responses: List[bytes], expire_time: Optional[float]
+    ) -> None:
+        """Stores the serialized responses under the key."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Removes all cached responses."""
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """Returns the number of cached requests."""
+
+
+class InMemoryResponseCache(ResponseCache):
+    """A least recently used response cache kept in memory.
+
+    Usage:
+        ```
+        model = GenerativeModel(
+            "gemini-pro",
+            response_cache=InMemoryResponseCache(max_entries=100),
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        ttl: Optional[Union[float, datetime.timedelta]] = None,
+    ):
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self._entries: "collections.OrderedDict[str, Tuple[List[bytes], Optional[float]]]" = (
+            collections.OrderedDict()
+        )
+
+    def _get(self, key: str) -> Optional[List[bytes]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            responses, expire_time = entry
+            if expire_time is not None and expire_time <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return responses
+
+    def _put(
+        self, key: str, responses: List[bytes], expire_time: Optional[float]
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (responses, expire_time)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SqliteResponseCache(ResponseCache):
+    """A least recently used response cache stored in a SQLite database.
+
+    The cache can be shared between processes and persists across runs.
+
+    Usage:
+        ```
+        model = GenerativeModel(
+            "gemini-pro",
+            response_cache=SqliteResponseCache("responses.db"),
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        ttl: Optional[Union[float, datetime.timedelta]] = None,
+    ):
+        """Initializes the cache.
+
+        Args:
+            path: The path of the SQLite database file. It is created if it
+                does not exist.
+            max_entries: The maximum number of cached requests. The least
+                recently used entries are evicted first.
+            ttl: How long an entry stays valid, either as a timedelta or in
+                seconds. Entries never expire if not set.
+        """
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self._path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "responses BLOB NOT NULL, "
+                "expire_time REAL, "
+                "access_time REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_access_time "
+                "ON responses (access_time)"
+            )
+
+    def _get(self, key: str) -> Optional[List[bytes]]:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT responses, expire_time FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            responses, expire_time = row
+            if expire_time is not None and expire_time <= now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE responses SET access_time = ? WHERE key = ?", (now, key)
+            )
+        return _unpack_responses(responses)
+
+    def _put(
+        self, key: str, responses: List[bytes], expire_time: Optional[float]
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, _pack_responses(responses), expire_time, time.time()),
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY access_time DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -23,6 +23,7 @@ from vertexai.language_models._language_models import (
     CodeGenerationModel,
     InputOutputTextPair,
     TextEmbedding,
+    TextEmbeddingBatch,
     TextEmbeddingInput,
     TextEmbeddingModel,
     TextGenerationModel,
@@ -39,6 +40,7 @@ __all__ = [
     "CodeGenerationModel",
     "InputOutputTextPair",
     "TextEmbedding",
+    "TextEmbeddingBatch",
     "TextEmbeddingInput",
     "TextEmbeddingModel",
     "TextGenerationModel",
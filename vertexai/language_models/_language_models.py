@@ -15,12 +15,16 @@
 """Classes for working with language models."""
 
 import abc
+import asyncio
+import concurrent.futures
 import dataclasses
 import collections.abc
 from typing import (
     Any,
     AsyncIterator,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Literal,
@@ -48,6 +52,11 @@ try:
 except ImportError:
     pandas = None
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 _LOGGER = base.Logger(__name__)
 
@@ -2070,6 +2079,11 @@ class _ChatSession:
         return response_obj
 
 
+# Per-request limits of the text embedding models.
+_TEXT_EMBEDDING_MAX_INSTANCES_PER_REQUEST = 250
+_TEXT_EMBEDDING_MAX_TOKENS_PER_REQUEST = 20000
+
+
 @dataclasses.dataclass
 class TextEmbeddingInput:
     """Structural text embedding input.
@@ -2233,6 +2247,233 @@ class _TextEmbeddingModel(_LanguageModel):
             for i_prediction, _ in enumerate(prediction_response.predictions)
         ]
 
+    def get_embeddings_batched(
+        self,
+        texts: Iterable[Union[str, TextEmbeddingInput]],
+        *,
+        batch_size: int = _TEXT_EMBEDDING_MAX_INSTANCES_PER_REQUEST,
+        max_tokens_per_request: int = _TEXT_EMBEDDING_MAX_TOKENS_PER_REQUEST,
+        max_concurrency: int = 8,
+        token_counter: Optional[Callable[[str], int]] = None,
+        auto_truncate: bool = True,
+        output_dimensionality: Optional[int] = None,
+        as_numpy: bool = True,
+    ) -> Union["TextEmbeddingBatch", List["TextEmbedding"]]:
+        """Calculates embeddings for an arbitrarily large number of texts.
+
+        The texts are split into requests that respect both the per-request
+        instance limit and the per-request token budget, and the requests are
+        sent concurrently.
+
+        Example::
+
+            model = TextEmbeddingModel.from_pretrained("text-embedding-004")
+            batch = model.get_embeddings_batched(documents, max_concurrency=16)
+            print(batch.values.shape)
+
+        Args:
+            texts: An iterable of texts or `TextEmbeddingInput` objects to embed.
+            batch_size: Maximum number of texts sent in a single request.
+            max_tokens_per_request: Maximum estimated number of tokens sent in a
+                single request.
+            max_concurrency: Maximum number of requests in flight at a time.
+            token_counter: Optional callable returning the number of tokens in
+                a text. Defaults to a conservative character-based estimate.
+            auto_truncate: Whether to automatically truncate long texts. Default: True.
+            output_dimensionality: Optional dimensions of embeddings. Range: [1, 768]. Default: None.
+            as_numpy: Whether to return a `TextEmbeddingBatch` backed by numpy
+                arrays instead of a list of `TextEmbedding` objects. Default: True.
+
+        Returns:
+            A `TextEmbeddingBatch` if `as_numpy` is True, otherwise a list of
+            `TextEmbedding` objects. Rows are in the same order as `texts`.
+        """
+        if as_numpy and numpy is None:
+            raise ImportError(
+                "numpy is not installed. Please install numpy or set `as_numpy=False`."
+            )
+        batches = _split_text_embedding_inputs(
+            texts,
+            batch_size=batch_size,
+            max_tokens_per_request=max_tokens_per_request,
+            token_counter=token_counter,
+        )
+
+        def _predict(batch):
+            prediction_request = self._prepare_text_embedding_request(
+                texts=batch,
+                auto_truncate=auto_truncate,
+                output_dimensionality=output_dimensionality,
+            )
+            return self._endpoint.predict(
+                instances=prediction_request.instances,
+                parameters=prediction_request.parameters,
+            )
+
+        prediction_responses = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrency
+        ) as executor:
+            pending = collections.deque()
+            for batch in batches:
+                if len(pending) >= max_concurrency:
+                    prediction_responses.append(pending.popleft().result())
+                pending.append(executor.submit(_predict, batch))
+            while pending:
+                prediction_responses.append(pending.popleft().result())
+
+        return _build_text_embedding_results(prediction_responses, as_numpy=as_numpy)
+
+    async def get_embeddings_batched_async(
+        self,
+        texts: Iterable[Union[str, TextEmbeddingInput]],
+        *,
+        batch_size: int = _TEXT_EMBEDDING_MAX_INSTANCES_PER_REQUEST,
+        max_tokens_per_request: int = _TEXT_EMBEDDING_MAX_TOKENS_PER_REQUEST,
+        max_concurrency: int = 8,
+        token_counter: Optional[Callable[[str], int]] = None,
+        auto_truncate: bool = True,
+        output_dimensionality: Optional[int] = None,
+        as_numpy: bool = True,
+    ) -> Union["TextEmbeddingBatch", List["TextEmbedding"]]:
+        """Asynchronously calculates embeddings for an arbitrarily large number of texts.
+
+        Args:
+            texts: An iterable of texts or `TextEmbeddingInput` objects to embed.
+            batch_size: Maximum number of texts sent in a single request.
+            max_tokens_per_request: Maximum estimated number of tokens sent in a
+                single request.
+            max_concurrency: Maximum number of requests in flight at a time.
+            token_counter: Optional callable returning the number of tokens in
+                a text. Defaults to a conservative character-based estimate.
+            auto_truncate: Whether to automatically truncate long texts. Default: True.
+            output_dimensionality: Optional dimensions of embeddings. Range: [1, 768]. Default: None.
+            as_numpy: Whether to return a `TextEmbeddingBatch` backed by numpy
+                arrays instead of a list of `TextEmbedding` objects. Default: True.
+
+        Returns:
+            A `TextEmbeddingBatch` if `as_numpy` is True, otherwise a list of
+            `TextEmbedding` objects. Rows are in the same order as `texts`.
+        """
+        if as_numpy and numpy is None:
+            raise ImportError(
+                "numpy is not installed. Please install numpy or set `as_numpy=False`."
+            )
+        batches = _split_text_embedding_inputs(
+            texts,
+            batch_size=batch_size,
+            max_tokens_per_request=max_tokens_per_request,
+            token_counter=token_counter,
+        )
+
+        async def _predict(batch):
+            prediction_request = self._prepare_text_embedding_request(
+                texts=batch,
+                auto_truncate=auto_truncate,
+                output_dimensionality=output_dimensionality,
+            )
+            return await self._endpoint.predict_async(
+                instances=prediction_request.instances,
+                parameters=prediction_request.parameters,
+            )
+
+        prediction_responses = []
+        pending = collections.deque()
+        try:
+            for batch in batches:
+                if len(pending) >= max_concurrency:
+                    prediction_responses.append(await pending.popleft())
+                pending.append(asyncio.ensure_future(_predict(batch)))
+            while pending:
+                prediction_responses.append(await pending.popleft())
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return _build_text_embedding_results(prediction_responses, as_numpy=as_numpy)
+
+
+def _estimate_token_count(text: str) -> int:
+    """Conservatively estimates the number of tokens in a text."""
+    # Typical tokenizers average about four characters per token for English
+    # text; two characters per token leaves headroom for other languages.
+    return len(text) // 2 + 1
+
+
+def _split_text_embedding_inputs(
+    texts: Iterable[Union[str, TextEmbeddingInput]],
+    *,
+    batch_size: int,
+    max_tokens_per_request: int,
+    token_counter: Optional[Callable[[str], int]] = None,
+) -> Iterator[List[Union[str, TextEmbeddingInput]]]:
+    """Splits texts into batches that fit the per-request limits.
+
+    A single text that exceeds the token budget on its own is sent in a
+    request by itself and is subject to `auto_truncate`.
+    """
+    if isinstance(texts, str):
+        raise TypeError(
+            "The `texts` argument must be an iterable, not a single string."
+        )
+    if batch_size < 1:
+        raise ValueError("`batch_size` must be a positive integer.")
+    token_counter = token_counter or _estimate_token_count
+
+    batch = []
+    batch_tokens = 0
+    for text in texts:
+        content = text.text if isinstance(text, TextEmbeddingInput) else text
+        num_tokens = token_counter(content)
+        if batch and (
+            len(batch) >= batch_size
+            or batch_tokens + num_tokens > max_tokens_per_request
+        ):
+            yield batch
+            batch = []
+            batch_tokens = 0
+        batch.append(text)
+        batch_tokens += num_tokens
+    if batch:
+        yield batch
+
+
+def _build_text_embedding_results(
+    prediction_responses: List[aiplatform.models.Prediction],
+    as_numpy: bool,
+) -> Union["TextEmbeddingBatch", List["TextEmbedding"]]:
+    """Combines the responses of batched embedding requests."""
+    if not as_numpy:
+        return [
+            TextEmbedding._parse_text_embedding_response(
+                prediction_response, i_prediction
+            )
+            for prediction_response in prediction_responses
+            for i_prediction, _ in enumerate(prediction_response.predictions)
+        ]
+
+    values = []
+    token_counts = []
+    truncated = []
+    for prediction_response in prediction_responses:
+        for prediction in prediction_response.predictions:
+            if isinstance(prediction, collections.abc.Mapping):
+                embeddings = prediction["embeddings"]
+                embedding_stats = embeddings["statistics"]
+                values.append(embeddings["values"])
+                token_counts.append(embedding_stats["token_count"])
+                truncated.append(embedding_stats["truncated"])
+            else:
+                values.append(prediction)
+                token_counts.append(0)
+                truncated.append(False)
+
+    return TextEmbeddingBatch(
+        values=numpy.array(values, dtype=numpy.float32),
+        token_counts=numpy.array(token_counts, dtype=numpy.int32),
+        truncated=numpy.array(truncated, dtype=bool),
+    )
+
 
 # TODO(b/625884109): Support Union[str, "pandas.core.frame.DataFrame"]
 # for corpus, queries, test and validation data.
@@ -2488,6 +2729,27 @@ class TextEmbedding:
             return cls(values=prediction, _prediction_response=prediction_response)
 
 
+@dataclasses.dataclass
+class TextEmbeddingBatch:
+    """Text embeddings for many texts stored as numpy arrays.
+
+    Attributes:
+        values: A `float32` matrix with one embedding per row.
+        token_counts: The number of tokens in each input text. Zero when the
+            model does not report statistics.
+        truncated: Whether each input text was truncated.
+    """
+
+    __module__ = "vertexai.language_models"
+
+    values: "numpy.ndarray"
+    token_counts: "numpy.ndarray"
+    truncated: "numpy.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
 @dataclasses.dataclass
 class InputOutputTextPair:
     """InputOutputTextPair represents a pair of input and output texts."""
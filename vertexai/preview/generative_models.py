@@ -38,6 +38,11 @@ from vertexai.generative_models._generative_models import (
     Tool,
     ToolConfig,
 )
+from vertexai.generative_models._response_cache import (
+    InMemoryResponseCache,
+    ResponseCache,
+    SqliteResponseCache,
+)
 
 
 class GenerativeModel(_PreviewGenerativeModel):
@@ -63,10 +68,13 @@ __all__ = [
     "HarmCategory",
     "HarmBlockThreshold",
     "Image",
+    "InMemoryResponseCache",
     "Part",
     "ResponseBlockedError",
+    "ResponseCache",
     "ResponseValidationError",
     "SafetySetting",
+    "SqliteResponseCache",
     "Tool",
     "ToolConfig",
 ]
@@ -26,6 +26,7 @@ from vertexai.language_models._language_models import (
     CountTokensResponse,
     InputOutputTextPair,
     TextEmbedding,
+    TextEmbeddingBatch,
     TextEmbeddingInput,
     TextGenerationResponse,
     TuningEvaluationSpec,
@@ -65,6 +66,7 @@ __all__ = [
     "EvaluationTextClassificationSpec",
     "InputOutputTextPair",
     "TextEmbedding",
+    "TextEmbeddingBatch",
     "TextEmbeddingInput",
     "TextEmbeddingModel",
     "TextGenerationModel",
@@ -21,6 +21,7 @@ from vertexai.preview.rag.rag_data import (
     get_corpus,
     delete_corpus,
     upload_file,
+    upload_files,
     import_files,
     import_files_async,
     get_file,
@@ -45,6 +46,7 @@ from vertexai.preview.rag.utils.resources import (
     RagResource,
     SlackChannel,
     SlackChannelsSource,
+    UploadRagFilesResponse,
 )
 
 
@@ -54,6 +56,7 @@ __all__ = (
     "get_corpus",
     "delete_corpus",
     "upload_file",
+    "upload_files",
     "import_files",
     "import_files_async",
     "get_file",
@@ -70,4 +73,5 @@ __all__ = (
     "JiraQuery",
     "SlackChannel",
     "SlackChannelsSource",
+    "UploadRagFilesResponse",
 )
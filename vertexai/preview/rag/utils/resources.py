@@ -16,7 +16,7 @@
 #
 
 import dataclasses
-from typing import List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from google.protobuf import timestamp_pb2
 
@@ -37,6 +37,44 @@ class RagFile:
     description: Optional[str] = None
 
 
+@dataclasses.dataclass
+class UploadRagFilesResponse:
+    """The result of uploading a batch of local files (output only).
+
+    Attributes:
+        rag_files: The uploaded RagFiles, keyed by local file path. Files that
+            were uploaded by a previous, interrupted run recorded in the
+            manifest are included.
+        failed_files: The error message of each file that failed to upload,
+            keyed by local file path.
+        skipped_file_count: The number of files that were skipped because
+            the manifest shows they were already uploaded.
+        uploaded_bytes: The number of file bytes uploaded by this run.
+        elapsed_seconds: The wall time taken by this run, in seconds.
+    """
+
+    rag_files: Dict[str, RagFile] = dataclasses.field(default_factory=dict)
+    failed_files: Dict[str, str] = dataclasses.field(default_factory=dict)
+    skipped_file_count: int = 0
+    uploaded_bytes: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        """The number of files uploaded per second by this run."""
+        uploaded_file_count = len(self.rag_files) - self.skipped_file_count
+        if not self.elapsed_seconds:
+            return 0.0
+        return uploaded_file_count / self.elapsed_seconds
+
+    @property
+    def bytes_per_second(self) -> float:
+        """The number of file bytes uploaded per second by this run."""
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.uploaded_bytes / self.elapsed_seconds
+
+
 @dataclasses.dataclass
 class EmbeddingModelConfig:
     """EmbeddingModelConfig.
@@ -430,7 +430,7 @@ class ReasoningEngine(base.VertexAiResourceNounWithFutureManager, Queryable):
         response = self.execution_api_client.query_reasoning_engine(
             request=types.QueryReasoningEngineRequest(
                 name=self.resource_name,
-                input=kwargs,
+                input=_utils.dict_to_struct(kwargs),
             ),
         )
         output = _utils.to_dict(response)
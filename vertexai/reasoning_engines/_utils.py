@@ -24,6 +24,7 @@ import proto
 from google.cloud.aiplatform import base
 from google.protobuf import struct_pb2
 from google.protobuf import json_format
+from google.protobuf import message as message_pb2
 
 try:
     # For LangChain templates, they might not import langchain_core and get
@@ -39,10 +40,72 @@ JsonDict = Dict[str, Any]
 
 _LOGGER = base.Logger(__name__)
 
+_STRUCT_TYPES = (
+    struct_pb2.Struct.DESCRIPTOR,
+    struct_pb2.Value.DESCRIPTOR,
+)
+
+
+def struct_to_dict(struct: struct_pb2.Struct) -> JsonDict:
+    """Converts a Struct message into a dictionary.
+
+    Unlike `to_dict`, this reads the message directly instead of going through
+    a JSON string.
+
+    Args:
+        struct (struct_pb2.Struct):
+            Required. The Struct message to be converted.
+
+    Returns:
+        dict[str, Any]: A dictionary containing the contents of the Struct.
+    """
+    return {key: value_to_python(value) for key, value in struct.fields.items()}
+
+
+def value_to_python(value: struct_pb2.Value) -> Any:
+    """Converts a Value message into the corresponding Python object.
+
+    Args:
+        value (struct_pb2.Value):
+            Required. The Value message to be converted.
+
+    Returns:
+        Any: None, a bool, float, str, list or dict.
+    """
+    kind = value.WhichOneof("kind")
+    if kind == "struct_value":
+        return struct_to_dict(value.struct_value)
+    if kind == "list_value":
+        return [value_to_python(item) for item in value.list_value.values]
+    if kind is None or kind == "null_value":
+        return None
+    return getattr(value, kind)
+
+
+def dict_to_struct(obj: Mapping[str, Any]) -> struct_pb2.Struct:
+    """Converts a JSON-like dictionary into a Struct message.
+
+    Args:
+        obj (Mapping[str, Any]):
+            Required. The dictionary to be converted.
+
+    Returns:
+        struct_pb2.Struct: A Struct containing the contents of the dictionary.
+    """
+    struct = struct_pb2.Struct()
+    struct.update(obj)
+    return struct
+
+
+def _to_python(value: Union[struct_pb2.Struct, struct_pb2.Value]) -> Any:
+    if isinstance(value, struct_pb2.Struct):
+        return struct_to_dict(value)
+    return value_to_python(value)
+
 
 def to_proto(
     obj: Union[JsonDict, proto.Message],
-    message: proto.Message = struct_pb2.Struct(),
+    message: Optional[proto.Message] = None,
 ) -> proto.Message:
     """Parses a JSON-like object into a message.
 
@@ -55,13 +118,18 @@ def to_proto(
             Required. The object to convert to a proto message.
         message (proto.Message):
             Optional. A protocol buffer message to merge the obj into. It
-            defaults to Struct() if unspecified.
+            defaults to a new Struct() if unspecified.
 
     Returns:
         proto.Message: The same message passed as argument.
     """
     if isinstance(obj, proto.Message):
         return obj
+    if message is None:
+        return dict_to_struct(obj)
+    if isinstance(message, struct_pb2.Struct):
+        message.update(obj)
+        return message
     try:
         json_format.ParseDict(obj, message._pb)
     except AttributeError:
@@ -79,6 +147,15 @@ def to_dict(message: proto.Message) -> JsonDict:
     Returns:
         dict[str, Any]: A dictionary containing the contents of the proto.
     """
+    raw_message = getattr(message, "_pb", message)
+    if isinstance(raw_message, struct_pb2.Struct):
+        return struct_to_dict(raw_message)
+    if isinstance(raw_message, message_pb2.Message):
+        fields = raw_message.ListFields()
+        if all(field.message_type in _STRUCT_TYPES for field, _ in fields):
+            # Messages that only wrap JSON values (e.g. query responses) are
+            # converted directly instead of going through a JSON string.
+            return {field.json_name: _to_python(value) for field, value in fields}
     try:
         # Best effort attempt to convert the message into a JSON dictionary.
         result: JsonDict = json.loads(json_format.MessageToJson(message._pb))
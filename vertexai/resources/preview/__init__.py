@@ -44,6 +44,8 @@ from vertexai.resources.preview.feature_store import (
     FeatureOnlineStoreType,
     FeatureView,
     FeatureViewBigQuerySource,
+    FeatureViewReadCache,
+    FeatureViewReadManyResponse,
     FeatureViewReadResponse,
     IndexConfig,
     TreeAhConfig,
@@ -74,6 +76,8 @@ __all__ = (
     "FeatureOnlineStore",
     "FeatureView",
     "FeatureViewBigQuerySource",
+    "FeatureViewReadCache",
+    "FeatureViewReadManyResponse",
     "FeatureViewReadResponse",
     "IndexConfig",
     "TreeAhConfig",
@@ -36,6 +36,8 @@ from vertexai.resources.preview.feature_store.feature_view import (
 from vertexai.resources.preview.feature_store.utils import (
     FeatureGroupBigQuerySource,
     FeatureViewBigQuerySource,
+    FeatureViewReadCache,
+    FeatureViewReadManyResponse,
     FeatureViewReadResponse,
     IndexConfig,
     TreeAhConfig,
@@ -52,6 +54,8 @@ __all__ = (
     FeatureOnlineStore,
     FeatureView,
     FeatureViewBigQuerySource,
+    FeatureViewReadCache,
+    FeatureViewReadManyResponse,
     FeatureViewReadResponse,
     IndexConfig,
     IndexConfig,
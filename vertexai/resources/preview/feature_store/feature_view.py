@@ -15,8 +15,9 @@
 # limitations under the License.
 #
 
+import concurrent.futures
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 from google.cloud.aiplatform import initializer
 from google.auth import credentials as auth_credentials
 from google.cloud.aiplatform import base
@@ -126,11 +127,6 @@ class FeatureView(base.VertexAiResourceNounWithFutureManager):
         if getattr(self, "_online_store_client", None):
             return self._online_store_client
 
-        fos_name = fs_utils.get_feature_online_store_name(self.resource_name)
-        from .feature_online_store import FeatureOnlineStore
-
-        fos = FeatureOnlineStore(name=fos_name)
-
         if connection_options:
             # Check if we have a previously client created for these
             # connection_options.
@@ -189,6 +185,11 @@ class FeatureView(base.VertexAiResourceNounWithFutureManager):
                     f"Unsupported connection transport type, got transport: {connection_options.transport}"
                 )
 
+        fos_name = fs_utils.get_feature_online_store_name(self.resource_name)
+        from .feature_online_store import FeatureOnlineStore
+
+        fos = FeatureOnlineStore(name=fos_name)
+
         if fos._gca_resource.bigtable.auto_scaling:
             # This is Bigtable online store.
             _LOGGER.info(f"Connecting to Bigtable online store name {fos_name}")
@@ -385,6 +386,85 @@ class FeatureView(base.VertexAiResourceNounWithFutureManager):
         )
         return fs_utils.FeatureViewReadResponse(response)
 
+    def read_many(
+        self,
+        keys: Sequence[List[str]],
+        connection_options: Optional[fs_utils.ConnectionOptions] = None,
+        request_timeout: Optional[float] = None,
+        max_concurrency: int = 8,
+        cache: Optional[fs_utils.FeatureViewReadCache] = None,
+    ) -> fs_utils.FeatureViewReadManyResponse:
+        """Reads the feature values of many keys from FeatureView.
+
+        The reads are sent concurrently over the same online store client, so
+        the connection is set up once for all keys.
+
+        Example Usage:
+            ```
+            cache = fs_utils.FeatureViewReadCache(ttl_seconds=30)
+            df = vertexai.preview.FeatureView(
+                name='feature_view_name', feature_online_store_id='fos_name')
+                .read_many(keys=[["12345"], ["6789"]], cache=cache)
+                .to_pandas()
+            ```
+
+        Args:
+            keys: The request keys to read feature values for.
+            connection_options:
+                If specified, use these options to connect to a host for sending
+                requests instead of the default
+                `<region>-aiplatform.googleapis.com` or the feature online
+                store's public endpoint.
+            request_timeout: The timeout of each request, in seconds.
+            max_concurrency: The maximum number of requests in flight.
+            cache:
+                If specified, keys with cached feature values are not read
+                again, and the feature values read are added to the cache.
+
+        Returns:
+            "FeatureViewReadManyResponse" - FeatureViewReadManyResponse object.
+            It can be converted to columns by to_dict() or to_pandas(), or to
+            the responses of each key by to_proto().
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.wait()
+
+        keys = [list(key) for key in keys]
+        responses: List[Optional[fos_service.FetchFeatureValuesResponse]] = [
+            cache.get(self.resource_name, key) if cache is not None else None
+            for key in keys
+        ]
+        missing_indexes = [
+            i for i, response in enumerate(responses) if response is None
+        ]
+        if not missing_indexes:
+            return fs_utils.FeatureViewReadManyResponse(keys, responses)
+
+        online_store_client = self._get_online_store_client(
+            connection_options=connection_options
+        )
+
+        def fetch(key: List[str]) -> fos_service.FetchFeatureValuesResponse:
+            return online_store_client.fetch_feature_values(
+                feature_view=self.resource_name,
+                data_key=fos_service.FeatureViewDataKey(
+                    composite_key=fos_service.FeatureViewDataKey.CompositeKey(parts=key)
+                ),
+                timeout=request_timeout,
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(missing_indexes))
+        ) as executor:
+            fetched_responses = executor.map(fetch, [keys[i] for i in missing_indexes])
+            for i, response in zip(missing_indexes, fetched_responses):
+                responses[i] = response
+                if cache is not None:
+                    cache.put(self.resource_name, keys[i], response)
+
+        return fs_utils.FeatureViewReadManyResponse(keys, responses)
+
     def search(
         self,
         entity_id: Optional[str] = None,
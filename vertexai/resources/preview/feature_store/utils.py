@@ -16,10 +16,13 @@
 #
 
 import abc
+import collections
 from dataclasses import dataclass
 from dataclasses import field
 import enum
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from google.cloud.aiplatform.compat.types import (
     feature_online_store_service as fos_service,
 )
@@ -98,6 +101,146 @@ class FeatureViewReadResponse:
         return self._response
 
 
+def _feature_value_to_python(feature_value_pb: Any) -> Any:
+    """Converts a raw FeatureValue proto to a Python value."""
+    kind = feature_value_pb.WhichOneof("value")
+    if kind is None:
+        return None
+    value = getattr(feature_value_pb, kind)
+    if kind == "struct_value":
+        return {
+            struct_field.name: _feature_value_to_python(struct_field.value)
+            for struct_field in value.values
+        }
+    if kind.endswith("_array_value"):
+        return list(value.values)
+    return value
+
+
+@dataclass
+class FeatureViewReadManyResponse:
+    """Feature values read for many keys, convertible to a columnar table."""
+
+    _keys: List[List[str]]
+    _responses: List[fos_service.FetchFeatureValuesResponse]
+
+    def __init__(
+        self,
+        keys: List[List[str]],
+        responses: List[fos_service.FetchFeatureValuesResponse],
+    ):
+        self._keys = keys
+        self._responses = responses
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Returns the feature values as columns.
+
+        Returns:
+            A dictionary with a "key" column holding the requested keys and
+            one column per feature, in the order of the requested keys. Feature
+            values missing for a key are None.
+        """
+        columns: Dict[str, List[Any]] = {"key": list(self._keys)}
+        for row, response in enumerate(self._responses):
+            key_values_pb = fos_service.FetchFeatureValuesResponse.pb(
+                response
+            ).key_values
+            for feature in key_values_pb.features:
+                column = columns.get(feature.name)
+                if column is None:
+                    column = columns[feature.name] = [None] * len(self._responses)
+                column[row] = _feature_value_to_python(feature.value)
+        return columns
+
+    def to_pandas(
+        self,
+    ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
+        """Returns the feature values as a pandas DataFrame.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "Pandas is not installed. Please install pandas to use "
+                "FeatureViewReadManyResponse.to_pandas()."
+            )
+        return pd.DataFrame(self.to_dict())
+
+    def to_proto(self) -> List[fos_service.FetchFeatureValuesResponse]:
+        return self._responses
+
+
+class FeatureViewReadCache:
+    """A bounded cache of recently read feature values.
+
+    Entries are keyed by the feature view and the composite key, expire after
+    `ttl_seconds`, and the least recently used entries are evicted once the
+    cache holds `max_entries` keys. A cache can be shared by several feature
+    views and threads.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 60):
+        """Initializes the cache.
+
+        Args:
+            max_entries: The maximum number of cached keys.
+            ttl_seconds: How long feature values stay cached, in seconds.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive.")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "collections.OrderedDict[Tuple[str, Tuple[str, ...]], Tuple[float, fos_service.FetchFeatureValuesResponse]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(
+        self, feature_view: str, key: Sequence[str]
+    ) -> Optional[fos_service.FetchFeatureValuesResponse]:
+        """Returns the cached feature values for a key or None."""
+        cache_key = (feature_view, tuple(key))
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            expire_time, response = entry
+            if expire_time <= time.monotonic():
+                del self._entries[cache_key]
+                return None
+            self._entries.move_to_end(cache_key)
+            return response
+
+    def put(
+        self,
+        feature_view: str,
+        key: Sequence[str],
+        response: fos_service.FetchFeatureValuesResponse,
+    ) -> None:
+        """Caches the feature values for a key."""
+        cache_key = (feature_view, tuple(key))
+        with self._lock:
+            self._entries[cache_key] = (
+                time.monotonic() + self._ttl_seconds,
+                response,
+            )
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached feature values."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 @dataclass
 class SearchNearestEntitiesResponse:
     _response: fos_service.SearchNearestEntitiesResponse